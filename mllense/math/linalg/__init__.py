@@ -22,14 +22,36 @@ from mllense.math.linalg.registry.auto_register import auto_register as _auto_re
 _auto_register()
 
 # ── public API ────────────────────────────────────────────────────────── #
-from mllense.math.linalg.api.matmul import matmul  # noqa: E402
-from mllense.math.linalg.api.solve import solve  # noqa: E402
-from mllense.math.linalg.api.create import zeros, ones, eye, rand  # noqa: E402
+from mllense.math.linalg.api.matmul import matmul, matrix_power, power_apply  # noqa: E402
+from mllense.math.linalg.api.solve import solve, solve_triangular, solve_update  # noqa: E402
+from mllense.math.linalg.api.create import zeros, ones, eye, rand, randn, randint  # noqa: E402
 from mllense.math.linalg.api.ops import add, subtract, multiply, divide, scalar_add, scalar_multiply  # noqa: E402
-from mllense.math.linalg.api.shape import transpose, reshape, flatten, vstack, hstack  # noqa: E402
-from mllense.math.linalg.api.decomposition import det, inv, matrix_trace, qr, svd, eig  # noqa: E402
-from mllense.math.linalg.api.eigen import dominant_eigen  # noqa: E402
+from mllense.math.linalg.api.ops import add_, subtract_, multiply_, divide_, scalar_add_, scalar_multiply_  # noqa: E402
+from mllense.math.linalg.api.shape import transpose, reshape, flatten, vstack, hstack, concatenate  # noqa: E402
+from mllense.math.linalg.api.decomposition import (  # noqa: E402
+    det,
+    slogdet,
+    slogdet_batch,
+    lu_factor,
+    cho_factor,
+    cholupdate,
+    choldowndate,
+    inv,
+    diag_of_inverse,
+    inverse_update,
+    matrix_trace,
+    qr,
+    independent_columns,
+    svd,
+    eig,
+    eigh,
+)
+from mllense.math.linalg.api.eigen import dominant_eigen, eigs, eigsh  # noqa: E402
 from mllense.math.linalg.api.norms import vector_norm, frobenius_norm, spectral_norm  # noqa: E402
+from mllense.math.linalg.api.distance import pairwise_distances, kernel_matrix  # noqa: E402
+from mllense.math.linalg.api.lazy import lazy, evaluate  # noqa: E402
+from mllense.math.linalg.api.reduce import reduce, reduce_batch  # noqa: E402
+from mllense.math.linalg.api.io import load, save  # noqa: E402
 from mllense.math.linalg.diagnostics.condition_number import condition_number  # noqa: E402
 from mllense.math.linalg.diagnostics.rank import matrix_rank  # noqa: E402
 from mllense.math.linalg.diagnostics.stability import stability_report  # noqa: E402
@@ -38,6 +60,7 @@ from mllense.math.linalg.diagnostics.report import full_diagnostic_report  # noq
 from mllense.math.linalg._internal import constants  # noqa: E402
 
 from mllense.math.linalg.config import GlobalConfig, get_config  # noqa: E402
+from mllense.math.linalg.core.cache import get_decomposition_cache  # noqa: E402
 from mllense.math.linalg.version import __version__  # noqa: E402
 
 # ── re-export exceptions for convenience ─────────────────────────────── #
@@ -57,32 +80,65 @@ from mllense.math.linalg.exceptions import (  # noqa: E402
 __all__ = [
     # API
     "matmul",
+    "matrix_power",
+    "power_apply",
     "solve",
+    "solve_triangular",
+    "solve_update",
     "zeros",
     "ones",
     "eye",
     "rand",
+    "randn",
+    "randint",
     "add",
     "subtract",
     "multiply",
     "divide",
     "scalar_add",
     "scalar_multiply",
+    "add_",
+    "subtract_",
+    "multiply_",
+    "divide_",
+    "scalar_add_",
+    "scalar_multiply_",
     "transpose",
     "reshape",
     "flatten",
     "vstack",
     "hstack",
+    "concatenate",
     "det",
+    "slogdet",
+    "slogdet_batch",
+    "lu_factor",
+    "cho_factor",
+    "cholupdate",
+    "choldowndate",
     "inv",
+    "diag_of_inverse",
+    "inverse_update",
     "matrix_trace",
     "qr",
+    "independent_columns",
     "svd",
     "eig",
+    "eigh",
     "dominant_eigen",
+    "eigsh",
+    "eigs",
     "vector_norm",
     "frobenius_norm",
     "spectral_norm",
+    "pairwise_distances",
+    "kernel_matrix",
+    "lazy",
+    "evaluate",
+    "reduce",
+    "reduce_batch",
+    "save",
+    "load",
     "condition_number",
     "matrix_rank",
     "stability_report",
@@ -91,6 +147,7 @@ __all__ = [
     # Configuration
     "GlobalConfig",
     "get_config",
+    "get_decomposition_cache",
     # Version
     "__version__",
     # Exceptions
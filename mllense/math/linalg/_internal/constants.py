@@ -10,6 +10,17 @@ __all__ = [
     "MAX_MATRIX_DIM",
     "SMALL_MATRIX_THRESHOLD",
     "MEDIUM_MATRIX_THRESHOLD",
+    "CHOLESKY_BLOCK_SIZE",
+    "LU_BLOCK_SIZE",
+    "MIXED_PRECISION_MAX_REFINEMENTS",
+    "WOODBURY_CAPACITANCE_COND_LIMIT",
+    "POWER_EIGH_COST",
+    "PAIRWISE_CHUNK_BYTES",
+    "FUSED_BLOCK_BYTES",
+    "CONCAT_CHUNK_BYTES",
+    "RANDOM_CHUNK_ELEMENTS",
+    "PAIRWISE_SUM_BLOCK",
+    "RANGE_FINDER_CHUNK_BYTES",
 ]
 
 # ── Tolerances ──────────────────────────────────────────────────────────── #
@@ -31,4 +42,37 @@ MAX_MATRIX_DIM: int = 10000
 SMALL_MATRIX_THRESHOLD: int = 64
 
 # Between small and medium, use blocking; beyond medium, fall back to BLAS via numpy if possible
-MEDIUM_MATRIX_THRESHOLD: int = 512
\ No newline at end of file
+MEDIUM_MATRIX_THRESHOLD: int = 512
+
+# Column-panel width for the blocked left-looking Cholesky
+CHOLESKY_BLOCK_SIZE: int = 64
+
+# Panel width for the blocked right-looking LU of the mixed-precision solver
+LU_BLOCK_SIZE: int = 64
+
+# Refinement steps on a float32 factor before refactoring in float64
+MIXED_PRECISION_MAX_REFINEMENTS: int = 10
+
+# A Woodbury update loses about log10(cond(C)) digits; refactor beyond this
+WOODBURY_CAPACITANCE_COND_LIMIT: float = 1e8
+
+# Cost of eigh plus Q diag(w^k) Q^T, in n×n matrix products, for matrix_power's auto choice
+POWER_EIGH_COST: float = 10.0
+
+# Rows of a (possibly memory-mapped) matrix streamed per randomized-SVD pass
+RANGE_FINDER_CHUNK_BYTES: int = 64 * 1024 * 1024
+
+# Working-memory budget for one row block of a pairwise distance / kernel matrix
+PAIRWISE_CHUNK_BYTES: int = 64 * 1024 * 1024
+
+# Output block of a fused lazy expression, sized so its intermediates stay in cache
+FUSED_BLOCK_BYTES: int = 256 * 1024
+
+# Initial capacity of the growing buffer when concatenating a stream of unknown length; it doubles when full
+CONCAT_CHUNK_BYTES: int = 1024 * 1024
+
+# Elements per independently seeded chunk of a random matrix; fixed, so results do not depend on the worker count
+RANDOM_CHUNK_ELEMENTS: int = 1 << 20
+
+# Leaf length of pairwise summation: runs this long are summed in order, then combined as a balanced tree
+PAIRWISE_SUM_BLOCK: int = 128
@@ -1,11 +1,11 @@
 # ==============================
 # File: linalg/algorithms/creation/__init__.py
 # ==============================
-"""Creation algorithm family — zeros, ones, eye, rand."""
+"""Creation algorithm family — zeros, ones, eye, rand, randn, randint."""
 
 from mllense.math.linalg.algorithms.creation.eye import EyeCreation
 from mllense.math.linalg.algorithms.creation.ones import OnesCreation
-from mllense.math.linalg.algorithms.creation.rand import RandCreation
+from mllense.math.linalg.algorithms.creation.rand import RandCreation, RandintCreation, RandnCreation
 from mllense.math.linalg.algorithms.creation.zeros import ZerosCreation
 
-__all__ = ["ZerosCreation", "OnesCreation", "EyeCreation", "RandCreation"]
+__all__ = ["ZerosCreation", "OnesCreation", "EyeCreation", "RandCreation", "RandnCreation", "RandintCreation"]
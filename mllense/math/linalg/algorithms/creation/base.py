@@ -8,6 +8,7 @@ from typing import Any
 from mllense.math.linalg.algorithms.base import BaseAlgorithm
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.validation import validate_out
 
 __all__ = ["BaseCreation"]
 
@@ -27,3 +28,11 @@ class BaseCreation(BaseAlgorithm):
 
         Positional args vary by subclass (typically rows, cols).
         """
+
+    def _fill_out(self, out: Any, rows: int, cols: int, value: float, operation: str) -> Any:
+        """Validate a caller-provided ``rows×cols`` buffer and set every element to ``value``."""
+        validate_out(out, (rows, cols), operation)
+        for row in out:
+            for j in range(cols):
+                row[j] = value
+        return out
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from mllense.math.linalg.algorithms.creation.base import BaseCreation
+from mllense.math.linalg.core.constant import ScaledIdentity
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
@@ -39,6 +40,11 @@ class EyeCreation(BaseCreation):
         Args:
             args[0]: rows (int)
             args[1]: cols (int, defaults to rows)
+
+        Keyword Args:
+            out: Optional ``rows×cols`` list / ndarray to fill in place.
+            implicit: Return a read-only :class:`ScaledIdentity` that stores only
+                the shape and value instead of allocating the matrix.
         """
         rows: int = args[0]
         cols: int = args[1] if len(args) > 1 else rows
@@ -77,6 +83,23 @@ class EyeCreation(BaseCreation):
         else:
             self.what_lense = ""
 
+        if kwargs.get("implicit"):
+            self._record_checkpoint(
+                f"1. Returned an implicit {rows}×{cols} identity: only its shape and value are stored, nothing is allocated."
+            )
+            return ScaledIdentity(rows, cols)
+
+        out = kwargs.get("out")
+        if out is not None:
+            self._fill_out(out, rows, cols, 0.0, "eye")
+            for i in range(min(rows, cols)):
+                out[i][i] = 1.0
+            self.how_lense = (
+                f"1. Validated the caller's {rows}×{cols} output buffer.\n"
+                f"2. Zeroed it in place and set the {min(rows, cols)} diagonal entries to 1.0."
+            ) if how else ""
+            return out
+
         if how:
             checkpoints = []
             checkpoints.append(f"1. Validated inputs: {rows} rows, {cols} columns.")
@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import Any
 
 from mllense.math.linalg.algorithms.creation.base import BaseCreation
+from mllense.math.linalg.core.constant import ConstantMatrix
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
@@ -50,4 +51,13 @@ class OnesCreation(BaseCreation):
             description=f"Creating {rows}×{cols} ones matrix",
         )
 
+        if kwargs.get("implicit"):
+            self._record_checkpoint(
+                f"1. Returned an implicit {rows}×{cols} matrix of ones: only its shape and value are stored, nothing is allocated."
+            )
+            return ConstantMatrix(rows, cols, 1.0)
+
+        out = kwargs.get("out")
+        if out is not None:
+            return self._fill_out(out, rows, cols, 1.0, "ones")
         return [[1.0] * cols for _ in range(rows)]
@@ -1,25 +1,139 @@
 # ==============================
 # File: linalg/algorithms/creation/rand.py
 # ==============================
-"""Create a matrix with random values."""
+"""Create matrices of random values (uniform, normal, integer).
+
+Values come from ``numpy.random.Generator`` objects, never from global
+state, so seeding a call in one thread cannot affect another.  The
+matrix is split into fixed-size row chunks and each chunk is drawn from
+its own PCG64 stream spawned from ``SeedSequence(seed)``.  The streams are
+statistically independent and the chunking depends only on the shape,
+so:
+
+* the same seed gives the same matrix however many ``workers`` fill it;
+* chunks are filled in place — into a fresh array, a caller's ndarray
+  ``out`` or an ``np.memmap`` — and can be generated in parallel threads
+  (NumPy releases the GIL while drawing);
+* a list ``out`` is filled row by row from one chunk-sized scratch
+  block per chunk, never a full-size temporary.
+"""
 
 from __future__ import annotations
 
-import random as _random
-from typing import Any, Optional
+import abc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Union
+
+import numpy as np
 
+from mllense.math.linalg._internal.constants import RANDOM_CHUNK_ELEMENTS
 from mllense.math.linalg.algorithms.creation.base import BaseCreation
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
+from mllense.math.linalg.core.validation import validate_out
 from mllense.math.linalg.exceptions import InvalidInputError
 
-__all__ = ["RandCreation"]
+__all__ = ["RandCreation", "RandnCreation", "RandintCreation", "random_streams"]
+
+Seed = Union[None, int, np.random.SeedSequence]
+
+
+def random_streams(seed: Seed, n: int) -> List[np.random.Generator]:
+    """``n`` independent generators spawned from ``SeedSequence(seed)``.
 
+    A ``SeedSequence`` argument is not advanced, so passing the same one
+    twice gives the same streams; ``None`` draws fresh OS entropy.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        root = np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size)
+    else:
+        root = np.random.SeedSequence(seed)
+    return [np.random.Generator(np.random.PCG64(child)) for child in root.spawn(n)]
 
-class RandCreation(BaseCreation):
-    """Create an ``m × n`` matrix with uniform-random values in ``[0, 1)``."""
+
+class _RandomCreation(BaseCreation):
+    """Shared chunked, stream-per-chunk fill; subclasses provide ``_draw``."""
+
+    # dtype of a freshly allocated result (out= buffers are always float)
+    _dtype: Any = np.float64
+
+    @abc.abstractmethod
+    def _draw(self, gen: np.random.Generator, block: np.ndarray, kwargs: dict) -> None:
+        """Fill ``block`` in place with draws from ``gen``."""
+
+    @abc.abstractmethod
+    def _describe(self, kwargs: dict) -> str:
+        """The distribution, for the trace and checkpoints."""
+
+    def _generate(self, rows: int, cols: int, trace: Trace, kwargs: dict) -> Union[InternalMatrix, np.ndarray]:
+        if rows <= 0 or cols <= 0:
+            raise InvalidInputError(
+                f"Matrix dimensions must be positive, got ({rows}, {cols})."
+            )
+        seed: Seed = kwargs.get("seed")
+        out = kwargs.get("out")
+        as_numpy: bool = kwargs.get("as_numpy", False)
+        workers: int = kwargs.get("workers", 1)
+        if seed is not None and not isinstance(seed, (int, np.integer, np.random.SeedSequence)):
+            raise InvalidInputError(f"seed must be an int or SeedSequence, got {type(seed).__name__}.")
+        if workers < 1:
+            raise InvalidInputError(f"workers must be at least 1, got {workers}.")
+        if out is not None:
+            validate_out(out, (rows, cols), self.metadata.name)
+
+        chunk = max(1, RANDOM_CHUNK_ELEMENTS // cols)
+        starts = list(range(0, rows, chunk))
+        gens = random_streams(seed, len(starts))
+        if out is None:
+            target: Optional[np.ndarray] = np.empty((rows, cols), dtype=self._dtype)
+        else:
+            # a list out= has no array to draw into: each chunk goes through its own scratch block
+            target = out if isinstance(out, np.ndarray) else None
+
+        trace.record(
+            operation=self.metadata.name,
+            description=f"Creating {rows}×{cols} {self._describe(kwargs)} matrix in {len(starts)} chunk(s)",
+        )
+        self._record_checkpoint(
+            f"1. Split the {rows}×{cols} matrix into {len(starts)} chunk(s) of ≤{chunk} row(s), each drawn "
+            "from its own PCG64 stream spawned from SeedSequence(seed) — no global RNG state."
+        )
+
+        def fill(k: int) -> None:
+            start = starts[k]
+            stop = min(start + chunk, rows)
+            if target is not None:
+                self._draw(gens[k], target[start:stop], kwargs)
+                return
+            # list out: draw into this chunk's scratch rows, then copy them across
+            block = np.empty((stop - start, cols))
+            self._draw(gens[k], block, kwargs)
+            for i, row in enumerate(block.tolist(), start=start):
+                out[i][:] = row
+
+        if workers > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(starts))) as pool:
+                list(pool.map(fill, range(len(starts))))
+        else:
+            for k in range(len(starts)):
+                fill(k)
+        if isinstance(target, np.memmap):
+            target.flush()
+        where = "the caller's buffer" if out is not None else "a new array"
+        self._record_checkpoint(
+            f"2. Filled {where} chunk by chunk in place"
+            + (f" with {min(workers, len(starts))} threads." if workers > 1 and len(starts) > 1 else ".")
+        )
+
+        if out is not None:
+            return out
+        return target if as_numpy else target.tolist()
+
+
+class RandCreation(_RandomCreation):
+    """Create an ``m × n`` matrix with uniform-random values in ``[low, high)``."""
 
     metadata = AlgorithmMetadata(
         name="rand",
@@ -31,13 +145,26 @@ class RandCreation(BaseCreation):
         description="Creates a matrix filled with uniform random values in [0, 1).",
     )
 
+    def _draw(self, gen: np.random.Generator, block: np.ndarray, kwargs: dict) -> None:
+        low: float = kwargs.get("low", 0.0)
+        high: float = kwargs.get("high", 1.0)
+        if block.flags.c_contiguous:
+            gen.random(out=block)
+        else:
+            block[...] = gen.random(block.shape)
+        block *= high - low
+        block += low
+
+    def _describe(self, kwargs: dict) -> str:
+        return f"uniform [{kwargs.get('low', 0.0)}, {kwargs.get('high', 1.0)})"
+
     def execute(
         self,
         *args: Any,
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
+    ) -> Union[InternalMatrix, np.ndarray]:
         """Create random matrix.
 
         Args:
@@ -45,31 +172,113 @@ class RandCreation(BaseCreation):
             args[1]: cols (int, defaults to rows)
 
         Keyword Args:
-            seed: Optional random seed for reproducibility.
+            seed: Optional int or ``SeedSequence`` for reproducibility.
             low: Lower bound (default 0.0).
             high: Upper bound (default 1.0).
+            out: Optional ``rows×cols`` list / ndarray to fill in place.
+            as_numpy: Return an ndarray instead of a list matrix.
+            workers: Threads generating chunks in parallel (default 1).
         """
         rows: int = args[0]
         cols: int = args[1] if len(args) > 1 else rows
-        seed: Optional[int] = kwargs.get("seed", None)
-        low: float = kwargs.get("low", 0.0)
-        high: float = kwargs.get("high", 1.0)
+        return self._generate(rows, cols, trace, kwargs)
 
-        if rows <= 0 or cols <= 0:
-            raise InvalidInputError(
-                f"Matrix dimensions must be positive, got ({rows}, {cols})."
-            )
 
-        if seed is not None:
-            _random.seed(seed)
+class RandnCreation(_RandomCreation):
+    """Create an ``m × n`` matrix of normal samples with the given mean and standard deviation."""
 
-        trace.record(
-            operation="rand",
-            description=f"Creating {rows}×{cols} random matrix (range [{low}, {high}))",
-        )
+    metadata = AlgorithmMetadata(
+        name="randn",
+        operation="create_randn",
+        complexity="O(m*n)",
+        stable=True,
+        supports_batch=False,
+        requires_square=False,
+        description="Creates a matrix filled with normally distributed random values.",
+    )
+
+    def _draw(self, gen: np.random.Generator, block: np.ndarray, kwargs: dict) -> None:
+        if block.flags.c_contiguous:
+            gen.standard_normal(out=block)
+        else:
+            block[...] = gen.standard_normal(block.shape)
+        block *= kwargs.get("std", 1.0)
+        block += kwargs.get("mean", 0.0)
 
-        span = high - low
-        return [
-            [low + _random.random() * span for _ in range(cols)]
-            for _ in range(rows)
-        ]
+    def _describe(self, kwargs: dict) -> str:
+        return f"normal (mean {kwargs.get('mean', 0.0)}, std {kwargs.get('std', 1.0)})"
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Union[InternalMatrix, np.ndarray]:
+        """Create a normal random matrix.
+
+        Args:
+            args[0]: rows (int)
+            args[1]: cols (int, defaults to rows)
+
+        Keyword Args:
+            seed, out, as_numpy, workers: As for :class:`RandCreation`.
+            mean: Mean (default 0.0).
+            std: Standard deviation (default 1.0, must be ≥ 0).
+        """
+        if kwargs.get("std", 1.0) < 0:
+            raise InvalidInputError(f"std must be non-negative, got {kwargs['std']}.")
+        rows: int = args[0]
+        cols: int = args[1] if len(args) > 1 else rows
+        return self._generate(rows, cols, trace, kwargs)
+
+
+class RandintCreation(_RandomCreation):
+    """Create an ``m × n`` matrix of integers drawn uniformly from ``[low, high)``."""
+
+    metadata = AlgorithmMetadata(
+        name="randint",
+        operation="create_randint",
+        complexity="O(m*n)",
+        stable=True,
+        supports_batch=False,
+        requires_square=False,
+        description="Creates a matrix filled with uniform random integers in [low, high).",
+    )
+
+    _dtype = np.int64
+
+    def _draw(self, gen: np.random.Generator, block: np.ndarray, kwargs: dict) -> None:
+        block[...] = gen.integers(kwargs["low"], kwargs["high"], size=block.shape)
+
+    def _describe(self, kwargs: dict) -> str:
+        return f"integer [{kwargs['low']}, {kwargs['high']})"
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Union[InternalMatrix, np.ndarray]:
+        """Create an integer random matrix.
+
+        Args:
+            args[0]: rows (int)
+            args[1]: cols (int, defaults to rows)
+
+        Keyword Args:
+            low: Smallest value (default 0).
+            high: One past the largest value (required).
+            seed, out, as_numpy, workers: As for :class:`RandCreation`; a
+                float ``out`` receives integer values.
+        """
+        low = kwargs.setdefault("low", 0)
+        high: Optional[int] = kwargs.get("high")
+        if high is None or not isinstance(low, (int, np.integer)) or not isinstance(high, (int, np.integer)):
+            raise InvalidInputError(f"randint needs integer low and high, got low={low!r}, high={high!r}.")
+        if high <= low:
+            raise InvalidInputError(f"randint needs low < high, got [{low}, {high}).")
+        rows: int = args[0]
+        cols: int = args[1] if len(args) > 1 else rows
+        return self._generate(rows, cols, trace, kwargs)
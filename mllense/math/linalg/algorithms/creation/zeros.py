@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import Any
 
 from mllense.math.linalg.algorithms.creation.base import BaseCreation
+from mllense.math.linalg.core.constant import ConstantMatrix
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
@@ -42,6 +43,11 @@ class ZerosCreation(BaseCreation):
         Args:
             args[0]: rows (int)
             args[1]: cols (int)
+
+        Keyword Args:
+            out: Optional ``rows×cols`` list / ndarray to fill in place.
+            implicit: Return a read-only :class:`ConstantMatrix` that stores only
+                the shape and value instead of allocating the matrix.
         """
         rows: int = args[0]
         cols: int = args[1] if len(args) > 1 else rows
@@ -56,4 +62,13 @@ class ZerosCreation(BaseCreation):
             description=f"Creating {rows}×{cols} zero matrix",
         )
 
+        if kwargs.get("implicit"):
+            self._record_checkpoint(
+                f"1. Returned an implicit {rows}×{cols} zero matrix: only its shape and value are stored, nothing is allocated."
+            )
+            return ConstantMatrix(rows, cols, 0.0)
+
+        out = kwargs.get("out")
+        if out is not None:
+            return self._fill_out(out, rows, cols, 0.0, "zeros")
         return [[0.0] * cols for _ in range(rows)]
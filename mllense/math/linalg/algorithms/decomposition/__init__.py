@@ -3,18 +3,35 @@
 # ==============================
 """Decomposition algorithm family."""
 
-from mllense.math.linalg.algorithms.decomposition.det import Determinant
+from mllense.math.linalg.algorithms.decomposition.det import Determinant, LogDeterminant
 from mllense.math.linalg.algorithms.decomposition.eig import EigenDecomposition
-from mllense.math.linalg.algorithms.decomposition.inverse import Inverse
+from mllense.math.linalg.algorithms.decomposition.eigh import SymmetricEigenDecomposition
+from mllense.math.linalg.algorithms.decomposition.inverse import (
+    FactorizedInverse,
+    Inverse,
+    InverseDiagonal,
+)
 from mllense.math.linalg.algorithms.decomposition.qr import QRDecomposition
+from mllense.math.linalg.algorithms.decomposition.qrcp import PivotedQRDecomposition, qr_pivoted
+from mllense.math.linalg.algorithms.decomposition.randomized_svd import RandomizedSVD
 from mllense.math.linalg.algorithms.decomposition.svd import SVDDecomposition
 from mllense.math.linalg.algorithms.decomposition.trace import MatrixTrace
+from mllense.math.linalg.algorithms.decomposition.woodbury import InverseUpdate, SolveUpdate
 
 __all__ = [
     "Determinant",
     "EigenDecomposition",
+    "FactorizedInverse",
     "Inverse",
+    "InverseDiagonal",
+    "InverseUpdate",
+    "LogDeterminant",
+    "PivotedQRDecomposition",
     "QRDecomposition",
+    "RandomizedSVD",
     "SVDDecomposition",
+    "SolveUpdate",
+    "SymmetricEigenDecomposition",
     "MatrixTrace",
+    "qr_pivoted",
 ]
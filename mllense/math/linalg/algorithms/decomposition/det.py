@@ -1,22 +1,36 @@
 # ==============================
 # File: linalg/algorithms/decomposition/det.py
 # ==============================
-"""Determinant computation via LU decomposition."""
+"""Determinant and log-determinant computation via LU / Cholesky."""
 
 from __future__ import annotations
 
-from typing import Any
+import math
+from typing import Any, Tuple, Union
 
 from mllense.math.linalg.algorithms.decomposition.base import BaseDecomposition
-from mllense.math.linalg.algorithms.solve.lu import lu_decompose
+from mllense.math.linalg.algorithms.solve.cholesky import (
+    CholeskyFactorization,
+    cholesky_factor,
+    is_cholesky_candidate,
+)
+from mllense.math.linalg.algorithms.solve.lu import (
+    LUFactorization,
+    lu_factor,
+)
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
 from mllense.math.linalg.core.validation import validate_square
-from mllense.math.linalg.exceptions import SingularMatrixError
+from mllense.math.linalg.exceptions import InvalidInputError, SingularMatrixError
 
-__all__ = ["Determinant"]
+__all__ = ["Determinant", "LogDeterminant"]
+
+# log(sys.float_info.max) — exp() of anything larger overflows
+_MAX_EXP_ARG = 709.782712893384
+
+_SLOGDET_METHODS = ("auto", "lu", "cholesky")
 
 
 class Determinant(BaseDecomposition):
@@ -48,27 +62,24 @@ class Determinant(BaseDecomposition):
         )
 
         try:
-            _l, u, perm = lu_decompose(a, trace=trace)
+            factor = lu_factor(a, trace=trace)
         except SingularMatrixError:
             trace.record(operation="det_done", description="Determinant = 0 (singular)")
             return 0.0
 
-        # det = product of U diagonal * sign of permutation
-        det_val = 1.0
+        # det = sign of permutation * product of U diagonal
+        det_val = -1.0 if factor.swaps % 2 else 1.0
         for i in range(n):
-            det_val *= u[i][i]
+            det_val *= factor.lu[i][i]
 
-        # count swaps
-        swaps = 0
-        perm_copy = perm[:]
-        for i in range(n):
-            while perm_copy[i] != i:
-                j = perm_copy[i]
-                perm_copy[i], perm_copy[j] = perm_copy[j], perm_copy[i]
-                swaps += 1
-
-        if swaps % 2 == 1:
-            det_val = -det_val
+        # the running product can over/underflow even when the determinant
+        # itself is representable — redo it in log space
+        if det_val == 0.0 or not math.isfinite(det_val):
+            sign, logabsdet = factor.slogdet()
+            if logabsdet > _MAX_EXP_ARG:
+                det_val = sign * float("inf")
+            else:
+                det_val = sign * math.exp(logabsdet)
 
         trace.record(
             operation="det_done",
@@ -76,3 +87,96 @@ class Determinant(BaseDecomposition):
         )
 
         return det_val
+
+
+class LogDeterminant(BaseDecomposition):
+    """Compute ``(sign, log|det A|)`` without forming the determinant.
+
+    Summing logarithms of the factor's diagonal instead of multiplying
+    the diagonal avoids overflow and underflow for large or badly scaled
+    matrices (e.g. covariance matrices in Gaussian log-likelihoods).
+    """
+
+    metadata = AlgorithmMetadata(
+        name="log_determinant",
+        operation="slogdet",
+        complexity="O(n^3)",
+        stable=True,
+        supports_batch=True,
+        requires_square=True,
+        description="Sign and log-absolute-determinant via LU or Cholesky in log space.",
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Tuple[float, float]:
+        """Compute ``(sign, logabsdet)``.
+
+        Args:
+            args[0]: A (square InternalMatrix) or an existing
+                :class:`LUFactorization` / :class:`CholeskyFactorization`.
+
+        Keyword Args:
+            method: ``"auto"`` (Cholesky for symmetric matrices with a
+                positive diagonal, LU otherwise), ``"lu"`` or ``"cholesky"``.
+
+        Returns:
+            ``(sign, logabsdet)``; a singular matrix gives ``(0.0, -inf)``.
+        """
+        target: Union[InternalMatrix, LUFactorization, CholeskyFactorization] = args[0]
+        method: str = kwargs.get("method", "auto")
+
+        if isinstance(target, (LUFactorization, CholeskyFactorization)):
+            kind = "LU" if isinstance(target, LUFactorization) else "Cholesky"
+            self._record_checkpoint(f"{len(self._checkpoints) + 1}. Reusing existing {kind} factorization ({target.n}×{target.n}).")
+            result = target.slogdet()
+            self._record_checkpoint(f"{len(self._checkpoints) + 1}. Summed log|diag| of the factor: sign = {result[0]}, logabsdet = {result[1]}.")
+            trace.record(
+                operation="slogdet_done",
+                description=f"slogdet from cached {kind} factor = {result}",
+            )
+            return result
+
+        if method not in _SLOGDET_METHODS:
+            raise InvalidInputError(
+                f"Unknown slogdet method {method!r}. Valid methods: {', '.join(_SLOGDET_METHODS)}."
+            )
+
+        a: InternalMatrix = target
+        n = validate_square(a, operation="slogdet")
+        trace.record(
+            operation="slogdet_start",
+            description=f"Computing slogdet of {n}×{n} matrix (method={method})",
+        )
+        self._record_checkpoint(f"{len(self._checkpoints) + 1}. Validated {n}×{n} square matrix.")
+
+        factor: Union[LUFactorization, CholeskyFactorization, None] = None
+        if method == "cholesky" or (method == "auto" and is_cholesky_candidate(a)):
+            try:
+                factor = cholesky_factor(a, trace=trace)
+                self._record_checkpoint(f"{len(self._checkpoints) + 1}. Factored A = L L^T (Cholesky).")
+            except (InvalidInputError, SingularMatrixError):
+                if method == "cholesky":
+                    raise
+                self._record_checkpoint(f"{len(self._checkpoints) + 1}. Cholesky failed (not SPD); falling back to LU.")
+
+        if factor is None:
+            try:
+                factor = lu_factor(a, trace=trace)
+            except SingularMatrixError:
+                self._record_checkpoint(f"{len(self._checkpoints) + 1}. LU hit a zero pivot: matrix is singular.")
+                trace.record(operation="slogdet_done", description="Singular matrix: (0.0, -inf)")
+                return 0.0, float("-inf")
+            self._record_checkpoint(f"{len(self._checkpoints) + 1}. Factored PA = LU with {factor.swaps} row swaps.")
+
+        sign, logabsdet = factor.slogdet()
+        self._record_checkpoint(f"{len(self._checkpoints) + 1}. Summed log|diag| of the factor: sign = {sign}, logabsdet = {logabsdet}.")
+        trace.record(
+            operation="slogdet_done",
+            description=f"sign = {sign}, logabsdet = {logabsdet}",
+        )
+        return sign, logabsdet
@@ -0,0 +1,263 @@
+# ==============================
+# File: linalg/algorithms/decomposition/eigh.py
+# ==============================
+"""Symmetric eigenvalue decomposition via tridiagonal reduction.
+
+For the full spectrum this delegates to ``numpy.linalg.eigh`` (LAPACK
+``syevd``, which tridiagonalizes internally).  When only a subset is
+requested, the matrix is reduced to tridiagonal form ``A = Q T Q^T`` with
+Householder reflectors, the wanted eigenvalues of ``T`` are isolated by
+Sturm-sequence bisection, their eigenvectors are found by inverse
+iteration on ``T`` and finally mapped back through ``Q``.  Only the
+reduction is O(n^3); the subset costs O(n k) per bisection step.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from mllense.math.linalg.algorithms.decomposition.base import BaseDecomposition
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.types import InternalMatrix, InternalVector
+from mllense.math.linalg.core.validation import validate_square
+from mllense.math.linalg.exceptions import InvalidInputError
+
+__all__ = ["SymmetricEigenDecomposition", "tridiagonalize"]
+
+_EPS = np.finfo(np.float64).eps
+
+Reflector = Tuple[int, np.ndarray, float]
+
+
+def tridiagonalize(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List[Reflector]]:
+    """Reduce a symmetric matrix to tridiagonal form with Householder reflectors.
+
+    Returns:
+        ``(d, e, reflectors)`` — the diagonal and off-diagonal of ``T`` and
+        the reflectors ``(k, v, beta)`` with ``H_k = I - beta v v^T`` acting
+        on rows ``k+1:``, so that ``A = Q T Q^T`` with ``Q = H_0 H_1 ...``.
+    """
+    a = np.array(a, dtype=np.float64)
+    n = a.shape[0]
+    e = np.zeros(max(n - 1, 0))
+    reflectors: List[Reflector] = []
+
+    for k in range(n - 2):
+        x = a[k + 1:, k]
+        if not np.any(x[1:]):
+            e[k] = x[0]
+            continue
+        alpha = -np.copysign(np.linalg.norm(x), x[0])
+        v = x.copy()
+        v[0] -= alpha
+        beta = 2.0 / (v @ v)
+        # symmetric rank-2 update of the trailing block: H A22 H
+        a22 = a[k + 1:, k + 1:]
+        p = beta * (a22 @ v)
+        w = p - (0.5 * beta * (p @ v)) * v
+        a22 -= np.outer(v, w) + np.outer(w, v)
+        e[k] = alpha
+        reflectors.append((k, v, beta))
+
+    if n >= 2:
+        e[n - 2] = a[n - 1, n - 2]
+    return np.diag(a).copy(), e, reflectors
+
+
+def _sturm_count(d: np.ndarray, e2: np.ndarray, x: np.ndarray, pivmin: float) -> np.ndarray:
+    """Number of eigenvalues of ``T`` at or below each shift in ``x``.
+
+    As in LAPACK ``dstebz``, a pivot smaller than ``pivmin`` in magnitude
+    is replaced by ``-pivmin`` *before* it is counted, so a zero pivot (a
+    shift exactly on an eigenvalue) counts that eigenvalue.
+    """
+    q = d[0] - x
+    q = np.where(np.abs(q) < pivmin, -pivmin, q)
+    count = (q < 0).astype(np.int64)
+    for i in range(1, len(d)):
+        q = d[i] - x - e2[i - 1] / q
+        q = np.where(np.abs(q) < pivmin, -pivmin, q)
+        count += q < 0
+    return count
+
+
+def _bisect(d: np.ndarray, e: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """Eigenvalues of ``T`` with the given ascending indices, all bisected at once."""
+    n = len(d)
+    off = np.zeros(n)
+    off[:-1] += np.abs(e)
+    off[1:] += np.abs(e)
+    lo_bound = float(np.min(d - off))
+    hi_bound = float(np.max(d + off))
+    e2 = e * e
+    scale = max(abs(lo_bound), abs(hi_bound), np.finfo(np.float64).tiny)
+    pivmin = np.finfo(np.float64).tiny * max(1.0, float(e2.max()) if e2.size else 1.0)
+    tol = 2.0 * _EPS * scale
+
+    lo = np.full(len(indices), lo_bound)
+    hi = np.full(len(indices), hi_bound)
+    for _ in range(128):
+        mid = 0.5 * (lo + hi)
+        above = _sturm_count(d, e2, mid, pivmin) > indices
+        hi = np.where(above, mid, hi)
+        lo = np.where(above, lo, mid)
+        if np.max(hi - lo) <= tol:
+            break
+    return 0.5 * (lo + hi)
+
+
+def _tridiag_matmul(d: np.ndarray, e: np.ndarray, x: np.ndarray) -> np.ndarray:
+    y = d[:, None] * x
+    y[:-1] += e[:, None] * x[1:]
+    y[1:] += e[:, None] * x[:-1]
+    return y
+
+
+def _inverse_iteration(
+    d: np.ndarray, e: np.ndarray, lam: np.ndarray, n_iter: int = 3
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Eigenvectors of ``T`` for the shifts ``lam`` (one column per shift).
+
+    Returns the vectors together with their Rayleigh-Ritz eigenvalues.
+    """
+    n, k = len(d), len(lam)
+    scale = max(float(np.max(np.abs(d))) + 2.0 * (float(np.max(np.abs(e))) if e.size else 0.0), 1e-300)
+    pivmin = _EPS * scale
+    x = np.random.default_rng(0).uniform(-1.0, 1.0, size=(n, k))
+
+    for _ in range(n_iter):
+        # (T - lam I) y = x by tridiagonal elimination; tiny pivots are
+        # nudged, which is exactly what drives inverse iteration
+        piv = np.empty((n, k))
+        y = x.copy()
+        p = d[0] - lam
+        piv[0] = np.where(np.abs(p) < pivmin, pivmin, p)
+        for i in range(1, n):
+            m = e[i - 1] / piv[i - 1]
+            p = d[i] - lam - m * e[i - 1]
+            piv[i] = np.where(np.abs(p) < pivmin, pivmin, p)
+            y[i] -= m * y[i - 1]
+        y[n - 1] /= piv[n - 1]
+        for i in range(n - 2, -1, -1):
+            y[i] = (y[i] - e[i] * y[i + 1]) / piv[i]
+        x = y / np.linalg.norm(y, axis=0)
+
+    # orthonormalize (clustered eigenvalues) and refine by Rayleigh-Ritz on T
+    q, _ = np.linalg.qr(x)
+    w, s = np.linalg.eigh(q.T @ _tridiag_matmul(d, e, q))
+    return q @ s, w
+
+
+def _apply_q(reflectors: List[Reflector], y: np.ndarray) -> np.ndarray:
+    """Return ``Q y`` for ``Q = H_0 H_1 ...``."""
+    for k, v, beta in reversed(reflectors):
+        block = y[k + 1:]
+        block -= beta * np.outer(v, v @ block)
+    return y
+
+
+class SymmetricEigenDecomposition(BaseDecomposition):
+    """Eigenvalues (ascending) and eigenvectors of a symmetric matrix."""
+
+    metadata = AlgorithmMetadata(
+        name="symmetric_eigen_decomposition",
+        operation="eigh",
+        complexity="O(n^3)",
+        stable=True,
+        supports_batch=False,
+        requires_square=True,
+        description=(
+            "Symmetric eigensolver: Householder tridiagonal reduction, then "
+            "bisection and inverse iteration for an index or value subset."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Tuple[InternalVector, Optional[InternalMatrix]]:
+        """Compute eigenvalues and (optionally) eigenvectors.
+
+        Args:
+            args[0]: A (symmetric InternalMatrix, n×n).  Only the lower
+                triangle is trusted.
+
+        Keyword Args:
+            subset_by_index: ``(lo, hi)`` inclusive ascending indices.
+            subset_by_value: ``(vl, vu)`` — eigenvalues in ``(vl, vu]``.
+            eigvals_only: Skip eigenvectors (default ``False``).
+
+        Returns:
+            (eigenvalues, eigenvectors) with eigenvectors column-wise, or
+            ``None`` in place of the eigenvectors if ``eigvals_only``.
+        """
+        a: InternalMatrix = args[0]
+        subset_by_index: Optional[Tuple[int, int]] = kwargs.get("subset_by_index")
+        subset_by_value: Optional[Tuple[float, float]] = kwargs.get("subset_by_value")
+        eigvals_only: bool = kwargs.get("eigvals_only", False)
+        n = validate_square(a, operation="eigh")
+
+        if subset_by_index is not None and subset_by_value is not None:
+            raise InvalidInputError("Pass at most one of subset_by_index and subset_by_value.")
+        if subset_by_index is not None:
+            lo, hi = subset_by_index
+            if not 0 <= lo <= hi < n:
+                raise InvalidInputError(
+                    f"subset_by_index must satisfy 0 <= lo <= hi < {n}, got {subset_by_index}."
+                )
+
+        trace.record(
+            operation="eigh_start",
+            description=f"Symmetric eigendecomposition of {n}×{n} matrix",
+        )
+        a_np = np.tril(np.asarray(a, dtype=np.float64))
+        a_np = a_np + np.tril(a_np, -1).T
+
+        if subset_by_index is None and subset_by_value is None:
+            self._record_checkpoint("1. Full spectrum requested: LAPACK syevd (tridiagonal reduction + divide and conquer).")
+            if eigvals_only:
+                w, v = np.linalg.eigvalsh(a_np), None
+            else:
+                w, v = np.linalg.eigh(a_np)
+        else:
+            d, e, reflectors = tridiagonalize(a_np)
+            self._record_checkpoint(f"1. Reduced A to tridiagonal T with {len(reflectors)} Householder reflectors.")
+            if subset_by_value is not None:
+                vl, vu = subset_by_value
+                e2 = e * e
+                pivmin = np.finfo(np.float64).tiny * max(1.0, float(e2.max()) if e2.size else 1.0)
+                # eigenvalues <= vu minus those <= vl, via Sturm counts
+                lo_i, hi_i = _sturm_count(d, e2, np.array([vl, vu]), pivmin)
+                lo, hi = int(lo_i), int(hi_i) - 1
+                self._record_checkpoint(f"2. Sturm counts place {max(hi - lo + 1, 0)} eigenvalue(s) in ({vl}, {vu}].")
+            else:
+                lo, hi = subset_by_index
+            indices = np.arange(lo, hi + 1)
+
+            if len(indices) == 0:
+                w, v = np.empty(0), (None if eigvals_only else np.empty((n, 0)))
+            else:
+                w = _bisect(d, e, indices)
+                self._record_checkpoint(f"{len(self._checkpoints) + 1}. Bisected {len(indices)} eigenvalue(s) of T (indices {lo}..{hi}).")
+                v = None
+                if not eigvals_only:
+                    y, w = _inverse_iteration(d, e, w)
+                    v = _apply_q(reflectors, y)
+                    self._record_checkpoint(f"{len(self._checkpoints) + 1}. Inverse iteration on T, then mapped the eigenvectors back through Q.")
+
+        eigenvalues: InternalVector = w.tolist()
+        eigenvectors = v.tolist() if v is not None else None
+
+        trace.record(
+            operation="eigh_done",
+            description=f"Found {len(eigenvalues)} eigenvalues",
+            data={"eigenvalues": eigenvalues},
+        )
+        return eigenvalues, eigenvectors
@@ -9,7 +9,7 @@ standard interface and trace integration.
 
 from __future__ import annotations
 
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 
@@ -18,6 +18,7 @@ from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix, InternalVector
+from mllense.math.linalg.exceptions import InvalidInputError
 
 __all__ = ["SVDDecomposition"]
 
@@ -45,36 +46,55 @@ class SVDDecomposition(BaseDecomposition):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> Tuple[InternalMatrix, InternalVector, InternalMatrix]:
+    ) -> Tuple[Union[InternalMatrix, np.ndarray], Union[InternalVector, np.ndarray], Union[InternalMatrix, np.ndarray]]:
         """Compute SVD.
 
         Args:
-            args[0]: A (InternalMatrix m×n)
+            args[0]: A (InternalMatrix or ndarray, m×n).  An ndarray input
+                yields ndarray factors with no list round-trip.
+
+        Keyword Args:
+            full_matrices: Return square ``U`` / ``Vt`` (default ``True``);
+                ``False`` gives the economy ``m×r`` / ``r×n`` factors,
+                ``r = min(m, n)``.
+            k: Keep only the leading ``k`` singular triplets (implies
+                economy factors).
 
         Returns:
             (U, sigma, Vt) where sigma is the list of singular values.
         """
-        a: InternalMatrix = args[0]
+        a = args[0]
+        full_matrices: bool = kwargs.get("full_matrices", True)
+        k: Optional[int] = kwargs.get("k")
+        return_numpy = isinstance(a, np.ndarray)
         m = len(a)
         n = len(a[0]) if m else 0
+        if k is not None and not 1 <= k <= min(m, n):
+            raise InvalidInputError(f"k must satisfy 1 <= k <= min(m, n) = {min(m, n)}, got {k}.")
 
         trace.record(
             operation="svd_start",
-            description=f"SVD of {m}×{n} matrix",
+            description=f"SVD of {m}×{n} matrix"
+                        + ("" if full_matrices and k is None else " (economy)"),
         )
 
-        a_np = np.array(a, dtype=np.float64)
-        u_np, s_np, vt_np = np.linalg.svd(a_np, full_matrices=True)
+        a_np = np.asarray(a, dtype=np.float64)
+        u_np, s_np, vt_np = np.linalg.svd(a_np, full_matrices=full_matrices and k is None)
+        if k is not None:
+            u_np, s_np, vt_np = u_np[:, :k], s_np[:k], vt_np[:k]
 
-        u: InternalMatrix = u_np.tolist()
-        sigma: InternalVector = s_np.tolist()
-        vt: InternalMatrix = vt_np.tolist()
+        if return_numpy:
+            u, sigma, vt = u_np, s_np, vt_np
+        else:
+            u = u_np.tolist()
+            sigma = s_np.tolist()
+            vt = vt_np.tolist()
 
         trace.record(
             operation="svd_done",
-            description=f"U: {len(u)}×{len(u[0]) if u else 0}, "
-                        f"sigma: {len(sigma)} values, "
-                        f"Vt: {len(vt)}×{len(vt[0]) if vt else 0}",
+            description=f"U: {u_np.shape[0]}×{u_np.shape[1]}, "
+                        f"sigma: {len(s_np)} values, "
+                        f"Vt: {vt_np.shape[0]}×{vt_np.shape[1]}",
         )
 
         return u, sigma, vt
@@ -0,0 +1,285 @@
+# ==============================
+# File: linalg/algorithms/decomposition/woodbury.py
+# ==============================
+"""Rank-``k`` updates of an inverse or a factorized solve (Sherman-Morrison-Woodbury).
+
+``(A + U V^T)^{-1} = A^{-1} - A^{-1} U C^{-1} V^T A^{-1}`` with the
+``k × k`` *capacitance* matrix ``C = I + V^T A^{-1} U``.  Given ``A^{-1}``
+(or a factor of ``A``) the correction costs O(n^2 k) instead of a fresh
+O(n^3) inversion.
+
+The identity is only as accurate as the solve with ``C``: when ``C`` is
+nearly singular (``A + U V^T`` is nearly singular even though ``A`` is
+not) the correction loses digits catastrophically.  Because ``C`` is
+formed as ``I + V^T A^{-1} U``, its rounding error scales with
+``1 + ||V^T A^{-1} U||``, so the relevant condition number is
+``(1 + ||V^T A^{-1} U||_2) / sigma_min(C)`` — an upper bound on
+``cond(C)`` that, unlike ``cond(C)``, also catches cancellation in the
+``k = 1`` (Sherman-Morrison) case.  It costs O(k^3), negligible for small
+``k``; above
+:data:`~mllense.math.linalg._internal.constants.WOODBURY_CAPACITANCE_COND_LIMIT`
+the updated matrix is refactored from scratch with LAPACK.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Tuple, Union
+
+import numpy as np
+
+from mllense.math.linalg._internal.constants import WOODBURY_CAPACITANCE_COND_LIMIT
+from mllense.math.linalg.algorithms.decomposition.base import BaseDecomposition
+from mllense.math.linalg.algorithms.solve.base import BaseSolve
+from mllense.math.linalg.algorithms.solve.cholesky import CholeskyFactorization
+from mllense.math.linalg.algorithms.solve.lu import LUFactorization
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.types import InternalMatrix, InternalVector
+from mllense.math.linalg.exceptions import ShapeMismatchError, SingularMatrixError
+
+__all__ = ["InverseUpdate", "SolveUpdate", "capacitance"]
+
+Factorization = Union[LUFactorization, CholeskyFactorization]
+
+
+def _as_columns(m: Any, n: int, name: str, operation: str) -> np.ndarray:
+    """Return ``m`` as an ``n × k`` float array (a length-``n`` vector is one column)."""
+    arr = np.asarray(m, dtype=np.float64)
+    if arr.ndim == 1:
+        arr = arr[:, None]
+    if arr.ndim != 2 or arr.shape[0] != n:
+        raise ShapeMismatchError(
+            expected=f"{name} with {n} rows",
+            got=f"shape {arr.shape}",
+            operation=operation,
+        )
+    return arr
+
+
+def capacitance(v: np.ndarray, a_inv_u: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Return ``C = I + V^T (A^{-1} U)`` and its condition ``(1 + ||V^T A^{-1} U||) / sigma_min(C)``."""
+    k = v.shape[1]
+    if k == 0:
+        return np.eye(0), 1.0
+    g = v.T @ a_inv_u
+    c = np.eye(k) + g
+    s_min = float(np.linalg.svd(c, compute_uv=False)[-1])
+    scale = 1.0 + float(np.linalg.norm(g, 2))
+    cond = scale / s_min if s_min > 0.0 else float("inf")
+    return c, cond
+
+
+def _factor_matrix(factor: Factorization) -> np.ndarray:
+    """Multiply a factorization back out into ``A`` (O(n^3), refactor path only)."""
+    if isinstance(factor, CholeskyFactorization):
+        l = np.array(factor.l, dtype=np.float64)
+        return l @ l.T
+    lu = np.array(factor.lu, dtype=np.float64)
+    prod = (np.tril(lu, -1) + np.eye(factor.n)) @ np.triu(lu)
+    a = np.empty_like(prod)
+    a[factor.perm] = prod
+    return a
+
+
+def _lapack(fn: Any, *arrays: np.ndarray) -> np.ndarray:
+    """Run a ``numpy.linalg`` routine on the refactor path, reporting singularity as ours."""
+    try:
+        return fn(*arrays)
+    except np.linalg.LinAlgError as exc:
+        raise SingularMatrixError(f"The updated matrix A + U V^T is singular ({exc}).") from exc
+
+
+class InverseUpdate(BaseDecomposition):
+    """Update ``A^{-1}`` to ``(A + U V^T)^{-1}`` with the Woodbury identity."""
+
+    metadata = AlgorithmMetadata(
+        name="woodbury_inverse_update",
+        operation="inverse_update",
+        complexity="O(n^2 k)",
+        stable=False,
+        supports_batch=False,
+        requires_square=True,
+        description=(
+            "Rank-k correction of a known inverse via Sherman-Morrison-Woodbury, "
+            "refactoring from scratch when the capacitance matrix is ill-conditioned."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Compute ``(A + U V^T)^{-1}``.
+
+        Args:
+            args[0]: ``A^{-1}`` (n×n)
+            args[1]: U (n×k, or a length-n vector)
+            args[2]: V (n×k, or a length-n vector)
+
+        Keyword Args:
+            a: The original ``A``, used if a refactorization is needed
+                (otherwise it is recovered by inverting ``A^{-1}``).
+            cond_limit: Capacitance condition number above which the
+                update is recomputed from scratch.
+
+        Returns:
+            The updated inverse as an ndarray.
+        """
+        a_inv = np.asarray(args[0], dtype=np.float64)
+        n = a_inv.shape[0]
+        if a_inv.ndim != 2 or a_inv.shape[1] != n:
+            raise ShapeMismatchError(
+                expected="square matrix (rows == cols)",
+                got=f"shape {a_inv.shape}",
+                operation="inverse_update",
+            )
+        u = _as_columns(args[1], n, "U", "inverse_update")
+        v = _as_columns(args[2], n, "V", "inverse_update")
+        if u.shape[1] != v.shape[1]:
+            raise ShapeMismatchError(
+                expected=f"V with {u.shape[1]} columns (like U)",
+                got=f"{v.shape[1]} columns",
+                operation="inverse_update",
+            )
+        a_orig: Optional[Any] = kwargs.get("a")
+        cond_limit: float = kwargs.get("cond_limit", WOODBURY_CAPACITANCE_COND_LIMIT)
+        k = u.shape[1]
+
+        trace.record(
+            operation="inverse_update_start",
+            description=f"Rank-{k} Woodbury update of a {n}×{n} inverse",
+            complexity_note=f"O({n}^2 * {k})",
+        )
+
+        a_inv_u = a_inv @ u
+        vt_a_inv = v.T @ a_inv
+        c, cond = capacitance(v, a_inv_u)
+        self._record_checkpoint(
+            f"1. Formed A^-1 U, V^T A^-1 and the {k}×{k} capacitance C = I + V^T A^-1 U "
+            f"(condition {cond:.2e})."
+        )
+
+        if not cond < cond_limit:
+            a_np = (
+                np.asarray(a_orig, dtype=np.float64) if a_orig is not None
+                else _lapack(np.linalg.inv, a_inv)
+            )
+            result = _lapack(np.linalg.inv, a_np + u @ v.T)
+            self._record_checkpoint(
+                f"2. The capacitance condition exceeds {cond_limit:.0e}; refactored and inverted A + U V^T with LAPACK instead."
+            )
+            trace.record(
+                operation="inverse_update_refactor",
+                description=f"Capacitance condition {cond:.2e} too large; recomputed the inverse",
+            )
+        else:
+            result = a_inv - a_inv_u @ np.linalg.solve(c, vt_a_inv)
+            self._record_checkpoint(
+                "2. Subtracted the correction (A^-1 U) C^-1 (V^T A^-1) from A^-1."
+            )
+
+        trace.record(
+            operation="inverse_update_done",
+            description=f"Updated inverse computed for {n}×{n} matrix",
+        )
+        return result
+
+
+class SolveUpdate(BaseSolve):
+    """Solve ``(A + U V^T) x = b`` reusing a factorization of ``A``."""
+
+    metadata = AlgorithmMetadata(
+        name="woodbury_solve_update",
+        operation="solve_update",
+        complexity="O(n^2 k)",
+        stable=False,
+        supports_batch=False,
+        requires_square=True,
+        description=(
+            "Solve a rank-k modified system with k + 1 solves against an existing "
+            "LU / Cholesky factor via Woodbury, refactoring when the capacitance "
+            "matrix is ill-conditioned."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Union[InternalVector, InternalMatrix]:
+        """Solve the updated system.
+
+        Args:
+            args[0]: An :class:`LUFactorization` or :class:`CholeskyFactorization` of A
+            args[1]: U (n×k, or a length-n vector)
+            args[2]: V (n×k, or a length-n vector)
+            args[3]: b (length n, or n×m for several right-hand sides)
+
+        Keyword Args:
+            cond_limit: Capacitance condition number above which
+                ``A + U V^T`` is refactored.
+        """
+        factor: Factorization = args[0]
+        n = factor.n
+        u = _as_columns(args[1], n, "U", "solve_update")
+        v = _as_columns(args[2], n, "V", "solve_update")
+        b = args[3]
+        if u.shape[1] != v.shape[1]:
+            raise ShapeMismatchError(
+                expected=f"V with {u.shape[1]} columns (like U)",
+                got=f"{v.shape[1]} columns",
+                operation="solve_update",
+            )
+        if len(b) != n:
+            raise ShapeMismatchError(
+                expected=f"b length == {n}",
+                got=f"b length == {len(b)}",
+                operation="solve_update",
+            )
+        cond_limit: float = kwargs.get("cond_limit", WOODBURY_CAPACITANCE_COND_LIMIT)
+        k = u.shape[1]
+        kind = "LU" if isinstance(factor, LUFactorization) else "Cholesky"
+
+        trace.record(
+            operation="solve_update_start",
+            description=f"Rank-{k} Woodbury solve on {n}×{n} system using {kind} factor",
+            complexity_note=f"O({n}^2 * {k})",
+        )
+
+        # A^{-1} U and A^{-1} b with one multi-RHS triangular sweep pair
+        is_matrix = isinstance(b[0], list)
+        b_cols = [list(row) for row in b] if is_matrix else [[v_] for v_ in b]
+        rhs = [u_row + b_row for u_row, b_row in zip(u.tolist(), b_cols)]
+        solved = np.array(factor.solve(rhs), dtype=np.float64)
+        a_inv_u, x = solved[:, :k], solved[:, k:]
+        c, cond = capacitance(v, a_inv_u)
+        self._record_checkpoint(
+            f"1. Solved A [U | b] with the existing {kind} factor and formed the "
+            f"{k}×{k} capacitance C = I + V^T A^-1 U (condition {cond:.2e})."
+        )
+
+        if not cond < cond_limit:
+            updated = _factor_matrix(factor) + u @ v.T
+            x = _lapack(np.linalg.solve, updated, np.array(b_cols, dtype=np.float64))
+            self._record_checkpoint(
+                f"2. The capacitance condition exceeds {cond_limit:.0e}; refactored A + U V^T with LAPACK and solved directly."
+            )
+            trace.record(
+                operation="solve_update_refactor",
+                description=f"Capacitance condition {cond:.2e} too large; refactored the updated matrix",
+            )
+        else:
+            x = x - a_inv_u @ np.linalg.solve(c, v.T @ x)
+            self._record_checkpoint("2. Corrected x = A^-1 b - (A^-1 U) C^-1 V^T (A^-1 b).")
+
+        trace.record(
+            operation="solve_update_done",
+            description=f"Solution computed (length {n})",
+        )
+        return x.tolist() if is_matrix else x[:, 0].tolist()
@@ -0,0 +1,12 @@
+# ==============================
+# File: linalg/algorithms/distance/__init__.py
+# ==============================
+"""Distance and kernel algorithm family."""
+
+from mllense.math.linalg.algorithms.distance.pairwise import (
+    KernelMatrix,
+    PairwiseDistances,
+    PairwiseTopK,
+)
+
+__all__ = ["KernelMatrix", "PairwiseDistances", "PairwiseTopK"]
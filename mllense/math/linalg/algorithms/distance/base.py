@@ -0,0 +1,14 @@
+# ==============================
+# File: linalg/algorithms/distance/base.py
+# ==============================
+"""Base class for distance / kernel algorithm family."""
+
+from __future__ import annotations
+
+from mllense.math.linalg.algorithms.base import BaseAlgorithm
+
+__all__ = ["BaseDistance"]
+
+
+class BaseDistance(BaseAlgorithm):
+    """Abstract base for pairwise distance and kernel algorithms."""
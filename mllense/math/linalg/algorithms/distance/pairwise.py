@@ -0,0 +1,367 @@
+# ==============================
+# File: linalg/algorithms/distance/pairwise.py
+# ==============================
+"""Pairwise distances, kernel matrices and k-nearest-neighbour search.
+
+Euclidean-type distances use the norm expansion
+``||x - y||^2 = ||x||^2 - 2 x·y + ||y||^2``, so the O(n_x n_y d) work is a
+single matrix product per block instead of a Python loop over pairs.
+Both inputs are first shifted by the mean of ``Y`` (distances do not
+change): the expansion loses about ``eps · ||x||^2`` to cancellation, so
+data far from the origin would otherwise lose every significant digit.
+It can still round slightly below zero for near-identical points;
+results are clamped at zero, and ``Y = X`` gets an exact zero diagonal.
+
+Rows of ``X`` are processed in blocks sized so that one ``rows × n_y``
+block stays within
+:data:`~mllense.math.linalg._internal.constants.PAIRWISE_CHUNK_BYTES`.
+The top-``k`` search reduces each block as soon as it is computed, so the
+full ``n_x × n_y`` matrix never exists; ``X`` may be an ``np.memmap``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Optional, Tuple
+
+import numpy as np
+
+from mllense.math.linalg._internal.constants import PAIRWISE_CHUNK_BYTES
+from mllense.math.linalg.algorithms.distance.base import BaseDistance
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.exceptions import InvalidInputError, ShapeMismatchError
+
+__all__ = [
+    "KernelMatrix",
+    "PairwiseDistances",
+    "PairwiseTopK",
+    "pairwise_blocks",
+]
+
+DISTANCE_METRICS = ("euclidean", "sqeuclidean", "cosine", "manhattan")
+KERNELS = ("rbf", "laplacian", "linear", "cosine")
+
+
+def _as_samples(x: Any, name: str, operation: str) -> np.ndarray:
+    """Return ``x`` as a 2-D ``(n_samples, n_features)`` float array (memmaps stay mapped)."""
+    arr = x if isinstance(x, np.ndarray) and x.dtype == np.float64 else np.asarray(x, dtype=np.float64)
+    if arr.ndim == 1:
+        arr = arr[None, :]
+    if arr.ndim != 2:
+        raise ShapeMismatchError(
+            expected=f"{name} of shape (n_samples, n_features)",
+            got=f"shape {arr.shape}",
+            operation=operation,
+        )
+    return arr
+
+
+def _check_features(x: np.ndarray, y: np.ndarray, operation: str) -> None:
+    if x.shape[1] != y.shape[1]:
+        raise ShapeMismatchError(
+            expected=f"Y with {x.shape[1]} features (like X)",
+            got=f"{y.shape[1]} features",
+            operation=operation,
+        )
+
+
+def _block_rows(n_y: int, chunk_size: Optional[int]) -> int:
+    if chunk_size is not None:
+        return max(1, int(chunk_size))
+    return max(1, PAIRWISE_CHUNK_BYTES // (8 * max(1, n_y)))
+
+
+def _unit_rows(a: np.ndarray) -> np.ndarray:
+    """Rows scaled to unit 2-norm; all-zero rows stay zero."""
+    norms = np.sqrt(np.einsum("ij,ij->i", a, a))
+    norms[norms == 0.0] = 1.0
+    return a / norms[:, None]
+
+
+def pairwise_blocks(
+    x: np.ndarray,
+    y: np.ndarray,
+    metric: str,
+    *,
+    same: bool = False,
+    chunk_size: Optional[int] = None,
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """Yield ``(start, stop, D[start:stop])`` row blocks of the distance matrix.
+
+    Args:
+        x: ``n_x × d`` samples (read ``chunk_size`` rows at a time).
+        y: ``n_y × d`` samples (held in memory; a centred copy for the
+            euclidean metrics).
+        metric: One of ``euclidean``, ``sqeuclidean``, ``cosine``, ``manhattan``.
+        same: ``y`` is ``x`` — the diagonal is set to exactly zero.
+        chunk_size: Rows per block (default: from the memory budget).
+    """
+    n_x, n_y = x.shape[0], y.shape[0]
+    rows = _block_rows(n_y, chunk_size)
+
+    if metric in ("euclidean", "sqeuclidean"):
+        # centre both sides on Y so the expansion works with small norms
+        shift = y.mean(axis=0)
+        y = y - shift
+        yy = np.einsum("ij,ij->i", y, y)
+    elif metric == "cosine":
+        y_unit = _unit_rows(y)
+
+    for start in range(0, n_x, rows):
+        stop = min(start + rows, n_x)
+        xc = np.asarray(x[start:stop], dtype=np.float64)
+        if metric in ("euclidean", "sqeuclidean"):
+            xc = xc - shift
+            block = xc @ y.T
+            block *= -2.0
+            block += np.einsum("ij,ij->i", xc, xc)[:, None]
+            block += yy[None, :]
+            np.maximum(block, 0.0, out=block)
+        elif metric == "cosine":
+            block = _unit_rows(xc) @ y_unit.T
+            np.subtract(1.0, block, out=block)
+            np.clip(block, 0.0, 2.0, out=block)
+        else:
+            # one feature at a time keeps the temporary at rows × n_y
+            block = np.zeros((stop - start, n_y))
+            for f in range(x.shape[1]):
+                block += np.abs(xc[:, f, None] - y[None, :, f])
+        if same:
+            idx = np.arange(start, stop)
+            block[idx - start, idx] = 0.0
+        if metric == "euclidean":
+            np.sqrt(block, out=block)
+        yield start, stop, block
+
+
+def _validate_metric(metric: str, allowed: Tuple[str, ...], what: str, operation: str) -> None:
+    if metric not in allowed:
+        raise InvalidInputError(
+            f"Unknown {operation} {what} {metric!r}. Valid {what}s: {', '.join(allowed)}."
+        )
+
+
+class PairwiseDistances(BaseDistance):
+    """Compute the full ``n_x × n_y`` distance matrix in row blocks."""
+
+    metadata = AlgorithmMetadata(
+        name="pairwise_distances",
+        operation="pairwise_distances",
+        complexity="O(n_x * n_y * d)",
+        stable=True,
+        supports_batch=True,
+        requires_square=False,
+        description=(
+            "Pairwise euclidean / squared euclidean / cosine / manhattan distances, "
+            "via the ||x||^2 - 2x·y + ||y||^2 matmul expansion where applicable, "
+            "computed in memory-bounded row blocks."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Compute ``D[i][j] = dist(X[i], Y[j])``.
+
+        Args:
+            args[0]: X (``n_x × d``)
+            args[1]: Y (``n_y × d``) or ``None`` for ``Y = X``
+
+        Keyword Args:
+            metric: ``"euclidean"`` (default), ``"sqeuclidean"``, ``"cosine"``
+                or ``"manhattan"``.
+            chunk_size: Rows of ``X`` per block.
+        """
+        metric: str = kwargs.get("metric", "euclidean")
+        chunk_size: Optional[int] = kwargs.get("chunk_size")
+        _validate_metric(metric, DISTANCE_METRICS, "metric", "pairwise_distances")
+        x = _as_samples(args[0], "X", "pairwise_distances")
+        same = args[1] is None
+        y = x if same else _as_samples(args[1], "Y", "pairwise_distances")
+        _check_features(x, y, "pairwise_distances")
+        n_x, n_y = x.shape[0], y.shape[0]
+
+        trace.record(
+            operation="pairwise_distances_start",
+            description=f"{metric} distances between {n_x} and {n_y} samples ({x.shape[1]} features)",
+            complexity_note=f"O({n_x}·{n_y}·{x.shape[1]})",
+        )
+
+        out = np.empty((n_x, n_y))
+        blocks = 0
+        for start, stop, block in pairwise_blocks(x, y, metric, same=same, chunk_size=chunk_size):
+            out[start:stop] = block
+            blocks += 1
+        self._record_checkpoint(
+            f"1. Computed the {n_x}×{n_y} {metric} distance matrix in {blocks} row block(s)"
+            + (" using ||x||^2 - 2x·y + ||y||^2 (one matrix product per block)."
+               if metric in ("euclidean", "sqeuclidean") else ".")
+        )
+
+        trace.record(
+            operation="pairwise_distances_done",
+            description=f"Distance matrix {n_x}×{n_y} computed",
+        )
+        return out
+
+
+class PairwiseTopK(BaseDistance):
+    """Find the ``k`` nearest rows of ``Y`` for each row of ``X`` without the full matrix."""
+
+    metadata = AlgorithmMetadata(
+        name="pairwise_top_k",
+        operation="pairwise_distances",
+        complexity="O(n_x * n_y * d)",
+        stable=True,
+        supports_batch=True,
+        requires_square=False,
+        description=(
+            "k-nearest-neighbour search that reduces each row block of the distance "
+            "matrix with argpartition as soon as it is computed."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(distances, indices)``, both ``n_x × k``, nearest first.
+
+        Args:
+            args[0]: X (``n_x × d``)
+            args[1]: Y (``n_y × d``) or ``None`` for ``Y = X``
+
+        Keyword Args:
+            k: Neighbours per row (required, ``1 <= k <= n_y``).
+            metric: As for :class:`PairwiseDistances`.
+            chunk_size: Rows of ``X`` per block.
+        """
+        metric: str = kwargs.get("metric", "euclidean")
+        k: Optional[int] = kwargs.get("k")
+        chunk_size: Optional[int] = kwargs.get("chunk_size")
+        _validate_metric(metric, DISTANCE_METRICS, "metric", "pairwise_distances")
+        x = _as_samples(args[0], "X", "pairwise_distances")
+        same = args[1] is None
+        y = x if same else _as_samples(args[1], "Y", "pairwise_distances")
+        _check_features(x, y, "pairwise_distances")
+        n_x, n_y = x.shape[0], y.shape[0]
+        if k is None or not 1 <= k <= n_y:
+            raise InvalidInputError(f"top_k must satisfy 1 <= k <= n_y = {n_y}, got {k}.")
+
+        trace.record(
+            operation="pairwise_top_k_start",
+            description=f"{k} nearest of {n_y} samples for each of {n_x} ({metric})",
+        )
+
+        dist = np.empty((n_x, k))
+        idx = np.empty((n_x, k), dtype=np.intp)
+        blocks = 0
+        for start, stop, block in pairwise_blocks(x, y, metric, same=same, chunk_size=chunk_size):
+            if k < n_y:
+                part = np.argpartition(block, k - 1, axis=1)[:, :k]
+            else:
+                part = np.broadcast_to(np.arange(n_y), block.shape).copy()
+            vals = np.take_along_axis(block, part, axis=1)
+            order = np.argsort(vals, axis=1, kind="stable")
+            idx[start:stop] = np.take_along_axis(part, order, axis=1)
+            dist[start:stop] = np.take_along_axis(vals, order, axis=1)
+            blocks += 1
+        self._record_checkpoint(
+            f"1. Streamed {blocks} row block(s) of the {n_x}×{n_y} distance matrix, keeping "
+            f"only the {k} smallest entries per row (argpartition, then a sort of those {k})."
+        )
+
+        trace.record(
+            operation="pairwise_top_k_done",
+            description=f"Neighbour table {n_x}×{k} computed",
+        )
+        return dist, idx
+
+
+class KernelMatrix(BaseDistance):
+    """Compute a kernel (Gram) matrix ``K[i][j] = k(X[i], Y[j])`` in row blocks."""
+
+    metadata = AlgorithmMetadata(
+        name="kernel_matrix",
+        operation="kernel_matrix",
+        complexity="O(n_x * n_y * d)",
+        stable=True,
+        supports_batch=True,
+        requires_square=False,
+        description=(
+            "RBF, Laplacian, linear and cosine kernels built on blocked pairwise "
+            "distances or a single matrix product per block."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Compute the kernel matrix.
+
+        Args:
+            args[0]: X (``n_x × d``)
+            args[1]: Y (``n_y × d``) or ``None`` for ``Y = X``
+
+        Keyword Args:
+            kernel: ``"rbf"`` (default, ``exp(-gamma ||x - y||^2)``),
+                ``"laplacian"`` (``exp(-gamma ||x - y||_1)``), ``"linear"``
+                (``x·y``) or ``"cosine"`` (``x·y / (||x|| ||y||)``).
+            gamma: Bandwidth for ``rbf`` / ``laplacian`` (default ``1 / d``).
+            chunk_size: Rows of ``X`` per block.
+        """
+        kernel: str = kwargs.get("kernel", "rbf")
+        gamma: Optional[float] = kwargs.get("gamma")
+        chunk_size: Optional[int] = kwargs.get("chunk_size")
+        _validate_metric(kernel, KERNELS, "kernel", "kernel_matrix")
+        x = _as_samples(args[0], "X", "kernel_matrix")
+        same = args[1] is None
+        y = x if same else _as_samples(args[1], "Y", "kernel_matrix")
+        _check_features(x, y, "kernel_matrix")
+        n_x, n_y, d = x.shape[0], y.shape[0], x.shape[1]
+        if gamma is None:
+            gamma = 1.0 / max(d, 1)
+
+        trace.record(
+            operation="kernel_matrix_start",
+            description=f"{kernel} kernel between {n_x} and {n_y} samples ({d} features)",
+            complexity_note=f"O({n_x}·{n_y}·{d})",
+        )
+
+        out = np.empty((n_x, n_y))
+        if kernel == "linear":
+            rows = _block_rows(n_y, chunk_size)
+            for start in range(0, n_x, rows):
+                stop = min(start + rows, n_x)
+                out[start:stop] = np.asarray(x[start:stop], dtype=np.float64) @ y.T
+            self._record_checkpoint(f"1. Computed X Y^T in row blocks of {rows}.")
+        else:
+            metric = {"rbf": "sqeuclidean", "laplacian": "manhattan", "cosine": "cosine"}[kernel]
+            for start, stop, block in pairwise_blocks(x, y, metric, same=same, chunk_size=chunk_size):
+                if kernel == "cosine":
+                    np.subtract(1.0, block, out=out[start:stop])
+                else:
+                    np.multiply(block, -gamma, out=block)
+                    np.exp(block, out=out[start:stop])
+            self._record_checkpoint(
+                f"1. Computed blocked {metric} distances and mapped them through the "
+                f"{kernel} kernel" + (f" (gamma = {gamma:.4g})." if kernel != "cosine" else ".")
+            )
+
+        trace.record(
+            operation="kernel_matrix_done",
+            description=f"Kernel matrix {n_x}×{n_y} computed",
+        )
+        return out
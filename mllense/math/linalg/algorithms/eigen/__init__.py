@@ -4,6 +4,8 @@
 """Eigen algorithm family."""
 
 from mllense.math.linalg.algorithms.eigen.dominant import DominantEigen
+from mllense.math.linalg.algorithms.eigen.krylov import ArnoldiEigen, LanczosEigen
 from mllense.math.linalg.algorithms.eigen.power_iteration import PowerIteration
+from mllense.math.linalg.algorithms.eigen.subspace_iteration import SubspaceIteration
 
-__all__ = ["PowerIteration", "DominantEigen"]
+__all__ = ["PowerIteration", "DominantEigen", "LanczosEigen", "ArnoldiEigen", "SubspaceIteration"]
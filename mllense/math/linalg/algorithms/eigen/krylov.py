@@ -0,0 +1,347 @@
+# ==============================
+# File: linalg/algorithms/eigen/krylov.py
+# ==============================
+"""Implicitly restarted Lanczos / Arnoldi for a few eigenpairs.
+
+Only matrix-vector products with ``A`` are needed, so the operator may
+be a dense matrix, anything supporting ``@`` (e.g. a sparse matrix) or a
+plain ``matvec(x)`` callback.  An ``m``-step Krylov factorization
+``A V_m = V_m H_m + f e_m^T`` is built with full (DGKS) reorthogonalization;
+the unwanted Ritz values are then used as exact shifts in ``m - k``
+implicit QR steps on ``H_m`` (Sorensen, 1992), which compresses the
+factorization to the wanted ``k``-dimensional subspace without any new
+matvecs.  ``H_m`` is tridiagonal (Lanczos) for symmetric operators and
+upper Hessenberg (Arnoldi) otherwise.
+
+Shift-invert mode iterates with ``(A - σI)^{-1}``, whose largest
+eigenvalues correspond to the eigenvalues of ``A`` nearest ``σ``.  The
+shifted matrix is densified and inverted once by LAPACK (``getrf`` +
+``getri``), after which every step is one O(n^2) product — so it needs
+O(n^2) memory and one O(n^3) factorization, and suits operators that fit
+densely in memory.  For a large sparse operator, pass a callback that
+applies ``(A - σI)^{-1}`` with a sparse factorization instead, with
+``which="LM"``, and map the results back with ``λ = σ + 1/θ``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from mllense.math.linalg.algorithms.eigen.base import BaseEigen
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.exceptions import (
+    InvalidInputError,
+    NumericalInstabilityError,
+    ShapeMismatchError,
+    SingularMatrixError,
+)
+
+__all__ = ["ArnoldiEigen", "LanczosEigen", "implicitly_restarted_eigen"]
+
+_EPS = np.finfo(np.float64).eps
+_WHICH = ("LM", "SM", "LA", "SA")
+_MAX_RESTARTS = 300
+_CONVERGENCE_TOL = 1e-10
+
+Matvec = Callable[[np.ndarray], np.ndarray]
+
+
+def _sort_key(theta: np.ndarray, which: str) -> np.ndarray:
+    if which == "LM":
+        return -np.abs(theta)
+    if which == "SM":
+        return np.abs(theta)
+    if which == "LA":
+        return -theta.real
+    return theta.real
+
+
+def _orthogonalize(v: np.ndarray, basis: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Classical Gram-Schmidt applied twice (DGKS)."""
+    h = basis.conj().T @ v
+    v = v - basis @ h
+    h2 = basis.conj().T @ v
+    return v - basis @ h2, h + h2
+
+
+def _extend(
+    op: Matvec, v: np.ndarray, h: np.ndarray, start: int, m: int, rng: np.random.Generator
+) -> None:
+    """Grow the Krylov factorization in place from ``start`` to ``m`` columns."""
+    for j in range(start, m):
+        w, coeffs = _orthogonalize(op(v[:, j]), v[:, : j + 1])
+        h[: j + 1, j] = coeffs
+        beta = np.linalg.norm(w)
+        if beta <= _EPS * max(np.linalg.norm(coeffs), 1.0):
+            # invariant subspace found: continue from a fresh direction
+            w, _ = _orthogonalize(rng.uniform(-1.0, 1.0, v.shape[0]).astype(v.dtype), v[:, : j + 1])
+            v[:, j + 1] = w / np.linalg.norm(w)
+            h[j + 1, j] = 0.0
+        else:
+            v[:, j + 1] = w / beta
+            h[j + 1, j] = beta
+
+
+def implicitly_restarted_eigen(
+    op: Matvec,
+    n: int,
+    k: int,
+    *,
+    symmetric: bool,
+    which: str = "LM",
+    ncv: Optional[int] = None,
+    tol: float = _CONVERGENCE_TOL,
+    max_restarts: int = _MAX_RESTARTS,
+    v0: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None,
+    trace: Optional[Trace] = None,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Return ``(theta, X, restarts)`` — the ``k`` wanted Ritz pairs of ``op``.
+
+    Args:
+        op: ``x -> A x`` on length-``n`` vectors.
+        n: Operator dimension.
+        k: Number of eigenpairs.
+        symmetric: Use Lanczos (real, tridiagonal ``H``) instead of Arnoldi
+            (complex arithmetic, Hessenberg ``H``).
+        which: ``"LM"``, ``"SM"``, ``"LA"`` or ``"SA"`` (``"LA"``/``"SA"``
+            compare real parts for non-symmetric operators).
+        ncv: Krylov subspace size ``m`` (default ``max(2k + 1, 20)``, at most ``n``).
+        tol: Residual ``|h_{m+1,m}| |e_m^T s|`` relative to the largest
+            Ritz value magnitude for convergence.
+        max_restarts: Restart budget before giving up.
+        v0: Starting vector (random if omitted).
+
+    Raises:
+        NumericalInstabilityError: If fewer than ``k`` pairs converge.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    m = min(n, ncv if ncv is not None else max(2 * k + 1, 20))
+    if m <= k:
+        raise InvalidInputError(f"ncv must exceed k (got ncv={m}, k={k}, n={n}).")
+
+    dtype = np.float64 if symmetric else np.complex128
+    if symmetric:
+        matvec = op
+    else:
+        def matvec(x: np.ndarray) -> np.ndarray:
+            y = np.asarray(op(x.real), dtype=np.complex128)
+            if np.any(x.imag):
+                y = y + 1j * np.asarray(op(x.imag), dtype=np.float64)
+            return y
+
+    v = np.zeros((n, m + 1), dtype=dtype)
+    h = np.zeros((m + 1, m), dtype=dtype)
+    start = np.asarray(v0, dtype=dtype) if v0 is not None else rng.uniform(-1.0, 1.0, n).astype(dtype)
+    v[:, 0] = start / np.linalg.norm(start)
+    kept = 0
+
+    for restart in range(max_restarts):
+        _extend(matvec, v, h, kept, m, rng)
+        hm = h[:m, :m]
+        if symmetric:
+            theta, s = np.linalg.eigh(0.5 * (hm + hm.T))
+        else:
+            theta, s = np.linalg.eig(hm)
+        order = np.argsort(_sort_key(theta, which), kind="stable")
+        theta, s = theta[order], s[:, order]
+
+        beta = abs(h[m, m - 1])
+        residuals = beta * np.abs(s[m - 1, :k])
+        # residuals are measured against the spectral scale (largest Ritz
+        # value), so eigenvalues at or near zero can still converge
+        scale = max(float(np.max(np.abs(theta))), _EPS)
+        converged = residuals <= tol * scale
+        nconv = int(np.count_nonzero(converged))
+        if trace is not None:
+            trace.record(
+                operation="krylov_restart",
+                description=f"Restart {restart}: {nconv}/{k} Ritz pairs converged, "
+                            f"max residual {float(residuals.max()):.2e}",
+            )
+        if nconv >= k:
+            x = v[:, :m] @ s[:, :k]
+            x /= np.linalg.norm(x, axis=0)
+            return theta[:k], x, restart
+
+        # keep k (plus some converged extras, as ARPACK does) and apply the
+        # remaining Ritz values as exact shifts
+        keep = min(k + min(nconv, (m - k) // 2), m - 1)
+        q = np.eye(m, dtype=dtype)
+        hm = hm.copy()
+        eye = np.eye(m, dtype=dtype)
+        for mu in theta[keep:]:
+            qj, _ = np.linalg.qr(hm - mu * eye)
+            hm = qj.conj().T @ hm @ qj
+            q = q @ qj
+
+        f = v[:, :m] @ q[:, keep] * hm[keep, keep - 1] + h[m, m - 1] * q[m - 1, keep - 1] * v[:, m]
+        v[:, :keep] = v[:, :m] @ q[:, :keep]
+        h[:] = 0.0
+        h[:keep, :keep] = hm[:keep, :keep]
+        beta_k = np.linalg.norm(f)
+        if beta_k <= _EPS:
+            f, _ = _orthogonalize(rng.uniform(-1.0, 1.0, n).astype(dtype), v[:, :keep])
+            v[:, keep] = f / np.linalg.norm(f)
+        else:
+            v[:, keep] = f / beta_k
+            h[keep, keep - 1] = beta_k
+        kept = keep
+
+    raise NumericalInstabilityError(
+        f"Only {nconv} of {k} eigenpairs converged after {max_restarts} restarts; "
+        f"increase ncv or max_restarts, or loosen tol."
+    )
+
+
+def _as_operator(a: Any, n: Optional[int], sigma: Optional[float], trace: Trace) -> Tuple[Matvec, int]:
+    """Return ``(matvec, n)`` for a matrix, an ``@``-capable object or a callback."""
+    if callable(a) and not hasattr(a, "shape"):
+        if n is None:
+            raise InvalidInputError("n is required when the operator is a matvec callback.")
+        if sigma is not None:
+            raise InvalidInputError(
+                "Shift-invert needs an explicit matrix; for a callback operator pass one "
+                "applying (A - sigma*I)^-1 with which='LM' and map eigenvalues back as sigma + 1/theta."
+            )
+        return (lambda x: np.asarray(a(x), dtype=np.float64)), n
+
+    if not hasattr(a, "shape"):
+        a = np.array(a, dtype=np.float64)
+    rows, cols = a.shape
+    if rows != cols:
+        raise ShapeMismatchError(expected="square operator", got=f"{rows}×{cols}", operation="krylov_eigen")
+
+    if sigma is None:
+        return (lambda x: np.asarray(a @ x, dtype=np.float64)), rows
+
+    shifted = np.array(a.toarray() if hasattr(a, "toarray") else a, dtype=np.float64)
+    shifted[np.diag_indices(rows)] -= sigma
+    try:
+        shifted_inv = np.linalg.inv(shifted)
+    except np.linalg.LinAlgError as exc:
+        raise SingularMatrixError(f"A - {sigma}·I is singular; sigma is an eigenvalue of A.") from exc
+    trace.record(
+        operation="krylov_shift_invert",
+        description=f"Inverted A - {sigma}·I ({rows}×{rows}) once with LAPACK",
+    )
+    return (lambda x: shifted_inv @ x), rows
+
+
+class _KrylovEigen(BaseEigen):
+    """Shared driver for the Lanczos and Arnoldi front-ends."""
+
+    _symmetric = True
+    _label = "Lanczos"
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find ``k`` eigenpairs.
+
+        Args:
+            args[0]: Operator — square matrix, object supporting ``@``, or a
+                ``matvec(x)`` callback (then ``n`` is required).
+
+        Keyword Args:
+            k: Number of eigenpairs (default 6).
+            n: Dimension of a callback operator.
+            which: ``"LM"`` (default), ``"SM"``, ``"LA"`` or ``"SA"``.
+            sigma: Shift for shift-invert mode (eigenvalues nearest ``sigma``).
+            v0, ncv, tol, max_restarts, random_state: Solver controls.
+
+        Returns:
+            (eigenvalues, eigenvectors) with eigenvectors as columns.
+        """
+        k: int = kwargs.get("k", 6)
+        which: str = kwargs.get("which", "LM")
+        sigma: Optional[float] = kwargs.get("sigma")
+        if which not in _WHICH:
+            raise InvalidInputError(f"Unknown which={which!r}. Valid: {', '.join(_WHICH)}.")
+
+        op, n = _as_operator(args[0], kwargs.get("n"), sigma, trace)
+        if not 1 <= k < n:
+            raise InvalidInputError(f"k must satisfy 1 <= k < n = {n}, got {k}.")
+
+        trace.record(
+            operation="krylov_start",
+            description=f"{self._label} for {k} eigenpair(s) of {n}×{n} operator (which={which}"
+                        + (f", shift-invert σ={sigma})" if sigma is not None else ")"),
+        )
+        self._record_checkpoint(
+            f"1. Operator of size {n} ready"
+            + (f"; inverted A - {sigma}·I once with LAPACK for shift-invert." if sigma is not None else ".")
+        )
+
+        theta, x, restarts = implicitly_restarted_eigen(
+            op,
+            n,
+            k,
+            symmetric=self._symmetric,
+            # shift-invert maps the eigenvalues nearest sigma to the largest ones
+            which="LM" if sigma is not None else which,
+            ncv=kwargs.get("ncv"),
+            tol=kwargs.get("tol", _CONVERGENCE_TOL),
+            max_restarts=kwargs.get("max_restarts", _MAX_RESTARTS),
+            v0=kwargs.get("v0"),
+            rng=np.random.default_rng(kwargs.get("random_state")),
+            trace=trace,
+        )
+        self._record_checkpoint(
+            f"2. Converged after {restarts} implicit restart(s) using unwanted Ritz values as shifts."
+        )
+        if sigma is not None:
+            theta = sigma + 1.0 / theta
+            self._record_checkpoint("3. Mapped Ritz values back: λ = σ + 1/θ.")
+
+        if self._symmetric:
+            order = np.argsort(theta)
+            theta, x = theta.real[order], x[:, order]
+
+        trace.record(
+            operation="krylov_converged",
+            description=f"{self._label} converged after {restarts} restart(s): {theta.tolist()}",
+        )
+        return theta, x
+
+
+class LanczosEigen(_KrylovEigen):
+    """Implicitly restarted Lanczos for a few eigenpairs of a symmetric operator."""
+
+    _symmetric = True
+    _label = "Lanczos"
+
+    metadata = AlgorithmMetadata(
+        name="implicitly_restarted_lanczos",
+        operation="eigsh",
+        complexity="O(n * ncv * restarts) matvecs + O(n * ncv^2) orthogonalization",
+        stable=True,
+        supports_batch=False,
+        requires_square=True,
+        description="Implicitly restarted Lanczos with full reorthogonalization and optional shift-invert.",
+    )
+
+
+class ArnoldiEigen(_KrylovEigen):
+    """Implicitly restarted Arnoldi for a few eigenpairs of a general operator."""
+
+    _symmetric = False
+    _label = "Arnoldi"
+
+    metadata = AlgorithmMetadata(
+        name="implicitly_restarted_arnoldi",
+        operation="eigs",
+        complexity="O(n * ncv * restarts) matvecs + O(n * ncv^2) orthogonalization",
+        stable=True,
+        supports_batch=False,
+        requires_square=True,
+        description="Implicitly restarted Arnoldi (complex arithmetic) with optional shift-invert.",
+    )
@@ -14,7 +14,7 @@ from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix, InternalVector
 from mllense.math.linalg.core.validation import validate_square
-from mllense.math.linalg.exceptions import NumericalInstabilityError
+from mllense.math.linalg.exceptions import NumericalInstabilityError, ShapeMismatchError
 
 __all__ = ["PowerIteration"]
 
@@ -50,6 +50,9 @@ class PowerIteration(BaseEigen):
         Keyword Args:
             max_iterations: Max iterations (default 1000).
             tolerance: Convergence tolerance (default 1e-10).
+            x0: Warm-start vector (default: the normalized all-ones vector).
+            shift: Iterate with ``A - shift·I`` to widen the eigengap; the
+                returned eigenvalue is that of ``A`` (default 0.0).
 
         Returns:
             (eigenvalue, eigenvector)
@@ -58,21 +61,33 @@ class PowerIteration(BaseEigen):
         n = validate_square(a, operation="power_iteration")
         max_iter: int = kwargs.get("max_iterations", _MAX_ITERATIONS)
         tol: float = kwargs.get("tolerance", _CONVERGENCE_TOL)
+        x0 = kwargs.get("x0")
+        shift: float = kwargs.get("shift", 0.0)
 
         trace.record(
             operation="power_iter_start",
             description=f"Power iteration on {n}×{n} matrix, max_iter={max_iter}",
         )
 
-        # initial vector: [1, 1, ..., 1] normalized
-        b: InternalVector = [1.0 / math.sqrt(n)] * n
+        if x0 is not None:
+            if len(x0) != n:
+                raise ShapeMismatchError(
+                    expected=f"x0 of length {n}", got=f"length {len(x0)}", operation="power_iteration"
+                )
+            x0_norm = math.sqrt(math.fsum(x * x for x in x0))
+            if x0_norm < 1e-15:
+                raise NumericalInstabilityError("Warm-start vector x0 has zero norm.")
+            b: InternalVector = [x / x0_norm for x in x0]
+        else:
+            # initial vector: [1, 1, ..., 1] normalized
+            b = [1.0 / math.sqrt(n)] * n
         eigenvalue = 0.0
 
         for iteration in range(max_iter):
             # matrix-vector multiply: Ab
             ab: InternalVector = [0.0] * n
             for i in range(n):
-                ab[i] = math.fsum(a[i][j] * b[j] for j in range(n))
+                ab[i] = math.fsum(a[i][j] * b[j] for j in range(n)) - shift * b[i]
 
             # compute eigenvalue estimate (Rayleigh quotient)
             new_eigenvalue = math.fsum(ab[i] * b[i] for i in range(n))
@@ -91,15 +106,15 @@ class PowerIteration(BaseEigen):
                 trace.record(
                     operation="power_iter_converged",
                     description=f"Converged at iteration {iteration + 1}, "
-                                f"eigenvalue = {new_eigenvalue}",
+                                f"eigenvalue = {new_eigenvalue + shift}",
                 )
-                return new_eigenvalue, b
+                return new_eigenvalue + shift, b
 
             eigenvalue = new_eigenvalue
 
         trace.record(
             operation="power_iter_done",
-            description=f"Max iterations reached. Best eigenvalue = {eigenvalue}",
+            description=f"Max iterations reached. Best eigenvalue = {eigenvalue + shift}",
         )
 
-        return eigenvalue, b
+        return eigenvalue + shift, b
@@ -5,6 +5,7 @@
 
 from mllense.math.linalg.algorithms.elementwise.add import ElementwiseAdd
 from mllense.math.linalg.algorithms.elementwise.divide import ElementwiseDivide
+from mllense.math.linalg.algorithms.elementwise.implicit import ImplicitAlgebra
 from mllense.math.linalg.algorithms.elementwise.multiply import ElementwiseMultiply
 from mllense.math.linalg.algorithms.elementwise.scalar import ScalarAdd, ScalarMultiply
 from mllense.math.linalg.algorithms.elementwise.subtract import ElementwiseSubtract
@@ -16,4 +17,5 @@ __all__ = [
     "ElementwiseDivide",
     "ScalarMultiply",
     "ScalarAdd",
+    "ImplicitAlgebra",
 ]
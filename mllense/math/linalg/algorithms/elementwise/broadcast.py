@@ -0,0 +1,131 @@
+# ==============================
+# File: linalg/algorithms/elementwise/broadcast.py
+# ==============================
+"""NumPy-style broadcasting for the element-wise family.
+
+Shapes are aligned on their trailing dimensions; a dimension of size 1
+(or a missing leading one) is stretched to match the other operand.
+Nothing is replicated: a stretched dimension gets stride 0, so the same
+stored element is read for every position along it.  For the internal
+list format that is the index arithmetic in :func:`broadcast_apply`; for
+ndarrays the ufuncs already iterate with stride-0 views.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from mllense.math.linalg.core.types import InternalMatrix
+from mllense.math.linalg.core.validation import validate_numeric, validate_out
+from mllense.math.linalg.exceptions import EmptyMatrixError, ShapeMismatchError
+
+__all__ = ["broadcast_apply", "broadcast_shapes", "broadcast_strides", "broadcast_ufunc", "unaliased_rows"]
+
+
+def broadcast_shapes(
+    a_shape: Sequence[int],
+    b_shape: Sequence[int],
+    operation: str,
+) -> Tuple[int, ...]:
+    """Return the broadcast result shape, or raise :class:`ShapeMismatchError`."""
+    ndim = max(len(a_shape), len(b_shape))
+    a_full = (1,) * (ndim - len(a_shape)) + tuple(a_shape)
+    b_full = (1,) * (ndim - len(b_shape)) + tuple(b_shape)
+    out = []
+    for da, db in zip(a_full, b_full):
+        if da != db and da != 1 and db != 1:
+            raise ShapeMismatchError(
+                expected=f"shapes broadcastable with {'×'.join(map(str, a_shape))}",
+                got="×".join(map(str, b_shape)),
+                operation=operation,
+            )
+        out.append(db if da == 1 else da)
+    return tuple(out)
+
+
+def broadcast_strides(shape: Sequence[int], out_shape: Sequence[int]) -> Tuple[int, ...]:
+    """Per-dimension index multipliers: ``0`` where ``shape`` is stretched, else ``1``."""
+    full = (1,) * (len(out_shape) - len(shape)) + tuple(shape)
+    return tuple(0 if d == 1 and o != 1 else 1 for d, o in zip(full, out_shape))
+
+
+def unaliased_rows(
+    x: InternalMatrix, out: InternalMatrix, row_stride: int = 1, col_stride: int = 1
+) -> InternalMatrix:
+    """The rows of operand ``x`` as read while writing ``out`` row by row.
+
+    A row of ``x`` that is also a row of ``out`` is copied first, unless it
+    is ``out[i]`` read only at row ``i`` and column ``j`` before ``out[i][j]``
+    is written — the plain ``a += b`` case.  Anything else (a stretched row
+    or column, or a row shared with another position of ``out``) would
+    read elements that were already overwritten.  Costs O(rows) unless
+    such a row exists.
+    """
+    out_ids = {id(row) for row in out}
+    in_place = row_stride and col_stride
+    return [
+        row[:] if id(row) in out_ids and not (in_place and i < len(out) and row is out[i]) else row
+        for i, row in enumerate(x)
+    ]
+
+
+def broadcast_apply(
+    a: InternalMatrix,
+    b: InternalMatrix,
+    fn: Callable[[float, float], float],
+    operation: str,
+    out: Optional[InternalMatrix] = None,
+) -> InternalMatrix:
+    """Apply ``fn`` element-wise to two broadcast-compatible list matrices.
+
+    With ``out`` the result is written into that list of lists (which may
+    be ``a`` itself, or share rows with ``b``) and no new rows are
+    allocated beyond copies of aliased rows.  Both operands are checked
+    for non-numeric elements before anything is written.
+    """
+    a_shape = (len(a), len(a[0]) if a else 0)
+    b_shape = (len(b), len(b[0]) if b else 0)
+    if 0 in a_shape or 0 in b_shape:
+        raise EmptyMatrixError(f"Cannot apply {operation} to empty matrices.")
+    rows, cols = broadcast_shapes(a_shape, b_shape, operation)
+    ar, ac = broadcast_strides(a_shape, (rows, cols))
+    br, bc = broadcast_strides(b_shape, (rows, cols))
+    if out is None:
+        return [
+            [fn(a[i * ar][j * ac], b[i * br][j * bc]) for j in range(cols)]
+            for i in range(rows)
+        ]
+    validate_out(out, (rows, cols), operation)
+    validate_numeric(a, operation)
+    validate_numeric(b, operation)
+    a = unaliased_rows(a, out, ar, ac)
+    b = unaliased_rows(b, out, br, bc)
+    for i in range(rows):
+        row_a, row_b, row_out = a[i * ar], b[i * br], out[i]
+        for j in range(cols):
+            row_out[j] = fn(row_a[j * ac], row_b[j * bc])
+    return out
+
+
+def broadcast_ufunc(
+    a: Any,
+    b: Any,
+    ufunc: np.ufunc,
+    operation: str,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Apply a binary ufunc to two broadcast-compatible arrays of any rank.
+
+    With ``out`` (exactly the broadcast shape) nothing is allocated.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    if a.size == 0 or b.size == 0:
+        raise EmptyMatrixError(f"Cannot apply {operation} to empty matrices.")
+    shape = broadcast_shapes(a.shape, b.shape, operation)
+    if out is None:
+        return ufunc(a, b)
+    validate_out(out, shape, operation)
+    return ufunc(a, b, out=out)
@@ -5,22 +5,35 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Union
+
+import numpy as np
 
 from mllense.math.linalg.algorithms.elementwise.base import BaseElementwise
+from mllense.math.linalg.algorithms.elementwise.broadcast import broadcast_apply, broadcast_ufunc
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
-from mllense.math.linalg.exceptions import (
-    ShapeMismatchError,
-    EmptyMatrixError,
-    NumericalInstabilityError,
-)
+from mllense.math.linalg.exceptions import NumericalInstabilityError
 
 __all__ = ["ElementwiseDivide"]
 
 
+def _checked_divide(x: float, y: float) -> float:
+    if y == 0.0:
+        raise NumericalInstabilityError(f"Division by zero ({x} / 0).")
+    return x / y
+
+
+def _check_divisor(b: InternalMatrix) -> None:
+    """Reject a zero divisor before anything is written into ``out``."""
+    for i, row in enumerate(b):
+        for j, v in enumerate(row):
+            if v == 0:
+                raise NumericalInstabilityError(f"Division by zero at element {[i, j]} of the divisor.")
+
+
 class ElementwiseDivide(BaseElementwise):
     """Element-wise division: ``C[i][j] = A[i][j] / B[i][j]``."""
 
@@ -29,9 +42,9 @@ class ElementwiseDivide(BaseElementwise):
         operation="divide",
         complexity="O(m*n)",
         stable=True,
-        supports_batch=False,
+        supports_batch=True,
         requires_square=False,
-        description="Element-wise matrix division.",
+        description="Element-wise matrix division with NumPy-style broadcasting.",
     )
 
     def execute(
@@ -40,38 +53,33 @@ class ElementwiseDivide(BaseElementwise):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
-        a: InternalMatrix = args[0]
-        b: InternalMatrix = args[1]
-
-        a_rows = len(a)
-        a_cols = len(a[0]) if a_rows else 0
-        b_rows = len(b)
-        b_cols = len(b[0]) if b_rows else 0
+    ) -> Union[InternalMatrix, np.ndarray]:
+        """Args: args[0], args[1] = broadcast-compatible list matrices or ndarrays.
 
-        if a_rows == 0 or a_cols == 0:
-            raise EmptyMatrixError("Cannot divide empty matrices.")
+        Keyword Args:
+            out: Optional list / ndarray of the result shape to write into.
+        """
+        a = args[0]
+        b = args[1]
+        out = kwargs.get("out")
 
-        if a_rows != b_rows or a_cols != b_cols:
-            raise ShapeMismatchError(
-                expected=f"same shape ({a_rows}×{a_cols})",
-                got=f"({b_rows}×{b_cols})",
-                operation="divide",
-            )
+        if isinstance(out, np.ndarray) or (out is None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray))):
+            b_arr = np.asarray(b, dtype=np.float64)
+            if not b_arr.all():
+                zeros = np.argwhere(b_arr == 0.0)
+                raise NumericalInstabilityError(
+                    f"Division by zero at element {list(map(int, zeros[0]))} of the divisor."
+                )
+            result = broadcast_ufunc(a, b_arr, np.divide, "divide", out=out)
+        else:
+            if out is not None:
+                # a failure found mid-loop would leave out (often a itself) half-divided
+                _check_divisor(b)
+            result = broadcast_apply(a, b, _checked_divide, "divide", out=out)
 
+        shape = "×".join(map(str, np.shape(result)))
         trace.record(
             operation="elementwise_divide",
-            description=f"Element-wise dividing {a_rows}×{a_cols} matrices",
+            description=f"Element-wise dividing {shape} matrices",
         )
-
-        result: InternalMatrix = []
-        for i in range(a_rows):
-            row: list[float] = []
-            for j in range(a_cols):
-                if b[i][j] == 0.0:
-                    raise NumericalInstabilityError(
-                        f"Division by zero at element [{i}][{j}]."
-                    )
-                row.append(a[i][j] / b[i][j])
-            result.append(row)
         return result
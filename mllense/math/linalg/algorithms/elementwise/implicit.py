@@ -0,0 +1,309 @@
+# ==============================
+# File: linalg/algorithms/elementwise/implicit.py
+# ==============================
+"""O(1) / O(n) algebra on implicit constant matrices.
+
+When an operand of ``add``, ``subtract``, ``multiply``, ``divide``,
+``scalar_multiply``, ``scalar_add``, ``matmul`` or ``matrix_trace`` is a
+:class:`~mllense.math.linalg.core.constant.ConstantMatrix` or
+:class:`~mllense.math.linalg.core.constant.ScaledIdentity`, the API
+first asks :class:`ImplicitAlgebra` for a closed-form result:
+
+* implicit ⊕ implicit stays implicit (``2I + 3I = 5I``, ``c·1 @ d·1``);
+* ``I @ X = X``, ``(cI) @ X = cX``, ``X + 0 = X``, ``X * c·1 = cX`` —
+  as a float copy of ``X``, never ``X`` itself, so in-place ops on the
+  result cannot reach the input;
+* ``X + cI`` copies ``X`` once and touches only its diagonal (in place —
+  O(n) — for ``add_``), as in regularized solves ``A + λI``;
+* ``(c·1) @ X`` needs only the column sums of ``X``;
+* ``trace(cI) = c·n``.
+
+A result involving a dense operand keeps that operand's format (list,
+view or ndarray).  Shapes the rules do not cover return
+``NotImplemented`` and the caller falls back to the dense algorithm,
+which reads the implicit operand element by element.
+"""
+
+from __future__ import annotations
+
+import numbers
+from typing import Any, Tuple
+
+import numpy as np
+
+from mllense.math.linalg.algorithms.elementwise.base import BaseElementwise
+from mllense.math.linalg.core.constant import ConstantMatrix, ImplicitMatrix, ScaledIdentity, shape_of
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata, LinalgResult
+from mllense.math.linalg.core.trace import Trace
+
+__all__ = ["ImplicitAlgebra"]
+
+
+def _unwrap(x: Any) -> Any:
+    return x.value if isinstance(x, LinalgResult) else x
+
+
+def _is_scalar(x: Any) -> bool:
+    return isinstance(x, numbers.Real) and not isinstance(x, bool)
+
+
+def _is_identity(x: Any) -> bool:
+    return isinstance(x, ScaledIdentity) and x.is_square
+
+
+def _is_zero(x: Any) -> bool:
+    return isinstance(x, ConstantMatrix) and x.value == 0.0
+
+
+def _scale(x: Any, c: float) -> Any:
+    """``c * x`` in ``x``'s own format, as new floats even when ``c == 1``.
+
+    Only read-only implicit matrices are ever handed back unchanged; a
+    dense ``x`` is the caller's and may be modified in place later.
+    """
+    if isinstance(x, ImplicitMatrix):
+        return x if c == 1.0 else x.scaled(c)
+    c = float(c)
+    if isinstance(x, np.ndarray):
+        return x * c
+    if _is_scalar(x):
+        return x * c
+    if len(shape_of(x)) == 1:
+        return [c * v for v in x]
+    return [[c * v for v in row] for row in x]
+
+
+def _full(shape: Tuple[int, ...], value: float, numpy: bool) -> Any:
+    """A dense constant result of ``shape`` (a float for shape ``()``)."""
+    if not shape:
+        return np.float64(value) if numpy else float(value)
+    if numpy:
+        return np.full(shape, value)
+    if len(shape) == 1:
+        return [value] * shape[0]
+    return [[value] * shape[1] for _ in range(shape[0])]
+
+
+def _covers(dense_shape: Tuple[int, ...], implicit: ImplicitMatrix) -> bool:
+    """Whether ``implicit`` broadcasts into ``dense_shape`` without enlarging it."""
+    try:
+        return np.broadcast_shapes(dense_shape, implicit.shape) == dense_shape
+    except ValueError:
+        return False
+
+
+def _copy_into(x: Any, out: Any) -> Any:
+    """``out`` holding a copy of ``x`` (a fresh float copy if ``out`` is None)."""
+    if out is None:
+        if isinstance(x, np.ndarray):
+            return np.array(x, dtype=np.float64)
+        return [[float(v) for v in row] for row in x]
+    if out is not x:
+        if isinstance(out, np.ndarray):
+            out[...] = x
+        else:
+            for row_out, row in zip(out, x):
+                row_out[:] = row
+    return out
+
+
+class ImplicitAlgebra(BaseElementwise):
+    """Closed-form results for ops with an implicit constant operand."""
+
+    metadata = AlgorithmMetadata(
+        name="implicit_algebra",
+        operation="implicit_algebra",
+        complexity="O(1) to O(n*k)",
+        stable=True,
+        supports_batch=False,
+        requires_square=False,
+        description=(
+            "Algebra on implicit constant matrices (zeros, ones, identity, scaled identity) "
+            "without materializing them: I @ X = X, X + 0 = X, (cI) @ X = cX, trace(cI) = cn."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Any:
+        """Args: args[0] = op name, args[1:] = operands.
+
+        Keyword Args:
+            out: Optional dense buffer for ``add`` / ``subtract`` results.
+
+        Returns:
+            The result, or ``NotImplemented`` if no closed form applies.
+        """
+        op: str = args[0]
+        operands = [_unwrap(x) for x in args[1:]]
+        out = kwargs.get("out")
+        if out is not None and op not in ("add", "subtract"):
+            return NotImplemented
+        handler = getattr(self, f"_{op}", None)
+        if handler is None:
+            return NotImplemented
+        result = handler(*operands, out=out) if op in ("add", "subtract") else handler(*operands)
+        if result is not NotImplemented:
+            trace.record(operation="implicit_algebra", description=f"{op} on implicit operand(s) in closed form")
+        return result
+
+    # ── element-wise ────────────────────────────────────────────────── #
+    def _add(self, a: Any, b: Any, out: Any = None) -> Any:
+        if isinstance(a, ImplicitMatrix) and isinstance(b, ImplicitMatrix):
+            if out is not None or a.shape != b.shape:
+                return NotImplemented
+            if isinstance(a, ConstantMatrix) and isinstance(b, ConstantMatrix):
+                self._record_checkpoint(f"1. const({a.value}) + const({b.value}) = const({a.value + b.value}), O(1).")
+                return ConstantMatrix(*a.shape, a.value + b.value)
+            if isinstance(a, ScaledIdentity) and isinstance(b, ScaledIdentity):
+                self._record_checkpoint(f"1. {a.scale}·I + {b.scale}·I = {a.scale + b.scale}·I, O(1).")
+                return ScaledIdentity(*a.shape, a.scale + b.scale)
+            if _is_zero(a) or _is_zero(b):
+                self._record_checkpoint("1. Adding an implicit zero matrix leaves the other operand unchanged.")
+                return b if _is_zero(a) else a
+            return NotImplemented
+        c, d = (a, b) if isinstance(a, ImplicitMatrix) else (b, a)
+        if _is_scalar(d):
+            if out is None and isinstance(c, ConstantMatrix):
+                self._record_checkpoint(f"1. const({c.value}) + {d} = const({c.value + d}), O(1).")
+                return ConstantMatrix(*c.shape, c.value + d)
+            return NotImplemented
+        if not _covers(shape_of(d), c):
+            return NotImplemented
+        if _is_zero(c):
+            self._record_checkpoint("1. X + 0 = X: the implicit zero matrix is skipped; X is copied once.")
+            return _copy_into(d, out)
+        if isinstance(c, ConstantMatrix):
+            self._record_checkpoint(f"1. X + const({c.value}): one scalar shift of X; the constant is never built.")
+            if isinstance(out, np.ndarray) or (out is None and isinstance(d, np.ndarray)):
+                return np.add(d, c.value, out=out)
+            res = _copy_into(d, out)
+            for row in res:
+                for j in range(len(row)):
+                    row[j] += c.value
+            return res
+        if not _is_identity(c) or len(shape_of(d)) < 2:
+            return NotImplemented
+        n = c.shape[0]
+        where = "in place" if out is d else "on a copy of X"
+        self._record_checkpoint(f"1. X + {c.scale}·I: added {c.scale} to the {n} diagonal entries {where}, O(n).")
+        res = _copy_into(d, out)
+        if isinstance(res, np.ndarray):
+            idx = np.arange(n)
+            res[..., idx, idx] += c.scale
+        else:
+            for i in range(n):
+                res[i][i] += c.scale
+        return res
+
+    def _subtract(self, a: Any, b: Any, out: Any = None) -> Any:
+        if isinstance(b, ImplicitMatrix):
+            return self._add(a, b.scaled(-1.0), out=out)
+        if _is_zero(a) and out is None and _covers(shape_of(b), a):
+            self._record_checkpoint("1. 0 - X = -X: a single negation of X.")
+            return _scale(b, -1.0)
+        return NotImplemented
+
+    def _multiply(self, a: Any, b: Any) -> Any:
+        if isinstance(a, ImplicitMatrix) and isinstance(b, ImplicitMatrix):
+            if a.shape != b.shape:
+                return NotImplemented
+            if isinstance(a, ConstantMatrix) or isinstance(b, ConstantMatrix):
+                c, other = (a, b) if isinstance(a, ConstantMatrix) else (b, a)
+                self._record_checkpoint(f"1. const({c.value}) ∘ M = {c.value}·M, O(1).")
+                return other.scaled(c.value)
+            self._record_checkpoint(f"1. {a.scale}·I ∘ {b.scale}·I = {a.scale * b.scale}·I, O(1).")
+            return ScaledIdentity(*a.shape, a.scale * b.scale)
+        c, d = (a, b) if isinstance(a, ImplicitMatrix) else (b, a)
+        if _is_scalar(d):
+            self._record_checkpoint(f"1. {d} · implicit matrix, O(1).")
+            return c.scaled(d)
+        if not _covers(shape_of(d), c):
+            return NotImplemented
+        if isinstance(c, ConstantMatrix):
+            self._record_checkpoint(f"1. X ∘ const({c.value}) = {c.value}·X: one scaling, the constant is never built.")
+            return _scale(d, c.value)
+        if not _is_identity(c) or shape_of(d) != c.shape:
+            return NotImplemented
+        n = c.shape[0]
+        self._record_checkpoint(f"1. X ∘ {c.scale}·I keeps only the {n} diagonal entries of X.")
+        res = _full(c.shape, 0.0, isinstance(d, np.ndarray))
+        for i in range(n):
+            res[i][i] = c.scale * d[i][i]
+        return res
+
+    def _divide(self, a: Any, b: Any) -> Any:
+        if isinstance(b, ConstantMatrix) and b.value != 0.0:
+            if isinstance(a, ImplicitMatrix):
+                if a.shape != b.shape:
+                    return NotImplemented
+            elif _is_scalar(a) or not _covers(shape_of(a), b):
+                return NotImplemented
+            self._record_checkpoint(f"1. X / const({b.value}) = (1/{b.value})·X: one scaling.")
+            return _scale(a, 1.0 / b.value)
+        if isinstance(a, ImplicitMatrix) and _is_scalar(b) and b != 0:
+            self._record_checkpoint(f"1. implicit matrix / {b}, O(1).")
+            return a.scaled(1.0 / b)
+        return NotImplemented
+
+    def _scalar_multiply(self, m: Any, scalar: float) -> Any:
+        if not isinstance(m, ImplicitMatrix):
+            return NotImplemented
+        self._record_checkpoint(f"1. Scaled the implicit matrix by {scalar}: only its stored value changes, O(1).")
+        return m.scaled(scalar)
+
+    def _scalar_add(self, m: Any, scalar: float) -> Any:
+        if not isinstance(m, ConstantMatrix):
+            return NotImplemented
+        self._record_checkpoint(f"1. const({m.value}) + {scalar} = const({m.value + scalar}), O(1).")
+        return ConstantMatrix(*m.shape, m.value + scalar)
+
+    # ── products and reductions ─────────────────────────────────────── #
+    def _matmul(self, a: Any, b: Any) -> Any:
+        sa, sb = shape_of(a), shape_of(b)
+        if not sa or not sb or len(sa) > 2 or len(sb) > 2 or sa[-1] != sb[0]:
+            return NotImplemented
+        if _is_identity(a):
+            self._record_checkpoint(f"1. {a.scale}·I @ X = {a.scale}·X: no product is formed.")
+            return _scale(b, a.scale)
+        if _is_identity(b):
+            self._record_checkpoint(f"1. X @ {b.scale}·I = {b.scale}·X: no product is formed.")
+            return _scale(a, b.scale)
+        shape = sa[:-1] + sb[1:]
+        if isinstance(a, ConstantMatrix) and isinstance(b, ConstantMatrix):
+            value = a.value * b.value * sa[-1]
+            self._record_checkpoint(f"1. const @ const = const({value}) of shape {shape[0]}×{shape[1]}, O(1).")
+            return ConstantMatrix(shape[0], shape[1], value)
+        numpy = isinstance(a, np.ndarray) or isinstance(b, np.ndarray)
+        if _is_zero(a) or _is_zero(b):
+            self._record_checkpoint("1. A product with an implicit zero matrix is zero; no product is formed.")
+            return _full(shape, 0.0, numpy)
+        if isinstance(a, ConstantMatrix) and not isinstance(b, ImplicitMatrix):
+            self._record_checkpoint(f"1. const({a.value}) @ X: every row is {a.value} × the column sums of X, O(n·k).")
+            if numpy:
+                sums = a.value * np.asarray(b, dtype=np.float64).sum(axis=0)
+                return np.broadcast_to(sums, shape).copy()
+            sums = [a.value * sum(col) for col in zip(*b)] if len(sb) == 2 else [a.value * sum(b)]
+            return [list(sums) for _ in range(shape[0])] if len(sb) == 2 else sums * shape[0]
+        if isinstance(b, ConstantMatrix) and not isinstance(a, ImplicitMatrix):
+            self._record_checkpoint(f"1. X @ const({b.value}): every column is {b.value} × the row sums of X, O(m·n).")
+            if numpy:
+                sums = b.value * np.asarray(a, dtype=np.float64).sum(axis=-1, keepdims=True)
+                return np.broadcast_to(sums, shape).copy()
+            if len(sa) == 1:
+                return [b.value * sum(a)] * shape[0]
+            return [[b.value * sum(row)] * shape[1] for row in a]
+        return NotImplemented
+
+    def _trace(self, m: Any) -> Any:
+        if not isinstance(m, ImplicitMatrix) or m.shape[0] != m.shape[1]:
+            return NotImplemented
+        n = m.shape[0]
+        value = m.scale if isinstance(m, ScaledIdentity) else m.value
+        self._record_checkpoint(f"1. trace = {n} × {value} = {n * value}, O(1).")
+        return n * value
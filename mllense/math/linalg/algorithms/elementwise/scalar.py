@@ -5,18 +5,45 @@
 
 from __future__ import annotations
 
-from typing import Any, Union
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
 
 from mllense.math.linalg.algorithms.elementwise.base import BaseElementwise
+from mllense.math.linalg.algorithms.elementwise.broadcast import unaliased_rows
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
+from mllense.math.linalg.core.validation import validate_numeric, validate_out
 from mllense.math.linalg.exceptions import EmptyMatrixError
 
 __all__ = ["ScalarMultiply", "ScalarAdd"]
 
 
+def _apply_scalar(
+    m: Union[InternalMatrix, np.ndarray],
+    scalar: float,
+    fn: Callable[[float, float], float],
+    ufunc: np.ufunc,
+    operation: str,
+    out: Optional[Union[InternalMatrix, np.ndarray]],
+) -> Union[InternalMatrix, np.ndarray]:
+    """``fn(v, scalar)`` for every element, into ``out`` (which may be ``m``) if given."""
+    if isinstance(out, np.ndarray) or (out is None and isinstance(m, np.ndarray)):
+        if out is not None:
+            validate_out(out, np.shape(m), operation)
+        return ufunc(m, scalar, out=out)
+    if out is None:
+        return [[fn(v, scalar) for v in row] for row in m]
+    validate_out(out, (len(m), len(m[0])), operation)
+    validate_numeric(m, operation)
+    for row, row_out in zip(unaliased_rows(m, out), out):
+        for j, v in enumerate(row):
+            row_out[j] = fn(v, scalar)
+    return out
+
+
 class ScalarMultiply(BaseElementwise):
     """Multiply every element by a scalar: ``C[i][j] = scalar * A[i][j]``."""
 
@@ -36,22 +63,25 @@ class ScalarMultiply(BaseElementwise):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
-        """Args: args[0] = matrix, args[1] = scalar."""
+    ) -> Union[InternalMatrix, np.ndarray]:
+        """Args: args[0] = matrix (list or ndarray), args[1] = scalar.
+
+        Keyword Args:
+            out: Optional list / ndarray of the same shape to write into.
+        """
         m: InternalMatrix = args[0]
         scalar: float = float(args[1])
 
-        rows = len(m)
-        if rows == 0:
+        if isinstance(m, np.ndarray) and m.size == 0 or len(m) == 0:
             raise EmptyMatrixError("Cannot scale an empty matrix.")
-        cols = len(m[0])
+        shape = "×".join(map(str, m.shape)) if isinstance(m, np.ndarray) else f"{len(m)}×{len(m[0])}"
 
         trace.record(
             operation="scalar_multiply",
-            description=f"Scaling {rows}×{cols} matrix by {scalar}",
+            description=f"Scaling {shape} matrix by {scalar}",
         )
 
-        return [[v * scalar for v in row] for row in m]
+        return _apply_scalar(m, scalar, lambda v, s: v * s, np.multiply, "scalar_multiply", kwargs.get("out"))
 
 
 class ScalarAdd(BaseElementwise):
@@ -73,18 +103,22 @@ class ScalarAdd(BaseElementwise):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
+    ) -> Union[InternalMatrix, np.ndarray]:
+        """Args: args[0] = matrix (list or ndarray), args[1] = scalar.
+
+        Keyword Args:
+            out: Optional list / ndarray of the same shape to write into.
+        """
         m: InternalMatrix = args[0]
         scalar: float = float(args[1])
 
-        rows = len(m)
-        if rows == 0:
+        if isinstance(m, np.ndarray) and m.size == 0 or len(m) == 0:
             raise EmptyMatrixError("Cannot add to an empty matrix.")
-        cols = len(m[0])
+        shape = "×".join(map(str, m.shape)) if isinstance(m, np.ndarray) else f"{len(m)}×{len(m[0])}"
 
         trace.record(
             operation="scalar_add",
-            description=f"Adding {scalar} to {rows}×{cols} matrix",
+            description=f"Adding {scalar} to {shape} matrix",
         )
 
-        return [[v + scalar for v in row] for row in m]
+        return _apply_scalar(m, scalar, lambda v, s: v + s, np.add, "scalar_add", kwargs.get("out"))
@@ -5,14 +5,16 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Union
+
+import numpy as np
 
 from mllense.math.linalg.algorithms.elementwise.base import BaseElementwise
+from mllense.math.linalg.algorithms.elementwise.broadcast import broadcast_apply, broadcast_ufunc
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
-from mllense.math.linalg.exceptions import ShapeMismatchError, EmptyMatrixError
 
 __all__ = ["ElementwiseSubtract"]
 
@@ -25,9 +27,9 @@ class ElementwiseSubtract(BaseElementwise):
         operation="subtract",
         complexity="O(m*n)",
         stable=True,
-        supports_batch=False,
+        supports_batch=True,
         requires_square=False,
-        description="Element-wise matrix subtraction.",
+        description="Element-wise matrix subtraction with NumPy-style broadcasting.",
     )
 
     def execute(
@@ -36,31 +38,24 @@ class ElementwiseSubtract(BaseElementwise):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
-        a: InternalMatrix = args[0]
-        b: InternalMatrix = args[1]
-
-        a_rows = len(a)
-        a_cols = len(a[0]) if a_rows else 0
-        b_rows = len(b)
-        b_cols = len(b[0]) if b_rows else 0
-
-        if a_rows == 0 or a_cols == 0:
-            raise EmptyMatrixError("Cannot subtract empty matrices.")
-
-        if a_rows != b_rows or a_cols != b_cols:
-            raise ShapeMismatchError(
-                expected=f"same shape ({a_rows}×{a_cols})",
-                got=f"({b_rows}×{b_cols})",
-                operation="subtract",
-            )
-
+    ) -> Union[InternalMatrix, np.ndarray]:
+        """Args: args[0], args[1] = broadcast-compatible list matrices or ndarrays.
+
+        Keyword Args:
+            out: Optional list / ndarray of the result shape to write into.
+        """
+        a = args[0]
+        b = args[1]
+        out = kwargs.get("out")
+
+        if isinstance(out, np.ndarray) or (out is None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray))):
+            result = broadcast_ufunc(a, b, np.subtract, "subtract", out=out)
+        else:
+            result = broadcast_apply(a, b, lambda x, y: x - y, "subtract", out=out)
+
+        shape = "×".join(map(str, np.shape(result)))
         trace.record(
             operation="elementwise_subtract",
-            description=f"Subtracting {a_rows}×{a_cols} matrices",
+            description=f"Subtracting {shape} matrices",
         )
-
-        return [
-            [a[i][j] - b[i][j] for j in range(a_cols)]
-            for i in range(a_rows)
-        ]
+        return result
@@ -7,14 +7,17 @@ from mllense.math.linalg.algorithms.matmul.block import BlockMatmul
 from mllense.math.linalg.algorithms.matmul.dot import DotProduct
 from mllense.math.linalg.algorithms.matmul.naive import NaiveMatmul
 from mllense.math.linalg.algorithms.matmul.outer import OuterProduct
+from mllense.math.linalg.algorithms.matmul.power import MatrixPower, PowerApply
 from mllense.math.linalg.algorithms.matmul.strassen import StrassenMatmul
 from mllense.math.linalg.algorithms.matmul.transpose import Transpose
 
 __all__ = [
     "BlockMatmul",
     "DotProduct",
+    "MatrixPower",
     "NaiveMatmul",
     "OuterProduct",
+    "PowerApply",
     "StrassenMatmul",
     "Transpose",
 ]
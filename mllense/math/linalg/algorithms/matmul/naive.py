@@ -94,18 +94,23 @@ class NaiveMatmul(BaseAlgorithm):
         # allocate result
         result: InternalMatrix = [[0.0] * n for _ in range(m)]
 
+        # rows are fetched once per loop level, so strided views (e.g. a
+        # transposed operand) are read in place at no extra indexing cost
         for i in range(m):
+            a_row = a[i]
+            r_row = result[i]
             for j_k in range(k):
-                a_val = a[i][j_k]
+                a_val = a_row[j_k]
                 if a_val == 0.0:
                     continue
+                b_row = b[j_k]
                 for j in range(n):
-                    result[i][j] += a_val * b[j_k][j]
+                    r_row[j] += a_val * b_row[j]
 
                     # overflow guard
-                    if abs(result[i][j]) > FLOAT_OVERFLOW_GUARD:
+                    if abs(r_row[j]) > FLOAT_OVERFLOW_GUARD:
                         raise NumericalInstabilityError(
-                            f"Float overflow at result[{i}][{j}] = {result[i][j]}"
+                            f"Float overflow at result[{i}][{j}] = {r_row[j]}"
                         )
 
         trace.record(
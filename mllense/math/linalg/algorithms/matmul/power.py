@@ -0,0 +1,295 @@
+# ==============================
+# File: linalg/algorithms/matmul/power.py
+# ==============================
+"""Integer matrix powers ``A^k`` and their action ``A^k v``.
+
+Three strategies, all vectorized over leading batch dimensions
+(``A`` of shape ``(..., n, n)``):
+
+* **squaring** — binary exponentiation, ``floor(log2 k) + popcount(k) - 1``
+  products instead of ``k - 1``.
+* **eigh** — for symmetric ``A = Q diag(w) Q^T``, ``A^k = Q diag(w^k) Q^T``:
+  one eigendecomposition whatever ``k`` is.
+* **matvec** — ``A^k v`` as ``k`` repeated products with the vector,
+  O(k n^2), never forming a matrix power at all.  This is the cheapest
+  way to propagate a Markov chain a modest number of steps.
+
+``method="auto"`` picks the cheapest by a flop-count model, counting a
+symmetric eigendecomposition as
+:data:`~mllense.math.linalg._internal.constants.POWER_EIGH_COST`
+matrix products.  It takes the eigh route only when that is a clear win
+(:data:`_EIGH_MARGIN` times cheaper) and never for integer-valued
+matrices (permutations, adjacency and transition counts), whose powers
+repeated squaring computes exactly while ``Q diag(w^k) Q^T`` rounds.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+from mllense.math.linalg._internal.constants import POWER_EIGH_COST
+from mllense.math.linalg.algorithms.matmul.base import BaseMatmul
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.exceptions import (
+    InvalidInputError,
+    ShapeMismatchError,
+    SingularMatrixError,
+)
+
+__all__ = ["MatrixPower", "PowerApply", "matrix_power_squaring"]
+
+_POWER_METHODS = ("auto", "squaring", "eigh")
+# how many times cheaper eigh must be before "auto" trades squaring's accuracy for it
+_EIGH_MARGIN = 2.0
+_APPLY_METHODS = ("auto", "matvec", "squaring", "eigh")
+
+
+def _validate_stack(a: np.ndarray, operation: str) -> int:
+    if a.ndim < 2 or a.shape[-1] != a.shape[-2]:
+        raise ShapeMismatchError(
+            expected="square matrix or stack of square matrices (..., n, n)",
+            got=f"shape {a.shape}",
+            operation=operation,
+        )
+    return a.shape[-1]
+
+
+def _is_symmetric_stack(a: np.ndarray) -> bool:
+    return bool(np.allclose(a, np.swapaxes(a, -1, -2), rtol=1e-12, atol=1e-12))
+
+
+def _eigh_allowed(a: np.ndarray, symmetric: bool) -> bool:
+    """Whether ``method="auto"`` may consider eigh: symmetric and not integer-valued."""
+    return symmetric and not bool(np.all(a == np.round(a)))
+
+
+def _invert_stack(a: np.ndarray) -> np.ndarray:
+    try:
+        return np.linalg.inv(a)
+    except np.linalg.LinAlgError as exc:
+        raise SingularMatrixError("Negative power of a singular matrix.") from exc
+
+
+def matrix_power_squaring(a: np.ndarray, k: int) -> np.ndarray:
+    """Return ``A^k`` (``k >= 0``) by binary exponentiation over a ``(..., n, n)`` stack."""
+    n = a.shape[-1]
+    result: Optional[np.ndarray] = None
+    base = a
+    while k:
+        if k & 1:
+            result = base if result is None else result @ base
+        k >>= 1
+        if k:
+            base = base @ base
+    if result is None:
+        return np.broadcast_to(np.eye(n), a.shape).copy()
+    return result.copy() if result is a else result
+
+
+def _eigh_power(a: np.ndarray, k: int) -> np.ndarray:
+    """``Q diag(w^k) Q^T`` for a symmetric stack."""
+    w, q = np.linalg.eigh(a)
+    if k < 0 and np.any(w == 0.0):
+        raise SingularMatrixError("Negative power of a singular matrix.")
+    return (q * w[..., None, :] ** k) @ np.swapaxes(q, -1, -2)
+
+
+def _squarings(k: int) -> int:
+    """Matrix products used by binary exponentiation of ``|k|``."""
+    k = abs(k)
+    return max(0, k.bit_length() - 1 + bin(k).count("1") - 1)
+
+
+def _exponent(k: Any, operation: str) -> int:
+    """``k`` as an ``int``, rejecting non-integral values instead of truncating them."""
+    if isinstance(k, (bool, np.bool_)):
+        raise InvalidInputError(f"{operation} needs an integer exponent, got {k!r}.")
+    try:
+        k_int = int(k)
+    except (TypeError, ValueError, OverflowError) as exc:
+        raise InvalidInputError(f"{operation} needs an integer exponent, got {k!r}.") from exc
+    if k_int != k:
+        raise InvalidInputError(f"{operation} needs an integer exponent, got {k!r}.")
+    return k_int
+
+
+def _check_method(method: str, allowed: tuple, symmetric: bool, operation: str) -> str:
+    if method not in allowed:
+        raise InvalidInputError(
+            f"Unknown {operation} method {method!r}. Valid methods: {', '.join(allowed)}."
+        )
+    if method == "eigh" and not symmetric:
+        raise InvalidInputError(f"{operation} method 'eigh' requires a symmetric matrix.")
+    return method
+
+
+class MatrixPower(BaseMatmul):
+    """Compute ``A^k`` by repeated squaring or, for symmetric ``A``, by eigendecomposition."""
+
+    metadata = AlgorithmMetadata(
+        name="matrix_power",
+        operation="matrix_power",
+        complexity="O(n^3 log k)",
+        stable=True,
+        supports_batch=True,
+        requires_square=True,
+        description=(
+            "Integer matrix power by binary exponentiation, or via A = Q diag(w) Q^T "
+            "for symmetric matrices; negative k inverts first."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Compute ``A^k``.
+
+        Args:
+            args[0]: A (ndarray, ``(n, n)`` or a ``(..., n, n)`` batch)
+            args[1]: k (int, may be negative)
+
+        Keyword Args:
+            method: ``"auto"`` (default), ``"squaring"`` or ``"eigh"``.
+        """
+        a = np.asarray(args[0], dtype=np.float64)
+        k = _exponent(args[1], "matrix_power")
+        n = _validate_stack(a, "matrix_power")
+        symmetric = _is_symmetric_stack(a)
+        method = _check_method(kwargs.get("method", "auto"), _POWER_METHODS, symmetric, "matrix_power")
+        if method == "auto":
+            clear_win = _squarings(k) > _EIGH_MARGIN * POWER_EIGH_COST
+            method = "eigh" if clear_win and _eigh_allowed(a, symmetric) else "squaring"
+        batch = a.shape[:-2]
+        label = f"{n}×{n}" + (f" (batch {batch})" if batch else "")
+
+        trace.record(
+            operation="matrix_power_start",
+            description=f"A^{k} for {label} matrix via {method}",
+        )
+
+        if method == "eigh":
+            result = _eigh_power(a, k)
+            self._record_checkpoint(
+                f"1. A is symmetric: decomposed A = Q diag(w) Q^T once and formed Q diag(w^{k}) Q^T."
+            )
+        else:
+            base = a
+            if k < 0:
+                base = _invert_stack(a)
+                self._record_checkpoint("1. k < 0: inverted A first.")
+            result = matrix_power_squaring(base, abs(k))
+            self._record_checkpoint(
+                f"{len(self._checkpoints) + 1}. Binary exponentiation: {_squarings(k)} matrix "
+                f"product(s) instead of {max(abs(k) - 1, 0)}."
+            )
+
+        trace.record(
+            operation="matrix_power_done",
+            description=f"A^{k} computed ({label})",
+        )
+        return result
+
+
+class PowerApply(BaseMatmul):
+    """Compute ``A^k v`` without necessarily forming ``A^k``."""
+
+    metadata = AlgorithmMetadata(
+        name="power_apply",
+        operation="power_apply",
+        complexity="O(min(k n^2, n^3 log k))",
+        stable=True,
+        supports_batch=True,
+        requires_square=True,
+        description=(
+            "Action of a matrix power on a vector: k matrix-vector products, "
+            "binary exponentiation, or Q diag(w^k) Q^T v for symmetric A."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Compute ``A^k v``.
+
+        Args:
+            args[0]: A (ndarray, ``(n, n)`` or ``(..., n, n)``)
+            args[1]: k (int >= 0; negative k needs ``method="squaring"`` or ``"eigh"``)
+            args[2]: v (``(n,)``, ``(..., n)`` matching the batch, or ``(n, m)``
+                for several vectors)
+
+        Keyword Args:
+            method: ``"auto"`` (default), ``"matvec"``, ``"squaring"`` or ``"eigh"``.
+        """
+        a = np.asarray(args[0], dtype=np.float64)
+        k = _exponent(args[1], "power_apply")
+        v = np.asarray(args[2], dtype=np.float64)
+        n = _validate_stack(a, "power_apply")
+        symmetric = _is_symmetric_stack(a)
+        method = _check_method(kwargs.get("method", "auto"), _APPLY_METHODS, symmetric, "power_apply")
+
+        # v as a stack of column blocks (..., n, m)
+        single = v.ndim == 1 or (a.ndim > 2 and v.ndim == a.ndim - 1)
+        cols = v[..., None] if single else v
+        if cols.shape[-2] != n:
+            raise ShapeMismatchError(
+                expected=f"v with {n} entries along its first matrix axis",
+                got=f"shape {v.shape}",
+                operation="power_apply",
+            )
+        m = cols.shape[-1]
+
+        if method == "auto":
+            # flop model in units of n^2: k products with an n×m block, ~log2(k)
+            # n×n products, or one eigendecomposition
+            costs = {"squaring": _squarings(k) * n + m}
+            if k >= 0:
+                costs["matvec"] = k * m
+            if _eigh_allowed(a, symmetric):
+                costs["eigh"] = _EIGH_MARGIN * (POWER_EIGH_COST * n + 2 * m)
+            method = min(costs, key=costs.__getitem__)
+        if method == "matvec" and k < 0:
+            raise InvalidInputError("power_apply method 'matvec' needs k >= 0.")
+
+        trace.record(
+            operation="power_apply_start",
+            description=f"A^{k} v for {n}×{n} A and {m} vector(s) via {method}",
+        )
+
+        if method == "matvec":
+            out = cols
+            for _ in range(k):
+                out = a @ out
+            self._record_checkpoint(f"1. Applied A to the vector(s) {k} time(s) (O(k n^2)), never forming A^{k}.")
+        elif method == "eigh":
+            w, q = np.linalg.eigh(a)
+            if k < 0 and np.any(w == 0.0):
+                raise SingularMatrixError("Negative power of a singular matrix.")
+            coeffs = np.swapaxes(q, -1, -2) @ cols
+            out = q @ (w[..., :, None] ** k * coeffs)
+            self._record_checkpoint(
+                f"1. A is symmetric: projected v on the eigenvectors, scaled by w^{k} and mapped back."
+            )
+        else:
+            base = _invert_stack(a) if k < 0 else a
+            out = matrix_power_squaring(base, abs(k)) @ cols
+            self._record_checkpoint(
+                f"1. Formed A^{k} by binary exponentiation ({_squarings(k)} products), then applied it."
+            )
+
+        trace.record(
+            operation="power_apply_done",
+            description=f"A^{k} v computed ({n}×{m})",
+        )
+        return out[..., 0] if single else out
@@ -1,17 +1,21 @@
 # ==============================
 # File: linalg/algorithms/matmul/transpose.py
 # ==============================
-"""Matrix transpose algorithm."""
+"""Matrix transpose algorithm (an O(1) strided view unless ``out`` is given)."""
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Union
+
+import numpy as np
 
 from mllense.math.linalg.algorithms.matmul.base import BaseMatmul
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
+from mllense.math.linalg.core.validation import validate_out
+from mllense.math.linalg.core.view import MatrixView, readonly
 from mllense.math.linalg.exceptions import EmptyMatrixError
 
 __all__ = ["Transpose"]
@@ -36,7 +40,17 @@ class Transpose(BaseMatmul):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
+    ) -> Union[MatrixView, np.ndarray, InternalMatrix]:
+        """Args: args[0] = matrix (list, view or 2-D ndarray).
+
+        Returns a view sharing ``args[0]``'s storage — a
+        :class:`~mllense.math.linalg.core.view.MatrixView` for lists, a
+        read-only ``.T`` for ndarrays — so nothing is copied.
+
+        Keyword Args:
+            out: Optional ``cols×rows`` list / ndarray to write into; it must
+                not alias ``args[0]``.
+        """
         m: InternalMatrix = args[0]
 
         rows = len(m)
@@ -49,4 +63,18 @@ class Transpose(BaseMatmul):
             description=f"Transposing {rows}×{cols} → {cols}×{rows}",
         )
 
-        return [[m[i][j] for i in range(rows)] for j in range(cols)]
+        out = kwargs.get("out")
+        if out is None:
+            self._record_checkpoint(
+                f"1. Swapped the shape and strides of the {rows}×{cols} input: a {cols}×{rows} "
+                "view reading it in transposed order, no element copied."
+            )
+            return readonly(m.T) if isinstance(m, np.ndarray) else MatrixView.of(m).T
+        validate_out(out, (cols, rows), "transpose")
+        if isinstance(out, np.ndarray):
+            out[...] = np.asarray(m).T
+            return out
+        for j, row_out in enumerate(out):
+            for i in range(rows):
+                row_out[i] = m[i][j]
+        return out
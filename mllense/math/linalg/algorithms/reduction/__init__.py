@@ -0,0 +1,10 @@
+# ==============================
+# File: linalg/algorithms/reduction/__init__.py
+# ==============================
+"""Reduction algorithm family — sum, mean, max, min, argmax, argmin and fused statistics."""
+
+from mllense.math.linalg.algorithms.reduction.compensated import CompensatedReduction
+from mllense.math.linalg.algorithms.reduction.moments import FusedMoments
+from mllense.math.linalg.algorithms.reduction.pairwise import PairwiseReduction
+
+__all__ = ["PairwiseReduction", "CompensatedReduction", "FusedMoments"]
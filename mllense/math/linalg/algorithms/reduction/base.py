@@ -0,0 +1,211 @@
+# ==============================
+# File: linalg/algorithms/reduction/base.py
+# ==============================
+"""Base class for the reduction algorithm family (sum, mean, max, ... along an axis).
+
+Every reduction is phrased as reducing *lines*: the input is arranged so
+that the reduced axis (or axes) comes first, giving an ``n × k`` block
+whose ``k`` columns are reduced independently.
+
+* ndarrays are transposed / reshaped to that layout (a view where
+  possible), and a 3-D stack is handled in the same call (``batch=True``);
+* list matrices and views are split into Python lines (all elements,
+  the columns or the rows).
+
+Subclasses provide the summation (``_sum_array`` / ``_sum_line``); the
+order statistics (max, min, argmax, argmin) are shared.
+"""
+
+from __future__ import annotations
+
+import abc
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from mllense.math.linalg.algorithms.base import BaseAlgorithm
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import LinalgResult
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.types import as_internal_matrix
+from mllense.math.linalg.core.view import as_view
+from mllense.math.linalg.exceptions import EmptyMatrixError, InvalidInputError
+
+__all__ = ["BaseReduction", "REDUCE_OPS"]
+
+# single-statistic reductions understood by every reduction algorithm
+REDUCE_OPS = ("sum", "mean", "max", "min", "argmax", "argmin")
+
+
+def _operand(m: Any, batch: bool) -> Tuple[Any, int]:
+    """The input without copying where possible, and its rank (1 or 2 per matrix)."""
+    if isinstance(m, LinalgResult):
+        m = m.value
+    if isinstance(m, np.ndarray) or batch:
+        try:
+            a = np.asarray(m, dtype=np.float64)
+        except (TypeError, ValueError) as exc:
+            raise InvalidInputError(f"reduce: expected numeric matrices of one shape ({exc}).") from exc
+        rank = a.ndim - (1 if batch else 0)
+        if rank not in (1, 2):
+            raise InvalidInputError(
+                f"reduce: expected {'a 2-D or 3-D stack' if batch else 'a 1-D or 2-D input'}, got {a.ndim}-D."
+            )
+        if a.size == 0:
+            raise EmptyMatrixError("Empty matrix is not supported.")
+        return a, rank
+    view = as_view(m)
+    if view is not None:
+        return (view.tolist(), 1) if view.ndim == 1 else (view, 2)
+    if isinstance(m, (list, tuple)) and m and not isinstance(m[0], (list, tuple, np.ndarray)) and as_view(m[0]) is None:
+        return list(m), 1
+    if not m:
+        raise EmptyMatrixError("Empty matrix is not supported.")
+    return as_internal_matrix(m), 2
+
+
+def _axis(axis: Optional[int], rank: int) -> Optional[int]:
+    if axis is None:
+        return None
+    if not isinstance(axis, (int, np.integer)) or not -rank <= axis < rank:
+        raise InvalidInputError(f"reduce: axis must be None or in [{-rank}, {rank - 1}], got {axis!r}.")
+    axis = int(axis) % rank
+    return None if rank == 1 else axis
+
+
+class BaseReduction(BaseAlgorithm):
+    """Abstract base for reductions; see the module docstring for the layout."""
+
+    # ops this algorithm accepts (the fused-statistics algorithm widens it)
+    ops: Tuple[str, ...] = REDUCE_OPS
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Any:
+        """Args: args[0] = matrix, vector or (with ``batch``) stack; args[1] = op.
+
+        Keyword Args:
+            axis: ``None`` (every element), ``0`` (down columns) or ``1``
+                (along rows); negative values count from the end.
+            batch: Reduce each matrix of a 3-D stack (or a sequence of
+                equal-shape matrices) in one call.
+            ddof: Delta degrees of freedom for ``var`` / ``std`` (default 0).
+
+        Returns:
+            A scalar for a full reduction, else a vector (list or ndarray,
+            following the input); per-matrix results stacked first with
+            ``batch``.  ``argmax`` / ``argmin`` give ints (flat indices
+            for a full reduction).
+        """
+        op = self._check_op(args[1])
+        batch: bool = kwargs.get("batch", False)
+        data, rank = _operand(args[0], batch)
+        axis = _axis(kwargs.get("axis"), rank)
+
+        if isinstance(data, np.ndarray):
+            block, kept = self._layout(data, axis, batch)
+            trace.record(
+                operation=self.metadata.name,
+                description=f"{op} over {block.shape[0]} element(s) for each of {block.shape[1]} output(s)",
+            )
+            self._record_checkpoint(
+                f"1. Arranged the input as {block.shape[0]}×{block.shape[1]}: the reduced axis first, "
+                f"one column per output{' (no copy)' if np.shares_memory(block, data) else ''}."
+            )
+            result = self._reduce_array(block, op, kwargs)
+            return self._shape_result(result, kept)
+
+        lines = self._lines(data, axis, rank)
+        trace.record(
+            operation=self.metadata.name,
+            description=f"{op} over {len(lines)} line(s) of {len(lines[0])} element(s)",
+        )
+        self._record_checkpoint(
+            f"1. Split the input into {len(lines)} line(s) of {len(lines[0])} element(s) "
+            f"({'all elements' if axis is None else 'columns' if axis == 0 else 'rows'})."
+        )
+        try:
+            results = [self._reduce_line(line, op, kwargs) for line in lines]
+        except TypeError as exc:
+            # list operands are not copied (and so not converted) on this path
+            raise InvalidInputError(f"reduce: non-numeric element ({exc}).") from exc
+        if axis is None:
+            return results[0]
+        return self._merge_lines(results)
+
+    # ── layout ──────────────────────────────────────────────────────── #
+    def _check_op(self, op: Any) -> Any:
+        if not isinstance(op, str) or op not in self.ops:
+            raise InvalidInputError(f"{self.metadata.name}: op must be one of {', '.join(self.ops)}; got {op!r}.")
+        return op
+
+    @staticmethod
+    def _layout(a: np.ndarray, axis: Optional[int], batch: bool) -> Tuple[np.ndarray, Tuple[int, ...]]:
+        """``a`` as ``n × k`` with the reduced axes first, and the shape of the kept axes."""
+        lead = 1 if batch else 0
+        reduced = tuple(range(lead, a.ndim)) if axis is None else (lead + axis,)
+        kept = tuple(i for i in range(a.ndim) if i not in reduced)
+        n = int(np.prod([a.shape[i] for i in reduced]))
+        kept_shape = tuple(a.shape[i] for i in kept)
+        return np.transpose(a, reduced + kept).reshape(n, -1), kept_shape
+
+    @staticmethod
+    def _shape_result(result: Any, kept: Tuple[int, ...]) -> Any:
+        if isinstance(result, dict):
+            return {k: BaseReduction._shape_result(v, kept) for k, v in result.items()}
+        result = np.asarray(result)
+        return result.reshape(kept)[()] if not kept else result.reshape(kept)
+
+    @staticmethod
+    def _lines(m: Any, axis: Optional[int], rank: int) -> List[Sequence[float]]:
+        if rank == 1:
+            return [m]
+        if axis is None:
+            return [[v for row in m for v in row]]
+        if axis == 0:
+            return list(zip(*m))
+        return [row if isinstance(row, list) else list(row) for row in m]
+
+    @staticmethod
+    def _merge_lines(results: List[Any]) -> Any:
+        if isinstance(results[0], dict):
+            return {k: [r[k] for r in results] for k in results[0]}
+        return results
+
+    # ── reductions ──────────────────────────────────────────────────── #
+    def _reduce_array(self, block: np.ndarray, op: str, kwargs: dict) -> Any:
+        """Reduce each column of ``block``; returns a length-``k`` array."""
+        if op == "max":
+            return block.max(axis=0)
+        if op == "min":
+            return block.min(axis=0)
+        if op == "argmax":
+            return block.argmax(axis=0)
+        if op == "argmin":
+            return block.argmin(axis=0)
+        total = self._sum_array(block)
+        return total / block.shape[0] if op == "mean" else total
+
+    def _reduce_line(self, line: Sequence[float], op: str, kwargs: dict) -> Union[float, int]:
+        if op == "max":
+            return float(max(line))
+        if op == "min":
+            return float(min(line))
+        if op == "argmax":
+            return max(range(len(line)), key=line.__getitem__)
+        if op == "argmin":
+            return min(range(len(line)), key=line.__getitem__)
+        total = self._sum_line(line)
+        return total / len(line) if op == "mean" else total
+
+    @abc.abstractmethod
+    def _sum_array(self, block: np.ndarray) -> np.ndarray:
+        """Sum each column of the ``n × k`` ``block``; returns a length-``k`` array."""
+
+    @abc.abstractmethod
+    def _sum_line(self, line: Sequence[float]) -> float:
+        """Sum one Python line."""
@@ -0,0 +1,154 @@
+# ==============================
+# File: linalg/algorithms/reduction/moments.py
+# ==============================
+"""Fused multi-statistic reductions (count, sum, mean, var, std, min, max).
+
+Computing ``mean`` and then ``var`` reads the data twice, and the
+one-pass textbook formula ``E[x²] - E[x]²`` cancels catastrophically.
+Here every requested statistic comes out of a single pass:
+
+* ndarrays are read in cache-sized row blocks (``FUSED_BLOCK_BYTES``);
+  each block's mean and sum of squared deviations are computed while it
+  is in cache and merged into the running totals with Chan's parallel
+  update, which is as stable as a two-pass variance;
+* list lines use Welford's running update.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+from mllense.math.linalg._internal.constants import FUSED_BLOCK_BYTES
+from mllense.math.linalg.algorithms.reduction.base import BaseReduction
+from mllense.math.linalg.core.metadata import AlgorithmMetadata
+from mllense.math.linalg.exceptions import InvalidInputError
+
+__all__ = ["FusedMoments", "MOMENT_STATS"]
+
+# statistics a fused pass can return together
+MOMENT_STATS = ("count", "sum", "mean", "var", "std", "min", "max")
+
+
+class FusedMoments(BaseReduction):
+    """Several statistics along an axis in one pass over the data."""
+
+    metadata = AlgorithmMetadata(
+        name="fused_moments",
+        operation="reduce",
+        complexity="O(n)",
+        stable=True,
+        supports_batch=True,
+        requires_square=False,
+        description=(
+            "Fused reduction: count, sum, mean, variance, std, min and max in a single "
+            "pass, merging cache-sized blocks with Chan's stable update."
+        ),
+    )
+
+    ops = MOMENT_STATS
+
+    def _check_op(self, op: Any) -> Union[str, Tuple[str, ...]]:
+        stats = (op,) if isinstance(op, str) else tuple(op)
+        bad = [s for s in stats if s not in MOMENT_STATS]
+        if not stats or bad:
+            raise InvalidInputError(
+                f"fused_moments: statistics must be among {', '.join(MOMENT_STATS)}; got {op!r}."
+            )
+        return op if isinstance(op, str) else stats
+
+    @staticmethod
+    def _finish(
+        stats: Union[str, Tuple[str, ...]],
+        count: Any,
+        total: Any,
+        mean: Any,
+        m2: Any,
+        lo: Any,
+        hi: Any,
+        ddof: int,
+    ) -> Any:
+        wanted = (stats,) if isinstance(stats, str) else stats
+        if ("var" in wanted or "std" in wanted) and np.min(count) - ddof <= 0:
+            raise InvalidInputError(f"var/std: ddof={ddof} leaves no degrees of freedom for {np.min(count)} element(s).")
+        values: Dict[str, Any] = {}
+        for s in wanted:
+            if s == "count":
+                values[s] = count
+            elif s == "sum":
+                values[s] = total
+            elif s == "mean":
+                values[s] = mean
+            elif s == "var":
+                values[s] = m2 / (count - ddof)
+            elif s == "std":
+                values[s] = (m2 / (count - ddof)) ** 0.5
+            elif s == "min":
+                values[s] = lo
+            else:
+                values[s] = hi
+        return values[stats] if isinstance(stats, str) else values
+
+    def _sum_array(self, block: np.ndarray) -> np.ndarray:
+        return np.add.reduce(block, axis=0)
+
+    def _sum_line(self, line: Sequence[float]) -> float:
+        return math.fsum(line)
+
+    def _reduce_array(self, block: np.ndarray, op: Any, kwargs: dict) -> Any:
+        n, k = block.shape
+        rows = max(1, FUSED_BLOCK_BYTES // (8 * k))
+        wanted = (op,) if isinstance(op, str) else op
+        need_range = "min" in wanted or "max" in wanted
+        count = 0
+        mean = np.zeros(k)
+        m2 = np.zeros(k)
+        lo = np.full(k, np.inf)
+        hi = np.full(k, -np.inf)
+        sums = []
+        for start in range(0, n, rows):
+            x = block[start:start + rows]
+            nb = x.shape[0]
+            bsum = self._sum_array(x)
+            bmean = bsum / nb
+            d = x - bmean
+            bm2 = np.einsum("ij,ij->j", d, d)
+            delta = bmean - mean
+            total = count + nb
+            mean += delta * (nb / total)
+            m2 += bm2 + delta * delta * (count * nb / total)
+            count = total
+            sums.append(bsum)
+            if need_range:
+                np.minimum(lo, x.min(axis=0), out=lo)
+                np.maximum(hi, x.max(axis=0), out=hi)
+        self._record_checkpoint(
+            f"2. One pass over {len(sums)} block(s) of ≤{rows} row(s): each block's mean and squared "
+            "deviations computed in cache, merged with Chan's update."
+        )
+        total_sum = np.add.reduce(np.stack(sums), axis=0)
+        counts = np.full(k, count, dtype=np.int64)
+        return self._finish(op, counts, total_sum, mean, m2, lo, hi, kwargs.get("ddof", 0))
+
+    def _reduce_line(self, line: Sequence[float], op: Any, kwargs: dict) -> Any:
+        if len(self._checkpoints) == 1:
+            self._record_checkpoint("2. One pass over each line with Welford's running mean and variance.")
+        wanted = (op,) if isinstance(op, str) else op
+        count = 0
+        mean = m2 = 0.0
+        lo, hi = math.inf, -math.inf
+        need_range = "min" in wanted or "max" in wanted
+        for x in line:
+            count += 1
+            d = x - mean
+            mean += d / count
+            m2 += d * (x - mean)
+            if need_range:
+                if x < lo:
+                    lo = x
+                if x > hi:
+                    hi = x
+        total = self._sum_line(line) if "sum" in wanted else mean * count
+        return self._finish(op, count, total, mean, m2, float(lo), float(hi), kwargs.get("ddof", 0))
@@ -4,6 +4,7 @@
 """Shape manipulation algorithm family."""
 
 from mllense.math.linalg.algorithms.shape.concat import ConcatHorizontal, ConcatVertical
+from mllense.math.linalg.algorithms.shape.concatenate import Concatenate
 from mllense.math.linalg.algorithms.shape.flatten import Flatten
 from mllense.math.linalg.algorithms.shape.reshape import Reshape
 from mllense.math.linalg.algorithms.shape.stack import StackColumns, StackRows
@@ -13,6 +14,7 @@ __all__ = [
     "Flatten",
     "ConcatVertical",
     "ConcatHorizontal",
+    "Concatenate",
     "StackRows",
     "StackColumns",
 ]
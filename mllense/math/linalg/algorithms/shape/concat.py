@@ -1,17 +1,21 @@
 # ==============================
 # File: linalg/algorithms/shape/concat.py
 # ==============================
-"""Matrix concatenation (horizontal and vertical)."""
+"""Matrix concatenation (horizontal and vertical), as views over the inputs for lists."""
 
 from __future__ import annotations
 
-from typing import Any, List
+from typing import Any, List, Union
+
+import numpy as np
 
 from mllense.math.linalg.algorithms.shape.base import BaseShape
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
+from mllense.math.linalg.core.validation import validate_out
+from mllense.math.linalg.core.view import ConcatView, MatrixView
 from mllense.math.linalg.exceptions import ShapeMismatchError, InvalidInputError
 
 __all__ = ["ConcatVertical", "ConcatHorizontal"]
@@ -36,14 +40,22 @@ class ConcatVertical(BaseShape):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
+    ) -> Union[ConcatView, np.ndarray, InternalMatrix]:
+        """Args: args = matrices with equal column counts.
+
+        List inputs are stacked as a :class:`ConcatView` over the inputs,
+        without copying; ndarrays are concatenated (one copy).
+
+        Keyword Args:
+            out: Optional list / ndarray of the stacked shape to write into.
+        """
         matrices: List[InternalMatrix] = list(args)
         if not matrices:
             raise InvalidInputError("No matrices provided for concatenation.")
 
-        cols = len(matrices[0][0]) if matrices[0] else 0
+        cols = len(matrices[0][0]) if len(matrices[0]) else 0
         for idx, m in enumerate(matrices):
-            m_cols = len(m[0]) if m else 0
+            m_cols = len(m[0]) if len(m) else 0
             if m_cols != cols:
                 raise ShapeMismatchError(
                     expected=f"{cols} columns",
@@ -56,10 +68,22 @@ class ConcatVertical(BaseShape):
             description=f"Vertically stacking {len(matrices)} matrices",
         )
 
-        result: InternalMatrix = []
-        for m in matrices:
-            result.extend([row[:] for row in m])
-        return result
+        out = kwargs.get("out")
+        if out is not None:
+            validate_out(out, (sum(len(m) for m in matrices), cols), "vstack")
+            if isinstance(out, np.ndarray):
+                np.concatenate(matrices, axis=0, out=out)
+                return out
+            i = 0
+            for m in matrices:
+                for row in m:
+                    out[i][:] = row
+                    i += 1
+            return out
+
+        if any(isinstance(m, np.ndarray) for m in matrices):
+            return np.concatenate(matrices, axis=0)
+        return ConcatView([MatrixView.of(m) for m in matrices], axis=0)
 
 
 class ConcatHorizontal(BaseShape):
@@ -81,7 +105,15 @@ class ConcatHorizontal(BaseShape):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
+    ) -> Union[ConcatView, np.ndarray, InternalMatrix]:
+        """Args: args = matrices with equal row counts.
+
+        List inputs are stacked as a :class:`ConcatView` over the inputs,
+        without copying; ndarrays are concatenated (one copy).
+
+        Keyword Args:
+            out: Optional list / ndarray of the stacked shape to write into.
+        """
         matrices: List[InternalMatrix] = list(args)
         if not matrices:
             raise InvalidInputError("No matrices provided for concatenation.")
@@ -100,10 +132,20 @@ class ConcatHorizontal(BaseShape):
             description=f"Horizontally stacking {len(matrices)} matrices",
         )
 
-        result: InternalMatrix = []
-        for i in range(rows):
-            row: list[float] = []
-            for m in matrices:
-                row.extend(m[i])
-            result.append(row)
-        return result
+        out = kwargs.get("out")
+        if out is not None:
+            widths = [len(m[0]) if len(m) else 0 for m in matrices]
+            validate_out(out, (rows, sum(widths)), "hstack")
+            if isinstance(out, np.ndarray):
+                np.concatenate(matrices, axis=1, out=out)
+                return out
+            for i, row_out in enumerate(out):
+                start = 0
+                for m, width in zip(matrices, widths):
+                    row_out[start: start + width] = m[i]
+                    start += width
+            return out
+
+        if any(isinstance(m, np.ndarray) for m in matrices):
+            return np.concatenate(matrices, axis=1)
+        return ConcatView([MatrixView.of(m) for m in matrices], axis=1)
@@ -0,0 +1,304 @@
+# ==============================
+# File: linalg/algorithms/shape/concatenate.py
+# ==============================
+"""Multi-way concatenation into one preallocated buffer.
+
+Appending pieces to a growing result copies rows over and over.  Here
+the result is allocated once and every piece is copied into it exactly
+once:
+
+* **Sized input** (a list or tuple of pieces) is measured in one pass,
+  then the result — a list matrix, an ndarray, a caller's ``out`` or a
+  new memory-mapped ``.npy`` file — is allocated at its final size.
+* **Streams** (generators) along axis 0 cannot be measured up front.  An
+  ndarray result grows geometrically in place (``ndarray.resize``, so
+  each element is moved O(1) times amortized); a file result is written
+  sequentially and its ``.npy`` header patched with the final row count,
+  so it never has to fit in memory.  A stream along axis 1 is collected
+  (by reference) and sized first.
+
+A piece may be a list of lists, a flat list (one row), an ndarray, a
+view or a ``LinalgResult``.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Sized
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from mllense.math.linalg._internal.constants import CONCAT_CHUNK_BYTES
+from mllense.math.linalg.algorithms.shape.base import BaseShape
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata, LinalgResult
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.types import InternalMatrix, as_internal_matrix
+from mllense.math.linalg.core.validation import validate_numeric, validate_out
+from mllense.math.linalg.core.view import as_view
+from mllense.math.linalg.exceptions import InvalidInputError, ShapeMismatchError
+
+__all__ = ["Concatenate"]
+
+# fixed .npy header size, so a streamed file's header can be rewritten in place
+_NPY_HEADER_BYTES = 128
+
+
+def _piece(m: Any) -> Any:
+    """One input as a 2-D block, without copying it.
+
+    List pieces are checked element by element here (they are converted
+    to float only as they are copied), so a bad piece is reported before
+    anything is written.
+    """
+    if isinstance(m, LinalgResult):
+        m = m.value
+    if isinstance(m, np.ndarray):
+        if m.ndim > 2:
+            raise InvalidInputError(f"concatenate: expected 1-D or 2-D pieces, got {m.ndim}-D.")
+        if m.dtype.kind not in "biuf":
+            raise InvalidInputError(f"concatenate: expected a numeric piece, got dtype {m.dtype}.")
+        return np.atleast_2d(m)
+    view = as_view(m)
+    if view is not None:
+        return view.as_2d()
+    if isinstance(m, (list, tuple)) and m and not isinstance(m[0], (list, tuple, np.ndarray)) and as_view(m[0]) is None:
+        block = [m]
+    else:
+        block = as_internal_matrix(m)
+    if as_view(block) is None:
+        validate_numeric(block, "concatenate")
+    return block
+
+
+def _shape(p: Any) -> Tuple[int, int]:
+    if isinstance(p, np.ndarray) or as_view(p) is not None:
+        return p.shape
+    return len(p), len(p[0])
+
+
+def _npy_header(shape: Tuple[int, int]) -> bytes:
+    magic = np.lib.format.magic(1, 0)
+    size = _NPY_HEADER_BYTES - len(magic) - 2
+    header = repr({
+        "descr": np.lib.format.dtype_to_descr(np.dtype(np.float64)),
+        "fortran_order": False,
+        "shape": tuple(shape),
+    })
+    return magic + struct.pack("<H", size) + (header.ljust(size - 1) + "\n").encode("latin1")
+
+
+class Concatenate(BaseShape):
+    """Concatenate any number of matrices (or a stream of them) along one axis."""
+
+    metadata = AlgorithmMetadata(
+        name="concatenate",
+        operation="concatenate",
+        complexity="O(total_elements)",
+        stable=True,
+        supports_batch=False,
+        requires_square=False,
+        description=(
+            "Multi-way concatenation into one preallocated buffer (list, ndarray, "
+            "caller's out= or memory-mapped .npy file); streams grow in chunks."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Union[InternalMatrix, np.ndarray]:
+        """Args: args[0] = iterable of matrices.
+
+        Keyword Args:
+            axis: 0 (stack rows, default) or 1 (stack columns).
+            out: Optional list / ndarray (``np.memmap`` included) of the
+                result shape to fill.
+            filename: Write the result to this ``.npy`` file and return it
+                memory-mapped.
+            as_numpy: Return an ndarray even if every piece is a list.
+        """
+        pieces: Iterable[Any] = args[0]
+        axis: int = kwargs.get("axis", 0)
+        out = kwargs.get("out")
+        filename: Optional[str] = kwargs.get("filename")
+        as_numpy: bool = kwargs.get("as_numpy", False)
+
+        if axis not in (0, 1):
+            raise InvalidInputError(f"concatenate: axis must be 0 or 1, got {axis!r}.")
+        if out is not None and filename is not None:
+            raise InvalidInputError("concatenate: give out= or filename=, not both.")
+        numpy = as_numpy or filename is not None or isinstance(out, np.ndarray)
+
+        if axis == 1 or isinstance(pieces, Sized):
+            blocks = [_piece(m) for m in pieces]
+            return self._preallocated(blocks, axis, out, filename, numpy, trace)
+        return self._streamed(iter(pieces), out, filename, numpy, trace)
+
+    # ── sized input ─────────────────────────────────────────────────── #
+    def _preallocated(
+        self,
+        blocks: List[Any],
+        axis: int,
+        out: Any,
+        filename: Optional[str],
+        numpy: bool,
+        trace: Trace,
+    ) -> Union[InternalMatrix, np.ndarray]:
+        if not blocks:
+            raise InvalidInputError("No matrices provided for concatenation.")
+        shapes = [_shape(b) for b in blocks]
+        other = shapes[0][1 - axis]
+        for idx, s in enumerate(shapes):
+            if s[1 - axis] != other:
+                raise ShapeMismatchError(
+                    expected=f"{other} {'columns' if axis == 0 else 'rows'}",
+                    got=f"{s[1 - axis]} (matrix {idx})",
+                    operation="concatenate",
+                )
+        total = sum(s[axis] for s in shapes)
+        shape = (total, other) if axis == 0 else (other, total)
+        numpy = numpy or any(isinstance(b, np.ndarray) for b in blocks)
+
+        trace.record(
+            operation="concatenate",
+            description=f"Concatenating {len(blocks)} matrices along axis {axis} into {shape[0]}×{shape[1]}",
+        )
+        if out is not None:
+            validate_out(out, shape, "concatenate")
+            dest, where = out, "the caller's buffer"
+        elif filename is not None:
+            dest, where = np.lib.format.open_memmap(filename, mode="w+", dtype=np.float64, shape=shape), filename
+        elif numpy:
+            dest, where = np.empty(shape), "one ndarray"
+        else:
+            dest, where = [None] * shape[0] if axis == 0 else [[0.0] * total for _ in range(other)], "one list"
+        self._record_checkpoint(
+            f"1. Sized {len(blocks)} piece(s) in one pass: result {shape[0]}×{shape[1]}, allocated once in {where}."
+        )
+
+        start = 0
+        for block, s in zip(blocks, shapes):
+            n = s[axis]
+            if isinstance(dest, np.ndarray):
+                if axis == 0:
+                    dest[start:start + n] = block
+                else:
+                    dest[:, start:start + n] = block
+            elif axis == 0:
+                for i, row in enumerate(block):
+                    if out is None:
+                        dest[start + i] = list(map(float, row))
+                    else:
+                        dest[start + i][:] = map(float, row)
+            else:
+                for row_out, row in zip(dest, block):
+                    row_out[start:start + n] = map(float, row)
+            start += n
+        if isinstance(dest, np.memmap):
+            dest.flush()
+        self._record_checkpoint("2. Copied every piece into place once.")
+        return dest
+
+    # ── streams along axis 0 ────────────────────────────────────────── #
+    def _streamed(
+        self,
+        it: Iterator[Any],
+        out: Any,
+        filename: Optional[str],
+        numpy: bool,
+        trace: Trace,
+    ) -> Union[InternalMatrix, np.ndarray]:
+        first = next(it, None)
+        if first is None:
+            raise InvalidInputError("No matrices provided for concatenation.")
+        first = _piece(first)
+        cols = _shape(first)[1]
+        numpy = numpy or isinstance(first, np.ndarray)
+
+        def blocks() -> Iterator[Tuple[Any, int]]:
+            yield first, _shape(first)[0]
+            for idx, m in enumerate(it, start=1):
+                block = _piece(m)
+                rows, c = _shape(block)
+                if c != cols:
+                    raise ShapeMismatchError(
+                        expected=f"{cols} columns", got=f"{c} (matrix {idx})", operation="concatenate"
+                    )
+                yield block, rows
+
+        if out is not None:
+            rows_out = len(out)
+            validate_out(out, (rows_out, cols), "concatenate")
+            n = 0
+            for block, rows in blocks():
+                if n + rows > rows_out:
+                    raise ShapeMismatchError(
+                        expected=f"out with room for the stream ({rows_out} rows)",
+                        got=f"at least {n + rows} rows",
+                        operation="concatenate",
+                    )
+                if isinstance(out, np.ndarray):
+                    out[n:n + rows] = block
+                else:
+                    for i, row in enumerate(block):
+                        out[n + i][:] = map(float, row)
+                n += rows
+            if n != rows_out:
+                raise ShapeMismatchError(expected=f"{rows_out} rows (out)", got=f"{n} rows", operation="concatenate")
+            if isinstance(out, np.memmap):
+                out.flush()
+            self._record_checkpoint(f"1. Streamed {n} row(s) straight into the caller's buffer.")
+            result: Any = out
+        elif filename is not None:
+            n = 0
+            try:
+                with open(filename, "wb") as fh:
+                    fh.write(b"\0" * _NPY_HEADER_BYTES)
+                    for block, rows in blocks():
+                        np.ascontiguousarray(block, dtype=np.float64).tofile(fh)
+                        n += rows
+                    fh.seek(0)
+                    fh.write(_npy_header((n, cols)))
+            except BaseException:
+                # a half-written file has no valid header; do not leave it behind
+                os.remove(filename)
+                raise
+            self._record_checkpoint(
+                f"1. Streamed {n} row(s) sequentially to {filename}, then wrote the .npy header; "
+                "the result never had to fit in memory."
+            )
+            result = np.load(filename, mmap_mode="r+")
+        elif numpy:
+            capacity = max(_shape(first)[0], CONCAT_CHUNK_BYTES // (8 * max(1, cols)))
+            result = np.empty((capacity, cols))
+            n = grows = 0
+            for block, rows in blocks():
+                if n + rows > capacity:
+                    capacity = max(2 * capacity, n + rows)
+                    result.resize((capacity, cols), refcheck=False)
+                    grows += 1
+                result[n:n + rows] = block
+                n += rows
+            result.resize((n, cols), refcheck=False)
+            self._record_checkpoint(
+                f"1. Streamed {n} row(s) into a buffer grown in place {grows} time(s) by doubling, "
+                "then trimmed to size."
+            )
+        else:
+            result = []
+            for block, _ in blocks():
+                result.extend(list(map(float, row)) for row in block)
+            n = len(result)
+            self._record_checkpoint(f"1. Streamed {n} row(s) into one list.")
+
+        trace.record(
+            operation="concatenate",
+            description=f"Concatenated a stream into {n}×{cols}",
+        )
+        return result
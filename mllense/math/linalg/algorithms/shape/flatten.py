@@ -1,17 +1,21 @@
 # ==============================
 # File: linalg/algorithms/shape/flatten.py
 # ==============================
-"""Flatten a matrix to a 1-D vector (row-major)."""
+"""Flatten a matrix to a 1-D vector (row-major), as a view where possible."""
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Union
+
+import numpy as np
 
 from mllense.math.linalg.algorithms.shape.base import BaseShape
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix, InternalVector
+from mllense.math.linalg.core.validation import validate_out
+from mllense.math.linalg.core.view import MatrixView, readonly
 
 __all__ = ["Flatten"]
 
@@ -35,7 +39,15 @@ class Flatten(BaseShape):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalVector:
+    ) -> Union[MatrixView, np.ndarray, InternalVector]:
+        """Args: args[0] = matrix.
+
+        A row-major-contiguous input is flattened in O(1) to a 1-D view of
+        the same storage; otherwise it is copied once.
+
+        Keyword Args:
+            out: Optional list / 1-D ndarray of length ``rows*cols`` to write into.
+        """
         m: InternalMatrix = args[0]
 
         rows = len(m)
@@ -46,4 +58,13 @@ class Flatten(BaseShape):
             description=f"Flattening {rows}×{cols} → ({rows * cols},)",
         )
 
-        return [v for row in m for v in row]
+        out = kwargs.get("out")
+        if out is None:
+            return readonly(np.ravel(m)) if isinstance(m, np.ndarray) else MatrixView.of(m).ravel()
+        validate_out(out, (rows * cols,), "flatten")
+        if isinstance(out, np.ndarray):
+            out[...] = np.ravel(m)
+            return out
+        for i, row in enumerate(m):
+            out[i * cols: (i + 1) * cols] = row
+        return out
@@ -1,17 +1,21 @@
 # ==============================
 # File: linalg/algorithms/shape/reshape.py
 # ==============================
-"""Reshape a matrix to a new shape (row-major)."""
+"""Reshape a matrix to a new shape (row-major), as a view where possible."""
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Union
+
+import numpy as np
 
 from mllense.math.linalg.algorithms.shape.base import BaseShape
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix
+from mllense.math.linalg.core.validation import validate_out
+from mllense.math.linalg.core.view import MatrixView, readonly
 from mllense.math.linalg.exceptions import ShapeMismatchError
 
 __all__ = ["Reshape"]
@@ -36,7 +40,15 @@ class Reshape(BaseShape):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalMatrix:
+    ) -> Union[MatrixView, np.ndarray, InternalMatrix]:
+        """Args: args[0] = matrix, args[1] = new_rows, args[2] = new_cols.
+
+        A row-major-contiguous input is reshaped in O(1) to a view of the
+        same storage; otherwise (e.g. a transposed view) it is copied once.
+
+        Keyword Args:
+            out: Optional ``new_rows×new_cols`` list / ndarray to write into.
+        """
         m: InternalMatrix = args[0]
         new_rows: int = args[1]
         new_cols: int = args[2]
@@ -57,5 +69,18 @@ class Reshape(BaseShape):
             description=f"Reshaping {rows}×{cols} → {new_rows}×{new_cols}",
         )
 
-        flat = [v for row in m for v in row]
-        return [flat[i * new_cols: (i + 1) * new_cols] for i in range(new_rows)]
+        out = kwargs.get("out")
+        if out is not None:
+            validate_out(out, (new_rows, new_cols), "reshape")
+            if isinstance(out, np.ndarray):
+                out[...] = np.reshape(m, (new_rows, new_cols))
+                return out
+            values = (v for row in m for v in row)
+            for row_out in out:
+                for j in range(new_cols):
+                    row_out[j] = next(values)
+            return out
+
+        if isinstance(m, np.ndarray):
+            return readonly(np.reshape(m, (new_rows, new_cols)))
+        return MatrixView.of(m).reshape(new_rows, new_cols)
@@ -4,15 +4,57 @@
 """Solve algorithm family."""
 
 from mllense.math.linalg.algorithms.solve.back_substitution import BackSubstitution
-from mllense.math.linalg.algorithms.solve.cholesky import CholeskySolve, cholesky_decompose
+from mllense.math.linalg.algorithms.solve.cholesky import (
+    CholeskyFactorization,
+    CholeskySolve,
+    cholesky_decompose,
+    cholesky_factor,
+    cholesky_update,
+    is_cholesky_candidate,
+)
 from mllense.math.linalg.algorithms.solve.gaussian import GaussianSolve
-from mllense.math.linalg.algorithms.solve.lu import LUSolve, lu_decompose
+from mllense.math.linalg.algorithms.solve.lu import (
+    LUFactorization,
+    LUSolve,
+    lu_decompose,
+    lu_decompose_packed,
+    lu_factor,
+)
+from mllense.math.linalg.algorithms.solve.mixed_precision import (
+    MixedPrecisionSolve,
+    lu_factor_blocked,
+    lu_solve_blocked,
+)
+from mllense.math.linalg.algorithms.solve.norm_estimate import (
+    cond1_estimate,
+    onenorm_estimate,
+)
+from mllense.math.linalg.algorithms.solve.triangular import (
+    TriangularSolve,
+    triangular_inverse,
+    triangular_solve,
+)
 
 __all__ = [
     "BackSubstitution",
+    "CholeskyFactorization",
     "CholeskySolve",
     "GaussianSolve",
+    "LUFactorization",
     "LUSolve",
+    "MixedPrecisionSolve",
+    "TriangularSolve",
     "cholesky_decompose",
+    "cholesky_factor",
+    "cholesky_update",
+    "cond1_estimate",
+    "is_cholesky_candidate",
     "lu_decompose",
+    "lu_decompose_packed",
+    "lu_factor",
+    "lu_factor_blocked",
+    "lu_solve_blocked",
+    "onenorm_estimate",
+    "triangular_inverse",
+    "triangular_solve",
 ]
@@ -5,16 +5,14 @@
 
 from __future__ import annotations
 
-import math
 from typing import Any
 
-from mllense.math.linalg._internal.constants import SINGULAR_PIVOT_THRESHOLD
 from mllense.math.linalg.algorithms.solve.base import BaseSolve
+from mllense.math.linalg.algorithms.solve.triangular import triangular_solve
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix, InternalVector
-from mllense.math.linalg.exceptions import SingularMatrixError
 
 __all__ = ["BackSubstitution"]
 
@@ -54,14 +52,7 @@ class BackSubstitution(BaseSolve):
             description=f"Back-substitution on {n}×{n} upper-triangular system",
         )
 
-        x: InternalVector = [0.0] * n
-        for i in range(n - 1, -1, -1):
-            if abs(u[i][i]) < SINGULAR_PIVOT_THRESHOLD:
-                raise SingularMatrixError(
-                    f"Zero diagonal at U[{i}][{i}]. System is singular."
-                )
-            s = math.fsum(u[i][j] * x[j] for j in range(i + 1, n))
-            x[i] = (b[i] - s) / u[i][i]
+        x: InternalVector = triangular_solve(u, b, lower=False)
 
         trace.record(
             operation="back_sub_done",
@@ -4,56 +4,117 @@
 """Cholesky decomposition and Cholesky-based solve for SPD matrices.
 
 Only applicable to symmetric positive-definite (SPD) matrices.
-Complexity: O(n³/3).
+Complexity: O(n³/3) to factor, O(n²) for a rank-1 update or downdate
+of an existing factor.
 """
 
 from __future__ import annotations
 
+import dataclasses
 import math
-from typing import Any, Tuple
+from dataclasses import dataclass
+from operator import mul
+from typing import Any, Optional, Tuple, Union
 
+from mllense.math.linalg._internal.constants import CHOLESKY_BLOCK_SIZE
 from mllense.math.linalg.algorithms.solve.base import BaseSolve
+from mllense.math.linalg.algorithms.solve.norm_estimate import cond1_estimate
+from mllense.math.linalg.algorithms.solve.triangular import (
+    lower_inverse_rows,
+    triangular_solve,
+)
+from mllense.math.linalg.core.cache import get_decomposition_cache
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import InternalMatrix, InternalVector
 from mllense.math.linalg.core.validation import validate_square
-from mllense.math.linalg.exceptions import InvalidInputError, SingularMatrixError
+from mllense.math.linalg.exceptions import (
+    InvalidInputError,
+    ShapeMismatchError,
+    SingularMatrixError,
+)
+from mllense.math.linalg.utils.inspection import is_symmetric
 
-__all__ = ["CholeskySolve", "cholesky_decompose"]
+__all__ = [
+    "CholeskyFactorization",
+    "CholeskySolve",
+    "cholesky_decompose",
+    "cholesky_factor",
+    "cholesky_update",
+    "is_cholesky_candidate",
+]
+
+
+def is_cholesky_candidate(a: InternalMatrix) -> bool:
+    """Cheap necessary test for SPD: positive diagonal and symmetry.
+
+    Passing does not guarantee positive-definiteness — callers should
+    still be ready for :func:`cholesky_decompose` to reject the matrix.
+    """
+    n = len(a)
+    return all(a[i][i] > 0.0 for i in range(n)) and is_symmetric(a)
 
 
 def cholesky_decompose(
-    a: InternalMatrix, trace: Trace | None = None
+    a: InternalMatrix,
+    trace: Trace | None = None,
+    *,
+    block_size: int = CHOLESKY_BLOCK_SIZE,
 ) -> InternalMatrix:
     """Compute the Cholesky decomposition ``A = L L^T``.
 
+    Blocked left-looking variant: columns are processed in panels of
+    ``block_size``.  Each panel first receives the contribution of every
+    already-factored column in one sweep (one dot product of length ``k0``
+    per entry, with the row prefixes sliced once), and is then factored
+    with short dot products that only span the panel itself.
+
     Args:
         a: Symmetric positive-definite matrix (n×n).
+        block_size: Panel width.
 
     Returns:
         Lower-triangular matrix L such that ``A = L @ L^T``.
     """
     n = len(a)
     l: InternalMatrix = [[0.0] * n for _ in range(n)]
+    block_size = max(1, block_size)
 
-    for i in range(n):
-        for j in range(i + 1):
-            s = math.fsum(l[i][k] * l[j][k] for k in range(j))
-            if i == j:
-                val = a[i][i] - s
-                if val <= 0.0:
-                    raise InvalidInputError(
-                        f"Matrix is not positive-definite: "
-                        f"a[{i}][{i}] - sum = {val:.2e} <= 0"
-                    )
-                l[i][j] = math.sqrt(val)
-            else:
-                if abs(l[j][j]) < 1e-15:
-                    raise SingularMatrixError(
-                        f"Zero diagonal L[{j}][{j}] during Cholesky."
-                    )
-                l[i][j] = (a[i][j] - s) / l[j][j]
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+
+        # left-looking update: A[k0:, k0:k1] - L[k0:, :k0] L[k0:k1, :k0]^T
+        heads = [l[j][:k0] for j in range(k0, k1)]
+        panel: InternalMatrix = []
+        for i in range(k0, n):
+            li = l[i][:k0]
+            ai = a[i]
+            panel.append([
+                ai[j] - math.fsum(map(mul, li, heads[j - k0]))
+                for j in range(k0, min(i + 1, k1))
+            ])
+
+        # factor the diagonal block and solve the rows below it
+        for i in range(k0, n):
+            row = panel[i - k0]
+            li = l[i]
+            for j in range(k0, min(i + 1, k1)):
+                lj = l[j]
+                val = row[j - k0] - math.fsum(map(mul, li[k0:j], lj[k0:j]))
+                if i == j:
+                    if val <= 0.0:
+                        raise InvalidInputError(
+                            f"Matrix is not positive-definite: "
+                            f"a[{i}][{i}] - sum = {val:.2e} <= 0"
+                        )
+                    li[j] = math.sqrt(val)
+                else:
+                    if abs(lj[j]) < 1e-15:
+                        raise SingularMatrixError(
+                            f"Zero diagonal L[{j}][{j}] during Cholesky."
+                        )
+                    li[j] = val / lj[j]
 
     if trace is not None:
         trace.record(
@@ -65,6 +126,173 @@ def cholesky_decompose(
     return l
 
 
+def cholesky_update(
+    l: InternalMatrix,
+    x: InternalVector,
+    *,
+    downdate: bool = False,
+) -> InternalMatrix:
+    """Return the factor of ``L L^T + x x^T`` (or ``- x x^T``) in O(n^2).
+
+    Applies one Givens-style (hyperbolic for a downdate) rotation per
+    column.  ``l`` itself is left untouched, so a failed downdate never
+    corrupts the original factor.
+
+    Args:
+        l: Lower-triangular Cholesky factor (n×n).
+        x: Update vector of length n.
+        downdate: Remove ``x x^T`` instead of adding it.
+
+    Raises:
+        InvalidInputError: If the downdated matrix is not positive-definite.
+    """
+    n = len(l)
+    if len(x) != n:
+        raise ShapeMismatchError(
+            expected=f"vector of length {n}",
+            got=f"length {len(x)}",
+            operation="choldowndate" if downdate else "cholupdate",
+        )
+    new_l: InternalMatrix = [row[:] for row in l]
+    w = list(x)
+    sigma = -1.0 if downdate else 1.0
+
+    for k in range(n):
+        wk = w[k]
+        if wk == 0.0:
+            continue
+        lkk = new_l[k][k]
+        r2 = lkk * lkk + sigma * wk * wk
+        if r2 <= 0.0:
+            raise InvalidInputError(
+                f"Downdate would make the matrix not positive-definite "
+                f"(column {k}: L[k][k]^2 - x[k]^2 = {r2:.2e} <= 0)"
+            )
+        r = math.sqrt(r2)
+        c = r / lkk
+        s = wk / lkk
+        new_l[k][k] = r
+        for i in range(k + 1, n):
+            row = new_l[i]
+            lik = (row[k] + sigma * s * w[i]) / c
+            row[k] = lik
+            w[i] = c * w[i] - s * lik
+
+    return new_l
+
+
+@dataclass
+class CholeskyFactorization:
+    """Reusable handle for a Cholesky factorization ``A = L L^T``.
+
+    Attributes:
+        l: Lower-triangular Cholesky factor.
+    """
+
+    l: InternalMatrix
+
+    @property
+    def n(self) -> int:
+        return len(self.l)
+
+    def solve(
+        self, b: Union[InternalVector, InternalMatrix]
+    ) -> Union[InternalVector, InternalMatrix]:
+        """Solve ``A x = b`` using the stored factor.
+
+        ``b`` may be a vector or an ``n × k`` matrix of right-hand sides.
+        """
+        y = triangular_solve(self.l, b, lower=True)
+        return triangular_solve(self.l, y, lower=True, trans=True)
+
+    def matvec(self, x: InternalVector) -> InternalVector:
+        """Return ``A x = L (L^T x)`` from the factor, in O(n^2)."""
+        l, n = self.l, self.n
+        y = [0.0] * n
+        for i in range(n):
+            xi = x[i]
+            if xi != 0.0:
+                y[: i + 1] = [a + f * xi for a, f in zip(y, l[i][: i + 1])]
+        return [math.fsum(map(mul, l[i][: i + 1], y)) for i in range(n)]
+
+    def cond1_estimate(self, anorm: Optional[float] = None) -> float:
+        """Estimate the 1-norm condition number in O(n^2).
+
+        ``A`` is symmetric, so the estimator's transposed products reuse
+        :meth:`solve` and :meth:`matvec` directly.
+        """
+        return cond1_estimate(
+            self.solve, self.solve, self.n, anorm, matvec=self.matvec, matvec_t=self.matvec
+        )
+
+    def inverse(self) -> InternalMatrix:
+        """Return ``A^{-1} = L^{-T} L^{-1}``.
+
+        Only the upper triangle of the symmetric product is accumulated;
+        it is then mirrored into the lower triangle.
+        """
+        n = self.n
+        l_inv = lower_inverse_rows(self.l)
+        result: InternalMatrix = [[0.0] * n for _ in range(n)]
+        # A^{-1}[i][j] = sum_k L^{-1}[k][i] * L^{-1}[k][j], for i <= j <= k
+        for k in range(n):
+            r = l_inv[k]
+            for i in range(k + 1):
+                ri = r[i]
+                if ri != 0.0:
+                    res_i = result[i]
+                    res_i[i: k + 1] = [a + ri * v for a, v in zip(res_i[i: k + 1], r[i:])]
+        for i in range(n):
+            res_i = result[i]
+            for j in range(i + 1, n):
+                result[j][i] = res_i[j]
+        return result
+
+    def diag_of_inverse(self) -> InternalVector:
+        """Return ``diag(A^{-1})`` as the squared column norms of ``L^{-1}``."""
+        n = self.n
+        l_inv = lower_inverse_rows(self.l)
+        return [math.fsum(l_inv[k][i] ** 2 for k in range(i, n)) for i in range(n)]
+
+    def update(self, x: InternalVector) -> "CholeskyFactorization":
+        """Replace the factor with that of ``A + x x^T`` (O(n^2)); returns ``self``."""
+        self.l = cholesky_update(self.l, x)
+        return self
+
+    def downdate(self, x: InternalVector) -> "CholeskyFactorization":
+        """Replace the factor with that of ``A - x x^T`` (O(n^2)); returns ``self``.
+
+        The factor is unchanged if the downdate fails.
+        """
+        self.l = cholesky_update(self.l, x, downdate=True)
+        return self
+
+    def slogdet(self) -> Tuple[float, float]:
+        """Return ``(1.0, log det A)`` as ``2 * sum(log L[i][i])``."""
+        return 1.0, 2.0 * math.fsum(math.log(self.l[i][i]) for i in range(self.n))
+
+
+def cholesky_factor(
+    a: InternalMatrix, trace: Trace | None = None
+) -> CholeskyFactorization:
+    """Factor an SPD matrix and return a reusable :class:`CholeskyFactorization`.
+
+    Factors are memoized in the shared decomposition cache.
+    """
+    n = validate_square(a, operation="cholesky_factor")
+    factor, hit = get_decomposition_cache().get_or_compute(
+        "cholesky", a, lambda: CholeskyFactorization(l=cholesky_decompose(a, trace=trace))
+    )
+    if hit and trace is not None:
+        trace.record(
+            operation="cholesky_decompose",
+            description=f"Reused cached Cholesky factorization for {n}×{n} matrix",
+        )
+    # copied rows: neither update()/downdate() nor in-place ops on the handle's
+    # factor may reach the cached one
+    return dataclasses.replace(factor, l=[row[:] for row in factor.l])
+
+
 class CholeskySolve(BaseSolve):
     """Solve ``Ax = b`` using Cholesky decomposition for SPD matrices."""
 
@@ -84,9 +312,9 @@ class CholeskySolve(BaseSolve):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalVector:
+    ) -> Union[InternalVector, InternalMatrix]:
         a: InternalMatrix = args[0]
-        b: InternalVector = args[1]
+        b: Union[InternalVector, InternalMatrix] = args[1]
         n = validate_square(a, operation="cholesky_solve")
 
         trace.record(
@@ -94,23 +322,14 @@ class CholeskySolve(BaseSolve):
             description=f"Cholesky solve on {n}×{n} system",
         )
 
-        l = cholesky_decompose(a, trace=trace)
-
-        # forward substitution: Ly = b
-        y: InternalVector = [0.0] * n
-        for i in range(n):
-            s = math.fsum(l[i][j] * y[j] for j in range(i))
-            y[i] = (b[i] - s) / l[i][i]
+        factor = cholesky_factor(a, trace=trace)
 
-        # back substitution: L^T x = y
-        x: InternalVector = [0.0] * n
-        for i in range(n - 1, -1, -1):
-            s = math.fsum(l[j][i] * x[j] for j in range(i + 1, n))
-            x[i] = (y[i] - s) / l[i][i]
+        # forward substitution Ly = b, then back substitution L^T x = y
+        x = factor.solve(b)
 
         trace.record(
             operation="cholesky_solve_done",
-            description=f"Solution vector (length {n})",
+            description=f"Solution computed (length {n})",
             data=x,
         )
 
@@ -19,7 +19,6 @@ Edge-case handling:
 
 from __future__ import annotations
 
-import math
 from typing import Any
 
 from mllense.math.linalg._internal.constants import (
@@ -27,6 +26,7 @@ from mllense.math.linalg._internal.constants import (
     SINGULAR_PIVOT_THRESHOLD,
 )
 from mllense.math.linalg.algorithms.base import BaseAlgorithm
+from mllense.math.linalg.algorithms.solve.triangular import triangular_solve
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
@@ -137,11 +137,10 @@ class GaussianSolve(BaseAlgorithm):
             )
 
         # ── back substitution ─────────────────────────────────────────── #
-        x: InternalVector = [0.0] * n
-        for i in range(n - 1, -1, -1):
-            s = math.fsum(aug[i][j] * x[j] for j in range(i + 1, n))
-            x[i] = (aug[i][n] - s) / aug[i][i]
-
+        # the kernel reads only the upper triangle, so the augmented
+        # rows can be passed as-is
+        x: InternalVector = triangular_solve(aug, [row[n] for row in aug], lower=False)
+        for i in range(n):
             if abs(x[i]) > FLOAT_OVERFLOW_GUARD:
                 raise NumericalInstabilityError(
                     f"Float overflow in back-substitution: x[{i}] = {x[i]}"
@@ -1,15 +1,31 @@
 # ==============================
 # File: linalg/algorithms/solve/lu.py
 # ==============================
-"""LU Decomposition with partial pivoting, and LU-based solve."""
+"""LU Decomposition with partial pivoting, and LU-based solve.
+
+The factorization is computed in *packed* form: the strictly-lower part
+of a single matrix holds ``L`` (whose unit diagonal is implicit) and the
+upper part holds ``U``.  :class:`LUFactorization` wraps the packed
+factor so it can be reused for many solves or determinants without
+factoring the matrix again.
+"""
 
 from __future__ import annotations
 
+import dataclasses
 import math
-from typing import Any, Tuple
+from dataclasses import dataclass
+from operator import mul
+from typing import Any, List, Optional, Tuple, Union
 
 from mllense.math.linalg._internal.constants import SINGULAR_PIVOT_THRESHOLD
 from mllense.math.linalg.algorithms.solve.base import BaseSolve
+from mllense.math.linalg.algorithms.solve.norm_estimate import cond1_estimate
+from mllense.math.linalg.algorithms.solve.triangular import (
+    lower_inverse_rows,
+    triangular_solve,
+)
+from mllense.math.linalg.core.cache import get_decomposition_cache
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.trace import Trace
@@ -17,30 +33,39 @@ from mllense.math.linalg.core.types import InternalMatrix, InternalVector
 from mllense.math.linalg.core.validation import validate_square
 from mllense.math.linalg.exceptions import SingularMatrixError
 
-__all__ = ["LUSolve", "lu_decompose"]
+__all__ = [
+    "LUFactorization",
+    "LUSolve",
+    "lu_decompose",
+    "lu_decompose_packed",
+    "lu_factor",
+]
 
 
-def lu_decompose(
+def lu_decompose_packed(
     a: InternalMatrix, trace: Trace | None = None
-) -> Tuple[InternalMatrix, InternalMatrix, list[int]]:
-    """Compute PA = LU decomposition with partial pivoting.
+) -> Tuple[InternalMatrix, List[int], int]:
+    """Compute ``PA = LU`` with partial pivoting, in packed form.
 
     Returns:
-        (L, U, perm) where ``perm`` is the row permutation vector.
+        ``(lu, perm, swaps)`` where ``lu`` holds ``L`` below the diagonal
+        and ``U`` on and above it, ``perm`` is the row permutation vector
+        and ``swaps`` is the number of row interchanges performed (its
+        parity is the sign of the permutation).
     """
     n = len(a)
-    # deep copy
-    u: InternalMatrix = [row[:] for row in a]
-    l: InternalMatrix = [[0.0] * n for _ in range(n)]
+    lu: InternalMatrix = [row[:] for row in a]
     perm = list(range(n))
+    swaps = 0
 
     for col in range(n):
         # partial pivot
-        max_val = abs(u[col][col])
+        max_val = abs(lu[col][col])
         max_row = col
         for row in range(col + 1, n):
-            if abs(u[row][col]) > max_val:
-                max_val = abs(u[row][col])
+            v = abs(lu[row][col])
+            if v > max_val:
+                max_val = v
                 max_row = row
 
         if max_val < SINGULAR_PIVOT_THRESHOLD:
@@ -49,33 +74,201 @@ def lu_decompose(
             )
 
         if max_row != col:
-            u[col], u[max_row] = u[max_row], u[col]
-            l[col], l[max_row] = l[max_row], l[col]
+            lu[col], lu[max_row] = lu[max_row], lu[col]
             perm[col], perm[max_row] = perm[max_row], perm[col]
+            swaps += 1
 
-        l[col][col] = 1.0
-
+        pivot_row = lu[col]
+        pivot = pivot_row[col]
+        tail = pivot_row[col + 1:]
         for row in range(col + 1, n):
-            factor = u[row][col] / u[col][col]
-            l[row][col] = factor
-            for j in range(col, n):
-                u[row][j] -= factor * u[col][j]
-            u[row][col] = 0.0
-
-    # set remaining diagonal of L
-    for i in range(n):
-        l[i][i] = 1.0
+            r = lu[row]
+            factor = r[col] / pivot
+            r[col] = factor
+            if factor != 0.0:
+                r[col + 1:] = [x - factor * y for x, y in zip(r[col + 1:], tail)]
 
     if trace is not None:
         trace.record(
             operation="lu_decompose",
-            description=f"LU decomposition complete for {n}×{n} matrix",
-            data={"L": l, "U": u, "perm": perm},
+            description=f"Packed LU decomposition complete for {n}×{n} matrix ({swaps} row swaps)",
+            data={"LU": lu, "perm": perm},
         )
 
+    return lu, perm, swaps
+
+
+def lu_decompose(
+    a: InternalMatrix, trace: Trace | None = None
+) -> Tuple[InternalMatrix, InternalMatrix, list[int]]:
+    """Compute PA = LU decomposition with partial pivoting.
+
+    Returns:
+        (L, U, perm) where ``perm`` is the row permutation vector.
+    """
+    lu, perm, _swaps = lu_decompose_packed(a, trace=trace)
+    n = len(lu)
+    l: InternalMatrix = [
+        [lu[i][j] if j < i else (1.0 if j == i else 0.0) for j in range(n)]
+        for i in range(n)
+    ]
+    u: InternalMatrix = [[0.0] * i + lu[i][i:] for i in range(n)]
     return l, u, perm
 
 
+@dataclass
+class LUFactorization:
+    """Reusable handle for a packed ``PA = LU`` factorization.
+
+    Attributes:
+        lu: Packed factor (``L`` strictly below the diagonal, ``U`` on and above).
+        perm: Row permutation vector (``(PA)[i] = A[perm[i]]``).
+        swaps: Number of row interchanges performed during pivoting.
+    """
+
+    lu: InternalMatrix
+    perm: List[int]
+    swaps: int = 0
+
+    @property
+    def n(self) -> int:
+        return len(self.lu)
+
+    @property
+    def L(self) -> InternalMatrix:
+        n = self.n
+        return [
+            [self.lu[i][j] if j < i else (1.0 if j == i else 0.0) for j in range(n)]
+            for i in range(n)
+        ]
+
+    @property
+    def U(self) -> InternalMatrix:
+        return [[0.0] * i + self.lu[i][i:] for i in range(self.n)]
+
+    def solve(
+        self, b: Union[InternalVector, InternalMatrix], *, trans: bool = False
+    ) -> Union[InternalVector, InternalMatrix]:
+        """Solve ``A x = b`` (or ``A^T x = b``) using the stored factor.
+
+        ``b`` may be a vector or an ``n × k`` matrix of right-hand sides.
+        """
+        if trans:
+            # A^T = U^T L^T P, so solve U^T z = b, L^T y = z, x = P^T y
+            z = triangular_solve(self.lu, b, lower=False, trans=True)
+            y = triangular_solve(self.lu, z, lower=True, trans=True, unit_diagonal=True)
+            x: list[Any] = [None] * self.n
+            for i, p in enumerate(self.perm):
+                x[p] = y[i]
+            return x
+        pb = [b[p] for p in self.perm]
+        y = triangular_solve(self.lu, pb, lower=True, unit_diagonal=True)
+        return triangular_solve(self.lu, y, lower=False)
+
+    def matvec(self, x: InternalVector, *, trans: bool = False) -> InternalVector:
+        """Return ``A x`` (or ``A^T x``) from the factors, in O(n^2)."""
+        lu, n = self.lu, self.n
+        if trans:
+            # A^T x = U^T L^T P x
+            v = [x[p] for p in self.perm]
+            w = list(v)
+            for i in range(1, n):
+                vi = v[i]
+                if vi != 0.0:
+                    w[:i] = [a + f * vi for a, f in zip(w[:i], lu[i][:i])]
+            r = [0.0] * n
+            for i in range(n):
+                wi = w[i]
+                if wi != 0.0:
+                    r[i:] = [a + f * wi for a, f in zip(r[i:], lu[i][i:])]
+            return r
+        # A x = P^T L U x
+        u = [math.fsum(map(mul, lu[i][i:], x[i:])) for i in range(n)]
+        z = [u[i] + math.fsum(map(mul, lu[i][:i], u[:i])) for i in range(n)]
+        y = [0.0] * n
+        for i, p in enumerate(self.perm):
+            y[p] = z[i]
+        return y
+
+    def cond1_estimate(self, anorm: Optional[float] = None) -> float:
+        """Estimate the 1-norm condition number in O(n^2).
+
+        Uses the Hager/Higham estimator on ``A^{-1}`` through the stored
+        factor.  Pass ``anorm = ||A||_1`` when the matrix is at hand;
+        otherwise it is estimated from the factors as well.
+        """
+        return cond1_estimate(
+            self.solve,
+            lambda v: self.solve(v, trans=True),
+            self.n,
+            anorm,
+            matvec=self.matvec,
+            matvec_t=lambda v: self.matvec(v, trans=True),
+        )
+
+    def inverse(self) -> InternalMatrix:
+        """Return ``A^{-1}`` by solving ``A X = I`` with two multi-RHS triangular solves."""
+        n = self.n
+        # rows of P I, i.e. the permuted identity
+        p_eye = [[1.0 if j == p else 0.0 for j in range(n)] for p in self.perm]
+        y = triangular_solve(self.lu, p_eye, lower=True, unit_diagonal=True)
+        return triangular_solve(self.lu, y, lower=False)
+
+    def diag_of_inverse(self) -> InternalVector:
+        """Return ``diag(A^{-1})`` without forming the full inverse.
+
+        ``A^{-1} = U^{-1} L^{-1} P``, so each diagonal entry is a single
+        dot product between a row of ``U^{-1}`` and a column of ``L^{-1}``.
+        """
+        n = self.n
+        l_inv = lower_inverse_rows(self.lu, unit_diagonal=True)
+        # ragged rows of inv(U^T); inv(U)[i][k] == ut_inv[k][i]
+        ut_inv = lower_inverse_rows(self.lu, trans=True)
+        # column i of (L^{-1} P) is column pinv[i] of L^{-1}
+        pinv = [0] * n
+        for m, p in enumerate(self.perm):
+            pinv[p] = m
+        diag: InternalVector = []
+        for i in range(n):
+            c = pinv[i]
+            diag.append(
+                math.fsum(ut_inv[k][i] * l_inv[k][c] for k in range(max(i, c), n))
+            )
+        return diag
+
+    def slogdet(self) -> Tuple[float, float]:
+        """Return ``(sign, log|det A|)`` from the diagonal of ``U``."""
+        sign = -1.0 if self.swaps % 2 else 1.0
+        logs: list[float] = []
+        for i in range(self.n):
+            d = self.lu[i][i]
+            if d == 0.0:
+                return 0.0, float("-inf")
+            if d < 0.0:
+                sign = -sign
+            logs.append(math.log(abs(d)))
+        return sign, math.fsum(logs)
+
+
+def lu_factor(a: InternalMatrix, trace: Trace | None = None) -> LUFactorization:
+    """Factor a square matrix and return a reusable :class:`LUFactorization`.
+
+    Factors are memoized in the shared decomposition cache, so factoring
+    the same matrix contents again costs one hash instead of O(n^3).
+    """
+    n = validate_square(a, operation="lu_factor")
+    factor, hit = get_decomposition_cache().get_or_compute(
+        "lu", a, lambda: LUFactorization(*lu_decompose_packed(a, trace=trace))
+    )
+    if hit and trace is not None:
+        trace.record(
+            operation="lu_decompose",
+            description=f"Reused cached LU factorization for {n}×{n} matrix",
+        )
+    # a fresh handle over copied rows, so callers cannot disturb the cached one
+    return dataclasses.replace(factor, lu=[row[:] for row in factor.lu], perm=factor.perm[:])
+
+
 class LUSolve(BaseSolve):
     """Solve ``Ax = b`` via LU decomposition with partial pivoting."""
 
@@ -95,9 +288,9 @@ class LUSolve(BaseSolve):
         context: ExecutionContext,
         trace: Trace,
         **kwargs: Any,
-    ) -> InternalVector:
+    ) -> Union[InternalVector, InternalMatrix]:
         a: InternalMatrix = args[0]
-        b: InternalVector = args[1]
+        b: Union[InternalVector, InternalMatrix] = args[1]
         n = validate_square(a, operation="lu_solve")
 
         trace.record(
@@ -105,30 +298,14 @@ class LUSolve(BaseSolve):
             description=f"LU solve on {n}×{n} system",
         )
 
-        l, u, perm = lu_decompose(a, trace=trace)
+        factor = lu_factor(a, trace=trace)
 
-        # apply permutation to b
-        pb = [b[perm[i]] for i in range(n)]
-
-        # forward substitution: Ly = Pb
-        y: InternalVector = [0.0] * n
-        for i in range(n):
-            s = math.fsum(l[i][j] * y[j] for j in range(i))
-            y[i] = pb[i] - s
-
-        # back substitution: Ux = y
-        x: InternalVector = [0.0] * n
-        for i in range(n - 1, -1, -1):
-            s = math.fsum(u[i][j] * x[j] for j in range(i + 1, n))
-            if abs(u[i][i]) < SINGULAR_PIVOT_THRESHOLD:
-                raise SingularMatrixError(
-                    f"Zero diagonal at U[{i}][{i}] during back-substitution."
-                )
-            x[i] = (y[i] - s) / u[i][i]
+        # forward substitution Ly = Pb, then back substitution Ux = y
+        x = factor.solve(b)
 
         trace.record(
             operation="lu_solve_done",
-            description=f"Solution vector (length {n})",
+            description=f"Solution computed (length {n})",
             data=x,
         )
 
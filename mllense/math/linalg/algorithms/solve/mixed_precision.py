@@ -0,0 +1,231 @@
+# ==============================
+# File: linalg/algorithms/solve/mixed_precision.py
+# ==============================
+"""Mixed-precision solve: float32 LU plus float64 iterative refinement.
+
+The O(n^3) factorization runs in single precision — half the memory
+traffic of float64 and roughly twice the BLAS throughput — and each
+O(n^2) refinement step computes the residual ``r = b - A x`` in double
+precision and corrects ``x`` with a single-precision solve.  For systems
+with ``cond(A)`` well below ``1 / eps_32 ≈ 1.7e7`` a few steps recover a
+float64-accurate solution.
+
+The loop stops once the normwise backward error
+(:func:`~mllense.math.linalg.diagnostics.error_analysis.backward_error`)
+reaches ``sqrt(n) * eps_64``.  When it stops halving from one step to
+the next — the system is too ill-conditioned for a float32 factor —
+or when ``A`` does not fit the float32 range, the solve falls back to a
+float64 factorization, as LAPACK's ``xSGESV`` does.
+
+Complexity: O(2n^3/3) in float32, plus O(n^2) per refinement step.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, List, Tuple, Union
+
+import numpy as np
+
+from mllense.math.linalg._internal.constants import (
+    LU_BLOCK_SIZE,
+    MIXED_PRECISION_MAX_REFINEMENTS,
+    SINGULAR_PIVOT_THRESHOLD,
+)
+from mllense.math.linalg.algorithms.solve.base import BaseSolve
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import AlgorithmMetadata
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.types import InternalMatrix, InternalVector
+from mllense.math.linalg.core.validation import validate_solve_shapes
+from mllense.math.linalg.diagnostics.error_analysis import backward_error
+from mllense.math.linalg.exceptions import SingularMatrixError
+
+__all__ = ["MixedPrecisionSolve", "lu_factor_blocked", "lu_solve_blocked"]
+
+
+def lu_factor_blocked(
+    a: np.ndarray,
+    dtype: Any = np.float64,
+    *,
+    block_size: int = LU_BLOCK_SIZE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Right-looking blocked ``PA = LU`` in the given floating ``dtype``.
+
+    Each panel of ``block_size`` columns is factored with partial pivoting,
+    the matching block row of ``U`` is solved for, and the trailing matrix
+    receives one matrix-matrix update, so almost all of the work runs in
+    BLAS-3 at the chosen precision.
+
+    Returns:
+        ``(lu, perm)`` in the packed layout of :func:`lu_decompose_packed`.
+
+    Raises:
+        SingularMatrixError: If a pivot is exactly zero (or below the
+            singular threshold relative to the largest entry).
+    """
+    lu = np.array(a, dtype=dtype, order="C")
+    n = lu.shape[0]
+    perm = np.arange(n)
+    scale = float(np.abs(lu).max(initial=0.0))
+    threshold = SINGULAR_PIVOT_THRESHOLD * max(scale, 1.0)
+    block_size = max(1, block_size)
+
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+        # unblocked factorization of the panel lu[k0:, k0:k1]
+        for j in range(k0, k1):
+            p = j + int(np.argmax(np.abs(lu[j:, j])))
+            if not abs(lu[p, j]) > threshold:
+                raise SingularMatrixError(
+                    f"Near-zero pivot at column {j} during LU decomposition."
+                )
+            if p != j:
+                lu[[j, p]] = lu[[p, j]]
+                perm[[j, p]] = perm[[p, j]]
+            lu[j + 1:, j] /= lu[j, j]
+            if j + 1 < k1:
+                lu[j + 1:, j + 1:k1] -= np.outer(lu[j + 1:, j], lu[j, j + 1:k1])
+        if k1 < n:
+            # U12 = L11^{-1} A12, then the trailing update A22 -= L21 U12
+            for j in range(k0, k1 - 1):
+                lu[j + 1:k1, k1:] -= np.outer(lu[j + 1:k1, j], lu[j, k1:])
+            lu[k1:, k1:] -= lu[k1:, k0:k1] @ lu[k0:k1, k1:]
+    return lu, perm
+
+
+def lu_solve_blocked(lu: np.ndarray, perm: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Solve ``A x = b`` from :func:`lu_factor_blocked` output, in ``lu.dtype``."""
+    n = lu.shape[0]
+    x = np.array(b, dtype=lu.dtype)[perm]
+    # forward substitution with the unit lower triangle
+    for j in range(n - 1):
+        x[j + 1:] -= lu[j + 1:, j] * x[j]
+    # back substitution with the upper triangle
+    for j in range(n - 1, -1, -1):
+        x[j] /= lu[j, j]
+        x[:j] -= lu[:j, j] * x[j]
+    return x
+
+
+class MixedPrecisionSolve(BaseSolve):
+    """Solve ``Ax = b`` with a float32 LU factor and float64 iterative refinement."""
+
+    metadata = AlgorithmMetadata(
+        name="mixed_precision_solve",
+        operation="solve",
+        complexity="O(n^3) float32 + O(n^2) per refinement",
+        stable=True,
+        supports_batch=False,
+        requires_square=True,
+        description=(
+            "Factor in single precision, refine on double-precision residuals "
+            "until the backward error reaches float64 level; falls back to a "
+            "float64 factorization when refinement stalls."
+        ),
+    )
+
+    def execute(
+        self,
+        *args: Any,
+        context: ExecutionContext,
+        trace: Trace,
+        **kwargs: Any,
+    ) -> Union[InternalVector, np.ndarray]:
+        """Solve ``Ax = b``.
+
+        Args:
+            args[0]: A (InternalMatrix or ndarray, n×n)
+            args[1]: b (InternalVector or ndarray, length n)
+
+        Keyword Args:
+            max_refinements: Refinement steps before giving up on float32
+                (default :data:`MIXED_PRECISION_MAX_REFINEMENTS`).
+            tol: Target normwise backward error (default ``sqrt(n) * eps_64``).
+
+        Returns:
+            ``x`` — an ndarray if ``A`` was given as one, else a list.
+        """
+        a = args[0]
+        b = args[1]
+        max_refinements: int = kwargs.get("max_refinements", MIXED_PRECISION_MAX_REFINEMENTS)
+
+        return_numpy = isinstance(a, np.ndarray)
+        a64 = np.asarray(a, dtype=np.float64)
+        b64 = np.asarray(b, dtype=np.float64)
+        n = validate_solve_shapes(a64, b64)
+        tol: float = kwargs.get("tol", math.sqrt(n) * float(np.finfo(np.float64).eps))
+
+        trace.record(
+            operation="mixed_precision_start",
+            description=f"Mixed-precision solve on {n}×{n} system (float32 LU, float64 refinement)",
+            complexity_note=f"O({n}^3) in float32 + O({n}^2) per step",
+        )
+
+        x = self._refine(a64, b64, n, tol, max_refinements, trace)
+        if x is None:
+            lu, perm = lu_factor_blocked(a64, np.float64)
+            x = lu_solve_blocked(lu, perm, b64)
+            self._record_checkpoint(
+                f"{len(self._checkpoints) + 1}. Refactored A in float64 and solved directly."
+            )
+            trace.record(
+                operation="mixed_precision_fallback",
+                description="Solved with a float64 LU factorization",
+            )
+
+        trace.record(
+            operation="mixed_precision_done",
+            description=f"Solution computed (length {n})",
+        )
+        return x if return_numpy else x.tolist()
+
+    def _refine(
+        self,
+        a64: np.ndarray,
+        b64: np.ndarray,
+        n: int,
+        tol: float,
+        max_refinements: int,
+        trace: Trace,
+    ) -> Union[np.ndarray, None]:
+        """Return the refined solution, or ``None`` if float64 is needed."""
+        if float(np.abs(a64).max(initial=0.0)) >= float(np.finfo(np.float32).max):
+            self._record_checkpoint("1. A exceeds the float32 range; skipping the single-precision factor.")
+            return None
+        try:
+            lu32, perm = lu_factor_blocked(a64, np.float32)
+        except SingularMatrixError:
+            self._record_checkpoint("1. The float32 factor hit a zero pivot; falling back to float64.")
+            return None
+        self._record_checkpoint(f"1. Factored PA = LU in float32 ({n}×{n}).")
+
+        x = lu_solve_blocked(lu32, perm, b64).astype(np.float64)
+        history: List[float] = []
+        for step in range(max_refinements + 1):
+            berr = backward_error(a64, b64, x, normwise=True)
+            history.append(berr)
+            trace.record(
+                operation="mixed_precision_refine",
+                description=f"Step {step}: normwise backward error {berr:.3e}",
+                data={"step": step, "backward_error": berr},
+            )
+            if berr <= tol:
+                self._record_checkpoint(
+                    f"2. Refined in {step} step(s) to a backward error of {berr:.1e} "
+                    f"(target {tol:.1e})."
+                )
+                return x
+            if step and (not np.isfinite(berr) or berr > 0.5 * history[-2]):
+                break
+            if step == max_refinements:
+                break
+            # correction from the float32 factor, applied in float64
+            r = b64 - a64 @ x
+            x = x + lu_solve_blocked(lu32, perm, r).astype(np.float64)
+
+        self._record_checkpoint(
+            f"2. Refinement stalled after {len(history) - 1} step(s) at a backward error "
+            f"of {history[-1]:.1e}; A is too ill-conditioned for a float32 factor."
+        )
+        return None
@@ -0,0 +1,108 @@
+# ==============================
+# File: linalg/algorithms/solve/norm_estimate.py
+# ==============================
+"""Hager/Higham 1-norm estimation for implicitly given matrices.
+
+The estimator only needs products with ``B`` and ``B^T``, so applied to
+``B = A^{-1}`` through an existing LU or Cholesky factor it estimates
+``||A^{-1}||_1`` with a handful of O(n^2) triangular solves instead of
+forming the inverse or an O(n^3) SVD.  The result is a lower bound that
+is exact in most cases and rarely off by more than a factor of 3.
+
+References:
+    W. W. Hager, "Condition estimates", SIAM J. Sci. Stat. Comput. 5 (1984).
+    N. J. Higham, "FORTRAN codes for estimating the one-norm of a real or
+    complex matrix", ACM TOMS 14 (1988), Algorithm 4.1.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Optional
+
+from mllense.math.linalg.core.types import InternalVector
+from mllense.math.linalg.exceptions import InvalidInputError
+
+__all__ = ["cond1_estimate", "onenorm_estimate"]
+
+MatVec = Callable[[InternalVector], InternalVector]
+
+
+def onenorm_estimate(
+    apply: MatVec,
+    apply_t: MatVec,
+    n: int,
+    *,
+    max_iterations: int = 5,
+) -> float:
+    """Estimate ``||B||_1`` from the products ``x -> B x`` and ``x -> B^T x``.
+
+    Runs Hager's gradient ascent on the unit 1-norm ball, starting from the
+    uniform vector and stopping as soon as the estimate stops growing, then
+    takes the maximum with Higham's alternating-sign test vector, which
+    catches the matrices the ascent is known to underestimate.
+
+    Args:
+        apply: Computes ``B x``.
+        apply_t: Computes ``B^T x``.
+        n: Order of ``B``.
+        max_iterations: Upper bound on the ascent steps (each costs one
+            product with ``B`` and one with ``B^T``).
+    """
+    if n == 0:
+        return 0.0
+
+    x: InternalVector = [1.0 / n] * n
+    est = 0.0
+    signs: Optional[list[float]] = None
+    for it in range(max_iterations):
+        y = apply(x)
+        new_est = math.fsum(abs(v) for v in y)
+        if it > 0 and new_est <= est:
+            break
+        est = new_est
+        new_signs = [1.0 if v >= 0.0 else -1.0 for v in y]
+        if new_signs == signs:
+            # the same vertex again: the ascent has converged
+            break
+        signs = new_signs
+        z = apply_t(signs)
+        j = max(range(n), key=lambda i: abs(z[i]))
+        if it > 0 and abs(z[j]) <= math.fsum(zi * xi for zi, xi in zip(z, x)):
+            break
+        x = [0.0] * n
+        x[j] = 1.0
+
+    if n > 1:
+        b = [(-1.0) ** i * (1.0 + i / (n - 1)) for i in range(n)]
+        alt = 2.0 * math.fsum(abs(v) for v in apply(b)) / (3.0 * n)
+        est = max(est, alt)
+    return est
+
+
+def cond1_estimate(
+    solve: MatVec,
+    solve_t: MatVec,
+    n: int,
+    anorm: Optional[float] = None,
+    *,
+    matvec: Optional[MatVec] = None,
+    matvec_t: Optional[MatVec] = None,
+) -> float:
+    """Estimate ``kappa_1(A) = ||A||_1 * ||A^{-1}||_1`` from a factorization.
+
+    Args:
+        solve: Computes ``A^{-1} x`` (a factor's forward/back substitution).
+        solve_t: Computes ``A^{-T} x``.
+        n: Order of ``A``.
+        anorm: ``||A||_1`` if already known (O(n^2) from the matrix itself).
+        matvec / matvec_t: Products with ``A`` and ``A^T``, used to estimate
+            ``||A||_1`` when ``anorm`` is not given.
+    """
+    if anorm is None:
+        if matvec is None or matvec_t is None:
+            raise InvalidInputError("cond1_estimate needs either anorm or matvec/matvec_t.")
+        anorm = onenorm_estimate(matvec, matvec_t, n)
+    if anorm == 0.0:
+        return float("inf")
+    return anorm * onenorm_estimate(solve, solve_t, n)
@@ -4,6 +4,6 @@
 """Public API layer — thin wrappers over the registry + algorithms."""
 
 from mllense.math.linalg.api.matmul import matmul
-from mllense.math.linalg.api.solve import solve
+from mllense.math.linalg.api.solve import solve, solve_triangular
 
-__all__ = ["matmul", "solve"]
+__all__ = ["matmul", "solve", "solve_triangular"]
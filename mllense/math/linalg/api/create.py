@@ -1,10 +1,10 @@
-"""Public API for matrix creation operations: zeros, ones, eye, rand."""
+"""Public API for matrix creation operations: zeros, ones, eye, rand, randn, randint."""
 
 from __future__ import annotations
 
 from mllense.math.linalg.core.metadata import LinalgResult
 
-from typing import Any, Optional, Union
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 
@@ -18,9 +18,9 @@ from mllense.math.linalg.exceptions import InvalidInputError
 from mllense.math.linalg.algorithms.creation.zeros import ZerosCreation
 from mllense.math.linalg.algorithms.creation.ones import OnesCreation
 from mllense.math.linalg.algorithms.creation.eye import EyeCreation
-from mllense.math.linalg.algorithms.creation.rand import RandCreation
+from mllense.math.linalg.algorithms.creation.rand import RandCreation, RandintCreation, RandnCreation
 
-__all__ = ["zeros", "ones", "eye", "rand"]
+__all__ = ["zeros", "ones", "eye", "rand", "randn", "randint"]
 
 
 def _build_context(
@@ -51,11 +51,33 @@ def _format_result(
     return internal
 
 
+def _shape(rows: Optional[int], cols: Optional[int], out: Any) -> Tuple[int, int]:
+    """``(rows, cols)``, taken from ``out`` when ``rows`` is omitted."""
+    if rows is None:
+        if out is None:
+            raise InvalidInputError("Either rows or out= must be given.")
+        if isinstance(out, np.ndarray):
+            if out.ndim != 2:
+                raise InvalidInputError(f"out= must be 2-D, got {out.ndim}-D.")
+            return out.shape
+        if not isinstance(out, list) or not out or not isinstance(out[0], list):
+            raise InvalidInputError("out= must be a non-empty list of lists or a 2-D ndarray.")
+        return len(out), len(out[0])
+    return rows, cols if cols is not None else rows
+
+
+def _check_implicit(implicit: bool, out: Any, as_numpy: bool) -> None:
+    if implicit and (out is not None or as_numpy):
+        raise InvalidInputError("implicit=True stores no elements; it cannot be combined with out= or as_numpy=True.")
+
+
 def zeros(
-    rows: int,
+    rows: Optional[int] = None,
     cols: Optional[int] = None,
     *,
+    out: Optional[MatrixLike] = None,
     as_numpy: bool = False,
+    implicit: bool = False,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -65,16 +87,23 @@ def zeros(
     """Create a zero matrix of shape ``(rows, cols)``.
 
     Args:
-        rows: Number of rows.
+        rows: Number of rows (taken from ``out`` if omitted).
         cols: Number of columns (defaults to ``rows``).
         as_numpy: If True, return a numpy array.
+        out: Optional list of lists / writeable float ndarray to fill in
+            place and return instead of allocating a new matrix.
+        implicit: If True, return a read-only
+            :class:`~mllense.math.linalg.core.constant.ConstantMatrix` storing only
+            the shape and value; ops, ``matmul`` and ``matrix_trace`` treat
+            it in closed form and it is materialized only on demand.
     """
-    c = cols if cols is not None else rows
+    r, c = _shape(rows, cols, out)
+    _check_implicit(implicit, out, as_numpy)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = ZerosCreation()
-    result = algo.execute(rows, c, context=ctx, trace=trace)
-    formatted_val = _format_result(result, as_numpy=as_numpy)
+    result = algo.execute(r, c, context=ctx, trace=trace, out=out, implicit=implicit)
+    formatted_val = result if out is not None or implicit else _format_result(result, as_numpy=as_numpy)
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
@@ -84,10 +113,12 @@ def zeros(
 
 
 def ones(
-    rows: int,
+    rows: Optional[int] = None,
     cols: Optional[int] = None,
     *,
+    out: Optional[MatrixLike] = None,
     as_numpy: bool = False,
+    implicit: bool = False,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -97,16 +128,23 @@ def ones(
     """Create a matrix of ones of shape ``(rows, cols)``.
 
     Args:
-        rows: Number of rows.
+        rows: Number of rows (taken from ``out`` if omitted).
         cols: Number of columns (defaults to ``rows``).
         as_numpy: If True, return a numpy array.
+        out: Optional list of lists / writeable float ndarray to fill in
+            place and return instead of allocating a new matrix.
+        implicit: If True, return a read-only
+            :class:`~mllense.math.linalg.core.constant.ConstantMatrix` storing only
+            the shape and value; ops, ``matmul`` and ``matrix_trace`` treat
+            it in closed form and it is materialized only on demand.
     """
-    c = cols if cols is not None else rows
+    r, c = _shape(rows, cols, out)
+    _check_implicit(implicit, out, as_numpy)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = OnesCreation()
-    result = algo.execute(rows, c, context=ctx, trace=trace)
-    formatted_val = _format_result(result, as_numpy=as_numpy)
+    result = algo.execute(r, c, context=ctx, trace=trace, out=out, implicit=implicit)
+    formatted_val = result if out is not None or implicit else _format_result(result, as_numpy=as_numpy)
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
@@ -116,10 +154,12 @@ def ones(
 
 
 def eye(
-    rows: int,
+    rows: Optional[int] = None,
     cols: Optional[int] = None,
     *,
+    out: Optional[MatrixLike] = None,
     as_numpy: bool = False,
+    implicit: bool = False,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -129,16 +169,23 @@ def eye(
     """Create an identity-like matrix of shape ``(rows, cols)``.
 
     Args:
-        rows: Number of rows.
+        rows: Number of rows (taken from ``out`` if omitted).
         cols: Number of columns (defaults to ``rows``).
         as_numpy: If True, return a numpy array.
+        out: Optional list of lists / writeable float ndarray to fill in
+            place and return instead of allocating a new matrix.
+        implicit: If True, return a read-only
+            :class:`~mllense.math.linalg.core.constant.ScaledIdentity` storing only
+            the shape and value; ops, ``matmul`` and ``matrix_trace`` treat
+            it in closed form and it is materialized only on demand.
     """
-    c = cols if cols is not None else rows
+    r, c = _shape(rows, cols, out)
+    _check_implicit(implicit, out, as_numpy)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = EyeCreation()
-    result = algo.execute(rows, c, context=ctx, trace=trace)
-    formatted_val = _format_result(result, as_numpy=as_numpy)
+    result = algo.execute(r, c, context=ctx, trace=trace, out=out, implicit=implicit)
+    formatted_val = result if out is not None or implicit else _format_result(result, as_numpy=as_numpy)
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
@@ -148,38 +195,133 @@ def eye(
 
 
 def rand(
-    rows: int,
+    rows: Optional[int] = None,
     cols: Optional[int] = None,
     *,
-    seed: Optional[int] = None,
+    out: Optional[MatrixLike] = None,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
     low: float = 0.0,
     high: float = 1.0,
     as_numpy: bool = False,
+    workers: int = 1,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> MatrixLike:
-    """Create a random matrix of shape ``(rows, cols)``.
+    """Create a random matrix of shape ``(rows, cols)``, uniform in ``[low, high)``.
+
+    Values come from per-chunk ``numpy.random.Generator`` streams spawned
+    from ``SeedSequence(seed)``; no global random state is used, so
+    concurrent calls in different threads do not affect each other.
 
     Args:
-        rows: Number of rows.
+        rows: Number of rows (taken from ``out`` if omitted).
         cols: Number of columns (defaults to ``rows``).
-        seed: Random seed for reproducibility.
+        seed: Int or ``SeedSequence`` for reproducibility (OS entropy if None).
         low: Lower bound for values.
         high: Upper bound for values.
         as_numpy: If True, return a numpy array.
+        out: Optional list of lists / writeable float ndarray (an
+            ``np.memmap`` included) to fill in place and return.
+        workers: Threads filling chunks in parallel; the result for a
+            given seed does not depend on it.
     """
-    c = cols if cols is not None else rows
+    r, c = _shape(rows, cols, out)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = RandCreation()
-    result = algo.execute(rows, c, context=ctx, trace=trace, seed=seed, low=low, high=high)
-    formatted_val = _format_result(result, as_numpy=as_numpy)
+    result = algo.execute(
+        r, c, context=ctx, trace=trace,
+        seed=seed, low=low, high=high, out=out, as_numpy=as_numpy, workers=workers,
+    )
     return LinalgResult(
-        value=formatted_val,
-        what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
-        how_lense=algo._finalize_how_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "how_lense_enabled")) and locals()["ctx"].how_lense_enabled else "",
-        metadata=getattr(locals().get("algo"), "metadata", None)
-    )
\ No newline at end of file
+        value=result,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def randn(
+    rows: Optional[int] = None,
+    cols: Optional[int] = None,
+    *,
+    out: Optional[MatrixLike] = None,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+    mean: float = 0.0,
+    std: float = 1.0,
+    as_numpy: bool = False,
+    workers: int = 1,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """Create a matrix of normal samples of shape ``(rows, cols)``.
+
+    Args:
+        rows: Number of rows (taken from ``out`` if omitted).
+        cols: Number of columns (defaults to ``rows``).
+        mean: Mean of the distribution.
+        std: Standard deviation (non-negative).
+        seed, out, as_numpy, workers: As for :func:`rand`.
+    """
+    r, c = _shape(rows, cols, out)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = RandnCreation()
+    result = algo.execute(
+        r, c, context=ctx, trace=trace,
+        seed=seed, mean=mean, std=std, out=out, as_numpy=as_numpy, workers=workers,
+    )
+    return LinalgResult(
+        value=result,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def randint(
+    rows: Optional[int] = None,
+    cols: Optional[int] = None,
+    *,
+    high: int,
+    low: int = 0,
+    out: Optional[MatrixLike] = None,
+    seed: Optional[Union[int, np.random.SeedSequence]] = None,
+    as_numpy: bool = False,
+    workers: int = 1,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """Create a matrix of random integers in ``[low, high)`` of shape ``(rows, cols)``.
+
+    Args:
+        rows: Number of rows (taken from ``out`` if omitted).
+        cols: Number of columns (defaults to ``rows``).
+        high: One past the largest value.
+        low: Smallest value.
+        seed, out, as_numpy, workers: As for :func:`rand`.  Without ``out``
+            the result holds ints (an int64 array with ``as_numpy``).
+    """
+    r, c = _shape(rows, cols, out)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = RandintCreation()
+    result = algo.execute(
+        r, c, context=ctx, trace=trace,
+        seed=seed, low=low, high=high, out=out, as_numpy=as_numpy, workers=workers,
+    )
+    return LinalgResult(
+        value=result,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
@@ -1,13 +1,16 @@
-"""Public API for decomposition operations: det, inverse, trace, qr, svd, eig."""
+"""Public API for decomposition operations: det, slogdet, inverse, trace, qr, independent_columns, svd, eig, eigh."""
 
 from __future__ import annotations
 
 from mllense.math.linalg.core.metadata import LinalgResult
+from mllense.math.linalg._internal.constants import WOODBURY_CAPACITANCE_COND_LIMIT
 
-from typing import Any, Optional, Tuple, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
+from mllense.math.linalg.core.cache import get_decomposition_cache
+from mllense.math.linalg.core.constant import as_implicit
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.mode import ExecutionMode
 from mllense.math.linalg.core.trace import Trace
@@ -15,17 +18,73 @@ from mllense.math.linalg.core.types import (
     InternalMatrix,
     InternalVector,
     MatrixLike,
+    VectorLike,
     is_numpy,
     to_internal_matrix,
+    to_internal_vector,
+)
+from mllense.math.linalg.exceptions import InvalidInputError
+from mllense.math.linalg.expr.graph import Expr
+from mllense.math.linalg.utils.inspection import is_symmetric
+from mllense.math.linalg.algorithms.decomposition.det import Determinant, LogDeterminant
+from mllense.math.linalg.algorithms.decomposition.inverse import (
+    FactorizedInverse,
+    Inverse,
+    InverseDiagonal,
 )
-from mllense.math.linalg.algorithms.decomposition.det import Determinant
-from mllense.math.linalg.algorithms.decomposition.inverse import Inverse
 from mllense.math.linalg.algorithms.decomposition.trace import MatrixTrace
+from mllense.math.linalg.algorithms.elementwise.implicit import ImplicitAlgebra
+from mllense.math.linalg.algorithms.decomposition.woodbury import InverseUpdate
 from mllense.math.linalg.algorithms.decomposition.qr import QRDecomposition
+from mllense.math.linalg.algorithms.decomposition.qrcp import PivotedQRDecomposition
+from mllense.math.linalg.algorithms.decomposition.randomized_svd import RandomizedSVD
 from mllense.math.linalg.algorithms.decomposition.svd import SVDDecomposition
 from mllense.math.linalg.algorithms.decomposition.eig import EigenDecomposition
+from mllense.math.linalg.algorithms.decomposition.eigh import SymmetricEigenDecomposition
+from mllense.math.linalg.algorithms.solve.cholesky import (
+    CholeskyFactorization,
+    cholesky_factor as _cholesky_factor,
+    cholesky_update as _cholesky_update,
+)
+from mllense.math.linalg.algorithms.solve.lu import (
+    LUFactorization,
+    lu_factor as _lu_factor,
+)
+
+__all__ = [
+    "det",
+    "slogdet",
+    "slogdet_batch",
+    "lu_factor",
+    "cho_factor",
+    "cholupdate",
+    "choldowndate",
+    "inv",
+    "diag_of_inverse",
+    "inverse_update",
+    "matrix_trace",
+    "qr",
+    "independent_columns",
+    "svd",
+    "eig",
+    "eigh",
+]
+
+Factorization = Union[LUFactorization, CholeskyFactorization]
 
-__all__ = ["det", "inv", "matrix_trace", "qr", "svd", "eig"]
+
+def _copy_factors(factors: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Copy cached factors so callers can modify what they get back."""
+    return tuple(
+        f.copy() if isinstance(f, np.ndarray)
+        else [row[:] if isinstance(row, list) else row for row in f]
+        for f in factors
+    )
+
+
+def _unwrap(x: Any) -> Any:
+    """Return the value of a :class:`LinalgResult` (e.g. from :func:`inv`), else ``x``."""
+    return x.value if isinstance(x, LinalgResult) else x
 
 
 def _build_context(
@@ -63,7 +122,77 @@ def det(
     return Determinant().execute(a_int, context=ctx, trace=trace)
 
 
-def inv(
+def slogdet(
+    a: Union[MatrixLike, Factorization],
+    *,
+    method: str = "auto",
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> Tuple[float, float]:
+    """Compute the sign and natural log of ``|det A|``.
+
+    The log-determinant is accumulated from the LU or Cholesky diagonal in
+    log space, so it stays finite where :func:`det` would overflow or
+    underflow.  ``det(A) == sign * exp(logabsdet)``.
+
+    Args:
+        a: Square matrix, or a handle returned by :func:`lu_factor` /
+            :func:`cho_factor` (the matrix is then not factored again).
+        method: ``"auto"`` (Cholesky for symmetric positive-diagonal
+            matrices, else LU), ``"lu"`` or ``"cholesky"``.
+
+    Returns:
+        ``(sign, logabsdet)``; singular matrices give ``(0.0, -inf)``.
+    """
+    target = a if isinstance(a, (LUFactorization, CholeskyFactorization)) else to_internal_matrix(a)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    return LogDeterminant().execute(target, context=ctx, trace=trace, method=method)
+
+
+def slogdet_batch(
+    matrices: Union[Sequence[Union[MatrixLike, Factorization]], np.ndarray],
+    *,
+    method: str = "auto",
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> Tuple[Any, Any]:
+    """Batched :func:`slogdet` over a stack of matrices.
+
+    Args:
+        matrices: A 3-D ``ndarray`` of shape ``(batch, n, n)`` or a sequence
+            of square matrices / factorization handles.
+        method: Factorization method, as for :func:`slogdet`.
+
+    Returns:
+        ``(signs, logabsdets)`` — ndarrays if the input was an ndarray,
+        otherwise lists.
+    """
+    return_numpy = is_numpy(matrices)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = LogDeterminant()
+
+    signs: List[float] = []
+    logabsdets: List[float] = []
+    for m in matrices:
+        target = m if isinstance(m, (LUFactorization, CholeskyFactorization)) else to_internal_matrix(m)
+        sign, logabsdet = algo.execute(target, context=ctx, trace=trace, method=method)
+        signs.append(sign)
+        logabsdets.append(logabsdet)
+
+    if return_numpy:
+        return np.array(signs, dtype=np.float64), np.array(logabsdets, dtype=np.float64)
+    return signs, logabsdets
+
+
+def lu_factor(
     a: MatrixLike,
     *,
     backend: Optional[str] = None,
@@ -71,19 +200,197 @@ def inv(
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
-) -> MatrixLike:
-    """Compute the inverse of a square matrix."""
-    return_numpy = is_numpy(a)
+) -> LUFactorization:
+    """Factor ``PA = LU`` once and return a reusable handle.
+
+    The handle exposes ``solve(b)`` and ``slogdet()`` and can be passed to
+    :func:`slogdet` so the same matrix is never factored twice.
+    """
     a_int = to_internal_matrix(a)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    result = Inverse().execute(a_int, context=ctx, trace=trace)
+    return _lu_factor(a_int, trace=trace)
+
+
+def cho_factor(
+    a: MatrixLike,
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> CholeskyFactorization:
+    """Factor a symmetric positive-definite ``A = L L^T`` and return a reusable handle.
+
+    The handle exposes ``solve(b)`` and ``slogdet()`` and can be passed to
+    :func:`slogdet` so the same matrix is never factored twice.
+    """
+    a_int = to_internal_matrix(a)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    return _cholesky_factor(a_int, trace=trace)
+
+
+def _cholesky_rank_one(
+    factor: Union[CholeskyFactorization, MatrixLike],
+    x: VectorLike,
+    downdate: bool,
+) -> Union[CholeskyFactorization, MatrixLike]:
+    is_handle = isinstance(factor, CholeskyFactorization)
+    return_numpy = not is_handle and is_numpy(factor)
+    l_int = factor.l if is_handle else to_internal_matrix(factor)
+    new_l = _cholesky_update(l_int, to_internal_vector(x), downdate=downdate)
+    if is_handle:
+        return CholeskyFactorization(l=new_l)
+    return np.array(new_l, dtype=np.float64) if return_numpy else new_l
+
+
+def cholupdate(
+    factor: Union[CholeskyFactorization, MatrixLike],
+    x: VectorLike,
+) -> Union[CholeskyFactorization, MatrixLike]:
+    """Return the Cholesky factor of ``A + x x^T`` given that of ``A``, in O(n^2).
+
+    Args:
+        factor: A handle from :func:`cho_factor` or a lower-triangular ``L``.
+        x: Update vector of length n.
+
+    Returns:
+        A new handle (or ``L`` in the same container type as the input);
+        the input factor is not modified.
+    """
+    return _cholesky_rank_one(factor, x, False)
+
+
+def choldowndate(
+    factor: Union[CholeskyFactorization, MatrixLike],
+    x: VectorLike,
+) -> Union[CholeskyFactorization, MatrixLike]:
+    """Return the Cholesky factor of ``A - x x^T`` given that of ``A``, in O(n^2).
+
+    Raises:
+        InvalidInputError: If ``A - x x^T`` is not positive-definite.
+    """
+    return _cholesky_rank_one(factor, x, True)
+
+
+def inv(
+    a: Union[MatrixLike, Factorization],
+    *,
+    method: str = "auto",
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Compute the inverse of a square matrix.
+
+    Args:
+        a: Square matrix, or a handle returned by :func:`lu_factor` /
+            :func:`cho_factor`.
+        method: ``"auto"`` (Cholesky for symmetric positive-diagonal
+            matrices, else LU), ``"lu"``, ``"cholesky"`` or
+            ``"gauss_jordan"`` (the step-by-step elimination).
+
+    With a lazy ``a`` the inverse is deferred; :func:`evaluate` will turn
+    ``inv(A) @ b`` into a solve rather than form it.
+    """
+    if isinstance(a, Expr):
+        return Expr.inv(a)
+    return_numpy = is_numpy(a)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    if isinstance(a, (LUFactorization, CholeskyFactorization)):
+        algo = FactorizedInverse()
+        result = algo.execute(a, context=ctx, trace=trace)
+    elif method == "gauss_jordan":
+        algo = Inverse()
+        result = algo.execute(to_internal_matrix(a), context=ctx, trace=trace)
+    else:
+        algo = FactorizedInverse()
+        result = algo.execute(to_internal_matrix(a), context=ctx, trace=trace, method=method)
+    formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
+    return LinalgResult(
+        value=formatted_val,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def diag_of_inverse(
+    a: Union[MatrixLike, Factorization],
+    *,
+    method: str = "auto",
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Compute ``diag(A^{-1})`` without forming the full inverse.
+
+    Useful for posterior variances, leverage scores and similar quantities
+    that only need the diagonal.
+
+    Args:
+        a: Square matrix or an existing factorization handle.
+        method: ``"auto"``, ``"lu"`` or ``"cholesky"``.
+    """
+    return_numpy = is_numpy(a)
+    target = a if isinstance(a, (LUFactorization, CholeskyFactorization)) else to_internal_matrix(a)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = InverseDiagonal()
+    result = algo.execute(target, context=ctx, trace=trace, method=method)
     formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
     return LinalgResult(
         value=formatted_val,
-        what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
-        how_lense=algo._finalize_how_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "how_lense_enabled")) and locals()["ctx"].how_lense_enabled else "",
-        metadata=getattr(locals().get("algo"), "metadata", None)
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def inverse_update(
+    a_inv: MatrixLike,
+    u: Union[MatrixLike, VectorLike],
+    v: Union[MatrixLike, VectorLike],
+    *,
+    a: Optional[MatrixLike] = None,
+    cond_limit: float = WOODBURY_CAPACITANCE_COND_LIMIT,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Return ``(A + U V^T)^{-1}`` from ``A^{-1}`` in O(n^2 k) (Woodbury identity).
+
+    Args:
+        a_inv: The current inverse ``A^{-1}`` (n × n).
+        u, v: ``n × k`` update factors (a length-n vector means ``k = 1``,
+            i.e. Sherman-Morrison).  To change row ``i`` of ``A`` by ``d``
+            pass ``u = e_i`` and ``v = d``.
+        a: The original matrix, used only if the capacitance matrix is too
+            ill-conditioned and the update has to be recomputed from
+            scratch; otherwise ``A`` is recovered from ``a_inv``.
+        cond_limit: Capacitance condition number above which the inverse
+            is recomputed from scratch.
+    """
+    a_inv, u, v, a = (_unwrap(m) for m in (a_inv, u, v, a))
+    return_numpy = is_numpy(a_inv)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = InverseUpdate()
+    result = algo.execute(a_inv, u, v, context=ctx, trace=trace, a=a, cond_limit=cond_limit)
+    return LinalgResult(
+        value=result if return_numpy else result.tolist(),
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
     )
 
 
@@ -96,68 +403,236 @@ def matrix_trace(
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> float:
-    """Compute the trace (sum of diagonal) of a square matrix."""
-    a_int = to_internal_matrix(a)
+    """Compute the trace (sum of diagonal) of a square matrix.
+
+    The trace of an implicit constant or scaled identity is ``n * value``, O(1).
+    """
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
+    if as_implicit(a) is not None:
+        result = ImplicitAlgebra().execute("trace", a, context=ctx, trace=trace)
+        if result is not NotImplemented:
+            return result
+    a_int = to_internal_matrix(a)
     return MatrixTrace().execute(a_int, context=ctx, trace=trace)
 
 
 def qr(
     a: MatrixLike,
     *,
+    pivoting: bool = False,
+    tol: Optional[float] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
-) -> Tuple[MatrixLike, MatrixLike]:
-    """Compute QR decomposition ``A = QR``."""
+) -> Union[Tuple[MatrixLike, MatrixLike], Tuple[MatrixLike, MatrixLike, List[int]]]:
+    """Compute QR decomposition ``A = QR``.
+
+    With ``pivoting=True``, computes the rank-revealing ``A P = Q R`` by
+    Householder QR with column pivoting and returns ``(Q, R, perm)``:
+    ``Q`` is ``m × r`` and ``R`` is ``r × n`` for the numerical rank ``r``
+    (columns whose remaining norm falls below ``tol`` are not eliminated),
+    and ``A[:, perm] ≈ Q R``.
+    """
     return_numpy = is_numpy(a)
-    a_int = to_internal_matrix(a)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    q, r = QRDecomposition().execute(a_int, context=ctx, trace=trace)
+    if pivoting:
+        a_in = a if return_numpy else to_internal_matrix(a)
+        q, r, perm, _rank = PivotedQRDecomposition().execute(a_in, context=ctx, trace=trace, tol=tol)
+        if return_numpy:
+            return q, r, perm
+        return q.tolist(), r.tolist(), perm
+
+    a_int = to_internal_matrix(a)
+    (q, r), hit = get_decomposition_cache().get_or_compute(
+        "qr", a_int, lambda: QRDecomposition().execute(a_int, context=ctx, trace=trace)
+    )
+    if hit:
+        trace.record(operation="qr_done", description="Reused cached QR decomposition")
     if return_numpy:
         return np.array(q, dtype=np.float64), np.array(r, dtype=np.float64)
+    q, r = _copy_factors((q, r))
     return q, r
 
 
+def independent_columns(
+    a: MatrixLike,
+    *,
+    tol: Optional[float] = None,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> List[int]:
+    """Return the indices of a maximal set of linearly independent columns.
+
+    The first ``rank`` pivots of a column-pivoted QR, in ascending order —
+    ``a[:, independent_columns(a)]`` drops redundant (collinear) features
+    while keeping the best-conditioned ones.
+    """
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    a_in = a if is_numpy(a) else to_internal_matrix(a)
+    _q, _r, perm, rank = PivotedQRDecomposition().execute(
+        a_in, context=ctx, trace=trace, tol=tol, compute_q=False
+    )
+    return sorted(perm[:rank])
+
+
+_SVD_METHODS = ("exact", "randomized")
+
+
 def svd(
     a: MatrixLike,
     *,
+    k: Optional[int] = None,
+    method: str = "exact",
+    full_matrices: bool = True,
+    n_oversamples: int = 10,
+    n_iter: int = 2,
+    random_state: Any = None,
+    chunk_size: Optional[int] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> Tuple[MatrixLike, Any, MatrixLike]:
-    """Compute SVD decomposition ``A = U Σ V^T``."""
+    """Compute SVD decomposition ``A = U Σ V^T``.
+
+    Args:
+        a: ``m × n`` matrix.  ndarray inputs (including ``np.memmap``) are
+            used in place and never copied into Python lists.
+        k: Keep only the top ``k`` singular triplets.  Required for
+            ``method="randomized"``.
+        method: ``"exact"`` (LAPACK) or ``"randomized"`` (sketch-based
+            top-``k``, streaming ``A`` in row chunks).
+        full_matrices: For ``"exact"`` without ``k``: ``False`` returns the
+            economy factors (``U`` is ``m × min(m, n)``).
+        n_oversamples: Randomized only — extra sketch columns.
+        n_iter: Randomized only — power iterations (raise for slowly
+            decaying spectra).
+        random_state: Randomized only — seed or ``np.random.Generator``.
+        chunk_size: Randomized only — rows of ``A`` read per block.
+    """
+    if method not in _SVD_METHODS:
+        raise InvalidInputError(
+            f"Unknown svd method {method!r}. Valid methods: {', '.join(_SVD_METHODS)}."
+        )
     return_numpy = is_numpy(a)
-    a_int = to_internal_matrix(a)
+    if return_numpy:
+        if a.ndim != 2 or a.size == 0:
+            raise InvalidInputError(f"Expected a non-empty 2-D array for svd, got shape {a.shape}.")
+        a_in = a
+    else:
+        a_in = to_internal_matrix(a)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    u, sigma, vt = SVDDecomposition().execute(a_int, context=ctx, trace=trace)
-    if return_numpy:
-        return np.array(u, dtype=np.float64), np.array(sigma, dtype=np.float64), np.array(vt, dtype=np.float64)
-    return u, sigma, vt
+    if method == "randomized":
+        def compute() -> Tuple[Any, Any, Any]:
+            return RandomizedSVD().execute(
+                a_in,
+                context=ctx,
+                trace=trace,
+                k=k,
+                n_oversamples=n_oversamples,
+                n_iter=n_iter,
+                random_state=random_state,
+                chunk_size=chunk_size,
+            )
+        # only a seeded sketch is reproducible; memmaps are too large to hash cheaply
+        cacheable = isinstance(random_state, int) and not isinstance(a_in, np.memmap)
+        params: Any = ("randomized", k, n_oversamples, n_iter, random_state, return_numpy)
+    else:
+        def compute() -> Tuple[Any, Any, Any]:
+            return SVDDecomposition().execute(a_in, context=ctx, trace=trace, full_matrices=full_matrices, k=k)
+        cacheable = not isinstance(a_in, np.memmap)
+        params = ("exact", k, full_matrices, return_numpy)
+
+    if not cacheable:
+        return compute()
+    factors, hit = get_decomposition_cache().get_or_compute("svd", a_in, compute, params=params)
+    if hit:
+        trace.record(operation="svd_done", description="Reused cached SVD")
+    return _copy_factors(factors)
 
 
 def eig(
     a: MatrixLike,
     *,
+    symmetric: Optional[bool] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> Tuple[Any, MatrixLike]:
-    """Compute eigenvalues and eigenvectors."""
+    """Compute eigenvalues and eigenvectors.
+
+    Args:
+        a: Square matrix.
+        symmetric: Use the symmetric solver (:func:`eigh`, eigenvalues in
+            ascending order).  ``None`` (default) detects symmetry.
+    """
     return_numpy = is_numpy(a)
     a_int = to_internal_matrix(a)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    eigenvalues, eigenvectors = EigenDecomposition().execute(a_int, context=ctx, trace=trace)
+    if symmetric is None:
+        symmetric = is_symmetric(a if return_numpy else a_int)
+    algo = SymmetricEigenDecomposition() if symmetric else EigenDecomposition()
+    eigenvalues, eigenvectors = algo.execute(a_int, context=ctx, trace=trace)
     if return_numpy:
         return np.array(eigenvalues, dtype=np.float64), np.array(eigenvectors, dtype=np.float64)
     return eigenvalues, eigenvectors
+
+
+def eigh(
+    a: MatrixLike,
+    *,
+    subset_by_index: Optional[Tuple[int, int]] = None,
+    subset_by_value: Optional[Tuple[float, float]] = None,
+    eigvals_only: bool = False,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> Union[Any, Tuple[Any, MatrixLike]]:
+    """Eigenvalues (ascending) and eigenvectors of a symmetric matrix.
+
+    Only the lower triangle of ``a`` is read.
+
+    Args:
+        a: Symmetric square matrix.
+        subset_by_index: ``(lo, hi)`` — return eigenvalues ``lo..hi``
+            (inclusive, ascending order).
+        subset_by_value: ``(vl, vu)`` — return eigenvalues in ``(vl, vu]``.
+        eigvals_only: Return only the eigenvalues.
+
+    Returns:
+        ``w`` if ``eigvals_only`` else ``(w, v)`` with eigenvectors as columns.
+    """
+    return_numpy = is_numpy(a)
+    a_int = to_internal_matrix(a)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    eigenvalues, eigenvectors = SymmetricEigenDecomposition().execute(
+        a_int,
+        context=ctx,
+        trace=trace,
+        subset_by_index=subset_by_index,
+        subset_by_value=subset_by_value,
+        eigvals_only=eigvals_only,
+    )
+    if return_numpy:
+        eigenvalues = np.array(eigenvalues, dtype=np.float64)
+        if eigenvectors is not None:
+            eigenvectors = np.array(eigenvectors, dtype=np.float64).reshape(len(a_int), -1)
+    if eigvals_only:
+        return eigenvalues
+    return eigenvalues, eigenvectors
@@ -0,0 +1,143 @@
+# ==============================
+# File: linalg/api/distance.py
+# ==============================
+"""Public API for pairwise distances, kernel matrices and nearest neighbours."""
+
+from __future__ import annotations
+
+from mllense.math.linalg.core.metadata import LinalgResult
+
+from typing import Any, Optional
+
+import numpy as np
+
+from mllense.math.linalg.algorithms.distance.pairwise import (
+    KernelMatrix,
+    PairwiseDistances,
+    PairwiseTopK,
+)
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.mode import ExecutionMode
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.types import MatrixLike, is_numpy
+
+__all__ = ["kernel_matrix", "pairwise_distances"]
+
+
+def _build_context(
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense_enabled: bool = True,
+    how_lense_enabled: bool = False,
+) -> ExecutionContext:
+    from mllense.math.linalg.config import get_config
+    cfg = get_config()
+    return ExecutionContext(
+        backend=backend or cfg.default_backend,
+        mode=ExecutionMode.from_string(mode or cfg.default_mode),
+        trace_enabled=trace_enabled if trace_enabled is not None else cfg.trace_enabled,
+        what_lense_enabled=what_lense_enabled,
+        how_lense_enabled=how_lense_enabled,
+    )
+
+
+def _unwrap(x: Any) -> Any:
+    return x.value if isinstance(x, LinalgResult) else x
+
+
+def pairwise_distances(
+    x: MatrixLike,
+    y: Optional[MatrixLike] = None,
+    *,
+    metric: str = "euclidean",
+    top_k: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Distances between every row of ``x`` and every row of ``y``.
+
+    Euclidean distances use ``||x||^2 - 2 x·y + ||y||^2`` (one matrix
+    product per block) and rows of ``x`` are processed in blocks that fit
+    :data:`~mllense.math.linalg._internal.constants.PAIRWISE_CHUNK_BYTES`.
+
+    Args:
+        x: ``n_x × d`` samples (an ``np.memmap`` is read block by block).
+        y: ``n_y × d`` samples; ``None`` means ``y = x`` (zero diagonal).
+        metric: ``"euclidean"`` (default), ``"sqeuclidean"``, ``"cosine"``
+            or ``"manhattan"``.
+        top_k: If given, return only the ``top_k`` nearest rows of ``y``
+            for each row of ``x`` — the full matrix is never built.
+        chunk_size: Rows of ``x`` per block (default: from the memory budget).
+
+    Returns:
+        A :class:`LinalgResult` holding the ``n_x × n_y`` distance matrix,
+        or with ``top_k`` a ``(distances, indices)`` tuple of
+        ``n_x × top_k`` arrays sorted nearest first.  Lists in, lists out.
+    """
+    x, y = _unwrap(x), _unwrap(y)
+    return_numpy = is_numpy(x) or is_numpy(y)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+
+    if top_k is not None:
+        algo: Any = PairwiseTopK()
+        dist, idx = algo.execute(
+            x, y, context=ctx, trace=trace, k=top_k, metric=metric, chunk_size=chunk_size
+        )
+        value: Any = (dist, idx) if return_numpy else (dist.tolist(), idx.tolist())
+    else:
+        algo = PairwiseDistances()
+        result = algo.execute(x, y, context=ctx, trace=trace, metric=metric, chunk_size=chunk_size)
+        value = result if return_numpy else result.tolist()
+    return LinalgResult(
+        value=value,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def kernel_matrix(
+    x: MatrixLike,
+    y: Optional[MatrixLike] = None,
+    *,
+    kernel: str = "rbf",
+    gamma: Optional[float] = None,
+    chunk_size: Optional[int] = None,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Kernel (Gram) matrix ``K[i][j] = k(x[i], y[j])``.
+
+    Args:
+        x: ``n_x × d`` samples.
+        y: ``n_y × d`` samples; ``None`` means ``y = x``.
+        kernel: ``"rbf"`` (default, ``exp(-gamma ||x - y||^2)``),
+            ``"laplacian"`` (``exp(-gamma ||x - y||_1)``), ``"linear"``
+            or ``"cosine"``.
+        gamma: Bandwidth for ``rbf`` / ``laplacian``; defaults to ``1 / d``.
+        chunk_size: Rows of ``x`` per block (default: from the memory budget).
+
+    Returns:
+        The ``n_x × n_y`` kernel matrix in the same format as the input.
+    """
+    x, y = _unwrap(x), _unwrap(y)
+    return_numpy = is_numpy(x) or is_numpy(y)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = KernelMatrix()
+    result = algo.execute(x, y, context=ctx, trace=trace, kernel=kernel, gamma=gamma, chunk_size=chunk_size)
+    return LinalgResult(
+        value=result if return_numpy else result.tolist(),
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
@@ -4,17 +4,28 @@ from __future__ import annotations
 
 from mllense.math.linalg.core.metadata import LinalgResult
 
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, Optional, Tuple, Union
 
 import numpy as np
 
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.mode import ExecutionMode
 from mllense.math.linalg.core.trace import Trace
-from mllense.math.linalg.core.types import InternalVector, MatrixLike, is_numpy, to_internal_matrix
+from mllense.math.linalg.core.types import (
+    InternalVector,
+    MatrixLike,
+    is_numpy,
+    to_internal_matrix,
+    to_internal_vector,
+)
+from mllense.math.linalg.exceptions import InvalidInputError
+from mllense.math.linalg.algorithms.eigen.krylov import ArnoldiEigen, LanczosEigen
 from mllense.math.linalg.algorithms.eigen.power_iteration import PowerIteration
+from mllense.math.linalg.algorithms.eigen.subspace_iteration import SubspaceIteration
 
-__all__ = ["dominant_eigen"]
+__all__ = ["dominant_eigen", "eigsh", "eigs"]
+
+Operator = Union[MatrixLike, Callable[[np.ndarray], np.ndarray]]
 
 
 def _build_context(
@@ -36,30 +47,171 @@ def _build_context(
     )
 
 
+_DOMINANT_METHODS = ("auto", "power", "subspace")
+
+
 def dominant_eigen(
     a: MatrixLike,
     *,
+    k: int = 1,
+    x0: Optional[Any] = None,
+    shift: float = 0.0,
+    method: str = "auto",
+    rqi: bool = False,
+    block_size: Optional[int] = None,
     max_iterations: int = 1000,
     tolerance: float = 1e-10,
+    random_state: Any = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
-) -> Tuple[float, Any]:
-    """Find the dominant eigenvalue and eigenvector via power iteration.
+) -> Tuple[Any, Any]:
+    """Find the dominant eigenvalue(s) and eigenvector(s).
+
+    Args:
+        a: Square matrix.
+        k: Number of dominant pairs (largest ``|λ - shift|``).
+        x0: Warm start — a vector, or an ``n × j`` block for ``k > 1``.
+            Passing the previous solution makes recomputations on a
+            slightly changed matrix converge in a few sweeps.
+        shift: Iterate with ``A - shift·I`` to widen the eigengap.
+        method: ``"power"`` (single vector), ``"subspace"`` (block
+            iteration with Rayleigh-Ritz and Hotelling deflation) or
+            ``"auto"`` (power for the plain single-pair case).
+        rqi: Polish the result with Rayleigh quotient iteration.
+        block_size: Subspace block width (default ``k`` plus guard vectors).
+        max_iterations: Iteration budget.
+        tolerance: Convergence tolerance.
+        random_state: Seed for the random start block (subspace only).
 
     Returns:
-        (eigenvalue, eigenvector)
+        ``(eigenvalue, eigenvector)`` for ``k == 1``; otherwise
+        ``(eigenvalues, eigenvectors)`` with eigenvectors as columns.
     """
+    if method not in _DOMINANT_METHODS:
+        raise InvalidInputError(
+            f"Unknown dominant_eigen method {method!r}. Valid methods: {', '.join(_DOMINANT_METHODS)}."
+        )
+    if method == "power" and (k != 1 or rqi):
+        raise InvalidInputError("method='power' finds a single pair without RQI; use method='subspace'.")
     return_numpy = is_numpy(a)
-    a_int = to_internal_matrix(a)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    eigenvalue, eigenvector = PowerIteration().execute(
-        a_int, context=ctx, trace=trace,
-        max_iterations=max_iterations, tolerance=tolerance,
+
+    if method == "power" or (method == "auto" and k == 1 and not rqi):
+        a_int = to_internal_matrix(a)
+        x0_int = to_internal_vector(x0) if x0 is not None else None
+        eigenvalue, eigenvector = PowerIteration().execute(
+            a_int, context=ctx, trace=trace,
+            max_iterations=max_iterations, tolerance=tolerance, x0=x0_int, shift=shift,
+        )
+        if return_numpy:
+            return eigenvalue, np.array(eigenvector, dtype=np.float64)
+        return eigenvalue, eigenvector
+
+    a_in = a if return_numpy else to_internal_matrix(a)
+    values, vectors = SubspaceIteration().execute(
+        a_in, context=ctx, trace=trace,
+        k=k, x0=x0, shift=shift, rqi=rqi, block_size=block_size,
+        max_iterations=max_iterations, tolerance=tolerance, random_state=random_state,
+    )
+    if k == 1:
+        value, vector = float(values[0]), vectors[:, 0]
+        return (value, vector) if return_numpy else (value, vector.tolist())
+    return (values, vectors) if return_numpy else (values.tolist(), vectors.tolist())
+
+
+def _krylov(
+    algo: Any,
+    a: Operator,
+    k: int,
+    ctx: ExecutionContext,
+    **kwargs: Any,
+) -> Tuple[Any, Any]:
+    trace = Trace(enabled=ctx.trace_enabled)
+    op = a.value if hasattr(a, "value") and hasattr(a, "what_lense") else a
+    eigenvalues, eigenvectors = algo.execute(op, context=ctx, trace=trace, k=k, **kwargs)
+    if isinstance(op, list):
+        return eigenvalues.tolist(), eigenvectors.tolist()
+    return eigenvalues, eigenvectors
+
+
+def eigsh(
+    a: Operator,
+    k: int = 6,
+    *,
+    which: str = "LM",
+    sigma: Optional[float] = None,
+    n: Optional[int] = None,
+    v0: Optional[Any] = None,
+    ncv: Optional[int] = None,
+    tol: float = 1e-10,
+    max_restarts: int = 300,
+    random_state: Any = None,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> Tuple[Any, Any]:
+    """Find ``k`` eigenpairs of a symmetric operator by implicitly restarted Lanczos.
+
+    Args:
+        a: Symmetric matrix, any object supporting ``a @ x`` (e.g. a sparse
+            matrix), or a ``matvec(x)`` callback (pass ``n``).
+        k: Number of eigenpairs.
+        which: ``"LM"``/``"SM"`` (largest/smallest magnitude) or
+            ``"LA"``/``"SA"`` (largest/smallest algebraic).
+        sigma: Shift-invert: return the eigenvalues nearest ``sigma``.
+            ``A - σI`` is densified and inverted once by LAPACK (needs an
+            explicit matrix; O(n^2) memory and one O(n^3) factorization).
+        n: Dimension of a callback operator.
+        v0: Starting vector.
+        ncv: Krylov subspace size (default ``max(2k + 1, 20)``).
+        tol: Relative residual tolerance.
+        max_restarts: Restart budget.
+        random_state: Seed for the starting vector.
+
+    Returns:
+        (eigenvalues, eigenvectors) — eigenvalues ascending, eigenvectors
+        as columns.  Lists for list input, ndarrays otherwise.
+    """
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    return _krylov(
+        LanczosEigen(), a, k, ctx,
+        which=which, sigma=sigma, n=n, v0=v0, ncv=ncv, tol=tol,
+        max_restarts=max_restarts, random_state=random_state,
+    )
+
+
+def eigs(
+    a: Operator,
+    k: int = 6,
+    *,
+    which: str = "LM",
+    sigma: Optional[float] = None,
+    n: Optional[int] = None,
+    v0: Optional[Any] = None,
+    ncv: Optional[int] = None,
+    tol: float = 1e-10,
+    max_restarts: int = 300,
+    random_state: Any = None,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> Tuple[Any, Any]:
+    """Find ``k`` eigenpairs of a general operator by implicitly restarted Arnoldi.
+
+    Arguments are as for :func:`eigsh`; ``"LA"``/``"SA"`` compare real
+    parts.  Eigenvalues and eigenvectors are complex, ordered by ``which``.
+    """
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    return _krylov(
+        ArnoldiEigen(), a, k, ctx,
+        which=which, sigma=sigma, n=n, v0=v0, ncv=ncv, tol=tol,
+        max_restarts=max_restarts, random_state=random_state,
     )
-    if return_numpy:
-        return eigenvalue, np.array(eigenvector, dtype=np.float64)
-    return eigenvalue, eigenvector
@@ -0,0 +1,205 @@
+# ==============================
+# File: linalg/api/io.py
+# ==============================
+"""Public API for saving and loading matrices, results and factorizations.
+
+Everything is stored in NumPy's own formats, so files are portable and
+never need pickle:
+
+* a matrix (list, view, ndarray or ``LinalgResult``) is one ``.npy``;
+  lists are converted once, ndarrays are written straight from their
+  buffer;
+* factorization handles (:class:`LUFactorization`,
+  :class:`CholeskyFactorization`), tuples of factors (``svd``, ``qr``,
+  ``eig``), dicts of arrays and implicit matrices are an ``.npz`` whose
+  ``__kind__`` entry says how to rebuild them.
+
+With ``mmap_mode`` a ``.npy`` loads as an ``np.memmap``, and so does
+every array member of an uncompressed ``.npz`` (located by its offset
+inside the archive; read-only or copy-on-write only).  Nothing is read until it is touched, the pages are
+shared by every process mapping the same file, and the result is an
+ndarray that the ndarray paths of the registry use in place — so a
+factorization can be computed once, saved, and mapped by many workers.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zipfile
+from typing import Any, Dict, Mapping, Optional, Union
+
+import numpy as np
+
+from mllense.math.linalg.algorithms.solve.cholesky import CholeskyFactorization
+from mllense.math.linalg.algorithms.solve.lu import LUFactorization
+from mllense.math.linalg.core.constant import ConstantMatrix, ScaledIdentity
+from mllense.math.linalg.core.metadata import LinalgResult
+from mllense.math.linalg.exceptions import InvalidInputError
+
+__all__ = ["save", "load"]
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_MMAP_MODES = (None, "r", "r+", "c")
+# archive entry naming what an .npz holds
+_KIND_KEY = "__kind__"
+# leading bytes of an .npz (a zip archive; the second for an empty one)
+_ZIP_MAGIC = b"PK\x03\x04"
+_EMPTY_ZIP_MAGIC = b"PK\x05\x06"
+# fixed part of a zip local file header; name and extra-field lengths sit at 26..30
+_ZIP_LOCAL_HEADER = 30
+
+
+def _as_array(m: Any) -> np.ndarray:
+    try:
+        a = np.asarray(m)
+    except (TypeError, ValueError) as exc:
+        raise InvalidInputError(f"save: expected a numeric matrix ({exc}).") from exc
+    if a.dtype == object or a.dtype.kind not in "biufc":
+        raise InvalidInputError(f"save: expected a numeric matrix, got dtype {a.dtype}.")
+    return a
+
+
+def _encode(obj: Any) -> Optional[Dict[str, np.ndarray]]:
+    """The ``.npz`` entries for ``obj``, or ``None`` if it is a plain matrix."""
+    if isinstance(obj, LUFactorization):
+        return {
+            _KIND_KEY: np.array("lu"),
+            "lu": _as_array(obj.lu),
+            "perm": np.asarray(obj.perm, dtype=np.int64),
+            "swaps": np.array(obj.swaps, dtype=np.int64),
+        }
+    if isinstance(obj, CholeskyFactorization):
+        return {_KIND_KEY: np.array("cholesky"), "l": _as_array(obj.l)}
+    if isinstance(obj, ConstantMatrix):
+        return {_KIND_KEY: np.array("constant"), "shape": np.array(obj.shape), "value": np.array(obj.value)}
+    if isinstance(obj, ScaledIdentity):
+        return {_KIND_KEY: np.array("scaled_identity"), "shape": np.array(obj.shape), "scale": np.array(obj.scale)}
+    if isinstance(obj, tuple):
+        entries = {f"arr_{i}": _as_array(f) for i, f in enumerate(obj)}
+        return {_KIND_KEY: np.array("tuple"), **entries}
+    if isinstance(obj, Mapping):
+        if any(not isinstance(k, str) or k == _KIND_KEY for k in obj):
+            raise InvalidInputError(f"save: dict keys must be strings other than {_KIND_KEY!r}.")
+        return {_KIND_KEY: np.array("dict"), **{k: _as_array(v) for k, v in obj.items()}}
+    return None
+
+
+def _decode(entries: Dict[str, np.ndarray]) -> Any:
+    if _KIND_KEY not in entries:
+        # an .npz written elsewhere: its arrays by name
+        return dict(entries)
+    kind = str(entries.pop(_KIND_KEY))
+    if kind == "lu":
+        return LUFactorization(
+            lu=entries["lu"].tolist(), perm=entries["perm"].tolist(), swaps=int(entries["swaps"])
+        )
+    if kind == "cholesky":
+        return CholeskyFactorization(l=entries["l"].tolist())
+    if kind == "constant":
+        return ConstantMatrix(*entries["shape"].tolist(), value=float(entries["value"]))
+    if kind == "scaled_identity":
+        return ScaledIdentity(*entries["shape"].tolist(), scale=float(entries["scale"]))
+    if kind == "tuple":
+        return tuple(entries[f"arr_{i}"] for i in range(len(entries)))
+    if kind == "dict":
+        return entries
+    raise InvalidInputError(f"load: unknown {_KIND_KEY} {kind!r} in archive.")
+
+
+def _map_member(path: str, info: zipfile.ZipInfo, mmap_mode: str) -> Optional[np.ndarray]:
+    """Memory-map one stored (uncompressed) ``.npy`` member of an archive, if possible."""
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        local = f.read(_ZIP_LOCAL_HEADER)
+        name_len, extra_len = struct.unpack("<HH", local[26:30])
+        f.seek(info.header_offset + _ZIP_LOCAL_HEADER + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            return None
+        offset = f.tell()
+    if dtype.hasobject or not shape or 0 in shape:
+        # scalars are read; empty arrays cannot be mapped
+        return None
+    return np.memmap(path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape, order="F" if fortran else "C")
+
+
+def save(path: PathLike, obj: Any, *, compress: bool = False) -> str:
+    """Save a matrix, result, tuple of factors or factorization handle.
+
+    Args:
+        path: Destination.  ``.npy`` (a single matrix) or ``.npz``
+            (everything else) is appended if the name lacks it.
+        obj: A matrix (list of lists, vector, view, ndarray), a
+            ``LinalgResult`` (its value is saved), an ``LUFactorization``
+            / ``CholeskyFactorization`` handle, a tuple of factors such as
+            ``svd``'s ``(U, S, Vt)``, a dict of arrays, or an implicit
+            ``ConstantMatrix`` / ``ScaledIdentity`` (stored by its
+            parameters, not its elements).
+        compress: Deflate ``.npz`` members.  Compressed members cannot be
+            memory-mapped by :func:`load`.
+
+    Returns:
+        The path written.
+    """
+    if isinstance(obj, LinalgResult):
+        obj = obj.value
+    path = os.fspath(path)
+    entries = _encode(obj)
+    if entries is None:
+        if not path.endswith(".npy"):
+            path += ".npy"
+        np.save(path, _as_array(obj), allow_pickle=False)
+        return path
+    if not path.endswith(".npz"):
+        path += ".npz"
+    (np.savez_compressed if compress else np.savez)(path, **entries)
+    return path
+
+
+def load(path: PathLike, *, mmap_mode: Optional[str] = None) -> Any:
+    """Load what :func:`save` wrote.
+
+    Args:
+        path: A ``.npy`` or ``.npz`` file.
+        mmap_mode: ``None`` reads into memory; ``"r"`` (read-only),
+            ``"r+"`` (writes go to the file) or ``"c"`` (copy-on-write)
+            return ``np.memmap`` arrays backed by the file — for a ``.npz``,
+            every uncompressed array member.  ``"r+"`` is refused for a
+            ``.npz``: writing into a member would leave its zip checksum
+            stale and the archive unreadable.
+
+    Returns:
+        An ndarray for a saved matrix; the handle, tuple, dict or implicit
+        matrix for an ``.npz``.  Factorization handles hold list factors,
+        so their factors are read into memory even with ``mmap_mode``.
+    """
+    if mmap_mode not in _MMAP_MODES:
+        raise InvalidInputError(f"load: mmap_mode must be one of {_MMAP_MODES}, got {mmap_mode!r}.")
+    path = os.fspath(path)
+    with open(path, "rb") as f:
+        magic = f.read(len(_ZIP_MAGIC))
+    # dispatch on the leading bytes, as np.load does: an .npy whose data
+    # happens to end like a zip record must not be taken for an archive
+    if magic not in (_ZIP_MAGIC, _EMPTY_ZIP_MAGIC):
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+    if mmap_mode == "r+":
+        # writes through a mapped member would not update the archive's CRCs
+        raise InvalidInputError(
+            "load: mmap_mode='r+' is not supported for .npz archives; use 'r' or 'c'."
+        )
+    entries: Dict[str, np.ndarray] = {}
+    with np.load(path, allow_pickle=False) as npz, zipfile.ZipFile(path) as archive:
+        for name in npz.files:
+            mapped = None
+            if mmap_mode is not None:
+                mapped = _map_member(path, archive.getinfo(f"{name}.npy"), mmap_mode)
+            entries[name] = mapped if mapped is not None else npz[name]
+    return _decode(entries)
@@ -0,0 +1,102 @@
+# ==============================
+# File: linalg/api/lazy.py
+# ==============================
+"""Public API for deferred (lazy) evaluation.
+
+Wrapping an operand with :func:`lazy` switches the element-wise ops in
+``api/ops`` — and ``matmul``, ``transpose`` and ``inv`` — into
+graph-building mode: any op with an
+:class:`~mllense.math.linalg.expr.graph.Expr` operand returns a new
+``Expr`` instead of computing.  :func:`evaluate` then plans and runs
+the whole graph at once::
+
+    x = lazy(a)
+    e = add(multiply(x, b), scalar_multiply(c, 2.0))   # nothing computed yet
+    r = evaluate(e)                                    # one pass, LinalgResult
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from mllense.math.linalg.algorithms.elementwise.fused import FusedElementwise
+from mllense.math.linalg.algorithms.matmul.planned import PlannedExpression
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import LinalgResult
+from mllense.math.linalg.core.mode import ExecutionMode
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.expr.graph import (
+    ELEMENTWISE_BINARY,
+    ELEMENTWISE_SCALAR,
+    Expr,
+    topological_order,
+)
+
+__all__ = ["evaluate", "lazy"]
+
+
+def _build_context(
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense_enabled: bool = True,
+    how_lense_enabled: bool = False,
+) -> ExecutionContext:
+    from mllense.math.linalg.config import get_config
+    cfg = get_config()
+    return ExecutionContext(
+        backend=backend or cfg.default_backend,
+        mode=ExecutionMode.from_string(mode or cfg.default_mode),
+        trace_enabled=trace_enabled if trace_enabled is not None else cfg.trace_enabled,
+        what_lense_enabled=what_lense_enabled,
+        how_lense_enabled=how_lense_enabled,
+    )
+
+
+def lazy(a: Any) -> Expr:
+    """Wrap a matrix (list, ndarray or scalar) as a leaf of a lazy expression.
+
+    ndarrays are referenced, not copied.  Ops applied to the result build an
+    expression graph; call :func:`evaluate` (or ``.evaluate()``) to compute it.
+    """
+    return Expr.leaf(a)
+
+
+def evaluate(
+    expr: Any,
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Compute a lazy expression.
+
+    Purely element-wise graphs run in a single fused pass with no
+    full-size intermediates.  Graphs with products, transposes or
+    inverses are first rewritten to a cheaper plan (``inv(A) @ b`` →
+    ``solve(A, b)``, ``(A @ B).T`` → ``B.T @ A.T``, ``X.T @ X`` →
+    symmetric rank-k update); the rewrites and the executed plan are
+    listed in the how_lense.  Either way repeated subexpressions are
+    computed once.
+
+    Returns:
+        The value as a :class:`LinalgResult`: an ndarray if any input was
+        one, a list matrix otherwise.
+    """
+    expr = Expr.leaf(expr)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    fusable = set(ELEMENTWISE_BINARY) | set(ELEMENTWISE_SCALAR) | {"leaf", "const"}
+    if all(node.op in fusable for node in topological_order(expr)):
+        algo = FusedElementwise()
+    else:
+        algo = PlannedExpression()
+    result = algo.execute(expr, context=ctx, trace=trace)
+    return LinalgResult(
+        value=result,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
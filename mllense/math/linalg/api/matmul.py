@@ -16,6 +16,9 @@ from typing import Any, Optional, Union
 
 import numpy as np
 
+from mllense.math.linalg.algorithms.elementwise.implicit import ImplicitAlgebra
+from mllense.math.linalg.algorithms.matmul.power import MatrixPower, PowerApply
+from mllense.math.linalg.core.constant import as_implicit
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.mode import ExecutionMode
 from mllense.math.linalg.core.trace import Trace
@@ -28,11 +31,13 @@ from mllense.math.linalg.core.types import (
     to_internal_vector,
 )
 from mllense.math.linalg.core.validation import validate_dimension_limit
+from mllense.math.linalg.core.view import as_view
 from mllense.math.linalg.exceptions import InvalidInputError
+from mllense.math.linalg.expr.graph import Expr
 from mllense.math.linalg.registry.algorithm_registry import algorithm_registry
 from mllense.math.linalg.registry.backend_registry import backend_registry
 
-__all__ = ["matmul"]
+__all__ = ["matmul", "matrix_power", "power_apply"]
 
 
 def matmul(
@@ -64,8 +69,29 @@ def matmul(
 
     Returns:
         The product, in the same format as the input (ndarray if input was
-        ndarray, list if input was list).
+        ndarray, list if input was list).  With a lazy operand (see
+        :func:`~mllense.math.linalg.api.lazy.lazy`), a deferred
+        :class:`~mllense.math.linalg.expr.graph.Expr` instead.  An implicit
+        identity, scaled identity or constant operand (``eye`` / ``zeros`` /
+        ``ones`` with ``implicit=True``) is applied in closed form without
+        forming the product.
     """
+    if isinstance(a, Expr) or isinstance(b, Expr):
+        return Expr.matmul(a, b)
+
+    # ── implicit constant operands: I @ X = X, (c*I) @ X = c*X, 0 @ X = 0 ─ #
+    if as_implicit(a) is not None or as_implicit(b) is not None:
+        ctx = _build_context(backend, mode, algorithm, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+        algo = ImplicitAlgebra()
+        result = algo.execute("matmul", a, b, context=ctx, trace=Trace(enabled=ctx.trace_enabled))
+        if result is not NotImplemented:
+            return LinalgResult(
+                value=result,
+                what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+                how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+                metadata=algo.metadata,
+            )
+
     # ── detect input format ──────────────────────────────────────────── #
     return_numpy = is_numpy(a) or is_numpy(b)
     a_is_1d, b_is_1d = _is_1d(a), _is_1d(b)
@@ -101,12 +127,99 @@ def matmul(
     )
 
 
+def matrix_power(
+    a: MatrixLike,
+    k: int,
+    *,
+    method: str = "auto",
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Raise a square matrix (or a ``(..., n, n)`` batch of them) to an integer power.
+
+    Args:
+        a: Square matrix, or a stack of square matrices.
+        k: Exponent; ``0`` gives the identity, negative values invert first.
+        method: ``"auto"`` (default), ``"squaring"`` (binary exponentiation,
+            about ``2 log2 k`` products) or ``"eigh"`` (symmetric ``A`` only:
+            one eigendecomposition, independent of ``k``).
+
+    Returns:
+        ``A^k`` in the same format as the input.
+    """
+    if isinstance(a, LinalgResult):
+        a = a.value
+    return_numpy = is_numpy(a)
+    ctx = _build_context(backend, mode, None, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = MatrixPower()
+    result = algo.execute(a, k, context=ctx, trace=trace, method=method)
+    return LinalgResult(
+        value=result if return_numpy else result.tolist(),
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def power_apply(
+    a: MatrixLike,
+    k: int,
+    v: Union[VectorLike, MatrixLike],
+    *,
+    method: str = "auto",
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Compute ``A^k @ v`` — e.g. ``k`` steps of a Markov chain.
+
+    With ``method="auto"`` the cheapest strategy is chosen from the sizes:
+    ``k`` matrix-vector products (O(k n^2), no matrix power is formed),
+    binary exponentiation followed by one product, or — for symmetric
+    ``A`` — an eigendecomposition.  For a row-stochastic transition matrix
+    ``P`` and a distribution ``p``, ``p P^k`` is ``power_apply(P.T, k, p)``.
+
+    Args:
+        a: Square matrix, or a ``(..., n, n)`` batch.
+        k: Number of applications.
+        v: A length-n vector, an ``n × m`` block of vectors, or one vector
+            per matrix in the batch (``(..., n)``).
+        method: ``"auto"``, ``"matvec"``, ``"squaring"`` or ``"eigh"``.
+
+    Returns:
+        ``A^k v`` in the same format as the input.
+    """
+    if isinstance(a, LinalgResult):
+        a = a.value
+    if isinstance(v, LinalgResult):
+        v = v.value
+    return_numpy = is_numpy(a) or is_numpy(v)
+    ctx = _build_context(backend, mode, None, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = PowerApply()
+    result = algo.execute(a, k, v, context=ctx, trace=trace, method=method)
+    return LinalgResult(
+        value=result if return_numpy else result.tolist(),
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
 # ── private helpers ──────────────────────────────────────────────────────── #
 
 def _is_1d(x: Any) -> bool:
     """Check if the original user input is 1-D."""
     if isinstance(x, np.ndarray):
         return x.ndim == 1
+    if as_view(x) is not None:
+        return as_view(x).ndim == 1
     if isinstance(x, (list, tuple)):
         if len(x) == 0:
             return True
@@ -129,6 +242,10 @@ def _to_2d(x: Any, label: str) -> InternalMatrix:
         else:
             # right 1-D → column vector (n×1)
             return [[v] for v in vec]
+    view = as_view(x)
+    if view is not None:
+        # read in place: a transposed view is multiplied without materializing it
+        return view
     return to_internal_matrix(x)
 
 
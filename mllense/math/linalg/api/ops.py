@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from mllense.math.linalg.core.metadata import LinalgResult
 
-from typing import Any, Optional, Union
+import numbers
+from typing import Any, Optional, Tuple, Union
 
 import numpy as np
 
@@ -14,16 +15,24 @@ from mllense.math.linalg.core.trace import Trace
 from mllense.math.linalg.core.types import (
     InternalMatrix,
     MatrixLike,
+    as_internal_matrix,
     is_numpy,
     to_internal_matrix,
 )
+from mllense.math.linalg.exceptions import InvalidInputError
 from mllense.math.linalg.algorithms.elementwise.add import ElementwiseAdd
 from mllense.math.linalg.algorithms.elementwise.subtract import ElementwiseSubtract
 from mllense.math.linalg.algorithms.elementwise.multiply import ElementwiseMultiply
 from mllense.math.linalg.algorithms.elementwise.divide import ElementwiseDivide
 from mllense.math.linalg.algorithms.elementwise.scalar import ScalarMultiply, ScalarAdd
+from mllense.math.linalg.algorithms.elementwise.implicit import ImplicitAlgebra
+from mllense.math.linalg.core.constant import as_implicit
+from mllense.math.linalg.expr.graph import Expr
 
-__all__ = ["add", "subtract", "multiply", "divide", "scalar_multiply", "scalar_add"]
+__all__ = [
+    "add", "subtract", "multiply", "divide", "scalar_multiply", "scalar_add",
+    "add_", "subtract_", "multiply_", "divide_", "scalar_multiply_", "scalar_add_",
+]
 
 
 def _build_context(
@@ -45,6 +54,71 @@ def _build_context(
     )
 
 
+def _operands(a: Any, b: Any) -> Tuple[Any, Any, bool]:
+    """Normalise two operands for a broadcasting op.
+
+    With any ndarray operand both become ndarrays (full NumPy rules, any
+    rank).  Otherwise a scalar becomes a 1×1 matrix and a flat list a row
+    vector, so both broadcast through the list path without being copied
+    out to the full shape.
+    """
+    a = a.value if isinstance(a, LinalgResult) else a
+    b = b.value if isinstance(b, LinalgResult) else b
+    if is_numpy(a) or is_numpy(b):
+        return np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64), True
+    return _to_list_operand(a), _to_list_operand(b), False
+
+
+def _to_list_operand(x: Any) -> InternalMatrix:
+    if isinstance(x, numbers.Real):
+        return to_internal_matrix([[x]])
+    if isinstance(x, (list, tuple)) and x and not isinstance(x[0], (list, tuple, np.ndarray)):
+        return to_internal_matrix([x])
+    return to_internal_matrix(x)
+
+
+def _out_operand(x: Any, out: Any) -> Any:
+    """An operand for a call writing into ``out``, without copying it where possible.
+
+    With an ndarray ``out`` operands are viewed as float arrays (no copy
+    for float64 input); with a list ``out`` a rectangular list of lists is
+    used as is, after an O(rows) length check.
+    """
+    x = x.value if isinstance(x, LinalgResult) else x
+    if isinstance(out, np.ndarray):
+        return np.asarray(x, dtype=np.float64)
+    if isinstance(x, list) and x and isinstance(x[0], list):
+        return as_internal_matrix(x)
+    return _to_list_operand(x)
+
+
+def _execute_into(algo: Any, args: Tuple[Any, ...], out: Any, ctx: ExecutionContext) -> MatrixLike:
+    """Run ``algo`` writing into ``out`` and wrap ``out`` itself as the result."""
+    trace = Trace(enabled=ctx.trace_enabled)
+    try:
+        algo.execute(*args, context=ctx, trace=trace, out=out)
+    except TypeError as exc:
+        # list operands are not copied (and so not converted) on this path
+        raise InvalidInputError(f"{algo.metadata.operation}: non-numeric element ({exc}).") from exc
+    return _format(out, False, algo, ctx)
+
+
+def _check_not_lazy(out: Any) -> None:
+    if out is not None:
+        raise InvalidInputError("out= is not supported for lazy expressions; evaluate() allocates the result.")
+
+
+def _implicit_result(op: str, operands: Tuple[Any, ...], out: Any, ctx: ExecutionContext) -> Optional[LinalgResult]:
+    """``op`` in closed form if an operand is an implicit constant matrix and a rule applies, else ``None``."""
+    if not any(as_implicit(x) is not None for x in operands):
+        return None
+    algo = ImplicitAlgebra()
+    result = algo.execute(op, *operands, context=ctx, trace=Trace(enabled=ctx.trace_enabled), out=out)
+    if result is NotImplemented:
+        return None
+    return _format(result, False, algo, ctx)
+
+
 def _format(result: InternalMatrix, return_numpy: bool, algo: Any, ctx: ExecutionContext) -> MatrixLike:
     formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
     return LinalgResult(
@@ -56,20 +130,48 @@ def _format(result: InternalMatrix, return_numpy: bool, algo: Any, ctx: Executio
 
 
 def add(
-    a: MatrixLike,
-    b: MatrixLike,
+    a: Union[MatrixLike, float],
+    b: Union[MatrixLike, float],
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> MatrixLike:
-    """Element-wise addition of two matrices."""
-    return_numpy = is_numpy(a) or is_numpy(b)
-    a_int = to_internal_matrix(a)
-    b_int = to_internal_matrix(b)
+    """Element-wise addition of two matrices, with NumPy-style broadcasting.
+
+    Either operand may be a scalar, a row vector (``1×n`` or a flat list),
+    a column vector (``m×1``) or, for ndarrays, any shape compatible under
+    the trailing-dimension rules.  Stretched dimensions are read with
+    stride 0 rather than materialised.
+
+    With ``out`` (a list of lists or a writeable float ndarray of exactly
+    the result shape) the result is written into it and ``out`` is
+    returned as the value; operands are not copied and nothing full-size
+    is allocated.  ``out`` may be one of the operands — see :func:`add_`.
+    The other ops in this module take ``out`` the same way.
+
+    If either operand is a lazy :class:`~mllense.math.linalg.expr.graph.Expr`
+    (see :func:`~mllense.math.linalg.api.lazy.lazy`), this and every other
+    element-wise op returns a new ``Expr`` instead of computing.
+
+    Implicit constant operands (``zeros`` / ``ones`` / ``eye`` with
+    ``implicit=True``, and their scalings) are handled in closed form:
+    ``X + 0`` is ``X``, ``X + c*I`` touches only the diagonal, and sums
+    of implicit matrices stay implicit.
+    """
+    if isinstance(a, Expr) or isinstance(b, Expr):
+        _check_not_lazy(out)
+        return Expr.binary("add", a, b)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    shortcut = _implicit_result("add", (a, b), out, ctx)
+    if shortcut is not None:
+        return shortcut
+    if out is not None:
+        return _execute_into(ElementwiseAdd(), (_out_operand(a, out), _out_operand(b, out)), out, ctx)
+    a_int, b_int, return_numpy = _operands(a, b)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = ElementwiseAdd()
     result = algo.execute(a_int, b_int, context=ctx, trace=trace)
@@ -77,20 +179,27 @@ def add(
 
 
 def subtract(
-    a: MatrixLike,
-    b: MatrixLike,
+    a: Union[MatrixLike, float],
+    b: Union[MatrixLike, float],
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> MatrixLike:
-    """Element-wise subtraction: ``A - B``."""
-    return_numpy = is_numpy(a) or is_numpy(b)
-    a_int = to_internal_matrix(a)
-    b_int = to_internal_matrix(b)
+    """Element-wise subtraction ``A - B``, broadcasting like :func:`add`."""
+    if isinstance(a, Expr) or isinstance(b, Expr):
+        _check_not_lazy(out)
+        return Expr.binary("subtract", a, b)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    shortcut = _implicit_result("subtract", (a, b), out, ctx)
+    if shortcut is not None:
+        return shortcut
+    if out is not None:
+        return _execute_into(ElementwiseSubtract(), (_out_operand(a, out), _out_operand(b, out)), out, ctx)
+    a_int, b_int, return_numpy = _operands(a, b)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = ElementwiseSubtract()
     result = algo.execute(a_int, b_int, context=ctx, trace=trace)
@@ -98,20 +207,27 @@ def subtract(
 
 
 def multiply(
-    a: MatrixLike,
-    b: MatrixLike,
+    a: Union[MatrixLike, float],
+    b: Union[MatrixLike, float],
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> MatrixLike:
-    """Element-wise (Hadamard) multiplication."""
-    return_numpy = is_numpy(a) or is_numpy(b)
-    a_int = to_internal_matrix(a)
-    b_int = to_internal_matrix(b)
+    """Element-wise (Hadamard) multiplication, broadcasting like :func:`add`."""
+    if isinstance(a, Expr) or isinstance(b, Expr):
+        _check_not_lazy(out)
+        return Expr.binary("multiply", a, b)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    shortcut = _implicit_result("multiply", (a, b), out, ctx)
+    if shortcut is not None:
+        return shortcut
+    if out is not None:
+        return _execute_into(ElementwiseMultiply(), (_out_operand(a, out), _out_operand(b, out)), out, ctx)
+    a_int, b_int, return_numpy = _operands(a, b)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = ElementwiseMultiply()
     result = algo.execute(a_int, b_int, context=ctx, trace=trace)
@@ -119,20 +235,27 @@ def multiply(
 
 
 def divide(
-    a: MatrixLike,
-    b: MatrixLike,
+    a: Union[MatrixLike, float],
+    b: Union[MatrixLike, float],
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> MatrixLike:
-    """Element-wise division: ``A / B``."""
-    return_numpy = is_numpy(a) or is_numpy(b)
-    a_int = to_internal_matrix(a)
-    b_int = to_internal_matrix(b)
+    """Element-wise division ``A / B``, broadcasting like :func:`add`."""
+    if isinstance(a, Expr) or isinstance(b, Expr):
+        _check_not_lazy(out)
+        return Expr.binary("divide", a, b)
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    shortcut = _implicit_result("divide", (a, b), out, ctx)
+    if shortcut is not None:
+        return shortcut
+    if out is not None:
+        return _execute_into(ElementwiseDivide(), (_out_operand(a, out), _out_operand(b, out)), out, ctx)
+    a_int, b_int, return_numpy = _operands(a, b)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = ElementwiseDivide()
     result = algo.execute(a_int, b_int, context=ctx, trace=trace)
@@ -143,6 +266,7 @@ def scalar_multiply(
     m: MatrixLike,
     scalar: float,
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -150,9 +274,17 @@ def scalar_multiply(
     how_lense: bool = False,
 ) -> MatrixLike:
     """Multiply every element of a matrix by a scalar."""
+    if isinstance(m, Expr):
+        _check_not_lazy(out)
+        return Expr.scalar("scalar_multiply", m, scalar)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    shortcut = _implicit_result("scalar_multiply", (m, scalar), out, ctx)
+    if shortcut is not None:
+        return shortcut
+    if out is not None:
+        return _execute_into(ScalarMultiply(), (_out_operand(m, out), scalar), out, ctx)
     return_numpy = is_numpy(m)
     m_int = to_internal_matrix(m)
-    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = ScalarMultiply()
     result = algo.execute(m_int, scalar, context=ctx, trace=trace)
@@ -163,6 +295,7 @@ def scalar_add(
     m: MatrixLike,
     scalar: float,
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -170,10 +303,136 @@ def scalar_add(
     how_lense: bool = False,
 ) -> MatrixLike:
     """Add a scalar to every element of a matrix."""
+    if isinstance(m, Expr):
+        _check_not_lazy(out)
+        return Expr.scalar("scalar_add", m, scalar)
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    shortcut = _implicit_result("scalar_add", (m, scalar), out, ctx)
+    if shortcut is not None:
+        return shortcut
+    if out is not None:
+        return _execute_into(ScalarAdd(), (_out_operand(m, out), scalar), out, ctx)
     return_numpy = is_numpy(m)
     m_int = to_internal_matrix(m)
-    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
     algo = ScalarAdd()
     result = algo.execute(m_int, scalar, context=ctx, trace=trace)
     return _format(result, return_numpy, algo, ctx)
+
+
+def add_(
+    a: MatrixLike,
+    b: Union[MatrixLike, float],
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """In-place :func:`add`: ``a += b``, written into ``a`` and returned as the value.
+
+    ``a`` must be a list of lists or a writeable float ndarray already of
+    the broadcast result shape.
+    """
+    return add(
+        a, b, out=a.value if isinstance(a, LinalgResult) else a,
+        backend=backend, mode=mode, trace_enabled=trace_enabled, what_lense=what_lense, how_lense=how_lense,
+    )
+
+
+def subtract_(
+    a: MatrixLike,
+    b: Union[MatrixLike, float],
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """In-place :func:`subtract`: ``a -= b``, written into ``a`` and returned as the value.
+
+    ``a`` must be a list of lists or a writeable float ndarray already of
+    the broadcast result shape.
+    """
+    return subtract(
+        a, b, out=a.value if isinstance(a, LinalgResult) else a,
+        backend=backend, mode=mode, trace_enabled=trace_enabled, what_lense=what_lense, how_lense=how_lense,
+    )
+
+
+def multiply_(
+    a: MatrixLike,
+    b: Union[MatrixLike, float],
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """In-place :func:`multiply`: ``a *= b``, written into ``a`` and returned as the value.
+
+    ``a`` must be a list of lists or a writeable float ndarray already of
+    the broadcast result shape.
+    """
+    return multiply(
+        a, b, out=a.value if isinstance(a, LinalgResult) else a,
+        backend=backend, mode=mode, trace_enabled=trace_enabled, what_lense=what_lense, how_lense=how_lense,
+    )
+
+
+def divide_(
+    a: MatrixLike,
+    b: Union[MatrixLike, float],
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """In-place :func:`divide`: ``a /= b``, written into ``a`` and returned as the value.
+
+    ``a`` must be a list of lists or a writeable float ndarray already of
+    the broadcast result shape.
+    """
+    return divide(
+        a, b, out=a.value if isinstance(a, LinalgResult) else a,
+        backend=backend, mode=mode, trace_enabled=trace_enabled, what_lense=what_lense, how_lense=how_lense,
+    )
+
+
+def scalar_multiply_(
+    m: MatrixLike,
+    scalar: float,
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """In-place :func:`scalar_multiply`: ``m *= scalar``, written into ``m`` and returned as the value."""
+    return scalar_multiply(
+        m, scalar, out=m.value if isinstance(m, LinalgResult) else m,
+        backend=backend, mode=mode, trace_enabled=trace_enabled, what_lense=what_lense, how_lense=how_lense,
+    )
+
+
+def scalar_add_(
+    m: MatrixLike,
+    scalar: float,
+    *,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> MatrixLike:
+    """In-place :func:`scalar_add`: ``m += scalar``, written into ``m`` and returned as the value."""
+    return scalar_add(
+        m, scalar, out=m.value if isinstance(m, LinalgResult) else m,
+        backend=backend, mode=mode, trace_enabled=trace_enabled, what_lense=what_lense, how_lense=how_lense,
+    )
@@ -0,0 +1,155 @@
+# ==============================
+# File: linalg/api/reduce.py
+# ==============================
+"""Public API for axis reductions: sum, mean, max, min, argmax, argmin and fused statistics.
+
+Reductions are resolved through the algorithm registry under
+``"reduce"``: ``"pairwise"`` (default), ``"compensated"`` and
+``"moments"`` (several statistics in one pass; chosen automatically for
+``var`` / ``std`` / ``count`` and for a list of statistics).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.metadata import LinalgResult
+from mllense.math.linalg.core.mode import ExecutionMode
+from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.core.types import MatrixLike, is_numpy
+from mllense.math.linalg.registry.algorithm_registry import algorithm_registry
+
+__all__ = ["reduce", "reduce_batch"]
+
+Op = Union[str, Sequence[str]]
+
+
+def _build_context(
+    backend: Optional[str],
+    mode: Optional[str],
+    algorithm: Optional[str],
+    trace_enabled: Optional[bool],
+    what_lense_enabled: bool = True,
+    how_lense_enabled: bool = False,
+) -> ExecutionContext:
+    from mllense.math.linalg.config import get_config
+
+    cfg = get_config()
+    return ExecutionContext(
+        backend=backend or cfg.default_backend,
+        mode=ExecutionMode.from_string(mode or cfg.default_mode),
+        trace_enabled=trace_enabled if trace_enabled is not None else cfg.trace_enabled,
+        what_lense_enabled=what_lense_enabled,
+        how_lense_enabled=how_lense_enabled,
+        algorithm_hint=algorithm,
+    )
+
+
+def _algorithm_for(op: Op, algorithm: Optional[str]) -> Optional[str]:
+    """The registry hint: the caller's, else ``"moments"`` for statistics only it computes."""
+    if algorithm is not None:
+        return algorithm
+    if not isinstance(op, str) or op in ("var", "std", "count"):
+        return "moments"
+    return None
+
+
+def _run(
+    data: Any,
+    op: Op,
+    axis: Optional[int],
+    ddof: int,
+    batch: bool,
+    algorithm: Optional[str],
+    backend: Optional[str],
+    mode: Optional[str],
+    trace_enabled: Optional[bool],
+    what_lense: bool,
+    how_lense: bool,
+) -> LinalgResult:
+    ctx = _build_context(
+        backend, mode, _algorithm_for(op, algorithm), trace_enabled,
+        what_lense_enabled=what_lense, how_lense_enabled=how_lense,
+    )
+    algo = algorithm_registry.get("reduce", ctx)
+    trace = Trace(enabled=ctx.trace_enabled)
+    result = algo.execute(data, op, context=ctx, trace=trace, axis=axis, ddof=ddof, batch=batch)
+    return LinalgResult(
+        value=result,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def reduce(
+    m: MatrixLike,
+    op: Op = "sum",
+    *,
+    axis: Optional[int] = None,
+    ddof: int = 0,
+    algorithm: Optional[str] = None,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Reduce a matrix or vector along an axis.
+
+    Args:
+        m: Matrix (list of lists, view, 2-D ndarray) or vector.
+        op: ``"sum"``, ``"mean"``, ``"max"``, ``"min"``, ``"argmax"``,
+            ``"argmin"``, ``"var"``, ``"std"`` or ``"count"`` — or a list of
+            statistics from ``count, sum, mean, var, std, min, max``,
+            computed together in one pass and returned as a dict.
+        axis: ``None`` reduces every element, ``0`` each column, ``1``
+            each row (negative values count from the end).
+        ddof: Delta degrees of freedom for ``var`` / ``std``.
+        algorithm: ``"pairwise"`` (default; rounding error grows like
+            ``O(log n)``), ``"compensated"`` (error independent of ``n``)
+            or ``"moments"`` (fused single pass).
+
+    Returns:
+        A scalar for a full reduction, otherwise a vector — an ndarray for
+        ndarray input, a list otherwise.  ``argmax`` / ``argmin`` give
+        ints (flat, row-major indices for a full reduction).
+    """
+    return _run(m, op, axis, ddof, False, algorithm, backend, mode, trace_enabled, what_lense, how_lense)
+
+
+def reduce_batch(
+    matrices: Union[Sequence[MatrixLike], np.ndarray],
+    op: Op = "sum",
+    *,
+    axis: Optional[int] = None,
+    ddof: int = 0,
+    algorithm: Optional[str] = None,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Batched :func:`reduce` over a stack of equal-shape matrices, in one vectorized call.
+
+    Args:
+        matrices: A 3-D ``ndarray`` of shape ``(batch, rows, cols)`` or a
+            sequence of matrices of one shape.
+        op, axis, ddof, algorithm: As for :func:`reduce`; ``axis`` refers
+            to each matrix.
+
+    Returns:
+        One result per matrix, stacked first — an ndarray if the input (or
+        any matrix in it) was an ndarray, nested lists otherwise; a dict
+        of such stacks for a list of statistics.
+    """
+    return_numpy = is_numpy(matrices) or any(is_numpy(m) for m in matrices)
+    res = _run(matrices, op, axis, ddof, True, algorithm, backend, mode, trace_enabled, what_lense, how_lense)
+    if not return_numpy:
+        value = res.value
+        res.value = {k: v.tolist() for k, v in value.items()} if isinstance(value, dict) else value.tolist()
+    return res
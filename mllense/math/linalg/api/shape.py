@@ -1,11 +1,24 @@
 
-"""Public API for shape-manipulation operations."""
+"""Public API for shape-manipulation operations.
+
+None of these copy elements.  For list input they return a
+:class:`~mllense.math.linalg.core.view.MatrixView` /
+:class:`~mllense.math.linalg.core.view.ConcatView` over the input's
+storage, which reads, iterates and compares like the list it stands for
+and is copied only by ``.tolist()`` or on the first write to it.  It is
+not a ``list`` itself — call ``.tolist()`` before ``isinstance`` checks
+or :mod:`json` — and, like every list path, reads the elements as
+floats: ints are converted, non-numeric elements raise
+:class:`~mllense.math.linalg.exceptions.InvalidInputError`.  For
+ndarray input ``transpose``, ``reshape`` and ``flatten`` return NumPy
+views; ``vstack``/``hstack`` of ndarrays concatenate once.
+"""
 
 from __future__ import annotations
 
 from mllense.math.linalg.core.metadata import LinalgResult
 
-from typing import Any, List, Optional, Union
+from typing import Any, Iterable, List, Optional, Union
 
 import numpy as np
 
@@ -17,16 +30,21 @@ from mllense.math.linalg.core.types import (
     InternalVector,
     MatrixLike,
     VectorLike,
+    as_internal_matrix,
     is_numpy,
     to_internal_matrix,
     to_internal_vector,
 )
+from mllense.math.linalg.core.view import as_view
 from mllense.math.linalg.algorithms.shape.reshape import Reshape
 from mllense.math.linalg.algorithms.shape.flatten import Flatten
 from mllense.math.linalg.algorithms.shape.concat import ConcatVertical, ConcatHorizontal
+from mllense.math.linalg.algorithms.shape.concatenate import Concatenate
 from mllense.math.linalg.algorithms.matmul.transpose import Transpose
+from mllense.math.linalg.exceptions import InvalidInputError
+from mllense.math.linalg.expr.graph import Expr
 
-__all__ = ["reshape", "flatten", "transpose", "vstack", "hstack"]
+__all__ = ["reshape", "flatten", "transpose", "vstack", "hstack", "concatenate"]
 
 
 def _build_context(
@@ -48,11 +66,28 @@ def _build_context(
     )
 
 
+def _operand(m: MatrixLike, numpy: bool) -> Any:
+    """The input as the shape algorithms read it, without copying.
+
+    ndarrays (and everything, when the result is an ndarray) become 2-D
+    float arrays; views pass through; a list of lists is used as is after
+    an O(rows) rectangularity check.
+    """
+    m = m.value if isinstance(m, LinalgResult) else m
+    if numpy:
+        return np.atleast_2d(np.asarray(m, dtype=np.float64))
+    view = as_view(m)
+    if view is not None:
+        return view.as_2d()
+    return as_internal_matrix(m)
+
+
 def reshape(
     a: MatrixLike,
     new_rows: int,
     new_cols: int,
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -61,11 +96,11 @@ def reshape(
 ) -> MatrixLike:
     """Reshape a matrix to ``(new_rows, new_cols)``."""
     return_numpy = is_numpy(a)
-    a_int = to_internal_matrix(a)
+    a_int = _operand(a, return_numpy or isinstance(out, np.ndarray))
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    result = Reshape().execute(a_int, new_rows, new_cols, context=ctx, trace=trace)
-    formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
+    result = Reshape().execute(a_int, new_rows, new_cols, context=ctx, trace=trace, out=out)
+    formatted_val = result
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
@@ -77,6 +112,7 @@ def reshape(
 def flatten(
     a: MatrixLike,
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -85,11 +121,11 @@ def flatten(
 ) -> VectorLike:
     """Flatten a matrix to a 1-D vector."""
     return_numpy = is_numpy(a)
-    a_int = to_internal_matrix(a)
+    a_int = _operand(a, return_numpy or isinstance(out, np.ndarray))
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    result = Flatten().execute(a_int, context=ctx, trace=trace)
-    formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
+    result = Flatten().execute(a_int, context=ctx, trace=trace, out=out)
+    formatted_val = result
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
@@ -101,19 +137,33 @@ def flatten(
 def transpose(
     a: MatrixLike,
     *,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
     what_lense: bool = True,
     how_lense: bool = False,
 ) -> MatrixLike:
-    """Transpose a matrix."""
+    """Transpose a matrix in O(1), as a strided view (lazily, as an ``Expr``, if ``a`` is one).
+
+    ``matmul(transpose(A), B)`` reads ``A`` in transposed order without
+    ever materializing ``A.T``.
+
+    With ``out`` (a ``cols×rows`` list of lists or writeable float ndarray)
+    the result is written into it and ``out`` is returned as the value.
+    ``reshape``, ``flatten``, ``vstack`` and ``hstack`` take ``out`` the
+    same way; it must not alias the input.
+    """
+    if isinstance(a, Expr):
+        if out is not None:
+            raise InvalidInputError("out= is not supported for lazy expressions; evaluate() allocates the result.")
+        return Expr.transpose(a)
     return_numpy = is_numpy(a)
-    a_int = to_internal_matrix(a)
+    a_int = _operand(a, return_numpy or isinstance(out, np.ndarray))
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    result = Transpose().execute(a_int, context=ctx, trace=trace)
-    formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
+    result = Transpose().execute(a_int, context=ctx, trace=trace, out=out)
+    formatted_val = result
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
@@ -124,6 +174,7 @@ def transpose(
 
 def vstack(
     *matrices: MatrixLike,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -132,11 +183,11 @@ def vstack(
 ) -> MatrixLike:
     """Vertically stack matrices."""
     return_numpy = any(is_numpy(m) for m in matrices)
-    internals = [to_internal_matrix(m) for m in matrices]
+    internals = [_operand(m, return_numpy or isinstance(out, np.ndarray)) for m in matrices]
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    result = ConcatVertical().execute(*internals, context=ctx, trace=trace)
-    formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
+    result = ConcatVertical().execute(*internals, context=ctx, trace=trace, out=out)
+    formatted_val = result
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
@@ -147,6 +198,7 @@ def vstack(
 
 def hstack(
     *matrices: MatrixLike,
+    out: Optional[MatrixLike] = None,
     backend: Optional[str] = None,
     mode: Optional[str] = None,
     trace_enabled: Optional[bool] = None,
@@ -155,14 +207,63 @@ def hstack(
 ) -> MatrixLike:
     """Horizontally stack matrices."""
     return_numpy = any(is_numpy(m) for m in matrices)
-    internals = [to_internal_matrix(m) for m in matrices]
+    internals = [_operand(m, return_numpy or isinstance(out, np.ndarray)) for m in matrices]
     ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
     trace = Trace(enabled=ctx.trace_enabled)
-    result = ConcatHorizontal().execute(*internals, context=ctx, trace=trace)
-    formatted_val = np.array(result, dtype=np.float64) if return_numpy else result
+    result = ConcatHorizontal().execute(*internals, context=ctx, trace=trace, out=out)
+    formatted_val = result
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "what_lense_enabled")) and locals()["ctx"].what_lense_enabled else "",
         how_lense=algo._finalize_how_lense() if "algo" in locals() else "" if ("ctx" in locals() and hasattr(locals()["ctx"], "how_lense_enabled")) and locals()["ctx"].how_lense_enabled else "",
         metadata=getattr(locals().get("algo"), "metadata", None)
-    )
\ No newline at end of file
+    )
+
+
+def concatenate(
+    matrices: Iterable[MatrixLike],
+    axis: int = 0,
+    *,
+    out: Optional[MatrixLike] = None,
+    filename: Optional[str] = None,
+    as_numpy: bool = False,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> LinalgResult:
+    """Concatenate any number of matrices along ``axis`` into one preallocated result.
+
+    Unlike :func:`vstack` / :func:`hstack`, ``matrices`` may be any
+    iterable, including a generator of chunks (a flat list is one row).
+    A list or tuple is sized in one pass and the result allocated once; a
+    stream along axis 0 grows in chunks.  Every element is copied once.
+
+    Args:
+        matrices: Iterable of matrices with matching widths (axis 0) or
+            heights (axis 1).
+        axis: 0 to stack rows, 1 to stack columns.
+        out: Optional list / writeable float ndarray (``np.memmap``
+            included) of the result shape to fill.
+        filename: Write the result to this ``.npy`` file and return it as
+            a read-write memory map — for results larger than RAM.
+        as_numpy: Return an ndarray even if every piece is a list.
+
+    Returns:
+        The result in a :class:`LinalgResult`: an ndarray if any piece is
+        one (or ``out``/``filename``/``as_numpy`` asks for it), a list
+        matrix otherwise.
+    """
+    ctx = _build_context(backend, mode, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = Concatenate()
+    result = algo.execute(
+        matrices, context=ctx, trace=trace, axis=axis, out=out, filename=filename, as_numpy=as_numpy
+    )
+    return LinalgResult(
+        value=result,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
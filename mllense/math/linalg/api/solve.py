@@ -11,6 +11,7 @@ Thin wrapper that:
 from __future__ import annotations
 
 from mllense.math.linalg.core.metadata import LinalgResult
+from mllense.math.linalg._internal.constants import WOODBURY_CAPACITANCE_COND_LIMIT
 
 from typing import Any, Optional, Union
 
@@ -19,7 +20,12 @@ import numpy as np
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.mode import ExecutionMode
 from mllense.math.linalg.core.trace import Trace
+from mllense.math.linalg.algorithms.decomposition.woodbury import SolveUpdate
+from mllense.math.linalg.algorithms.solve.cholesky import CholeskyFactorization
+from mllense.math.linalg.algorithms.solve.lu import LUFactorization, lu_factor
+from mllense.math.linalg.algorithms.solve.triangular import TriangularSolve
 from mllense.math.linalg.core.types import (
+    InternalMatrix,
     InternalVector,
     MatrixLike,
     VectorLike,
@@ -30,7 +36,7 @@ from mllense.math.linalg.core.types import (
 from mllense.math.linalg.core.validation import validate_dimension_limit
 from mllense.math.linalg.registry.algorithm_registry import algorithm_registry
 
-__all__ = ["solve"]
+__all__ = ["solve", "solve_triangular", "solve_update"]
 
 
 def solve(
@@ -52,6 +58,9 @@ def solve(
         backend: Override default backend.
         mode: Override default mode.
         algorithm: Explicit algorithm hint (e.g. ``"gaussian"``).
+            ``"mixed_precision"`` factors in float32 and refines the
+            solution to float64 accuracy; ndarray inputs are passed to it
+            without list conversion.
         trace_enabled: Override global trace flag.
 
     Returns:
@@ -60,17 +69,22 @@ def solve(
     # ── detect format ────────────────────────────────────────────────── #
     return_numpy = is_numpy(a) or is_numpy(b)
 
+    # ── build execution context ──────────────────────────────────────── #
+    ctx = _build_context(backend, mode, algorithm, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+
     # ── normalise ────────────────────────────────────────────────────── #
-    a_int = to_internal_matrix(a)
-    b_int = to_internal_vector(b)
+    if (algorithm or "").strip().lower() == "mixed_precision" and is_numpy(a) and a.ndim == 2:
+        # the numpy-based solver reads ndarrays directly
+        a_int = a
+        b_int = np.asarray(b, dtype=np.float64).ravel()
+    else:
+        a_int = to_internal_matrix(a)
+        b_int = to_internal_vector(b)
 
     rows = len(a_int)
     cols = len(a_int[0]) if rows else 0
     validate_dimension_limit(rows, cols)
 
-    # ── build execution context ──────────────────────────────────────── #
-    ctx = _build_context(backend, mode, algorithm, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
-
     # ── resolve algorithm ────────────────────────────────────────────── #
     algo = algorithm_registry.get("solve", ctx, matrix_dim=rows)
 
@@ -79,7 +93,7 @@ def solve(
     x: InternalVector = algo.execute(a_int, b_int, context=ctx, trace=trace)
 
     # ── format result ────────────────────────────────────────────────── #
-    formatted_val = np.array(x, dtype=np.float64) if return_numpy else x
+    formatted_val = np.asarray(x, dtype=np.float64) if return_numpy else x
     return LinalgResult(
         value=formatted_val,
         what_lense=algo._generate_what_lense() if "algo" in locals() else ""
@@ -90,8 +104,136 @@ def solve(
     )
 
 
+def solve_triangular(
+    t: MatrixLike,
+    b: Union[VectorLike, MatrixLike],
+    *,
+    lower: bool = False,
+    trans: bool = False,
+    unit_diagonal: bool = False,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> Any:
+    """Solve ``op(T) X = B`` where ``T`` is triangular.
+
+    Args:
+        t: Triangular coefficient matrix (n × n).  Only the triangle
+            selected by ``lower`` is read.
+        b: Right-hand side — a vector of length n or an n × k matrix.
+        lower: ``True`` if ``T`` is lower-triangular (default upper).
+        trans: Solve with ``T^T`` instead of ``T``.
+        unit_diagonal: Assume ``T`` has ones on its diagonal.
+        backend: Override default backend.
+        mode: Override default mode.
+        trace_enabled: Override global trace flag.
+
+    Returns:
+        ``X`` with the same shape as ``b``, in the same format as the input.
+    """
+    return_numpy = is_numpy(t) or is_numpy(b)
+
+    t_int = to_internal_matrix(t)
+    b_int: Union[InternalVector, InternalMatrix] = (
+        to_internal_vector(b) if _is_1d(b) else to_internal_matrix(b)
+    )
+
+    rows = len(t_int)
+    cols = len(t_int[0]) if rows else 0
+    validate_dimension_limit(rows, cols)
+
+    ctx = _build_context(backend, mode, None, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = TriangularSolve()
+    x = algo.execute(
+        t_int, b_int, context=ctx, trace=trace,
+        lower=lower, trans=trans, unit_diagonal=unit_diagonal,
+    )
+
+    formatted_val = np.array(x, dtype=np.float64) if return_numpy else x
+    return LinalgResult(
+        value=formatted_val,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
+def solve_update(
+    factor: Union[MatrixLike, LUFactorization, CholeskyFactorization],
+    u: Union[MatrixLike, VectorLike],
+    v: Union[MatrixLike, VectorLike],
+    b: Union[VectorLike, MatrixLike],
+    *,
+    cond_limit: float = WOODBURY_CAPACITANCE_COND_LIMIT,
+    backend: Optional[str] = None,
+    mode: Optional[str] = None,
+    trace_enabled: Optional[bool] = None,
+    what_lense: bool = True,
+    how_lense: bool = False,
+) -> Any:
+    """Solve ``(A + U V^T) x = b`` reusing a factorization of ``A``.
+
+    Applies the Woodbury identity with ``k + 1`` solves against the existing
+    factor and one ``k × k`` dense solve — O(n^2 k) instead of refactoring.
+    If the ``k × k`` capacitance matrix is ill-conditioned, ``A + U V^T`` is
+    refactored and solved directly instead.
+
+    Args:
+        factor: An :class:`LUFactorization` / :class:`CholeskyFactorization`
+            of ``A`` (from ``lu_factor`` / ``cho_factor``), or ``A`` itself
+            (its LU factor is taken from the decomposition cache when
+            available).
+        u, v: ``n × k`` update factors; a length-n vector means ``k = 1``.
+        b: Right-hand side — a vector of length n or an n × m matrix.
+        cond_limit: Capacitance condition number above which ``A + U V^T``
+            is refactored.
+
+    Returns:
+        ``x`` with the same shape as ``b``, in the same format as the input.
+    """
+    factor, u, v, b = (_unwrap(m) for m in (factor, u, v, b))
+    return_numpy = any(is_numpy(m) for m in (factor, u, v, b))
+    if not isinstance(factor, (LUFactorization, CholeskyFactorization)):
+        factor = lu_factor(to_internal_matrix(factor))
+    b_int: Union[InternalVector, InternalMatrix] = (
+        to_internal_vector(b) if _is_1d(b) else to_internal_matrix(b)
+    )
+
+    ctx = _build_context(backend, mode, None, trace_enabled, what_lense_enabled=what_lense, how_lense_enabled=how_lense)
+    trace = Trace(enabled=ctx.trace_enabled)
+    algo = SolveUpdate()
+    x = algo.execute(factor, u, v, b_int, context=ctx, trace=trace, cond_limit=cond_limit)
+
+    formatted_val = np.array(x, dtype=np.float64) if return_numpy else x
+    return LinalgResult(
+        value=formatted_val,
+        what_lense=algo._generate_what_lense() if ctx.what_lense_enabled else "",
+        how_lense=algo._finalize_how_lense() if ctx.how_lense_enabled else "",
+        metadata=algo.metadata,
+    )
+
+
 # ── private helpers ──────────────────────────────────────────────────────── #
 
+def _unwrap(x: Any) -> Any:
+    """Return the value of a :class:`LinalgResult`, else ``x``."""
+    return x.value if isinstance(x, LinalgResult) else x
+
+
+def _is_1d(x: Any) -> bool:
+    """Check if the original user input is 1-D."""
+    if hasattr(x, "value") and hasattr(x, "what_lense"):
+        x = x.value
+    if isinstance(x, np.ndarray):
+        return x.ndim == 1
+    if isinstance(x, (list, tuple)) and x:
+        return not isinstance(x[0], (list, tuple, np.ndarray))
+    return True
+
+
 def _build_context(
     backend: Optional[str],
     mode: Optional[str],
@@ -4,7 +4,8 @@
 """Global configuration for the linalg engine.
 
 Provides a thread-safe singleton that stores runtime defaults.
-This is the *only* mutable global state in the library.
+Apart from the decomposition cache it sizes (see ``core.cache``), this
+is the *only* mutable global state in the library.
 """
 
 from __future__ import annotations
@@ -14,6 +15,8 @@ from typing import Any
 
 __all__ = ["GlobalConfig", "get_config"]
 
+_DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
 
 class GlobalConfig:
     """Thread-safe global configuration container.
@@ -24,6 +27,8 @@ class GlobalConfig:
         trace_enabled: Whether trace recording is turned on globally.
         auto_algorithm_selection: If ``True``, the registry picks the best algorithm
             automatically based on input size and backend.
+        decomposition_cache_bytes: Byte budget of the shared LRU cache of
+            SVD / LU / QR results (``0`` disables caching).
     """
 
     _instance: GlobalConfig | None = None
@@ -37,6 +42,7 @@ class GlobalConfig:
                 inst._default_mode = "fast"
                 inst._trace_enabled = False
                 inst._auto_algorithm_selection = True
+                inst._decomposition_cache_bytes = _DEFAULT_CACHE_BYTES
                 cls._instance = inst
             return cls._instance
 
@@ -87,6 +93,19 @@ class GlobalConfig:
     def auto_algorithm_selection(self, value: bool) -> None:
         self._auto_algorithm_selection = bool(value)  # type: ignore[attr-defined]
 
+    # -- decomposition_cache_bytes ---------------------------------------- #
+    @property
+    def decomposition_cache_bytes(self) -> int:
+        return self._decomposition_cache_bytes  # type: ignore[attr-defined]
+
+    @decomposition_cache_bytes.setter
+    def decomposition_cache_bytes(self, value: int) -> None:
+        if not isinstance(value, int) or value < 0:
+            from mllense.math.linalg.exceptions import InvalidInputError
+
+            raise InvalidInputError(f"decomposition_cache_bytes must be a non-negative int, got {value!r}.")
+        self._decomposition_cache_bytes = value  # type: ignore[attr-defined]
+
     # -- helpers ---------------------------------------------------------- #
     def reset(self) -> None:
         """Reset all config values to defaults."""
@@ -94,6 +113,7 @@ class GlobalConfig:
         self._default_mode = "fast"  # type: ignore[attr-defined]
         self._trace_enabled = False  # type: ignore[attr-defined]
         self._auto_algorithm_selection = True  # type: ignore[attr-defined]
+        self._decomposition_cache_bytes = _DEFAULT_CACHE_BYTES  # type: ignore[attr-defined]
 
     def as_dict(self) -> dict[str, Any]:
         return {
@@ -101,6 +121,7 @@ class GlobalConfig:
             "default_mode": self.default_mode,
             "trace_enabled": self.trace_enabled,
             "auto_algorithm_selection": self.auto_algorithm_selection,
+            "decomposition_cache_bytes": self.decomposition_cache_bytes,
         }
 
     def __repr__(self) -> str:
@@ -108,7 +129,8 @@ class GlobalConfig:
             f"GlobalConfig(default_backend={self.default_backend!r}, "
             f"default_mode={self.default_mode!r}, "
             f"trace_enabled={self.trace_enabled!r}, "
-            f"auto_algorithm_selection={self.auto_algorithm_selection!r})"
+            f"auto_algorithm_selection={self.auto_algorithm_selection!r}, "
+            f"decomposition_cache_bytes={self.decomposition_cache_bytes!r})"
         )
 
 
@@ -3,6 +3,7 @@
 # ==============================
 """Core infrastructure layer — dependency-safe and reusable."""
 
+from mllense.math.linalg.core.cache import DecompositionCache, get_decomposition_cache
 from mllense.math.linalg.core.execution_context import ExecutionContext
 from mllense.math.linalg.core.metadata import AlgorithmMetadata
 from mllense.math.linalg.core.mode import ExecutionMode
@@ -21,6 +22,8 @@ from mllense.math.linalg.core.types import (
     to_internal_matrix,
     to_internal_vector,
 )
+from mllense.math.linalg.core.constant import ConstantMatrix, ScaledIdentity
+from mllense.math.linalg.core.view import ConcatView, MatrixView
 from mllense.math.linalg.core.validation import (
     validate_dimension_limit,
     validate_matmul_shapes,
@@ -29,6 +32,8 @@ from mllense.math.linalg.core.validation import (
 )
 
 __all__ = [
+    "DecompositionCache",
+    "get_decomposition_cache",
     "ExecutionContext",
     "ExecutionMode",
     "AlgorithmMetadata",
@@ -46,6 +51,10 @@ __all__ = [
     "is_numpy",
     "get_matrix_shape",
     "get_vector_length",
+    "MatrixView",
+    "ConcatView",
+    "ConstantMatrix",
+    "ScaledIdentity",
     "validate_matmul_shapes",
     "validate_solve_shapes",
     "validate_square",
@@ -0,0 +1,159 @@
+# ==============================
+# File: linalg/core/cache.py
+# ==============================
+"""Content-addressed LRU cache for expensive decompositions.
+
+Diagnostics and decomposition APIs frequently factor the *same* matrix
+several times (``full_diagnostic_report`` alone needs its singular values
+for both the condition number and the rank).  Results are keyed by a
+BLAKE2 digest of the matrix's float64 buffer plus its shape, so equal
+contents hit the cache whatever container they arrived in, and any
+in-place modification produces a different key.
+
+The cache is bounded by ``get_config().decomposition_cache_bytes`` and
+evicts least-recently-used entries first.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import numpy as np
+
+__all__ = ["DecompositionCache", "get_decomposition_cache", "matrix_fingerprint"]
+
+T = TypeVar("T")
+
+
+def matrix_fingerprint(a: Any) -> str:
+    """Return a content hash of a matrix (list of lists or ndarray)."""
+    arr = np.ascontiguousarray(a, dtype=np.float64)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(arr.shape).encode())
+    h.update(memoryview(arr).cast("B"))
+    return h.hexdigest()
+
+
+def _nbytes(obj: Any) -> int:
+    """Approximate memory held by a cached value."""
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple)):
+        return 8 + sum(_nbytes(x) for x in obj)
+    if dataclasses.is_dataclass(obj):
+        return sum(_nbytes(getattr(obj, f.name)) for f in dataclasses.fields(obj))
+    return 8
+
+
+class DecompositionCache:
+    """Thread-safe LRU mapping ``(kind, fingerprint, params) -> result``."""
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self._entries: "OrderedDict[Tuple[str, str, Hashable], Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        from mllense.math.linalg.config import get_config
+
+        return get_config().decomposition_cache_bytes
+
+    def get_or_compute(
+        self,
+        kind: str,
+        a: Any,
+        compute: Callable[[], T],
+        *,
+        params: Hashable = (),
+    ) -> Tuple[T, bool]:
+        """Return ``(result, hit)`` for decomposition ``kind`` of matrix ``a``.
+
+        Args:
+            kind: Decomposition name, e.g. ``"svdvals"`` or ``"lu"``.
+            a: The matrix the result depends on.
+            compute: Zero-argument callable producing the result on a miss.
+            params: Extra options the result depends on (part of the key).
+        """
+        budget = self.max_bytes
+        if budget <= 0:
+            return compute(), False
+
+        key = (kind, matrix_fingerprint(a), params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], True
+            self.misses += 1
+
+        result = compute()
+        size = _nbytes(result)
+        if size <= budget:
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = (result, size)
+                    self._bytes += size
+                while self._bytes > budget and self._entries:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._bytes -= evicted
+        return result, False
+
+    def get(self, kind: str, a: Any, *, params: Hashable = ()) -> Optional[Any]:
+        """Return the cached ``kind`` result for ``a``, or ``None`` — never computes."""
+        if self.max_bytes <= 0:
+            return None
+        key = (kind, matrix_fingerprint(a), params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        s = self.stats()
+        return (
+            f"DecompositionCache(entries={s['entries']}, bytes={s['bytes']}, "
+            f"max_bytes={s['max_bytes']}, hits={s['hits']}, misses={s['misses']})"
+        )
+
+
+_CACHE = DecompositionCache()
+
+
+def get_decomposition_cache() -> DecompositionCache:
+    """Return the process-wide decomposition cache."""
+    return _CACHE
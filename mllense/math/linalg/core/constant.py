@@ -0,0 +1,158 @@
+# ==============================
+# File: linalg/core/constant.py
+# ==============================
+"""Implicit constant matrices: shape and value only, never materialized.
+
+``zeros``, ``ones`` and ``eye`` with ``implicit=True`` return one of
+
+* :class:`ConstantMatrix` — every element equals ``value`` (zeros, ones,
+  any fill);
+* :class:`ScaledIdentity` — ``scale`` on the main diagonal, ``0.0``
+  elsewhere (``eye``, ``lambda * I``).
+
+Both store O(1) data.  They index, iterate and compare like the list
+matrix they stand for (they share the view protocol of
+:mod:`~mllense.math.linalg.core.view`), so any algorithm can still read
+them; the ops in ``api/ops``, ``matmul`` and ``matrix_trace`` recognise
+them and use O(1) / O(n) algebra instead (``I @ X`` is ``X``, ``X + 0`` is
+``X``, ``(c*I) @ X`` is a scaling, ``trace(c*I)`` is ``c*n``).  They are
+read-only: :meth:`tolist` or ``np.asarray`` materializes a copy.
+"""
+
+from __future__ import annotations
+
+import abc
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from mllense.math.linalg.core.view import MatrixView, _BaseView
+from mllense.math.linalg.exceptions import InvalidInputError, ShapeMismatchError
+
+__all__ = ["ImplicitMatrix", "ConstantMatrix", "ScaledIdentity", "as_implicit", "shape_of"]
+
+
+class ImplicitMatrix(_BaseView):
+    """Base for the read-only implicit matrix types."""
+
+    __slots__ = ("shape",)
+
+    def __init__(self, rows: int, cols: int) -> None:
+        if rows <= 0 or cols <= 0:
+            raise InvalidInputError(f"Matrix dimensions must be positive, got ({rows}, {cols}).")
+        self.shape = (rows, cols)
+
+    def _set(self, i: int, j: int, value: Any) -> None:
+        raise InvalidInputError(
+            f"{type(self).__name__} is read-only; materialize it with tolist() or np.asarray() first."
+        )
+
+    @property
+    def size(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    @abc.abstractmethod
+    def scaled(self, c: float) -> "ImplicitMatrix":
+        """``c`` times this matrix, in O(1)."""
+
+    def ravel(self) -> MatrixView:
+        return MatrixView.of(self.tolist()).ravel()
+
+    def reshape(self, rows: int, cols: int) -> Any:
+        if rows * cols != self.size:
+            raise ShapeMismatchError(
+                expected=f"product = {self.size}", got=f"{rows}×{cols} = {rows * cols}", operation="reshape"
+            )
+        return MatrixView.of(self.tolist()).reshape(rows, cols)
+
+
+class ConstantMatrix(ImplicitMatrix):
+    """A ``rows × cols`` matrix whose every element is ``value``."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, rows: int, cols: int, value: float = 0.0) -> None:
+        super().__init__(rows, cols)
+        self.value = float(value)
+
+    def _get(self, i: int, j: int) -> float:
+        return self.value
+
+    def tolist(self) -> list:
+        rows, cols = self.shape
+        return [[self.value] * cols for _ in range(rows)]
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        return np.full(self.shape, self.value, dtype=dtype if dtype is not None else np.float64)
+
+    @property
+    def T(self) -> "ConstantMatrix":
+        return ConstantMatrix(self.shape[1], self.shape[0], self.value)
+
+    def reshape(self, rows: int, cols: int) -> "ConstantMatrix":
+        if rows * cols != self.size:
+            raise ShapeMismatchError(
+                expected=f"product = {self.size}", got=f"{rows}×{cols} = {rows * cols}", operation="reshape"
+            )
+        return ConstantMatrix(rows, cols, self.value)
+
+    def scaled(self, c: float) -> "ConstantMatrix":
+        return ConstantMatrix(self.shape[0], self.shape[1], self.value * c)
+
+    def __repr__(self) -> str:
+        return f"ConstantMatrix({self.shape[0]}, {self.shape[1]}, value={self.value})"
+
+
+class ScaledIdentity(ImplicitMatrix):
+    """``scale`` times the ``rows × cols`` identity (ones on the main diagonal)."""
+
+    __slots__ = ("scale",)
+
+    def __init__(self, rows: int, cols: Optional[int] = None, scale: float = 1.0) -> None:
+        super().__init__(rows, rows if cols is None else cols)
+        self.scale = float(scale)
+
+    @property
+    def is_square(self) -> bool:
+        return self.shape[0] == self.shape[1]
+
+    def _get(self, i: int, j: int) -> float:
+        return self.scale if i == j else 0.0
+
+    def tolist(self) -> list:
+        rows, cols = self.shape
+        out = [[0.0] * cols for _ in range(rows)]
+        for i in range(min(rows, cols)):
+            out[i][i] = self.scale
+        return out
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        return np.eye(*self.shape, dtype=dtype if dtype is not None else np.float64) * self.scale
+
+    @property
+    def T(self) -> "ScaledIdentity":
+        return ScaledIdentity(self.shape[1], self.shape[0], self.scale)
+
+    def scaled(self, c: float) -> "ScaledIdentity":
+        return ScaledIdentity(self.shape[0], self.shape[1], self.scale * c)
+
+    def __repr__(self) -> str:
+        return f"ScaledIdentity({self.shape[0]}, {self.shape[1]}, scale={self.scale})"
+
+
+def as_implicit(m: Any) -> Optional[ImplicitMatrix]:
+    """``m`` (or the value of a ``LinalgResult``) if it is an implicit matrix, else ``None``."""
+    if hasattr(m, "value") and hasattr(m, "what_lense"):
+        m = m.value
+    return m if isinstance(m, ImplicitMatrix) else None
+
+
+def shape_of(x: Any) -> Tuple[int, ...]:
+    """Shape of a scalar, list (1-D or 2-D), view or ndarray operand."""
+    if isinstance(x, (np.ndarray, _BaseView)):
+        return tuple(x.shape)
+    if isinstance(x, (list, tuple)):
+        if x and isinstance(x[0], (list, tuple, np.ndarray)):
+            return (len(x), len(x[0]))
+        return (len(x),)
+    return ()
@@ -21,6 +21,7 @@ __all__ = [
     "InternalMatrix",
     "InternalVector",
     "to_internal_matrix",
+    "as_internal_matrix",
     "to_internal_vector",
     "from_internal_matrix",
     "from_internal_vector",
@@ -62,10 +63,13 @@ def _assert_numeric(value: Any, label: str = "element") -> float:
 
 def to_internal_vector(v: VectorLike) -> InternalVector:
     """Normalise a 1-D input to ``list[float]``."""
+    from mllense.math.linalg.core.view import as_view
     from mllense.math.linalg.exceptions import EmptyMatrixError, InvalidInputError
 
     if hasattr(v, "value") and hasattr(v, "what_lense"):
         v = v.value
+    if as_view(v) is not None:
+        v = v.tolist()
 
     if isinstance(v, np.ndarray):
         if v.ndim != 1:
@@ -92,9 +96,12 @@ def to_internal_matrix(m: MatrixLike) -> InternalMatrix:
         InvalidInputError,
         NonRectangularMatrixError,
     )
+    from mllense.math.linalg.core.view import as_view
 
     if hasattr(m, "value") and hasattr(m, "what_lense"):
         m = m.value
+    if as_view(m) is not None:
+        m = m.as_2d().tolist()
 
     if isinstance(m, np.ndarray):
         if m.ndim == 1:
@@ -141,6 +148,28 @@ def to_internal_matrix(m: MatrixLike) -> InternalMatrix:
     ]
 
 
+def as_internal_matrix(m: MatrixLike) -> InternalMatrix:
+    """Like :func:`to_internal_matrix`, but return a list of equal-length lists as is.
+
+    Only the row lengths are checked (O(rows)), so an operand used with a
+    caller-provided output buffer is not copied; 2-D views
+    (:mod:`~mllense.math.linalg.core.view`) are returned as is too.
+    Anything else (tuples, ndarrays, ragged or empty input) goes through
+    the validating copy.
+    """
+    from mllense.math.linalg.core.view import as_view
+
+    if hasattr(m, "value") and hasattr(m, "what_lense"):
+        m = m.value
+    if as_view(m) is not None and m.ndim == 2:
+        return m
+    if isinstance(m, list) and m and isinstance(m[0], list) and m[0]:
+        width = len(m[0])
+        if all(isinstance(row, list) and len(row) == width for row in m):
+            return m
+    return to_internal_matrix(m)
+
+
 def from_internal_matrix(
     internal: InternalMatrix,
     *,
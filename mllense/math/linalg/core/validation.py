@@ -9,10 +9,12 @@ Every validation function raises a domain-specific exception from
 
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Any, Sequence
+
+import numpy as np
 
 from mllense.math.linalg._internal.constants import MAX_MATRIX_DIM
-from mllense.math.linalg.core.types import InternalMatrix, InternalVector, get_matrix_shape
+from mllense.math.linalg.core.types import InternalMatrix, InternalVector, _assert_numeric, get_matrix_shape
 from mllense.math.linalg.exceptions import (
     EmptyMatrixError,
     InvalidInputError,
@@ -24,6 +26,8 @@ __all__ = [
     "validate_square",
     "validate_solve_shapes",
     "validate_dimension_limit",
+    "validate_out",
+    "validate_numeric",
 ]
 
 
@@ -105,3 +109,59 @@ def validate_solve_shapes(
             operation="solve",
         )
     return n
+
+
+def validate_out(out: Any, shape: Sequence[int], operation: str) -> None:
+    """Validate a caller-provided output buffer of the given result shape.
+
+    ``out`` must be a writeable float ndarray of exactly ``shape``, or a
+    (list of) list(s) of that shape.  Only lengths are checked — O(rows)
+    for lists — so the check is cheap enough for every call of a hot loop.
+
+    Raises:
+        InvalidInputError: ``out`` is not a writeable list / float ndarray.
+        ShapeMismatchError: ``out`` has the wrong shape.
+    """
+    shape = tuple(shape)
+    label = "×".join(map(str, shape))
+    if isinstance(out, np.ndarray):
+        if out.dtype.kind != "f" or not out.flags.writeable:
+            raise InvalidInputError(
+                f"out= must be a writeable float array, got dtype {out.dtype} "
+                f"(writeable={out.flags.writeable})."
+            )
+        if out.shape != shape:
+            raise ShapeMismatchError(
+                expected=f"out of shape {label}",
+                got="×".join(map(str, out.shape)),
+                operation=operation,
+            )
+        return
+    if not isinstance(out, list):
+        raise InvalidInputError(f"out= must be a list or ndarray, got {type(out).__name__}.")
+    if len(out) != shape[0]:
+        raise ShapeMismatchError(expected=f"out of shape {label}", got=f"{len(out)} rows", operation=operation)
+    if len(shape) == 2:
+        cols = shape[1]
+        for i, row in enumerate(out):
+            if not isinstance(row, list) or len(row) != cols:
+                raise ShapeMismatchError(
+                    expected=f"out of shape {label}",
+                    got=f"row {i} of length {len(row) if isinstance(row, list) else type(row).__name__}",
+                    operation=operation,
+                )
+
+
+def validate_numeric(m: InternalMatrix, operation: str) -> None:
+    """Check that every element of a list matrix is a (non-NaN) real number.
+
+    List operands written into an ``out=`` buffer are not converted on the
+    way in, so this O(m*n) pass runs before the first write: a bad element
+    must not leave the buffer (often an operand itself) half-updated.
+
+    Raises:
+        InvalidInputError: An element is non-numeric or NaN.
+    """
+    for i, row in enumerate(m):
+        for j, v in enumerate(row):
+            _assert_numeric(v, f"{operation} operand element [{i}][{j}]")
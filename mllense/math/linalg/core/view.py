@@ -0,0 +1,393 @@
+# ==============================
+# File: linalg/core/view.py
+# ==============================
+"""Zero-copy strided views over list matrices.
+
+``transpose``, ``reshape``, ``flatten``, ``vstack`` and ``hstack`` on list
+input return views instead of copying every element into new lists:
+
+* :class:`MatrixView` — ``(offset, shape, strides)`` over a shared
+  row-major buffer (the caller's list of lists, or a flat list).  Element
+  ``(i, j)`` is buffer element ``offset + i*strides[0] + j*strides[1]``,
+  so a transpose is a swap of ``shape`` and ``strides`` and a reshape of
+  a contiguous view only changes them.
+* :class:`ConcatView` — views stacked along one axis.
+
+Views index, iterate and compare like the list they stand for
+(``v[i][j]``, ``len(v)``, ``v == [[...]]``), so algorithms and callers
+read them in place.  They are not ``list`` subclasses, though:
+``isinstance(v, list)`` is false and :mod:`json` cannot encode them, so
+hand ``v.tolist()`` to code that needs a real list.  Elements are
+validated on construction like :func:`~mllense.math.linalg.core.types.to_internal_matrix`
+does: a buffer of floats is used in place, anything else numeric is
+converted once into a private float copy, and non-numeric or NaN
+elements raise :class:`~mllense.math.linalg.exceptions.InvalidInputError`.  They are materialized only on request
+(:meth:`~MatrixView.tolist`, ``np.asarray``) or on the first write, which
+copies the view's elements into a private buffer first (copy-on-write)
+— writing to a view never changes the matrix it was taken from.  Writes
+to that matrix, however, show through views that have not been written.
+
+For ndarray input the shape ops return NumPy views marked read-only
+(:func:`readonly`), which gives the same guarantee: a write to the
+result raises instead of reaching the caller's array; ``.copy()`` it
+to get a writeable matrix.
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from mllense.math.linalg.core.types import _assert_numeric
+from mllense.math.linalg.exceptions import ShapeMismatchError
+
+__all__ = ["MatrixView", "ConcatView", "as_view", "readonly"]
+
+
+def _is_float_line(line: Sequence[Any]) -> bool:
+    return all(type(v) is float and v == v for v in line)
+
+
+def _float_buffer(m: List[Any]) -> Tuple[List[Any], bool]:
+    """``(m, False)`` if every element is already a float, else ``(validated float copy, True)``."""
+    if m and isinstance(m[0], list):
+        if all(_is_float_line(row) for row in m):
+            return m, False
+        return [
+            [_assert_numeric(v, f"matrix[{i}][{j}]") for j, v in enumerate(row)] for i, row in enumerate(m)
+        ], True
+    if _is_float_line(m):
+        return m, False
+    return [_assert_numeric(v, f"vector[{i}]") for i, v in enumerate(m)], True
+
+
+class _Row:
+    """Row ``i`` of a 2-D view; reads and writes go through the view."""
+
+    __slots__ = ("_view", "_i", "_len")
+
+    def __init__(self, view: "_BaseView", i: int) -> None:
+        self._view = view
+        self._i = i
+        self._len = view.shape[1]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, j: Any) -> Any:
+        if isinstance(j, slice):
+            return [self._view._get(self._i, k) for k in range(*j.indices(self._len))]
+        if j < 0:
+            j += self._len
+        if not 0 <= j < self._len:
+            raise IndexError("view row index out of range")
+        return self._view._get(self._i, j)
+
+    def __setitem__(self, j: int, value: float) -> None:
+        if j < 0:
+            j += self._len
+        if not 0 <= j < self._len:
+            raise IndexError("view row index out of range")
+        self._view._set(self._i, j, value)
+
+    def __iter__(self) -> Iterator[Any]:
+        get, i = self._view._get, self._i
+        return (get(i, j) for j in range(self._len))
+
+    def __eq__(self, other: Any) -> bool:
+        return list(self) == (list(other) if isinstance(other, _Row) else other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _BaseView(abc.ABC):
+    """List-like protocol shared by the view types; subclasses provide
+    ``shape``, ``_get``, ``_set``, ``tolist``, ``T``, ``reshape`` and ``ravel``."""
+
+    __slots__ = ()
+    shape: Tuple[int, ...]
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return self.tolist()[i]
+        if i < 0:
+            i += self.shape[0]
+        if not 0 <= i < self.shape[0]:
+            raise IndexError("view index out of range")
+        if len(self.shape) == 1:
+            return self._get(i, 0)
+        return _Row(self, i)
+
+    def __setitem__(self, i: int, value: Any) -> None:
+        if i < 0:
+            i += self.shape[0]
+        if not 0 <= i < self.shape[0]:
+            raise IndexError("view index out of range")
+        if len(self.shape) == 1:
+            self._set(i, 0, value)
+            return
+        if len(value) != self.shape[1]:
+            raise ShapeMismatchError(
+                expected=f"row of length {self.shape[1]}", got=f"length {len(value)}", operation="view assignment"
+            )
+        for j, v in enumerate(value):
+            self._set(i, j, v)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[i] for i in range(self.shape[0]))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, _BaseView):
+            other = other.tolist()
+        return self.tolist() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        return np.array(self.tolist(), dtype=dtype if dtype is not None else np.float64)
+
+    @abc.abstractmethod
+    def _get(self, i: int, j: int) -> Any:
+        """Element ``(i, j)`` (``j`` is ignored for 1-D views)."""
+
+    @abc.abstractmethod
+    def _set(self, i: int, j: int, value: Any) -> None:
+        """Write element ``(i, j)``."""
+
+    @abc.abstractmethod
+    def tolist(self) -> list:
+        """Materialize as a new list of lists (or flat list for 1-D)."""
+
+    def as_2d(self) -> "_BaseView":
+        """The view itself if 2-D; a 1-D view as a ``1 × n`` row."""
+        return self
+
+
+class MatrixView(_BaseView):
+    """A 1-D or 2-D strided window onto a shared row-major buffer.
+
+    Args:
+        buf: A list of equal-length rows, or a flat list.
+        shape: ``(rows, cols)`` or ``(n,)``.
+        strides: Element steps per axis in the row-major buffer.
+        offset: Buffer position of element ``(0, 0)``.
+    """
+
+    __slots__ = ("_buf", "_width", "offset", "shape", "strides", "_owned")
+
+    def __init__(
+        self,
+        buf: Union[List[List[Any]], List[Any]],
+        shape: Tuple[int, ...],
+        strides: Tuple[int, ...],
+        offset: int = 0,
+        *,
+        owned: bool = False,
+    ) -> None:
+        self._buf = buf
+        self._width = len(buf[0]) if buf and isinstance(buf[0], list) else 0
+        self.shape = tuple(shape)
+        self.strides = tuple(strides)
+        self.offset = offset
+        self._owned = owned
+
+    @classmethod
+    def of(cls, m: Any) -> "_BaseView":
+        """A view of a rectangular list of lists (or flat list); views pass through.
+
+        Raises:
+            InvalidInputError: An element is non-numeric or NaN.
+        """
+        if isinstance(m, _BaseView):
+            return m
+        buf, owned = _float_buffer(m)
+        if buf and isinstance(buf[0], list):
+            cols = len(buf[0])
+            return cls(buf, (len(buf), cols), (cols, 1), owned=owned)
+        return cls(buf, (len(buf),), (1,), owned=owned)
+
+    # ── element access ──────────────────────────────────────────────── #
+    def _pos(self, i: int, j: int) -> int:
+        if len(self.shape) == 1:
+            return self.offset + i * self.strides[0]
+        return self.offset + i * self.strides[0] + j * self.strides[1]
+
+    def _get(self, i: int, j: int) -> Any:
+        p = self._pos(i, j)
+        if self._width:
+            r, c = divmod(p, self._width)
+            return self._buf[r][c]
+        return self._buf[p]
+
+    def _set(self, i: int, j: int, value: Any) -> None:
+        if not self._owned:
+            self._own()
+        p = self._pos(i, j)
+        if self._width:
+            r, c = divmod(p, self._width)
+            self._buf[r][c] = value
+        else:
+            self._buf[p] = value
+
+    def _own(self) -> None:
+        """Copy-on-write: move the view's elements into a private buffer."""
+        self._buf = self.tolist()
+        self._width = self.shape[1] if len(self.shape) == 2 else 0
+        self.offset = 0
+        self.strides = (self.shape[1], 1) if len(self.shape) == 2 else (1,)
+        self._owned = True
+
+    @property
+    def is_contiguous(self) -> bool:
+        """Whether the elements are consecutive in row-major order in the buffer."""
+        if len(self.shape) == 1:
+            return self.shape[0] <= 1 or self.strides[0] == 1
+        rows, cols = self.shape
+        return (cols <= 1 or self.strides[1] == 1) and (rows <= 1 or self.strides[0] == cols)
+
+    def tolist(self) -> list:
+        """Materialize as a new list of lists (or flat list for 1-D)."""
+        if len(self.shape) == 1:
+            (n,), (s,) = self.shape, self.strides
+            if not self._width and s == 1:
+                return self._buf[self.offset:self.offset + n]
+            return [self._get(i, 0) for i in range(n)]
+        rows, cols = self.shape
+        w = self._width
+        if w and self.strides[1] == 1:
+            out = []
+            for i in range(rows):
+                r, c = divmod(self.offset + i * self.strides[0], w)
+                if c + cols > w:
+                    break
+                out.append(self._buf[r][c:c + cols])
+            else:
+                return out
+        return [[self._get(i, j) for j in range(cols)] for i in range(rows)]
+
+    # ── O(1) reshaping ──────────────────────────────────────────────── #
+    def as_2d(self) -> "MatrixView":
+        if len(self.shape) == 2:
+            return self
+        return MatrixView(self._buf, (1, self.shape[0]), (0, self.strides[0]), self.offset)
+
+    @property
+    def T(self) -> "MatrixView":
+        """Transposed view (a 1-D view is transposed as a ``1 × n`` row)."""
+        v = self.as_2d()
+        return MatrixView(v._buf, v.shape[::-1], v.strides[::-1], v.offset)
+
+    def reshape(self, rows: int, cols: int) -> "MatrixView":
+        """Row-major reshape: a view if contiguous, else a view of a copy."""
+        v = self.ravel()
+        return MatrixView(v._buf, (rows, cols), (cols, 1), v.offset)
+
+    def ravel(self) -> "MatrixView":
+        """Row-major 1-D view: no copy if contiguous."""
+        if self.is_contiguous:
+            return MatrixView(self._buf, (self.size,), (1,), self.offset)
+        flat = [v for row in self.tolist() for v in row] if len(self.shape) == 2 else self.tolist()
+        return MatrixView(flat, (len(flat),), (1,), owned=True)
+
+    @property
+    def size(self) -> int:
+        n = 1
+        for d in self.shape:
+            n *= d
+        return n
+
+
+class ConcatView(_BaseView):
+    """2-D views stacked along ``axis`` (0 = vstack, 1 = hstack), without copying."""
+
+    __slots__ = ("_parts", "_axis", "_starts", "shape")
+
+    def __init__(self, parts: Sequence[_BaseView], axis: int) -> None:
+        self._parts = [p.as_2d() for p in parts]
+        self._axis = axis
+        starts = [0]
+        for p in self._parts:
+            starts.append(starts[-1] + p.shape[axis])
+        self._starts = starts
+        other = self._parts[0].shape[1 - axis]
+        self.shape = (starts[-1], other) if axis == 0 else (other, starts[-1])
+
+    def _locate(self, k: int) -> Tuple[_BaseView, int]:
+        idx = bisect.bisect_right(self._starts, k) - 1
+        return self._parts[idx], k - self._starts[idx]
+
+    def __getitem__(self, i: Any) -> Any:
+        if self._axis == 0 and not isinstance(i, slice):
+            if i < 0:
+                i += self.shape[0]
+            if not 0 <= i < self.shape[0]:
+                raise IndexError("view index out of range")
+            part, r = self._locate(i)
+            return part[r]
+        return super().__getitem__(i)
+
+    def _get(self, i: int, j: int) -> Any:
+        if self._axis == 0:
+            part, r = self._locate(i)
+            return part._get(r, j)
+        part, c = self._locate(j)
+        return part._get(i, c)
+
+    def _set(self, i: int, j: int, value: Any) -> None:
+        # each part is a private view, so writing copies only that part
+        if self._axis == 0:
+            part, r = self._locate(i)
+            part._set(r, j, value)
+        else:
+            part, c = self._locate(j)
+            part._set(i, c, value)
+
+    def tolist(self) -> list:
+        if self._axis == 0:
+            return [row for p in self._parts for row in p.tolist()]
+        out = [[] for _ in range(self.shape[0])]
+        for p in self._parts:
+            for row_out, row in zip(out, p.tolist()):
+                row_out.extend(row)
+        return out
+
+    @property
+    def T(self) -> "ConcatView":
+        """Transposed view: the transposed parts stacked along the other axis."""
+        return ConcatView([p.T for p in self._parts], 1 - self._axis)
+
+    def reshape(self, rows: int, cols: int) -> MatrixView:
+        return MatrixView.of(self.tolist()).reshape(rows, cols)
+
+    def ravel(self) -> MatrixView:
+        return MatrixView.of(self.tolist()).ravel()
+
+
+def as_view(m: Any) -> Optional[_BaseView]:
+    """``m`` (or the value of a ``LinalgResult``) if it is a view, else ``None``."""
+    if hasattr(m, "value") and hasattr(m, "what_lense"):
+        m = m.value
+    return m if isinstance(m, _BaseView) else None
+
+
+def readonly(a: np.ndarray) -> np.ndarray:
+    """A read-only view of ``a`` (the ndarray counterpart of copy-on-write)."""
+    v = a.view()
+    v.flags.writeable = False
+    return v
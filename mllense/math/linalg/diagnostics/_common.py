@@ -0,0 +1,30 @@
+# ==============================
+# File: linalg/diagnostics/_common.py
+# ==============================
+"""Shared helpers for the diagnostics subsystem."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from mllense.math.linalg.core.cache import get_decomposition_cache
+from mllense.math.linalg.core.types import MatrixLike, is_numpy, to_internal_matrix
+
+__all__ = ["as_float_array", "singular_values"]
+
+
+def as_float_array(a: MatrixLike) -> np.ndarray:
+    """Validate ``a`` and return it as a float64 ndarray (no copy for float64 input)."""
+    if hasattr(a, "value") and hasattr(a, "what_lense"):
+        a = a.value
+    if is_numpy(a) and a.ndim == 2 and a.size and not np.isnan(a).any():
+        return np.asarray(a, dtype=np.float64)
+    return np.array(to_internal_matrix(a), dtype=np.float64)
+
+
+def singular_values(a_np: np.ndarray) -> np.ndarray:
+    """Singular values of ``a_np`` in descending order, via the decomposition cache."""
+    s, _ = get_decomposition_cache().get_or_compute(
+        "svdvals", a_np, lambda: np.linalg.svd(a_np, compute_uv=False)
+    )
+    return s
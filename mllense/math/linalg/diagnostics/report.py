@@ -7,9 +7,8 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from mllense.math.linalg.core.types import MatrixLike, to_internal_matrix
-from mllense.math.linalg.diagnostics.condition_number import condition_number
-from mllense.math.linalg.diagnostics.rank import matrix_rank
+from mllense.math.linalg.core.types import MatrixLike
+from mllense.math.linalg.diagnostics._common import as_float_array
 from mllense.math.linalg.diagnostics.stability import stability_report
 from mllense.math.linalg.utils.inspection import describe_matrix
 
@@ -24,10 +23,10 @@ def full_diagnostic_report(a: MatrixLike) -> Dict[str, Any]:
     - Stability analysis (condition number, rank)
     - Recommendations
     """
-    a_int = to_internal_matrix(a)
+    a_np = as_float_array(a)
 
-    props = describe_matrix(a_int)
-    stab = stability_report(a_int)
+    props = describe_matrix(a_np.tolist())
+    stab = stability_report(a_np)
 
     return {
         "properties": props,
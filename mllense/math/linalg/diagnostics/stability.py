@@ -7,30 +7,37 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-import numpy as np
-
-from mllense.math.linalg.core.types import MatrixLike, to_internal_matrix
+from mllense.math.linalg.core.types import MatrixLike
+from mllense.math.linalg.diagnostics._common import as_float_array
 from mllense.math.linalg.diagnostics.condition_number import condition_number
 from mllense.math.linalg.diagnostics.rank import matrix_rank
 
 __all__ = ["stability_report"]
 
+_WELL_CONDITIONED = 1e6
+
 
-def stability_report(a: MatrixLike) -> Dict[str, Any]:
+def stability_report(a: MatrixLike, *, method: str = "svd") -> Dict[str, Any]:
     """Generate a stability report for a matrix.
 
     Reports:
-    - Condition number (2-norm)
+    - Condition number (2-norm via the SVD by default, 1-norm with
+      ``method="estimate"``; see :func:`condition_number`)
     - Rank
     - Whether the matrix is well-conditioned
     - Estimated digits of accuracy lost
-    """
-    a_int = to_internal_matrix(a)
-    a_np = np.array(a_int, dtype=np.float64)
 
-    cond = condition_number(a_int)
-    rnk = matrix_rank(a_int)
+    The rank always comes from the singular values (shared with the
+    condition number through the decomposition cache): a condition
+    estimate is only a lower bound, so it cannot vouch for full rank.
+    """
+    a_np = as_float_array(a)
     rows, cols = a_np.shape
+    if rows != cols:
+        method = "svd"
+
+    cond = condition_number(a_np, method=method)
+    rnk = matrix_rank(a_np)
 
     import math
     if cond == float("inf"):
@@ -38,13 +45,14 @@ def stability_report(a: MatrixLike) -> Dict[str, Any]:
         well_conditioned = False
     else:
         digits_lost = math.log10(cond) if cond > 0 else 0.0
-        well_conditioned = cond < 1e6
+        well_conditioned = cond < _WELL_CONDITIONED
 
     return {
         "shape": (rows, cols),
         "rank": rnk,
         "full_rank": rnk == min(rows, cols),
         "condition_number": cond,
+        "condition_method": method,
         "well_conditioned": well_conditioned,
         "estimated_digits_lost": round(digits_lost, 2),
         "recommendation": (
@@ -0,0 +1,8 @@
+# ==============================
+# File: linalg/expr/__init__.py
+# ==============================
+"""Lazy expression graphs."""
+
+from mllense.math.linalg.expr.graph import Expr, structural_keys, topological_order
+
+__all__ = ["Expr", "structural_keys", "topological_order"]
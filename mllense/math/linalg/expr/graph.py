@@ -0,0 +1,229 @@
+# ==============================
+# File: linalg/expr/graph.py
+# ==============================
+"""Deferred expression graphs.
+
+An :class:`Expr` is a node in a DAG of operations whose leaves are
+concrete matrices (or scalar constants).  Building a node computes
+nothing except its shape, so shape errors still surface where the
+expression is written; the work happens in
+:func:`mllense.math.linalg.evaluate`.
+
+Two nodes are the *same subexpression* when they have the same operation,
+parameters and (recursively) operands — leaves compare by identity of the
+object the caller passed in.  :func:`structural_keys` assigns those keys, which the
+evaluators use to compute every repeated subexpression once.
+"""
+
+from __future__ import annotations
+
+import numbers
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from mllense.math.linalg.algorithms.elementwise.broadcast import broadcast_shapes
+from mllense.math.linalg.core.metadata import LinalgResult
+from mllense.math.linalg.core.types import to_internal_matrix, to_internal_vector
+from mllense.math.linalg.core.view import as_view
+from mllense.math.linalg.exceptions import ShapeMismatchError
+
+__all__ = [
+    "COMMUTATIVE_OPS",
+    "ELEMENTWISE_BINARY",
+    "ELEMENTWISE_SCALAR",
+    "Expr",
+    "structural_keys",
+    "topological_order",
+]
+
+# op name -> infix symbol, for the element-wise ops a graph may contain
+ELEMENTWISE_BINARY: Dict[str, str] = {"add": "+", "subtract": "-", "multiply": "*", "divide": "/"}
+ELEMENTWISE_SCALAR: Dict[str, str] = {"scalar_add": "+", "scalar_multiply": "*"}
+COMMUTATIVE_OPS = frozenset({"add", "multiply"})
+
+# the ShapeMismatchError operation label used by the eager ops
+_OP_LABEL = {"multiply": "hadamard"}
+
+
+class Expr:
+    """One node of a lazy expression DAG.
+
+    Attributes:
+        op: ``"leaf"``, ``"const"`` or an operation name (``"add"``, ...).
+        args: Operand nodes.
+        params: Hashable operation parameters (e.g. the scalar of ``scalar_add``).
+        shape: Result shape, inferred when the node is built.
+        value: The wrapped matrix (``"leaf"`` nodes only).
+        source: The object the caller passed for a leaf; leaves wrapping
+            the same object are the same subexpression.
+        numpy: Whether any leaf below is an ndarray (the result will be one).
+    """
+
+    __slots__ = ("op", "args", "params", "shape", "value", "source", "numpy")
+
+    def __init__(
+        self,
+        op: str,
+        args: Tuple[Expr, ...] = (),
+        params: Tuple[Hashable, ...] = (),
+        shape: Tuple[int, ...] = (),
+        value: Any = None,
+        source: Any = None,
+        numpy: bool = False,
+    ) -> None:
+        self.op = op
+        self.args = args
+        self.params = params
+        self.shape = shape
+        self.value = value
+        self.source = value if source is None else source
+        self.numpy = numpy
+
+    # ── construction ──────────────────────────────────────────────────── #
+    @classmethod
+    def leaf(cls, x: Any, *, vector: bool = False) -> Expr:
+        """Wrap a matrix, vector or scalar (an ``Expr`` is returned unchanged).
+
+        A flat list is a row vector and a scalar a broadcastable constant,
+        as in the eager element-wise ops; with ``vector=True`` (matrix
+        products) a flat list is a 1-D vector instead.  ndarrays are
+        referenced, not copied.
+        """
+        if isinstance(x, Expr):
+            return x
+        if isinstance(x, LinalgResult):
+            x = x.value
+        if as_view(x) is not None:
+            x = x.tolist()
+        if isinstance(x, numbers.Real):
+            return cls("const", params=(float(x),))
+        if isinstance(x, np.ndarray):
+            arr = x if x.dtype == np.float64 else x.astype(np.float64)
+            return cls("leaf", shape=arr.shape, value=arr, source=x, numpy=True)
+        flat = isinstance(x, (list, tuple)) and x and not isinstance(x[0], (list, tuple, np.ndarray))
+        if flat and vector:
+            v = to_internal_vector(x)
+            return cls("leaf", shape=(len(v),), value=v, source=x)
+        m = to_internal_matrix([x] if flat else x)
+        return cls("leaf", shape=(len(m), len(m[0])), value=m, source=x)
+
+    @classmethod
+    def binary(cls, op: str, a: Any, b: Any) -> Expr:
+        """Broadcasting element-wise ``op`` (``add``, ``subtract``, ``multiply``, ``divide``)."""
+        a, b = cls.leaf(a), cls.leaf(b)
+        shape = broadcast_shapes(a.shape, b.shape, _OP_LABEL.get(op, op))
+        return cls(op, (a, b), shape=shape, numpy=a.numpy or b.numpy)
+
+    @classmethod
+    def scalar(cls, op: str, m: Any, scalar: float) -> Expr:
+        """``scalar_add`` / ``scalar_multiply`` of ``m`` by a constant."""
+        m = cls.leaf(m)
+        return cls(op, (m,), params=(float(scalar),), shape=m.shape, numpy=m.numpy)
+
+    @classmethod
+    def matmul(cls, a: Any, b: Any) -> Expr:
+        """Matrix product with ``numpy.matmul`` shape rules for 1-D / 2-D operands."""
+        a, b = cls.leaf(a, vector=True), cls.leaf(b, vector=True)
+        if not 1 <= len(a.shape) <= 2 or not 1 <= len(b.shape) <= 2 or a.shape[-1] != b.shape[0]:
+            raise ShapeMismatchError(
+                expected=f"b with {a.shape[-1] if a.shape else '?'} rows",
+                got="×".join(map(str, b.shape)) or "scalar",
+                operation="matmul",
+            )
+        shape = a.shape[:-1] + b.shape[1:]
+        return cls("matmul", (a, b), shape=shape, numpy=a.numpy or b.numpy)
+
+    @classmethod
+    def transpose(cls, a: Any) -> Expr:
+        a = cls.leaf(a)
+        return cls("transpose", (a,), shape=a.shape[::-1], numpy=a.numpy)
+
+    @classmethod
+    def inv(cls, a: Any) -> Expr:
+        a = cls.leaf(a)
+        if len(a.shape) != 2 or a.shape[0] != a.shape[1]:
+            raise ShapeMismatchError(
+                expected="square matrix (rows == cols)",
+                got="×".join(map(str, a.shape)) or "scalar",
+                operation="inv",
+            )
+        return cls("inv", (a,), shape=a.shape, numpy=a.numpy)
+
+    # ── inspection ────────────────────────────────────────────────────── #
+    def describe(self, names: Optional[Dict[int, str]] = None) -> str:
+        """Render the expression in infix form, naming leaves ``A``, ``B``, ..."""
+        names = {} if names is None else names
+        if self.op == "leaf":
+            if id(self.source) not in names:
+                k = len(names)
+                names[id(self.source)] = chr(ord("A") + k) if k < 26 else f"M{k}"
+            return names[id(self.source)]
+        if self.op == "const":
+            return f"{self.params[0]:g}"
+        if self.op in ELEMENTWISE_BINARY:
+            a, b = (arg.describe(names) for arg in self.args)
+            return f"({a} {ELEMENTWISE_BINARY[self.op]} {b})"
+        if self.op in ELEMENTWISE_SCALAR:
+            return f"({self.args[0].describe(names)} {ELEMENTWISE_SCALAR[self.op]} {self.params[0]:g})"
+        if self.op == "matmul":
+            a, b = (arg.describe(names) for arg in self.args)
+            return f"({a} @ {b})"
+        if self.op == "transpose":
+            return f"{self.args[0].describe(names)}.T"
+        if self.op == "syrk":
+            x = self.args[0].describe(names)
+            return f"syrk({x}.T @ {x})" if self.params == ("T",) else f"syrk({x} @ {x}.T)"
+        inner = ", ".join(arg.describe(names) for arg in self.args)
+        return f"{self.op}({inner})"
+
+    def evaluate(self, **kwargs: Any) -> LinalgResult:
+        """Shorthand for :func:`mllense.math.linalg.evaluate` on this node."""
+        from mllense.math.linalg.api.lazy import evaluate
+
+        return evaluate(self, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"Expr({self.describe()}, shape={'×'.join(map(str, self.shape)) or 'scalar'})"
+
+
+def topological_order(root: Expr) -> List[Expr]:
+    """Distinct nodes (by identity) below ``root``, operands before their users."""
+    order: List[Expr] = []
+    seen = set()
+    stack: List[Tuple[Expr, bool]] = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.append((node, True))
+        for arg in reversed(node.args):
+            if id(arg) not in seen:
+                stack.append((arg, False))
+    return order
+
+
+def structural_keys(order: List[Expr]) -> Dict[int, int]:
+    """Map ``id(node)`` to an integer that is equal exactly for identical subexpressions.
+
+    ``order`` must be topological (see :func:`topological_order`).  Operands
+    of commutative ops are sorted, so ``A * B`` and ``B * A`` share a key.
+    """
+    canonical: Dict[Hashable, int] = {}
+    keys: Dict[int, int] = {}
+    for node in order:
+        if node.op == "leaf":
+            key: Hashable = ("leaf", id(node.source), node.shape)
+        elif node.op == "const":
+            key = ("const", node.params)
+        else:
+            arg_keys = tuple(keys[id(a)] for a in node.args)
+            if node.op in COMMUTATIVE_OPS:
+                arg_keys = tuple(sorted(arg_keys))
+            key = (node.op, node.params, arg_keys)
+        keys[id(node)] = canonical.setdefault(key, len(canonical))
+    return keys
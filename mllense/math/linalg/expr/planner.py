@@ -0,0 +1,122 @@
+# ==============================
+# File: linalg/expr/planner.py
+# ==============================
+"""Algebraic rewrites of lazy expression graphs.
+
+Written literally, ``matmul(inv(A), b)`` forms an O(n^3) inverse only to
+multiply it away, ``transpose(matmul(A, B))`` copies a product just to
+transpose it, and ``matmul(transpose(X), X)`` computes both triangles of
+a symmetric result.  :func:`plan` rewrites such patterns bottom-up until
+none applies:
+
+==============================  ======================================
+``inv(A) @ B``                  ``solve(A, B)``
+``(A @ B).T``                   ``B.T @ A.T`` (operands swapped)
+``X.T @ X`` / ``X @ X.T``       ``syrk`` (symmetric rank-k update)
+``X.T.T``, ``inv(inv(X))``      ``X``
+``inv(A).T``                    ``inv(A.T)`` (enables the solve rule)
+``syrk(...).T``                 ``syrk(...)`` (it is symmetric)
+==============================  ======================================
+
+Every rule that fires is reported, so the chosen plan can be audited in
+the how_lense.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from mllense.math.linalg.expr.graph import Expr, structural_keys, topological_order
+
+__all__ = ["plan"]
+
+
+def _rebuild(node: Expr, op: str, args: Tuple[Expr, ...], params: tuple = ()) -> Expr:
+    """A node equal in value (same shape) to ``node`` with a new op and operands."""
+    return Expr(op, args, params, node.shape, numpy=node.numpy)
+
+
+def _transpose(x: Expr) -> Expr:
+    return Expr("transpose", (x,), shape=x.shape[::-1], numpy=x.numpy)
+
+
+def _same(a: Expr, b: Expr) -> bool:
+    keys = structural_keys(topological_order(Expr("pair", (a, b))))
+    return keys[id(a)] == keys[id(b)]
+
+
+def _rule(node: Expr, names: Dict[int, str]) -> Optional[Tuple[Expr, str]]:
+    """Apply the first matching rewrite at ``node``; ``None`` if none matches."""
+    args = node.args
+    if node.op == "transpose":
+        (x,) = args
+        if x.op == "transpose":
+            return x.args[0], f"{node.describe(names)} → {x.args[0].describe(names)}: the transposes cancel."
+        if x.op == "syrk":
+            return x, f"{node.describe(names)} → {x.describe(names)}: the product is symmetric."
+        if x.op == "inv":
+            new = _rebuild(node, "inv", (_transpose(x.args[0]),))
+            return new, f"{node.describe(names)} → {new.describe(names)}, so a product with it can become a solve."
+        if x.op == "matmul":
+            a, b = x.args
+            new = _rebuild(node, "matmul", (_transpose(b), _transpose(a)))
+            return new, (
+                f"{node.describe(names)} → {new.describe(names)}: operands swapped; transposes are "
+                "strided views, so the product is never copied just to transpose it."
+            )
+    elif node.op == "inv" and args[0].op == "inv":
+        inner = args[0].args[0]
+        return inner, f"{node.describe(names)} → {inner.describe(names)}: the inverses cancel."
+    elif node.op == "matmul":
+        a, b = args
+        if a.op == "inv":
+            new = _rebuild(node, "solve", (a.args[0], b))
+            return new, (
+                f"{node.describe(names)} → {new.describe(names)}: one LU factorization and triangular "
+                "solves instead of an explicit O(n^3) inverse and a product."
+            )
+        if len(node.shape) == 2:
+            if a.op == "transpose" and _same(a.args[0], b):
+                new = _rebuild(node, "syrk", (b,), ("T",))
+                return new, (
+                    f"{node.describe(names)} → {new.describe(names)}: symmetric rank-k update, "
+                    "only one triangle of the result is computed."
+                )
+            if b.op == "transpose" and _same(b.args[0], a):
+                new = _rebuild(node, "syrk", (a,), ("N",))
+                return new, (
+                    f"{node.describe(names)} → {new.describe(names)}: symmetric rank-k update, "
+                    "only one triangle of the result is computed."
+                )
+    return None
+
+
+def plan(root: Expr) -> Tuple[Expr, List[str]]:
+    """Rewrite ``root`` to a cheaper equivalent; returns ``(planned, notes)``.
+
+    ``notes`` describes each rewrite in the order it was applied, with
+    leaves named as in ``root.describe()``.
+    """
+    names: Dict[int, str] = {}
+    root.describe(names)
+    notes: List[str] = []
+    # id -> (node, rewritten); holding the node keeps its id from being reused
+    memo: Dict[int, Tuple[Expr, Expr]] = {}
+
+    def rewrite(node: Expr) -> Expr:
+        if id(node) in memo:
+            return memo[id(node)][1]
+        args = tuple(rewrite(a) for a in node.args)
+        new = node
+        if any(x is not y for x, y in zip(args, node.args)):
+            new = _rebuild(node, node.op, args, node.params)
+        fired = _rule(new, names)
+        if fired is not None:
+            replacement, note = fired
+            notes.append(note)
+            new = rewrite(replacement)
+        memo[id(node)] = (node, new)
+        memo[id(new)] = (new, new)
+        return new
+
+    return rewrite(root), notes
@@ -40,8 +40,20 @@ def _register_backends() -> None:
 
 def _register_algorithms() -> None:
     from mllense.math.linalg.algorithms.matmul.naive import NaiveMatmul
+    from mllense.math.linalg.algorithms.reduction.compensated import CompensatedReduction
+    from mllense.math.linalg.algorithms.reduction.moments import FusedMoments
+    from mllense.math.linalg.algorithms.reduction.pairwise import PairwiseReduction
+    from mllense.math.linalg.algorithms.solve.cholesky import CholeskySolve
     from mllense.math.linalg.algorithms.solve.gaussian import GaussianSolve
+    from mllense.math.linalg.algorithms.solve.lu import LUSolve
+    from mllense.math.linalg.algorithms.solve.mixed_precision import MixedPrecisionSolve
     from mllense.math.linalg.registry.algorithm_registry import algorithm_registry
 
     algorithm_registry.register("matmul", "naive", NaiveMatmul, default=True)
     algorithm_registry.register("solve", "gaussian", GaussianSolve, default=True)
+    algorithm_registry.register("solve", "lu", LUSolve)
+    algorithm_registry.register("solve", "cholesky", CholeskySolve)
+    algorithm_registry.register("solve", "mixed_precision", MixedPrecisionSolve)
+    algorithm_registry.register("reduce", "pairwise", PairwiseReduction, default=True)
+    algorithm_registry.register("reduce", "compensated", CompensatedReduction)
+    algorithm_registry.register("reduce", "moments", FusedMoments)
@@ -0,0 +1,39 @@
+# ==============================
+# File: linalg/tests/algorithms/test_cholesky.py
+# ==============================
+"""Tests for the blocked Cholesky kernel and rank-1 updates."""
+
+import numpy as np
+import pytest
+
+from mllense.math.linalg.algorithms.solve.cholesky import (
+    cholesky_decompose,
+    cholesky_update,
+)
+from mllense.math.linalg.exceptions import InvalidInputError
+
+
+def _spd(n, seed=0):
+    g = np.random.default_rng(seed).standard_normal((n, n))
+    return g @ g.T + n * np.eye(n)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 4, 64])
+def test_blocked_cholesky_matches_numpy(block_size):
+    a = _spd(10)
+    l = cholesky_decompose(a.tolist(), block_size=block_size)
+    assert np.allclose(np.array(l), np.linalg.cholesky(a))
+
+
+def test_blocked_cholesky_rejects_indefinite():
+    with pytest.raises(InvalidInputError):
+        cholesky_decompose([[1.0, 2.0], [2.0, 1.0]], block_size=1)
+
+
+def test_cholesky_update_leaves_input_untouched():
+    a = _spd(6, seed=1)
+    l = np.linalg.cholesky(a).tolist()
+    x = [0.5, 0.0, -1.0, 2.0, 0.0, 0.3]
+    up = cholesky_update(l, x)
+    assert np.allclose(np.array(up), np.linalg.cholesky(a + np.outer(x, x)))
+    assert np.allclose(np.array(l), np.linalg.cholesky(a))
@@ -0,0 +1,43 @@
+"""Tests for the triangular solve kernel and solve_triangular API."""
+
+from mllense.math.linalg.algorithms.solve.triangular import triangular_solve
+from mllense.math.linalg.api.solve import solve_triangular
+from mllense.math.linalg.exceptions import SingularMatrixError
+import numpy as np
+import pytest
+
+L = [[2.0, 0.0, 0.0], [1.0, 3.0, 0.0], [4.0, -1.0, 5.0]]
+
+
+def test_lower_and_upper_vector():
+    b = [2.0, 7.0, 3.0]
+    x = triangular_solve(L, b, lower=True)
+    assert np.allclose(np.array(L) @ np.array(x), b)
+
+    u = np.array(L).T.tolist()
+    x = triangular_solve(u, b, lower=False)
+    assert np.allclose(np.array(u) @ np.array(x), b)
+
+
+def test_transpose_and_unit_diagonal():
+    b = [1.0, -2.0, 4.0]
+    x = triangular_solve(L, b, lower=True, trans=True)
+    assert np.allclose(np.array(L).T @ np.array(x), b)
+
+    unit = np.tril(np.array(L), -1) + np.eye(3)
+    # diagonal entries of L are ignored with unit_diagonal=True
+    x = triangular_solve(L, b, lower=True, unit_diagonal=True)
+    assert np.allclose(unit @ np.array(x), b)
+
+
+def test_multi_rhs_matches_columnwise():
+    b = np.arange(12, dtype=float).reshape(3, 4)
+    x = solve_triangular(np.array(L), b, lower=True)
+    assert isinstance(x.value, np.ndarray)
+    assert x.value.shape == (3, 4)
+    assert np.allclose(np.array(L) @ x.value, b)
+
+
+def test_singular_diagonal():
+    with pytest.raises(SingularMatrixError):
+        solve_triangular([[1.0, 2.0], [0.0, 0.0]], [1.0, 1.0])
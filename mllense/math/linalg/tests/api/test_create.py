@@ -1,9 +1,12 @@
 # ==============================
 # File: linalg/tests/api/test_create.py
 # ==============================
-"""Tests for the create API (zeros, ones, eye, rand)."""
+"""Tests for the create API (zeros, ones, eye, rand, randn, randint)."""
 
-from mllense.math.linalg.api.create import zeros, ones, eye, rand
+import threading
+
+from mllense.math.linalg.api.create import zeros, ones, eye, rand, randint, randn
+from mllense.math.linalg.algorithms.creation import rand as rand_module
 from mllense.math.linalg.exceptions import InvalidInputError
 import pytest
 import numpy as np
@@ -39,3 +42,63 @@ def test_negative_dims():
         zeros(0, 5)
     with pytest.raises(InvalidInputError):
         ones(5, -1)
+
+def test_create_into_out():
+    buf = np.full((2, 3), 7.0)
+    assert zeros(out=buf).value is buf and not buf.any()
+    rows = [[5.0, 5.0], [5.0, 5.0]]
+    assert eye(out=rows).value == [[1.0, 0.0], [0.0, 1.0]]
+    assert rand(2, 2, seed=3, out=rows).value is rows
+    assert rows == rand(2, 2, seed=3).value
+    with pytest.raises(InvalidInputError):
+        ones()
+
+
+def test_rand_chunks_reproducible_across_workers(monkeypatch):
+    monkeypatch.setattr(rand_module, "RANDOM_CHUNK_ELEMENTS", 64)
+    serial = rand(50, 10, seed=7, as_numpy=True).value
+    threaded = rand(50, 10, seed=7, as_numpy=True, workers=4).value
+    assert np.array_equal(serial, threaded)
+    assert np.array_equal(serial, np.array(rand(50, 10, seed=7).value))
+    assert not np.array_equal(serial, rand(50, 10, seed=8, as_numpy=True).value)
+    listed = [[0.0] * 10 for _ in range(50)]
+    assert rand(seed=7, out=listed, workers=3).value is listed
+    assert np.array_equal(np.array(listed), serial)
+    ss = np.random.SeedSequence(11)
+    assert np.array_equal(rand(3, seed=ss, as_numpy=True).value, rand(3, seed=ss, as_numpy=True).value)
+
+
+def test_rand_seeding_is_thread_independent():
+    expected = rand(20, 20, seed=1, as_numpy=True).value
+    results = []
+
+    def worker(seed):
+        results.append((seed, rand(20, 20, seed=seed, as_numpy=True).value))
+
+    threads = [threading.Thread(target=worker, args=(s,)) for s in (1, 2, 1, 3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(np.array_equal(v, expected) for s, v in results if s == 1)
+
+
+def test_randn_and_randint():
+    z = randn(200, 50, seed=0, mean=3.0, std=2.0, as_numpy=True).value
+    assert abs(z.mean() - 3.0) < 0.1 and abs(z.std() - 2.0) < 0.1
+    k = randint(3, 4, low=-2, high=5, seed=0).value
+    assert all(isinstance(v, int) and -2 <= v < 5 for row in k for v in row)
+    assert randint(2, high=10, seed=0, as_numpy=True).value.dtype == np.int64
+    with pytest.raises(InvalidInputError):
+        randn(2, std=-1.0)
+    with pytest.raises(InvalidInputError):
+        randint(2, low=3, high=3)
+
+
+def test_rand_fills_memmap(tmp_path):
+    mm = np.lib.format.open_memmap(str(tmp_path / "r.npy"), mode="w+", dtype=np.float64, shape=(6, 4))
+    assert rand(seed=5, out=mm, low=-1.0, high=1.0).value is mm
+    assert np.array_equal(np.load(tmp_path / "r.npy"), rand(6, 4, seed=5, low=-1.0, high=1.0, as_numpy=True).value)
+    col = np.zeros((4, 6)).T
+    randn(out=col, seed=2)
+    assert np.array_equal(col, randn(6, 4, seed=2, as_numpy=True).value)
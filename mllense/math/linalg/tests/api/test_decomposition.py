@@ -3,9 +3,14 @@
 # ==============================
 """Tests for the decomposition API (det, inv, qr, svd, eig)."""
 
-from mllense.math.linalg.api.decomposition import det, inv, matrix_trace, qr, svd, eig
+from mllense.math.linalg.api.decomposition import (
+    det, slogdet, slogdet_batch, lu_factor, cho_factor, cholupdate, choldowndate, inv, diag_of_inverse, inverse_update, matrix_trace, qr, independent_columns, svd, eig, eigh,
+)
+from mllense.math.linalg.api.ops import scalar_multiply_
+from mllense.math.linalg.exceptions import InvalidInputError
 import math
 import numpy as np
+import pytest
 
 def test_det():
     a = [[1.0, 2.0], [3.0, 4.0]]
@@ -42,3 +47,210 @@ def test_eig():
     vals, vecs = eig(a)
     assert set(vals) == {2.0, 3.0}
     assert len(vecs) == 2
+
+def test_slogdet_matches_det():
+    a = [[1.0, 2.0], [3.0, 4.0]]
+    sign, logabs = slogdet(a)
+    assert sign == -1.0
+    assert math.isclose(logabs, math.log(2.0))
+
+def test_slogdet_no_overflow():
+    # det = 1e400 overflows a float, but its log does not
+    a = np.diag([1e100] * 4)
+    sign, logabs = slogdet(a)
+    assert sign == 1.0
+    assert math.isclose(logabs, 400 * math.log(10.0))
+    assert det(a) == float("inf")
+
+def test_slogdet_singular():
+    assert slogdet([[1.0, 2.0], [2.0, 4.0]]) == (0.0, float("-inf"))
+
+def test_slogdet_reuses_factor():
+    a = [[4.0, 2.0, 0.6], [2.0, 5.0, 1.0], [0.6, 1.0, 3.0]]
+    expected = np.linalg.slogdet(np.array(a))
+    for handle in (lu_factor(a), cho_factor(a)):
+        sign, logabs = slogdet(handle)
+        assert sign == expected[0]
+        assert math.isclose(logabs, expected[1])
+    x = cho_factor(a).solve([1.0, 2.0, 3.0])
+    assert np.allclose(np.array(a) @ np.array(x), [1.0, 2.0, 3.0])
+
+def test_slogdet_batch():
+    stack = np.array([[[2.0, 0.0], [0.0, 3.0]], [[0.0, 1.0], [1.0, 0.0]]])
+    signs, logabs = slogdet_batch(stack)
+    assert np.allclose(signs, [1.0, -1.0])
+    assert np.allclose(logabs, [math.log(6.0), 0.0])
+
+def test_inv_methods_agree():
+    rng = np.random.default_rng(0)
+    g = rng.standard_normal((6, 6))
+    spd = g @ g.T + 6 * np.eye(6)
+    expected = np.linalg.inv(spd)
+    for method in ("auto", "lu", "cholesky", "gauss_jordan"):
+        assert np.allclose(inv(spd, method=method).value, expected)
+    assert np.allclose(inv(g.tolist()).value, np.linalg.inv(g))
+    assert np.allclose(inv(lu_factor(g)).value, np.linalg.inv(g))
+
+def test_inv_cholesky_result_is_symmetric():
+    a = [[4.0, 2.0, 0.6], [2.0, 5.0, 1.0], [0.6, 1.0, 3.0]]
+    i = inv(cho_factor(a)).value
+    assert all(i[r][c] == i[c][r] for r in range(3) for c in range(3))
+
+def test_diag_of_inverse():
+    rng = np.random.default_rng(1)
+    g = rng.standard_normal((7, 7))
+    spd = g @ g.T + 7 * np.eye(7)
+    assert np.allclose(diag_of_inverse(g).value, np.diag(np.linalg.inv(g)))
+    assert np.allclose(diag_of_inverse(spd).value, np.diag(np.linalg.inv(spd)))
+    assert np.allclose(diag_of_inverse(lu_factor(spd)).value, np.diag(np.linalg.inv(spd)))
+
+def test_factor_handles_do_not_share_rows_with_cache():
+    a = [[4.0, 1.0], [1.0, 3.0]]
+    lu = lu_factor(a)
+    scalar_multiply_(lu.lu, 2.0)
+    lu.perm.reverse()
+    assert np.allclose(lu_factor(a).solve([1.0, 1.0]), np.linalg.solve(a, [1.0, 1.0]))
+    ch = cho_factor(a)
+    scalar_multiply_(ch.l, 2.0)
+    assert np.allclose(cho_factor(a).solve([1.0, 1.0]), np.linalg.solve(a, [1.0, 1.0]))
+
+def test_cholupdate_and_downdate():
+    rng = np.random.default_rng(2)
+    g = rng.standard_normal((5, 5))
+    a = g @ g.T + 5 * np.eye(5)
+    x = rng.standard_normal(5)
+    handle = cho_factor(a)
+    up = cholupdate(handle, x)
+    assert np.allclose(np.array(up.l), np.linalg.cholesky(a + np.outer(x, x)))
+    down = choldowndate(up, x)
+    assert np.allclose(np.array(down.l), np.array(handle.l))
+    l_np = choldowndate(np.array(up.l), x)
+    assert isinstance(l_np, np.ndarray)
+    assert np.allclose(l_np, np.linalg.cholesky(a))
+
+def test_choldowndate_rejects_indefinite():
+    handle = cho_factor([[1.0, 0.0], [0.0, 1.0]])
+    with pytest.raises(InvalidInputError):
+        choldowndate(handle, [2.0, 0.0])
+    assert handle.l == [[1.0, 0.0], [0.0, 1.0]]
+
+def test_svd_economy_and_truncated():
+    a = np.random.default_rng(3).standard_normal((8, 3))
+    u, s, vt = svd(a, full_matrices=False)
+    assert u.shape == (8, 3) and vt.shape == (3, 3)
+    u2, s2, vt2 = svd(a.tolist(), k=2)
+    assert np.array(u2).shape == (8, 2)
+    assert np.allclose(s2, s[:2])
+
+def test_svd_randomized_matches_exact_top_k(tmp_path):
+    rng = np.random.default_rng(4)
+    # rank-5 signal plus small noise
+    a = rng.standard_normal((300, 5)) @ rng.standard_normal((5, 40)) + 1e-6 * rng.standard_normal((300, 40))
+    mm = np.lib.format.open_memmap(tmp_path / "a.npy", mode="w+", dtype=np.float64, shape=a.shape)
+    mm[:] = a
+    u, s, vt = svd(mm, k=5, method="randomized", random_state=0, chunk_size=32)
+    exact = np.linalg.svd(a, compute_uv=False)[:5]
+    assert u.shape == (300, 5) and vt.shape == (5, 40)
+    assert np.allclose(s, exact, rtol=1e-6)
+    assert np.allclose((u * s) @ vt, a, atol=1e-4)
+
+def test_svd_randomized_requires_k():
+    with pytest.raises(InvalidInputError):
+        svd([[1.0, 0.0], [0.0, 1.0]], method="randomized")
+
+def _sym(n, seed):
+    g = np.random.default_rng(seed).standard_normal((n, n))
+    return (g + g.T) / 2
+
+def test_eigh_full_and_auto_eig():
+    a = _sym(6, 5)
+    w, v = eigh(a)
+    assert np.allclose(w, np.linalg.eigvalsh(a))
+    assert np.allclose(a @ v, v * w)
+    w2, _ = eig(a.tolist())
+    assert np.allclose(w2, w)
+
+def test_eigh_subset_by_index():
+    a = _sym(30, 6)
+    expected = np.linalg.eigvalsh(a)
+    w, v = eigh(a, subset_by_index=(0, 2))
+    assert v.shape == (30, 3)
+    assert np.allclose(w, expected[:3])
+    assert np.allclose(a @ v, v * w, atol=1e-8)
+    assert np.allclose(v.T @ v, np.eye(3), atol=1e-10)
+
+def test_eigh_subset_by_value():
+    a = _sym(20, 7)
+    expected = np.linalg.eigvalsh(a)
+    w = eigh(a, subset_by_value=(0.0, 1.0), eigvals_only=True)
+    assert np.allclose(w, expected[(expected > 0.0) & (expected <= 1.0)])
+
+def test_eigh_degenerate_subset():
+    a = np.diag([1.0, 1.0, 1.0, 5.0])
+    w, v = eigh(a, subset_by_index=(0, 2))
+    assert np.allclose(w, [1.0, 1.0, 1.0])
+    assert np.allclose(v.T @ v, np.eye(3))
+
+def test_eigh_subset_with_repeated_zero_eigenvalue():
+    # two disconnected 50-node paths: eigenvalue 0 twice, then pairs
+    n = 100
+    lap = np.zeros((n, n))
+    for lo in (0, 50):
+        for i in range(lo, lo + 49):
+            lap[i, i] += 1.0
+            lap[i + 1, i + 1] += 1.0
+            lap[i, i + 1] = lap[i + 1, i] = -1.0
+    expected = np.linalg.eigvalsh(lap)[:4]
+    w, v = eigh(lap, subset_by_index=(0, 3))
+    assert np.allclose(w, expected, atol=1e-10)
+    assert np.allclose(lap @ v, v * w, atol=1e-8)
+    assert np.allclose(eigh(lap, subset_by_index=(0, 3), eigvals_only=True), expected, atol=1e-10)
+
+def test_eigh_subset_by_value_is_half_open():
+    a = np.diag([1.0, 2.0, 3.0])
+    assert np.allclose(eigh(a, subset_by_value=(1.0, 2.0), eigvals_only=True), [2.0])
+    assert np.allclose(eigh(a, subset_by_value=(0.0, 3.0), eigvals_only=True), [1.0, 2.0, 3.0])
+
+def test_qr_pivoted_reveals_rank_and_pivots():
+    rng = np.random.default_rng(8)
+    a = rng.standard_normal((50, 5))
+    a[:, 1] = 3.0 * a[:, 4]
+    q, r, perm = qr(a, pivoting=True)
+    assert q.shape == (50, 4) and r.shape == (4, 5)
+    assert np.allclose(q @ r, a[:, perm])
+    assert np.allclose(q.T @ q, np.eye(4))
+    d = np.abs(np.diag(r))
+    assert np.all(d[:-1] >= d[1:])
+    q2, r2, perm2 = qr(a.tolist(), pivoting=True)
+    assert perm2 == perm and np.allclose(r2, r)
+
+def test_independent_columns_drops_collinear_features():
+    rng = np.random.default_rng(9)
+    x = rng.standard_normal((100, 4))
+    x = np.column_stack([x, x[:, 0] + x[:, 2]])
+    keep = independent_columns(x)
+    assert len(keep) == 4 and keep == sorted(keep)
+    assert np.linalg.matrix_rank(x[:, keep]) == 4
+
+def test_inverse_update_matches_fresh_inverse():
+    rng = np.random.default_rng(10)
+    a = rng.standard_normal((9, 9)) + 9 * np.eye(9)
+    u = rng.standard_normal((9, 3))
+    v = rng.standard_normal((9, 3))
+    updated = inverse_update(inv(a), u, v)
+    assert isinstance(updated.value, np.ndarray)
+    assert np.allclose(updated.value, np.linalg.inv(a + u @ v.T))
+    # changing row 4 by d is u = e_4, v = d
+    d = rng.standard_normal(9)
+    e4 = np.eye(9)[4]
+    row = inverse_update(inv(a.tolist()), e4.tolist(), d.tolist()).value
+    assert isinstance(row, list)
+    assert np.allclose(row, np.linalg.inv(a + np.outer(e4, d)))
+
+def test_inverse_update_refactors_ill_conditioned_capacitance():
+    a = np.eye(3)
+    u = np.array([1.0, 0.0, 0.0])
+    v = np.array([-1.0 + 1e-10, 0.5, 0.0])
+    res = inverse_update(inv(a), u, v, how_lense=True)
+    assert "refactored" in res.how_lense
+    assert np.allclose(res.value @ (a + np.outer(u, v)), np.eye(3), atol=1e-5)
@@ -0,0 +1,77 @@
+# ==============================
+# File: linalg/tests/api/test_distance.py
+# ==============================
+"""Tests for pairwise distance and kernel API."""
+
+import numpy as np
+import pytest
+
+from mllense.math.linalg.api.distance import kernel_matrix, pairwise_distances
+from mllense.math.linalg.exceptions import InvalidInputError, ShapeMismatchError
+
+
+def _brute(x, y, metric):
+    diff = x[:, None, :] - y[None, :, :]
+    if metric == "sqeuclidean":
+        return (diff ** 2).sum(-1)
+    if metric == "euclidean":
+        return np.sqrt((diff ** 2).sum(-1))
+    if metric == "manhattan":
+        return np.abs(diff).sum(-1)
+    xn = x / np.linalg.norm(x, axis=1, keepdims=True)
+    yn = y / np.linalg.norm(y, axis=1, keepdims=True)
+    return 1.0 - xn @ yn.T
+
+
+def test_pairwise_distances_match_brute_force():
+    rng = np.random.default_rng(0)
+    x, y = rng.standard_normal((23, 4)), rng.standard_normal((11, 4))
+    for metric in ("euclidean", "sqeuclidean", "cosine", "manhattan"):
+        for chunk in (None, 5):
+            res = pairwise_distances(x, y, metric=metric, chunk_size=chunk)
+            assert np.allclose(res.value, _brute(x, y, metric))
+
+
+def test_pairwise_distances_self_and_lists():
+    x = np.random.default_rng(1).standard_normal((9, 3)) * 1e4 + 1e6
+    d = pairwise_distances(x, chunk_size=4).value
+    assert np.all(np.diag(d) == 0.0) and np.all(d >= 0.0)
+    assert pairwise_distances([[0.0, 0.0], [3.0, 4.0]]).value == [[0.0, 5.0], [5.0, 0.0]]
+
+
+def test_pairwise_top_k_matches_full_sort():
+    rng = np.random.default_rng(2)
+    x, y = rng.standard_normal((40, 5)), rng.standard_normal((30, 5))
+    res = pairwise_distances(x, y, top_k=3, chunk_size=7, how_lense=True)
+    assert res.algorithm_used == "pairwise_top_k" and res.how_lense
+    dist, idx = res.value
+    full = _brute(x, y, "euclidean")
+    expected = np.argsort(full, axis=1)[:, :3]
+    assert np.array_equal(idx, expected)
+    assert np.allclose(dist, np.take_along_axis(full, expected, axis=1))
+    with pytest.raises(InvalidInputError):
+        pairwise_distances(x, y, top_k=31)
+
+
+def test_pairwise_distances_far_from_origin():
+    rng = np.random.default_rng(4)
+    x = rng.random((30, 3)) * 0.005 + 1e6
+    assert np.allclose(pairwise_distances(x, chunk_size=8).value, _brute(x, x, "euclidean"), rtol=0, atol=1e-9)
+    centers = np.array([[0.0, 0.0], [1.0, 0.0]]) + 1e8
+    pts = np.repeat(centers, 50, axis=0) + rng.normal(0.0, 0.05, (100, 2))
+    _, idx = pairwise_distances(pts, centers, metric="sqeuclidean", top_k=1).value
+    assert np.array_equal(idx[:, 0], np.repeat([0, 1], 50))
+
+
+def test_kernel_matrix():
+    rng = np.random.default_rng(3)
+    x, y = rng.standard_normal((8, 3)), rng.standard_normal((6, 3))
+    assert np.allclose(kernel_matrix(x, y).value, np.exp(-_brute(x, y, "sqeuclidean") / 3))
+    assert np.allclose(kernel_matrix(x, y, kernel="laplacian", gamma=0.5).value,
+                       np.exp(-0.5 * _brute(x, y, "manhattan")))
+    assert np.allclose(kernel_matrix(x, y, kernel="linear").value, x @ y.T)
+    assert np.allclose(kernel_matrix(x, kernel="cosine").value, 1.0 - _brute(x, x, "cosine"))
+    with pytest.raises(InvalidInputError):
+        kernel_matrix(x, kernel="poly")
+    with pytest.raises(ShapeMismatchError):
+        kernel_matrix(x, rng.standard_normal((2, 4)))
@@ -3,11 +3,79 @@
 # ==============================
 """Tests for eigen API."""
 
-from mllense.math.linalg.api.eigen import dominant_eigen
+from mllense.math.linalg.api.eigen import dominant_eigen, eigs, eigsh
+from mllense.math.linalg.algorithms.eigen.subspace_iteration import SubspaceIteration
+from mllense.math.linalg.core.execution_context import ExecutionContext
+from mllense.math.linalg.core.mode import ExecutionMode
+from mllense.math.linalg.core.trace import Trace
 import math
+import numpy as np
 
 def test_dominant_eigen():
     a = [[2.0, 1.0], [1.0, 2.0]]
     val, vec = dominant_eigen(a)
     assert math.isclose(val, 3.0, abs_tol=1e-4)
     assert len(vec) == 2
+
+
+def _path_laplacian(n):
+    lap = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    lap[0, 0] = lap[-1, -1] = 1.0
+    return lap
+
+def test_eigsh_smallest_with_matvec_callback():
+    n = 200
+    lap = _path_laplacian(n)
+    expected = np.linalg.eigvalsh(lap)
+    w, v = eigsh(lambda x: lap @ x, k=4, n=n, which="SA", ncv=40, random_state=0)
+    assert np.allclose(w, expected[:4], atol=1e-8)
+    assert np.allclose(lap @ v, v * w, atol=1e-6)
+
+def test_eigsh_shift_invert():
+    lap = _path_laplacian(60)
+    expected = np.linalg.eigvalsh(lap)
+    target = expected[np.argsort(np.abs(expected - 0.9))[:3]]
+    w, _ = eigsh(lap.tolist(), k=3, sigma=0.9, random_state=0)
+    assert np.allclose(sorted(w), sorted(target), atol=1e-8)
+    # the documented route for operators that should not be densified
+    shifted_inv = np.linalg.inv(lap - 0.9 * np.eye(60))
+    theta, _ = eigsh(lambda x: shifted_inv @ x, k=3, n=60, random_state=0)
+    assert np.allclose(sorted(0.9 + 1.0 / theta), sorted(target), atol=1e-8)
+
+def test_eigs_largest_real():
+    a = np.random.default_rng(8).standard_normal((50, 50))
+    expected = np.linalg.eigvals(a)
+    w, v = eigs(a, k=3, which="LM", random_state=0)
+    top = expected[np.argsort(-np.abs(expected))[:3]]
+    assert np.allclose(np.sort(np.abs(w)), np.sort(np.abs(top)))
+    assert np.allclose(a @ v, v * w, atol=1e-6)
+
+def _spd_with_spectrum(values, seed):
+    q, _ = np.linalg.qr(np.random.default_rng(seed).standard_normal((len(values), len(values))))
+    return q @ np.diag(values) @ q.T
+
+def test_dominant_eigen_block_with_deflation():
+    a = _spd_with_spectrum([10.0, 9.0, 8.0, 1.0, 0.5, 0.1], 9)
+    w, v = dominant_eigen(a, k=3, random_state=0)
+    assert np.allclose(w, [10.0, 9.0, 8.0])
+    assert np.allclose(a @ v, v * w, atol=1e-7)
+
+def _sweeps(trace):
+    step = [s for s in trace.steps if s.operation == "subspace_iter_converged"][-1]
+    return int(step.description.split("iteration ")[1].split(",")[0])
+
+def test_dominant_eigen_warm_start_and_rqi():
+    a = _spd_with_spectrum([5.0, 4.9, 1.0, 0.2], 10)
+    exact = np.linalg.eigh(a)[1][:, -1]
+    ctx = ExecutionContext("python", ExecutionMode.FAST, True)
+    cold, warm = Trace(True), Trace(True)
+    SubspaceIteration().execute(a, context=ctx, trace=cold, random_state=0)
+    SubspaceIteration().execute(a, context=ctx, trace=warm, x0=exact + 1e-6, random_state=0)
+    assert _sweeps(warm) < _sweeps(cold)
+    val, _ = dominant_eigen(a, rqi=True, random_state=0)
+    assert math.isclose(val, 5.0, abs_tol=1e-12)
+
+def test_power_iteration_shift():
+    a = [[2.0, 1.0], [1.0, 2.0]]
+    val, _ = dominant_eigen(a, shift=0.5, x0=[1.0, 0.5])
+    assert math.isclose(val, 3.0, abs_tol=1e-6)
@@ -0,0 +1,72 @@
+# ==============================
+# File: linalg/tests/api/test_io.py
+# ==============================
+"""Tests for the save/load API (.npy/.npz, memory-mapped reads, factorization handles)."""
+
+import numpy as np
+import pytest
+
+from mllense.math.linalg import cho_factor, load, lu_factor, reduce, save, svd
+from mllense.math.linalg.core.constant import ConstantMatrix
+from mllense.math.linalg.exceptions import InvalidInputError
+
+
+def test_matrix_round_trip_and_memmap(tmp_path):
+    a = np.random.default_rng(0).random((40, 6))
+    path = save(tmp_path / "a", a)
+    assert path.endswith(".npy")
+    mapped = load(path, mmap_mode="r")
+    assert isinstance(mapped, np.memmap) and np.array_equal(mapped, a)
+    assert np.allclose(reduce(mapped, axis=0).value, a.sum(axis=0))
+    assert np.array_equal(load(save(tmp_path / "list.npy", [[1.0, 2.0], [3.0, 4.0]])), [[1.0, 2.0], [3.0, 4.0]])
+    assert np.array_equal(load(save(tmp_path / "res", reduce(a, "max", axis=1))), a.max(axis=1))
+
+
+def test_factorization_handles_round_trip(tmp_path):
+    a = np.random.default_rng(1).random((6, 6))
+    spd = a @ a.T + 6 * np.eye(6)
+    b = [1.0, -2.0, 0.5, 3.0, 0.0, 1.0]
+    lu = lu_factor(a.tolist())
+    lu2 = load(save(tmp_path / "lu", lu), mmap_mode="r")
+    assert lu2.perm == lu.perm and lu2.slogdet() == lu.slogdet()
+    assert np.allclose(lu2.solve(b), np.linalg.solve(a, b))
+    ch = load(save(tmp_path / "ch", cho_factor(spd.tolist())))
+    assert np.allclose(ch.solve(b), np.linalg.solve(spd, b))
+
+
+def test_factor_tuples_map_each_member(tmp_path):
+    a = np.random.default_rng(2).random((8, 5))
+    u, s, vt = load(save(tmp_path / "svd", svd(a, full_matrices=False)), mmap_mode="r")
+    assert all(isinstance(f, np.memmap) for f in (u, s, vt))
+    assert np.allclose((u * s) @ vt, a)
+    u2, s2 = load(save(tmp_path / "packed", (u, s), compress=True), mmap_mode="r")
+    assert not isinstance(u2, np.memmap) and np.array_equal(u2, u) and np.array_equal(s2, s)
+    path = tmp_path / "svd.npz"
+    with pytest.raises(InvalidInputError):
+        load(path, mmap_mode="r+")
+    u, _, _ = load(path, mmap_mode="c")
+    u[0, 0] = 42.0
+    # copy-on-write leaves the archive (and its CRCs) intact
+    assert load(path)[0][0, 0] != 42.0
+
+
+def test_implicit_and_dict_payloads(tmp_path):
+    c = load(save(tmp_path / "c", ConstantMatrix(1000, 1000, 2.5)))
+    assert isinstance(c, ConstantMatrix) and c.shape == (1000, 1000) and c.value == 2.5
+    stats = load(save(tmp_path / "stats", {"mean": np.arange(3.0), "n": np.array([4, 4, 4])}))
+    assert set(stats) == {"mean", "n"} and np.array_equal(stats["n"], [4, 4, 4])
+
+
+def test_npy_ending_like_a_zip_record_loads_as_npy(tmp_path):
+    tail = np.frombuffer(b"PK\x05\x06" + b"\0" * 18, dtype=np.uint8)
+    loaded = load(save(tmp_path / "tail", tail))
+    assert loaded.dtype == np.uint8 and np.array_equal(loaded, tail)
+
+
+def test_invalid_inputs(tmp_path):
+    with pytest.raises(InvalidInputError):
+        save(tmp_path / "bad", [[1.0], [2.0, 3.0]])
+    with pytest.raises(InvalidInputError):
+        save(tmp_path / "bad", [["a", "b"]])
+    with pytest.raises(InvalidInputError):
+        load(save(tmp_path / "ok", [[1.0]]), mmap_mode="w+")
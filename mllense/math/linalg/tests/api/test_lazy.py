@@ -0,0 +1,108 @@
+# ==============================
+# File: linalg/tests/api/test_lazy.py
+# ==============================
+"""Tests for lazy expression graphs and fused evaluation."""
+
+import numpy as np
+import pytest
+
+from mllense.math.linalg.algorithms.elementwise.fused import evaluate_fused
+from mllense.math.linalg.api.decomposition import inv
+from mllense.math.linalg.api.lazy import evaluate, lazy
+from mllense.math.linalg.api.matmul import matmul
+from mllense.math.linalg.api.shape import transpose
+from mllense.math.linalg.api.ops import add, divide, multiply, scalar_add, scalar_multiply, subtract
+from mllense.math.linalg.exceptions import NumericalInstabilityError, ShapeMismatchError, SingularMatrixError
+from mllense.math.linalg.expr.graph import Expr
+
+
+def _expr(x, b, c):
+    t = multiply(x, b)
+    return subtract(add(t, scalar_multiply(c, 2.0)), divide(t, scalar_add(x, 1.0)))
+
+
+def test_lazy_ops_build_graph_without_computing():
+    e = add(lazy([[1.0, 2.0]]), [[3.0, 4.0]])
+    assert isinstance(e, Expr) and e.shape == (1, 2)
+    assert evaluate(e).value == [[4.0, 6.0]]
+    with pytest.raises(ShapeMismatchError):
+        add(lazy([[1.0, 2.0]]), [[1.0, 2.0, 3.0]])
+
+
+def test_fused_matches_eager_ndarray_with_broadcasting():
+    rng = np.random.default_rng(0)
+    a = rng.random((700, 50)) + 0.5
+    b, c = rng.random(50), rng.random((700, 1))
+    expected = a * b + 2.0 * c - (a * b) / (a + 1.0)
+    res = evaluate(_expr(lazy(a), b, c), how_lense=True)
+    assert np.allclose(res.value, expected)
+    assert "block" in res.how_lense
+
+
+def test_fused_matches_eager_lists_and_hoists_broadcasts():
+    a = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    b = [10.0, 20.0, 30.0]
+    c = [[1.0], [2.0]]
+    expected = _expr(np.array(a), np.array(b), np.array(c)).value
+    res = _expr(lazy(a), b, c).evaluate().value
+    assert isinstance(res, list)
+    assert np.allclose(res, expected)
+    assert evaluate(multiply(lazy(c), 3.0)).value == [[3.0], [6.0]]
+
+
+def test_common_subexpressions_are_merged():
+    a, b = np.ones((3, 3)), np.full((3, 3), 2.0)
+    e = add(multiply(lazy(a), b), multiply(b, lazy(a)))
+    res = evaluate(e, how_lense=True)
+    assert np.array_equal(res.value, np.full((3, 3), 4.0))
+    assert "2 distinct op(s), 1 repeated subexpression(s) merged" in res.how_lense
+
+
+def test_fused_division_by_zero():
+    with pytest.raises(NumericalInstabilityError):
+        evaluate(divide(lazy([[1.0, 2.0]]), [[1.0, 0.0]]))
+    with pytest.raises(NumericalInstabilityError):
+        evaluate(divide(lazy(np.ones((2, 2))), np.array([1.0, 0.0])))
+
+
+def test_fused_root_leaf_is_copied_into_output():
+    a = np.random.default_rng(3).random((5, 3))
+    assert np.array_equal(evaluate_fused(lazy(a)), a)
+    assert np.array_equal(evaluate(lazy(a)).value, a)
+
+
+def test_plan_reducing_to_a_leaf_returns_a_copy():
+    a = np.random.default_rng(5).random((4, 3))
+    res = evaluate(transpose(transpose(lazy(a)))).value
+    assert np.array_equal(res, a) and not np.shares_memory(res, a)
+    res[0, 0] = 99.0
+    assert a[0, 0] != 99.0
+
+
+def test_planner_turns_inverse_product_into_solve():
+    rng = np.random.default_rng(4)
+    a = rng.random((6, 6)) + 6 * np.eye(6)
+    b = rng.random(6)
+    res = evaluate(matmul(inv(lazy(a)), b), how_lense=True)
+    assert np.allclose(res.value, np.linalg.solve(a, b))
+    assert "Plan: solve(A, B)" in res.how_lense
+    listed = evaluate(matmul(transpose(inv(lazy(a.tolist()))), b.tolist()))
+    assert isinstance(listed.value, list)
+    assert np.allclose(listed.value, np.linalg.solve(a.T, b))
+    with pytest.raises(SingularMatrixError):
+        evaluate(matmul(inv(lazy(np.ones((3, 3)))), np.ones(3)))
+
+
+def test_planner_swaps_transposed_product_and_uses_syrk():
+    rng = np.random.default_rng(5)
+    a, b, x = rng.random((4, 3)), rng.random((3, 5)), rng.random((7, 4))
+    res = evaluate(transpose(matmul(lazy(a), b)), how_lense=True)
+    assert np.allclose(res.value, (a @ b).T)
+    assert "Plan: (B.T @ A.T)" in res.how_lense
+    xl = lazy(x)
+    gram = evaluate(transpose(transpose(matmul(transpose(xl), xl))), how_lense=True)
+    assert np.allclose(gram.value, x.T @ x)
+    assert "Plan: syrk(A.T @ A)" in gram.how_lense
+    outer = evaluate(add(matmul(xl, transpose(xl)), 1.0), how_lense=True)
+    assert np.allclose(outer.value, x @ x.T + 1.0)
+    assert "syrk(A @ A.T)" in outer.how_lense
@@ -3,10 +3,10 @@
 # ==============================
 """Tests for matmul API."""
 
-from mllense.math.linalg.api.matmul import matmul
+from mllense.math.linalg.api.matmul import matmul, matrix_power, power_apply
 import numpy as np
 import pytest
-from mllense.math.linalg.exceptions import ShapeMismatchError
+from mllense.math.linalg.exceptions import InvalidInputError, ShapeMismatchError
 
 def test_matmul_2d():
     a = [[1.0, 2.0], [3.0, 4.0]]
@@ -28,3 +28,57 @@ def test_matmul_1d():
 def test_matmul_invalid():
     with pytest.raises(ShapeMismatchError):
         matmul([[1.0, 2.0]], [[1.0, 2.0]])
+
+def test_matrix_power_methods_agree():
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((5, 5)) / 3
+    for k in (0, 1, 2, 7, 13):
+        assert np.allclose(matrix_power(a, k).value, np.linalg.matrix_power(a, k))
+    assert np.allclose(matrix_power(a, -3).value, np.linalg.matrix_power(a, -3))
+    s = (a + a.T) / 2
+    expected = np.linalg.matrix_power(s, 40)
+    for method in ("auto", "squaring", "eigh"):
+        assert np.allclose(matrix_power(s, 40, method=method).value, expected)
+    assert matrix_power([[2.0, 0.0], [0.0, 3.0]], 3).value == [[8.0, 0.0], [0.0, 27.0]]
+
+def test_matrix_power_auto_keeps_integer_powers_exact():
+    swap = [[0.0, 1.0], [1.0, 0.0]]
+    assert matrix_power(swap, 2047).value == [[0.0, 1.0], [1.0, 0.0]]
+    assert matrix_power(np.array(swap), 4096).value.tolist() == [[1.0, 0.0], [0.0, 1.0]]
+    assert power_apply(np.array(swap), 2047, [1.0, 2.0]).value.tolist() == [2.0, 1.0]
+    res = matrix_power([[0.5, 0.25], [0.25, 0.5]], 1 << 30, how_lense=True)
+    assert "symmetric" in res.how_lense
+
+def test_matrix_power_rejects_non_integer_exponents():
+    with pytest.raises(InvalidInputError):
+        matrix_power(np.array([[2.0]]), 2.5)
+    with pytest.raises(InvalidInputError):
+        power_apply(np.eye(2), 1.5, [1.0, 0.0])
+    assert matrix_power(np.array([[2.0]]), 3.0).value.tolist() == [[8.0]]
+    assert matrix_power(np.array([[2.0]]), np.int64(2)).value.tolist() == [[4.0]]
+
+def test_matrix_power_batched():
+    stack = np.random.default_rng(1).standard_normal((4, 3, 3)) / 2
+    assert np.allclose(matrix_power(stack, 5).value, np.linalg.matrix_power(stack, 5))
+
+def test_power_apply_markov_chain():
+    rng = np.random.default_rng(2)
+    p = rng.random((6, 6))
+    p /= p.sum(axis=1, keepdims=True)
+    dist = np.eye(6)[0]
+    expected = dist @ np.linalg.matrix_power(p, 25)
+    for method in ("auto", "matvec", "squaring"):
+        res = power_apply(p.T, 25, dist, method=method)
+        assert np.allclose(res.value, expected)
+    assert "never forming" in power_apply(p.T, 3, dist, how_lense=True).how_lense
+
+def test_power_apply_symmetric_and_batched():
+    rng = np.random.default_rng(3)
+    g = rng.standard_normal((3, 4, 4)) / 3
+    s = g + np.swapaxes(g, 1, 2)
+    v = rng.standard_normal((3, 4))
+    expected = np.einsum("bij,bj->bi", np.linalg.matrix_power(s, 9), v)
+    for method in ("auto", "matvec", "squaring", "eigh"):
+        assert np.allclose(power_apply(s, 9, v, method=method).value, expected)
+    with pytest.raises(InvalidInputError):
+        power_apply(np.triu(np.ones((3, 3))), 2, [1.0, 1.0, 1.0], method="eigh")
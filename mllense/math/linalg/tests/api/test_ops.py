@@ -3,7 +3,12 @@
 # ==============================
 """Tests for general ops API."""
 
+import numpy as np
+import pytest
+
 from mllense.math.linalg.api.ops import add, subtract, multiply, divide, scalar_multiply, scalar_add
+from mllense.math.linalg.api.ops import add_, divide_, multiply_, scalar_multiply_, subtract_
+from mllense.math.linalg.exceptions import InvalidInputError, NumericalInstabilityError, ShapeMismatchError
 
 def test_add():
     res = add([[1.0]], [[2.0]])
@@ -28,3 +33,73 @@ def test_scalar_multiply():
 def test_scalar_add():
     res = scalar_add([[2.0]], 5.0)
     assert res == [[7.0]]
+
+def test_broadcast_row_column_and_scalar_lists():
+    m = [[1.0, 2.0], [3.0, 4.0]]
+    assert add(m, [10.0, 20.0]).value == [[11.0, 22.0], [13.0, 24.0]]
+    assert multiply(m, [[2.0], [3.0]]).value == [[2.0, 4.0], [9.0, 12.0]]
+    assert subtract(5.0, m).value == [[4.0, 3.0], [2.0, 1.0]]
+    assert add([[1.0], [2.0]], [[10.0, 20.0]]).value == [[11.0, 21.0], [12.0, 22.0]]
+
+def test_broadcast_ndarray_trailing_dimensions():
+    a = np.arange(24.0).reshape(2, 3, 4)
+    bias = np.arange(4.0)
+    assert np.array_equal(add(a, bias).value, a + bias)
+    assert np.array_equal(divide(a, np.full((3, 1), 2.0)).value, a / 2.0)
+
+def test_broadcast_incompatible_shapes():
+    with pytest.raises(ShapeMismatchError):
+        add([[1.0, 2.0]], [[1.0, 2.0, 3.0]])
+    with pytest.raises(ShapeMismatchError):
+        multiply(np.ones((2, 3)), np.ones(2))
+    with pytest.raises(NumericalInstabilityError):
+        divide(np.ones((2, 2)), np.array([1.0, 0.0]))
+
+def test_out_writes_into_caller_buffer():
+    out = [[0.0, 0.0], [0.0, 0.0]]
+    res = multiply([[1.0, 2.0], [3.0, 4.0]], [[2.0], [3.0]], out=out)
+    assert res.value is out and out == [[2.0, 4.0], [9.0, 12.0]]
+    buf = np.empty((3, 4))
+    assert add(np.ones((3, 4)), np.arange(4.0), out=buf).value is buf
+    assert np.array_equal(buf, np.ones((3, 4)) + np.arange(4.0))
+    with pytest.raises(ShapeMismatchError):
+        add(np.ones((3, 4)), 1.0, out=np.empty((4, 3)))
+    with pytest.raises(InvalidInputError):
+        add(np.ones((2, 2)), 1.0, out=np.empty((2, 2), dtype=int))
+
+def test_in_place_variants():
+    m = [[1.0, 2.0], [3.0, 4.0]]
+    row0 = m[0]
+    assert add_(m, [10.0, 20.0]).value is m
+    assert m == [[11.0, 22.0], [13.0, 24.0]] and m[0] is row0
+    a = np.ones((2, 3))
+    scalar_multiply_(a, 4.0)
+    divide_(a, np.array([1.0, 2.0, 4.0]))
+    assert np.array_equal(a, [[4.0, 2.0, 1.0], [4.0, 2.0, 1.0]])
+    with pytest.raises(NumericalInstabilityError):
+        divide_(a, np.array([1.0, 0.0, 1.0]))
+    m = [[1.0, 2.0], [3.0, 4.0]]
+    with pytest.raises(NumericalInstabilityError):
+        divide_(m, [[1.0, 2.0], [0.0, 1.0]])
+    with pytest.raises(InvalidInputError):
+        divide_(m, [[1.0, 2.0], [1.0, "x"]])
+    assert m == [[1.0, 2.0], [3.0, 4.0]]
+    with pytest.raises(InvalidInputError):
+        add_(m, [[1.0, 1.0], [1.0, "x"]])
+    with pytest.raises(InvalidInputError):
+        scalar_multiply_([[1.0, 2.0], ["x", 4.0]], 2.0)
+    assert m == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test_in_place_with_aliased_rows():
+    a = [[1.0, 2.0], [3.0, 4.0]]
+    add_(a, [a[0]])
+    assert a == [[2.0, 4.0], [4.0, 6.0]]
+    a = [[1.0, 2.0], [3.0, 4.0]]
+    subtract_(a, [a[1], a[0]])
+    assert a == [[-2.0, -2.0], [2.0, 2.0]]
+    a = [[1.0, 2.0], [3.0, 4.0]]
+    multiply_(a, a)
+    assert a == [[1.0, 4.0], [9.0, 16.0]]
+    with pytest.raises(ShapeMismatchError):
+        add_([[1.0, 2.0]], [[1.0], [2.0]])
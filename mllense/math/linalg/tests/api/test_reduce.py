@@ -0,0 +1,58 @@
+# ==============================
+# File: linalg/tests/api/test_reduce.py
+# ==============================
+"""Tests for the reduce API (axis reductions, fused statistics, batches)."""
+
+import numpy as np
+import pytest
+
+from mllense.math.linalg.api.reduce import reduce, reduce_batch
+from mllense.math.linalg.api.shape import transpose
+from mllense.math.linalg.exceptions import InvalidInputError
+
+
+@pytest.mark.parametrize("algorithm", ["pairwise", "compensated"])
+@pytest.mark.parametrize("op", ["sum", "mean", "max", "min", "argmax", "argmin"])
+def test_reduce_matches_numpy(op, algorithm):
+    a = np.random.default_rng(0).random((300, 7))
+    for axis in (None, 0, 1, -1):
+        expected = getattr(np, op)(a, axis=axis)
+        assert np.allclose(reduce(a, op, axis=axis, algorithm=algorithm).value, expected)
+        listed = reduce(a.tolist(), op, axis=axis, algorithm=algorithm).value
+        assert isinstance(listed, list if axis is not None else (float, int))
+        assert np.allclose(listed, expected)
+    assert np.allclose(reduce(transpose(a.tolist()), op, axis=0, algorithm=algorithm).value, expected)
+
+
+def test_summation_accuracy_down_columns():
+    a = np.full((100_000, 3), 0.1)
+    exact = 10_000.0
+    assert np.all(reduce(a, axis=0).value == exact)
+    assert np.all(reduce(a, axis=0, algorithm="compensated").value == exact)
+    assert reduce(np.full(10_001, 0.1), algorithm="compensated").value == pytest.approx(1000.1, abs=0)
+
+
+def test_fused_moments_in_one_call():
+    a = np.random.default_rng(1).normal(1e6, 1.0, size=(500, 4))
+    res = reduce(a, ["mean", "var", "std", "min", "max", "count"], axis=0, how_lense=True)
+    assert np.allclose(res.value["mean"], a.mean(0)) and np.allclose(res.value["var"], a.var(0))
+    assert np.allclose(res.value["std"], a.std(0)) and list(res.value["count"]) == [500] * 4
+    assert "Chan" in res.how_lense
+    listed = reduce(a.tolist(), ["mean", "var"], axis=1, ddof=1).value
+    assert np.allclose(listed["var"], a.var(1, ddof=1))
+    assert reduce([1.0, 2.0, 3.0, 4.0], "var").value == pytest.approx(1.25)
+    with pytest.raises(InvalidInputError):
+        reduce([1.0], "var", ddof=1)
+    with pytest.raises(InvalidInputError):
+        reduce([[1.0]], "median")
+
+
+def test_reduce_batch():
+    b = np.random.default_rng(2).random((4, 5, 6))
+    assert np.allclose(reduce_batch(b, "sum", axis=1).value, b.sum(axis=2))
+    assert np.allclose(reduce_batch(b, "argmax").value, [m.argmax() for m in b])
+    listed = reduce_batch([m.tolist() for m in b], ["mean", "var"], axis=0).value
+    assert isinstance(listed["var"], list)
+    assert np.allclose(listed["var"], b.var(axis=1))
+    with pytest.raises(InvalidInputError):
+        reduce_batch([[[1.0, 2.0]], [[1.0]]])
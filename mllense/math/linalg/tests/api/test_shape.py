@@ -3,8 +3,12 @@
 # ==============================
 """Tests for shape manipulation API."""
 
-from mllense.math.linalg.api.shape import reshape, flatten, transpose, vstack, hstack
-from mllense.math.linalg.exceptions import ShapeMismatchError
+from mllense.math.linalg.api.matmul import matmul
+from mllense.math.linalg.api.shape import concatenate, reshape, flatten, transpose, vstack, hstack
+from mllense.math.linalg.core.view import MatrixView
+from mllense.math.linalg.exceptions import InvalidInputError, ShapeMismatchError
+import json
+import numpy as np
 import pytest
 
 def test_reshape():
@@ -37,3 +41,78 @@ def test_hstack():
     b = [[2.0], [4.0]]
     res = hstack(a, b)
     assert res == [[1.0, 2.0], [3.0, 4.0]]
+
+def test_shape_ops_write_into_out():
+    a = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    out = [[0.0, 0.0] for _ in range(3)]
+    assert transpose(a, out=out).value is out and out == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]
+    flat = np.empty(6)
+    flatten(np.array(a), out=flat)
+    assert np.array_equal(flat, np.arange(1.0, 7.0))
+    assert reshape(a, 3, 2, out=out).value == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    stacked = np.empty((2, 6))
+    hstack(np.array(a), a, out=stacked)
+    assert np.array_equal(stacked, np.hstack([a, a]))
+    with pytest.raises(ShapeMismatchError):
+        vstack(a, a, out=np.empty((3, 3)))
+
+def test_shape_ops_return_views_without_copying():
+    a = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    t = transpose(a).value
+    assert isinstance(t, MatrixView) and t._buf is a
+    assert matmul(transpose(a), a).value == (np.array(a).T @ np.array(a)).tolist()
+    assert matmul(flatten(a), [1.0] * 6).value == 21.0
+    assert vstack(transpose(a), [[0.0, 0.0]]) == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0], [0.0, 0.0]]
+    arr = np.arange(6.0).reshape(2, 3)
+    assert np.shares_memory(transpose(arr).value, arr)
+    assert np.shares_memory(flatten(arr).value, arr)
+    for v in (transpose(arr).value, flatten(arr).value, reshape(arr, 3, 2).value):
+        with pytest.raises(ValueError):
+            v[0] = 99.0
+    assert arr[0, 0] == 0.0
+
+def test_list_views_validate_and_convert_elements():
+    t = transpose([[1, 2, 3], [4, 5, 6]]).value
+    assert t == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]] and type(t[0][0]) is float
+    assert json.dumps(t.tolist()) == "[[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]"
+    with pytest.raises(InvalidInputError):
+        transpose([["a", "b"]])
+    with pytest.raises(InvalidInputError):
+        flatten([[1.0, float("nan")]])
+
+def test_concatenate_sized_and_streamed():
+    assert concatenate([[[1.0, 2.0]], [3.0, 4.0], [[5.0, 6.0]]]).value == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    assert concatenate([[[1.0], [2.0]], np.array([[3.0], [4.0]])], axis=1).value.tolist() == [[1.0, 3.0], [2.0, 4.0]]
+    res = concatenate((np.full((3, 2), float(i)) for i in range(50000)), how_lense=True)
+    assert res.value.shape == (150000, 2) and res.value[-1, 0] == 49999.0
+    assert "grown in place" in res.how_lense
+    out = [[0.0, 0.0] for _ in range(3)]
+    assert concatenate(([float(i), 0.0] for i in range(3)), out=out).value is out
+    assert out == [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]]
+    with pytest.raises(ShapeMismatchError):
+        concatenate(([1.0, 2.0] for _ in range(4)), out=out)
+    with pytest.raises(ShapeMismatchError):
+        concatenate([[[1.0, 2.0]], [[1.0, 2.0, 3.0]]])
+
+
+def test_concatenate_to_memory_mapped_file(tmp_path):
+    path = str(tmp_path / "stream.npy")
+    res = concatenate((np.full((2, 3), float(i)) for i in range(4)), filename=path)
+    assert isinstance(res.value, np.memmap) and res.value.shape == (8, 3)
+    assert np.array_equal(np.load(path), np.repeat(np.arange(4.0), 2)[:, None] * np.ones(3))
+    sized = str(tmp_path / "sized.npy")
+    concatenate([np.ones((1, 2)), [[2.0, 2.0]]], filename=sized)
+    assert np.load(sized).tolist() == [[1.0, 1.0], [2.0, 2.0]]
+
+
+def test_concatenate_rejects_non_numeric_pieces(tmp_path):
+    with pytest.raises(InvalidInputError):
+        concatenate([[["a", 2]], [[3, 4]]])
+    with pytest.raises(InvalidInputError):
+        concatenate([np.ones((1, 2)), np.array([["a", "b"]])])
+    assert concatenate([[[1, 2]], [[3, 4]]]).value == [[1.0, 2.0], [3.0, 4.0]]
+    path = tmp_path / "bad.npy"
+    with pytest.raises(InvalidInputError):
+        concatenate(iter([[[1.0, 2.0]], [["a", 2.0]]]), filename=str(path))
+    assert not path.exists()
+
@@ -3,7 +3,7 @@
 # ==============================
 """Tests for linear equation solve API."""
 
-from mllense.math.linalg.api.solve import solve
+from mllense.math.linalg.api.solve import solve, solve_update
 from mllense.math.linalg.exceptions import SingularMatrixError
 import pytest
 import math
@@ -20,3 +20,74 @@ def test_solve_singular():
     b = [1.0, 2.0]
     with pytest.raises(SingularMatrixError):
         solve(a, b)
+
+def test_solve_lu_and_cholesky_hints():
+    a = [[4.0, 1.0], [1.0, 3.0]]
+    b = [1.0, 2.0]
+    for name in ("lu", "cholesky"):
+        x = solve(a, b, algorithm=name)
+        assert math.isclose(x[0], 1.0 / 11.0, abs_tol=1e-12)
+        assert math.isclose(x[1], 7.0 / 11.0, abs_tol=1e-12)
+
+def test_solve_mixed_precision_reaches_double_accuracy():
+    import numpy as np
+    from mllense.math.linalg.diagnostics.error_analysis import backward_error
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal((150, 150)) + 150 * np.eye(150)
+    x_true = rng.standard_normal(150)
+    b = a @ x_true
+    res = solve(a, b, algorithm="mixed_precision", trace_enabled=True)
+    assert isinstance(res.value, np.ndarray)
+    assert backward_error(a, b, res.value, normwise=True) <= np.sqrt(150) * np.finfo(np.float64).eps
+    assert np.allclose(res.value, x_true, rtol=1e-12, atol=1e-12)
+    x_list = solve(a.tolist(), b.tolist(), algorithm="mixed_precision")
+    assert isinstance(x_list.value, list) and np.allclose(x_list.value, x_true)
+
+def test_solve_mixed_precision_falls_back_when_ill_conditioned():
+    import numpy as np
+    # Hilbert matrix: cond ~ 1e10, beyond what a float32 factor can refine
+    n = 8
+    a = np.array([[1.0 / (i + j + 1) for j in range(n)] for i in range(n)])
+    b = a @ np.ones(n)
+    res = solve(a, b, algorithm="mixed_precision", how_lense=True)
+    assert "float64" in res.how_lense
+    assert np.allclose(res.value, np.ones(n), atol=1e-5)
+    with pytest.raises(SingularMatrixError):
+        solve([[1.0, 2.0], [2.0, 4.0]], [1.0, 2.0], algorithm="mixed_precision")
+
+def test_solve_update_woodbury():
+    import numpy as np
+    from mllense.math.linalg.api.decomposition import cho_factor, lu_factor
+    rng = np.random.default_rng(1)
+    a = rng.standard_normal((12, 12)) + 12 * np.eye(12)
+    u = rng.standard_normal((12, 2))
+    v = rng.standard_normal((12, 2))
+    b = rng.standard_normal(12)
+    expected = np.linalg.solve(a + u @ v.T, b)
+    assert np.allclose(solve_update(lu_factor(a), u, v, b).value, expected)
+    assert np.allclose(solve_update(a, u, v, b).value, expected)
+    spd = a @ a.T
+    x = solve_update(cho_factor(spd), u[:, 0], v[:, 0], b.tolist()).value
+    assert np.allclose(x, np.linalg.solve(spd + np.outer(u[:, 0], v[:, 0]), b))
+
+def test_solve_update_refactors_ill_conditioned_capacitance():
+    import numpy as np
+    from mllense.math.linalg.api.decomposition import lu_factor
+    # A + u v^T is nearly singular: C = 1 + v^T A^-1 u is ~1e-10
+    a = np.eye(3)
+    u = np.array([1.0, 0.0, 0.0])
+    v = np.array([-1.0 + 1e-10, 0.5, 0.0])
+    b = np.array([1.0, 2.0, 3.0])
+    res = solve_update(lu_factor(a), u, v, b, how_lense=True)
+    assert "refactored" in res.how_lense
+    assert np.allclose((a + np.outer(u, v)) @ res.value, b)
+
+def test_solve_update_unwraps_results():
+    import numpy as np
+    from mllense.math.linalg.api.decomposition import lu_factor
+    from mllense.math.linalg.api.ops import add
+    a = np.eye(3) * 2.0
+    u, v = np.ones(3), np.array([0.5, 0.0, 0.0])
+    b = add(np.zeros(3), np.array([1.0, 2.0, 3.0]))
+    x = solve_update(lu_factor(a), add(u, 0.0), v, b).value
+    assert np.allclose((a + np.outer(u, v)) @ x, b.value)
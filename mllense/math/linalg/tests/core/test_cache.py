@@ -0,0 +1,64 @@
+# ==============================
+# File: linalg/tests/core/test_cache.py
+# ==============================
+"""Tests for the content-addressed decomposition cache."""
+
+import numpy as np
+
+from mllense.math.linalg.api.decomposition import lu_factor, svd
+from mllense.math.linalg.config import get_config
+from mllense.math.linalg.core.cache import DecompositionCache, get_decomposition_cache, matrix_fingerprint
+from mllense.math.linalg.diagnostics import full_diagnostic_report, stability_report
+
+
+def test_fingerprint_ignores_container():
+    a = [[1.0, 2.0], [3.0, 4.0]]
+    assert matrix_fingerprint(a) == matrix_fingerprint(np.array(a))
+    assert matrix_fingerprint(a) != matrix_fingerprint([[1.0, 2.0], [3.0, 4.5]])
+    assert matrix_fingerprint([[1.0, 2.0, 3.0, 4.0]]) != matrix_fingerprint(a)
+
+
+def test_lru_evicts_to_budget():
+    cache = DecompositionCache(max_bytes=3 * 8 * 100)
+    for i in range(5):
+        cache.get_or_compute("x", [[float(i)]], lambda: np.zeros(100))
+    assert len(cache) == 3
+    _, hit = cache.get_or_compute("x", [[4.0]], lambda: np.zeros(100))
+    assert hit
+    _, hit = cache.get_or_compute("x", [[0.0]], lambda: np.zeros(100))
+    assert not hit
+
+
+def test_diagnostics_share_one_svd():
+    cache = get_decomposition_cache()
+    cache.clear()
+    a = np.random.default_rng(0).standard_normal((6, 6))
+    stability_report(a, method="svd")
+    stats = cache.stats()
+    assert stats["misses"] == 1 and stats["hits"] >= 1
+    # the default estimator needs one LU factor and no SVD at all
+    cache.clear()
+    full_diagnostic_report(a)
+    assert cache.stats()["misses"] == 1
+
+
+def test_cached_results_are_private_copies():
+    get_decomposition_cache().clear()
+    a = [[4.0, 1.0], [2.0, 3.0]]
+    u, s, vt = svd(a)
+    u[0][0] = 99.0
+    assert svd(a)[0][0][0] != 99.0
+    f1, f2 = lu_factor(a), lu_factor(a)
+    assert f1 is not f2 and f1.lu == f2.lu
+
+
+def test_zero_budget_disables_cache():
+    cfg = get_config()
+    cache = get_decomposition_cache()
+    cache.clear()
+    cfg.decomposition_cache_bytes = 0
+    try:
+        lu_factor([[2.0, 0.0], [0.0, 2.0]])
+        assert len(cache) == 0
+    finally:
+        cfg.reset()
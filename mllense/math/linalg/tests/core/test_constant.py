@@ -0,0 +1,78 @@
+# ==============================
+# File: linalg/tests/core/test_constant.py
+# ==============================
+"""Tests for implicit constant matrices and their closed-form algebra."""
+
+import numpy as np
+import pytest
+
+from mllense.math.linalg.api.create import eye, ones, zeros
+from mllense.math.linalg.api.decomposition import matrix_trace
+from mllense.math.linalg.api.matmul import matmul
+from mllense.math.linalg.api.ops import add, add_, divide, multiply, scalar_multiply, scalar_multiply_, subtract
+from mllense.math.linalg.api.shape import transpose
+from mllense.math.linalg.core.constant import ConstantMatrix, ScaledIdentity
+from mllense.math.linalg.exceptions import InvalidInputError
+
+
+def test_implicit_creation_stores_no_elements():
+    i3 = eye(3, implicit=True, how_lense=True)
+    assert isinstance(i3.value, ScaledIdentity) and "nothing is allocated" in i3.how_lense
+    assert i3.value == [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    z = zeros(2, 3, implicit=True).value
+    assert isinstance(z, ConstantMatrix) and z[1][2] == 0.0 and len(z) == 2
+    assert np.array_equal(np.asarray(ones(2, implicit=True).value), np.ones((2, 2)))
+    assert transpose(z).value.shape == (3, 2)
+    with pytest.raises(InvalidInputError):
+        z[0][0] = 1.0
+    with pytest.raises(InvalidInputError):
+        zeros(2, implicit=True, as_numpy=True)
+
+
+def test_identity_products_and_scaling():
+    x = [[1.0, 2.0], [3.0, 4.0]]
+    i2 = eye(2, implicit=True)
+    assert matmul(i2, x).value == x and matmul(i2, x).value is not x
+    lam_i = scalar_multiply(i2, 0.5).value
+    assert isinstance(lam_i, ScaledIdentity) and lam_i.scale == 0.5
+    assert matmul(x, lam_i).value == [[0.5, 1.0], [1.5, 2.0]]
+    assert matrix_trace(lam_i) == 1.0
+    assert add(i2, lam_i).value.scale == 1.5
+    a = np.array(x)
+    assert np.array_equal(matmul(zeros(3, 2, implicit=True), a).value, np.zeros((3, 2)))
+    assert np.allclose(matmul(ones(3, 2, implicit=True), a).value, np.ones((3, 2)) @ a)
+    assert np.allclose(matmul(a, ones(2, 3, implicit=True)).value, a @ np.ones((2, 3)))
+
+
+def test_closed_forms_never_return_the_dense_operand():
+    x = [[1, 2], [3, 4]]
+    a = np.array([[1.0, 2.0], [3.0, 4.0]])
+    results = [
+        matmul(eye(2, implicit=True), x).value,
+        matmul(x, eye(2, implicit=True)).value,
+        add(x, zeros(2, implicit=True)).value,
+        divide(x, ones(2, 2, implicit=True)).value,
+        multiply(x, ones(2, 2, implicit=True)).value,
+    ]
+    for r in results:
+        assert r == [[1.0, 2.0], [3.0, 4.0]] and all(type(v) is float for row in r for v in row)
+        scalar_multiply_(r, 10.0)
+    assert x == [[1, 2], [3, 4]]
+    assert matmul(eye(3, implicit=True), [1, 2, 3]).value == [1.0, 2.0, 3.0]
+    for r in (matmul(eye(2, implicit=True), a).value, add(a, zeros(2, implicit=True)).value):
+        assert r is not a and not np.shares_memory(r, a)
+
+
+def test_regularization_touches_only_the_diagonal():
+    x = [[1.0, 2.0], [3.0, 4.0]]
+    lam_i = scalar_multiply(eye(2, implicit=True), 0.1)
+    assert np.allclose(add(x, lam_i).value, np.array(x) + 0.1 * np.eye(2))
+    assert x == [[1.0, 2.0], [3.0, 4.0]]
+    a = np.array(x)
+    assert add_(a, lam_i).value is a
+    assert np.allclose(a, np.array(x) + 0.1 * np.eye(2))
+    assert np.allclose(subtract(a, eye(2, implicit=True)).value, a - np.eye(2))
+    assert add(x, zeros(2, implicit=True)).value == x
+    assert np.allclose(multiply(a, eye(2, implicit=True)).value, np.diag(np.diag(a)))
+    # shapes no rule covers fall back to the dense algorithm
+    assert add(eye(2, implicit=True), [[1.0, 1.0]]).value == [[2.0, 1.0], [1.0, 2.0]]
@@ -0,0 +1,48 @@
+# ==============================
+# File: linalg/tests/core/test_view.py
+# ==============================
+"""Tests for zero-copy strided matrix views."""
+
+import numpy as np
+import pytest
+
+from mllense.math.linalg.core.view import ConcatView, MatrixView
+from mllense.math.linalg.exceptions import ShapeMismatchError
+
+
+def test_transpose_and_reshape_share_the_buffer():
+    a = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    t = MatrixView.of(a).T
+    assert t.shape == (3, 2) and t.strides == (1, 3)
+    assert t == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]
+    a[0][1] = 20.0
+    assert t[1][0] == 20.0
+    r = MatrixView.of(a).reshape(3, 2)
+    assert r._buf is a and r == [[1.0, 20.0], [3.0, 4.0], [5.0, 6.0]]
+    # a transposed view is not contiguous, so reshaping it copies once
+    assert t.reshape(1, 6) == [[1.0, 4.0, 20.0, 5.0, 3.0, 6.0]]
+    assert t.ravel().tolist() == [1.0, 4.0, 20.0, 5.0, 3.0, 6.0]
+    assert np.array_equal(np.asarray(t), np.array(a).T)
+
+
+def test_write_copies_on_first_write():
+    a = [[1.0, 2.0], [3.0, 4.0]]
+    t = MatrixView.of(a).T
+    t[0][1] = 30.0
+    assert a == [[1.0, 2.0], [3.0, 4.0]]
+    assert t == [[1.0, 30.0], [2.0, 4.0]]
+    flat = MatrixView.of(a).ravel()
+    flat[-1] = 0.0
+    assert flat == [1.0, 2.0, 3.0, 0.0] and a[1][1] == 4.0
+    with pytest.raises(ShapeMismatchError):
+        t[0] = [1.0, 2.0, 3.0]
+
+
+def test_concat_view():
+    a, b = [[1.0, 2.0]], [[3.0, 4.0], [5.0, 6.0]]
+    v = ConcatView([MatrixView.of(a), MatrixView.of(b)], axis=0)
+    assert v.shape == (3, 2) and v == [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    h = v.T
+    assert isinstance(h, ConcatView) and h == [[1.0, 3.0, 5.0], [2.0, 4.0, 6.0]]
+    h[1][2] = 0.0
+    assert h[1][2] == 0.0 and b[1][1] == 6.0
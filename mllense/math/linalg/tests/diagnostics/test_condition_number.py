@@ -15,3 +15,40 @@ def test_condition_number_singular():
     a = [[1.0, 2.0], [2.0, 4.0]]
     c = condition_number(a)
     assert c == float("inf")
+
+def test_condition_estimate_matches_exact_1norm():
+    import numpy as np
+    from mllense.math.linalg.api.decomposition import cho_factor, lu_factor
+    rng = np.random.default_rng(0)
+    for n in (1, 5, 30):
+        g = rng.standard_normal((n, n))
+        exact = np.linalg.cond(g, 1)
+        est = condition_number(g, method="estimate")
+        # a lower bound, rarely more than a factor 3 below the true value
+        assert exact / 3 <= est <= exact * (1 + 1e-10)
+        assert math.isclose(condition_number(lu_factor(g)), est, rel_tol=0.5)
+    spd = g @ g.T + np.eye(30)
+    est = condition_number(cho_factor(spd))
+    assert np.linalg.cond(spd, 1) / 3 <= est <= np.linalg.cond(spd, 1) * (1 + 1e-10)
+
+def test_condition_estimate_singular_and_bad_args():
+    import pytest
+    from mllense.math.linalg.exceptions import InvalidInputError
+    assert condition_number([[1.0, 2.0], [2.0, 4.0]], method="estimate") == float("inf")
+    with pytest.raises(InvalidInputError):
+        condition_number([[1.0, 0.0], [0.0, 1.0]], method="bogus")
+    with pytest.raises(InvalidInputError):
+        condition_number([[1.0, 0.0], [0.0, 1.0]], method="estimate", ord=2)
+
+def test_condition_estimate_reuses_cached_factor():
+    import numpy as np
+    from mllense.math.linalg.api.decomposition import lu_factor
+    from mllense.math.linalg.core.cache import get_decomposition_cache
+    g = np.random.default_rng(1).standard_normal((20, 20))
+    get_decomposition_cache().clear()
+    # no factor yet: the exact 1-norm value from LAPACK
+    assert math.isclose(condition_number(g, method="estimate"), np.linalg.cond(g, 1))
+    lu_factor(g)
+    assert get_decomposition_cache().get("lu", g) is not None
+    anorm = float(np.abs(g).sum(axis=0).max())
+    assert condition_number(g, method="estimate") == lu_factor(g).cond1_estimate(anorm)
@@ -16,3 +16,14 @@ def test_rank_deficient():
 def test_rank_zero():
     a = [[0.0, 0.0], [0.0, 0.0]]
     assert matrix_rank(a) == 0
+
+def test_rank_qrcp_matches_svd():
+    import numpy as np
+    rng = np.random.default_rng(0)
+    # tall design matrix whose columns 3 and 5 are combinations of others
+    x = rng.standard_normal((200, 6))
+    x[:, 3] = x[:, 0] - 2.0 * x[:, 1]
+    x[:, 5] = 0.5 * x[:, 2]
+    assert matrix_rank(x, method="qrcp") == matrix_rank(x) == 4
+    assert matrix_rank([[0.0, 0.0], [0.0, 0.0]], method="qrcp") == 0
+    assert matrix_rank([[1.0, 2.0], [2.0, 4.0]], method="qrcp") == 1
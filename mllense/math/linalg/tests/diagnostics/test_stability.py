@@ -18,3 +18,15 @@ def test_stability_report_singular():
     assert report["rank"] == 1
     assert report["full_rank"] is False
     assert report["well_conditioned"] is False
+
+def test_stability_report_methods():
+    a = [[4.0, 1.0], [2.0, 3.0]]
+    est = stability_report(a, method="estimate")
+    exact = stability_report(a)
+    assert est["condition_method"] == "estimate" and exact["condition_method"] == "svd"
+    assert est["rank"] == exact["rank"] == 2
+    # kappa_1 and kappa_2 agree within a factor of n
+    assert exact["condition_number"] / 2 <= est["condition_number"] <= 2 * exact["condition_number"]
+    assert stability_report([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], method="estimate")["condition_method"] == "svd"
+    # an estimate below the threshold does not imply full rank
+    assert stability_report([[1.0, 2.0], [2.0, 4.0]], method="estimate")["rank"] == 1
@@ -28,6 +28,8 @@ def run_tutorial():
     A_t = transpose(A)
     print("\n1. transpose(A):")
     for row in A_t: print("  ", row)
+    # The result is a zero-copy view over A; .tolist() gives a plain list
+    print("   as a list:", A_t.value.tolist())
 
     # 2. Reshape
     # Changes dimensions while preserving the flattened order of elements
@@ -5,6 +5,10 @@
 
 from __future__ import annotations
 
+from typing import Union
+
+import numpy as np
+
 from mllense.math.linalg._internal.constants import DEFAULT_FLOAT_TOLERANCE
 from mllense.math.linalg.core.types import InternalMatrix, get_matrix_shape
 
@@ -33,17 +37,29 @@ def describe_matrix(m: InternalMatrix) -> dict[str, object]:
     }
 
 
-def is_symmetric(m: InternalMatrix, tol: float = DEFAULT_FLOAT_TOLERANCE) -> bool:
-    """Check if a square matrix is symmetric."""
+# Rows compared per vectorized block in is_symmetric
+_SYMMETRY_BLOCK_ROWS = 256
+
+
+def is_symmetric(
+    m: Union[InternalMatrix, np.ndarray], tol: float = DEFAULT_FLOAT_TOLERANCE
+) -> bool:
+    """Check if a square matrix is symmetric.
+
+    Compares ``A[i:j, :]`` with ``A[:, i:j]^T`` one row block at a time, so
+    an asymmetry near the top returns early and no full ``n × n``
+    temporary is created.
+    """
     n = len(m)
     if n == 0:
         return True
     if len(m[0]) != n:
         return False
-    for i in range(n):
-        for j in range(i + 1, n):
-            if abs(m[i][j] - m[j][i]) > tol:
-                return False
+    a = np.asarray(m, dtype=np.float64)
+    for start in range(0, n, _SYMMETRY_BLOCK_ROWS):
+        stop = min(start + _SYMMETRY_BLOCK_ROWS, n)
+        if np.any(np.abs(a[start:stop] - a[:, start:stop].T) > tol):
+            return False
     return True
 
 
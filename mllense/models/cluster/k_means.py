@@ -1,4 +1,5 @@
 import numpy as np
+from mllense.math.linalg import pairwise_distances
 from mllense.models.base import BaseEstimator
 from mllense.models.core.metadata import ModelMetadata, ModelResult
 from mllense.models.core.trace import Trace
@@ -19,8 +20,9 @@ class KMeans(BaseEstimator):
         self.cluster_centers_ = None
         self.labels_ = None
 
-    def _euclidean_distance(self, a, b):
-        return np.sqrt(np.sum((a - b)**2, axis=1))
+    def _nearest_center(self, X):
+        _, idx = pairwise_distances(X, self.cluster_centers_, metric="sqeuclidean", top_k=1).value
+        return idx[:, 0]
 
     def fit(self, X):
         trace = Trace(enabled=self.how_lense_enabled)
@@ -29,7 +31,7 @@ class KMeans(BaseEstimator):
         if self.random_state is not None:
             np.random.seed(self.random_state)
             
-        X = np.array(X)
+        X = np.asarray(X, dtype=np.float64)
         trace.record("forgy_init", f"Selecting {self.n_clusters} random indices as initial centroids")
         random_indices = np.random.choice(X.shape[0], self.n_clusters, replace=False)
         self.cluster_centers_ = X[random_indices]
@@ -41,8 +43,7 @@ class KMeans(BaseEstimator):
             elif i == 2:
                 trace.record("early_stop_poll", "... Hiding repeating iteration logs ...")
 
-            distances = np.array([self._euclidean_distance(X, center) for center in self.cluster_centers_])
-            self.labels_ = np.argmin(distances, axis=0)
+            self.labels_ = self._nearest_center(X)
             
             new_centers = np.array([
                 X[self.labels_ == k].mean(axis=0) if np.any(self.labels_ == k) else self.cluster_centers_[k]
@@ -65,11 +66,10 @@ class KMeans(BaseEstimator):
         trace = Trace(enabled=self.how_lense_enabled)
         trace.record("predict_start", "Predicting cluster affiliations for unobserved data")
         
-        X = np.array(X)
+        X = np.asarray(X, dtype=np.float64)
         trace.record("evaluating_distances", "Returning argmin over Euclidean distances from each point to established cluster centers")
         
-        distances = np.array([self._euclidean_distance(X, center) for center in self.cluster_centers_])
-        preds = np.argmin(distances, axis=0)
+        preds = self._nearest_center(X)
         
         what = self._generate_what_lense() if self.what_lense_enabled else ""
         how = self._finalize_how_lense(trace) if self.how_lense_enabled else ""